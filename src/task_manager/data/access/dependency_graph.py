@@ -0,0 +1,170 @@
+"""In-process dependency graph with incremental readiness tracking.
+
+This module implements the DependencyGraph class which keeps the dependency
+edges between tasks together with, for every task, the number of its
+dependencies that are not satisfied. A dependency is satisfied when the task
+it points at exists and is COMPLETED, so a task is ready when that count is
+zero. Ready tasks are kept in postings keyed by task list and status.
+
+The graph is updated incrementally as tasks are indexed:
+- Completing or reopening a task adjusts the counts of its dependents only,
+  in O(number of dependents)
+- Editing a task's dependencies recounts that task's dependencies only
+- Listing the ready tasks of a scope reads the ready postings, so its cost is
+  proportional to the number of ready tasks rather than to the scope's size
+
+The graph only stores identifiers and statuses. It is owned by
+FilesystemIndex and maintained by the stores through it.
+
+Requirements: 9.1, 9.2, 9.3
+"""
+
+from typing import Iterable, Optional
+from uuid import UUID
+
+from task_manager.models.entities import Task
+from task_manager.models.enums import Status
+
+
+class DependencyGraph:
+    """Dependency edges, unsatisfied dependency counts and ready postings.
+
+    Attributes:
+        ready_task_ids_by_scope: Maps (task list ID, status) pairs to the IDs
+            of the ready tasks of that task list in that status
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        self.ready_task_ids_by_scope: dict[tuple[UUID, Status], set[UUID]] = {}
+
+        # Adjacency in both directions; dependents may reference missing tasks
+        self._dependencies: dict[UUID, tuple[UUID, ...]] = {}
+        self._dependents: dict[UUID, set[UUID]] = {}
+        self._nodes: dict[UUID, tuple[UUID, Status]] = {}
+        self._unsatisfied: dict[UUID, int] = {}
+
+    def clear(self) -> None:
+        """Remove all tasks."""
+        self.ready_task_ids_by_scope.clear()
+        self._dependencies.clear()
+        self._dependents.clear()
+        self._nodes.clear()
+        self._unsatisfied.clear()
+
+    def add_task(self, task: Task) -> None:
+        """Add a task, replacing any previous entry for the same ID.
+
+        Args:
+            task: The task to add
+        """
+        self.remove_task(task.id)
+        dependency_ids = tuple(dict.fromkeys(dep.task_id for dep in task.dependencies))
+        self._nodes[task.id] = (task.task_list_id, task.status)
+        self._dependencies[task.id] = dependency_ids
+        for dependency_id in dependency_ids:
+            self._dependents.setdefault(dependency_id, set()).add(task.id)
+
+        self._unsatisfied[task.id] = sum(
+            1 for dependency_id in dependency_ids if not self._is_satisfied(dependency_id)
+        )
+        if self._unsatisfied[task.id] == 0:
+            self._set_ready(task.id, True)
+
+        if task.status == Status.COMPLETED:
+            for dependent_id in self._dependents.get(task.id, ()):
+                if dependent_id != task.id:
+                    self._change_unsatisfied(dependent_id, -1)
+
+    def remove_task(self, task_id: UUID) -> None:
+        """Remove a task if present.
+
+        Its dependents keep their dependency on it, which is then unsatisfied.
+
+        Args:
+            task_id: The UUID of the task to remove
+        """
+        node = self._nodes.get(task_id)
+        if node is None:
+            return
+
+        if node[1] == Status.COMPLETED:
+            for dependent_id in self._dependents.get(task_id, ()):
+                if dependent_id != task_id:
+                    self._change_unsatisfied(dependent_id, 1)
+
+        if self._unsatisfied[task_id] == 0:
+            self._set_ready(task_id, False)
+        for dependency_id in self._dependencies.pop(task_id):
+            dependents = self._dependents[dependency_id]
+            dependents.discard(task_id)
+            if not dependents:
+                del self._dependents[dependency_id]
+        del self._nodes[task_id]
+        del self._unsatisfied[task_id]
+
+    def dependent_task_ids(self, task_id: UUID) -> set[UUID]:
+        """Get the IDs of all tasks that depend on a task.
+
+        Args:
+            task_id: The UUID of the task depended on
+
+        Returns:
+            A new set of task IDs (empty if no task depends on it)
+        """
+        return set(self._dependents.get(task_id, ()))
+
+    def is_ready(self, task_id: UUID) -> bool:
+        """Check whether all dependencies of a task are satisfied.
+
+        Args:
+            task_id: The UUID of the task
+
+        Returns:
+            True if the task exists and all its dependencies are COMPLETED
+        """
+        return self._unsatisfied.get(task_id) == 0
+
+    def ready_task_ids(
+        self, task_list_ids: Iterable[UUID], statuses: Optional[Iterable[Status]] = None
+    ) -> set[UUID]:
+        """Get the IDs of the ready tasks of some task lists.
+
+        Args:
+            task_list_ids: Task lists whose ready tasks are returned
+            statuses: If given, only tasks in one of these statuses are returned
+
+        Returns:
+            A new set containing the union of the matching ready postings
+        """
+        statuses = list(Status) if statuses is None else list(statuses)
+        result: set[UUID] = set()
+        for task_list_id in task_list_ids:
+            for status in statuses:
+                result |= self.ready_task_ids_by_scope.get((task_list_id, status), set())
+        return result
+
+    def _is_satisfied(self, dependency_id: UUID) -> bool:
+        """Check whether a dependency points at an existing COMPLETED task."""
+        node = self._nodes.get(dependency_id)
+        return node is not None and node[1] == Status.COMPLETED
+
+    def _change_unsatisfied(self, task_id: UUID, delta: int) -> None:
+        """Adjust a task's unsatisfied dependency count, updating the ready postings."""
+        was_ready = self._unsatisfied[task_id] == 0
+        self._unsatisfied[task_id] += delta
+        is_ready = self._unsatisfied[task_id] == 0
+        if was_ready != is_ready:
+            self._set_ready(task_id, is_ready)
+
+    def _set_ready(self, task_id: UUID, ready: bool) -> None:
+        """Add a task to or remove it from its ready posting."""
+        key = self._nodes[task_id]
+        if ready:
+            self.ready_task_ids_by_scope.setdefault(key, set()).add(task_id)
+            return
+        ready_ids = self.ready_task_ids_by_scope.get(key)
+        if ready_ids is not None:
+            ready_ids.discard(task_id)
+            if not ready_ids:
+                del self.ready_task_ids_by_scope[key]
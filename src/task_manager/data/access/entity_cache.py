@@ -0,0 +1,145 @@
+"""Bounded LRU cache of deserialized entities for the filesystem data store.
+
+This module implements the EntityCache class which keeps recently used
+entities in memory so repeated reads of the same project, task list, or task
+do not re-open and re-parse its JSON file.
+
+Every cached entry is stored together with the stat signature (inode, mtime,
+size) of the file it was read from or written to. Lookups stat the file and
+only return the cached entity if the signature still matches, so a file
+replaced by another process is re-read instead of served stale. Because
+FilesystemStore writes via temp file and rename, every write produces a new
+inode even on filesystems with coarse mtime resolution.
+
+Requirements: 1.2, 1.5
+"""
+
+import os
+import pathlib
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+# Stat signature identifying one version of an entity file
+FileSignature = tuple[int, int, int]
+
+
+def file_signature(file_path: pathlib.Path) -> Optional[FileSignature]:
+    """Get the stat signature of a file.
+
+    Args:
+        file_path: The file to stat
+
+    Returns:
+        A (st_ino, st_mtime_ns, st_size) tuple, or None if the file does not exist
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class EntityCache:
+    """Thread-safe LRU cache of entities validated against file signatures.
+
+    Attributes:
+        max_size: Maximum number of entries kept before the least recently used
+                  entry is evicted. A max_size of 0 disables caching.
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that had to read the file
+        evictions: Number of entries evicted because the cache was full
+    """
+
+    def __init__(self, max_size: int = 10000):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached entities (0 disables caching)
+
+        Raises:
+            ValueError: If max_size is negative
+        """
+        if max_size < 0:
+            raise ValueError("Cache size must be non-negative")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[FileSignature, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, signature: Optional[FileSignature]) -> Optional[Any]:
+        """Look up an entity, validating it against the file's current signature.
+
+        Args:
+            key: Cache key of the entity
+            signature: Current stat signature of the entity's file, or None if the
+                       file does not exist
+
+        Returns:
+            The cached entity if present and still current, None otherwise
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or signature is None or entry[0] != signature:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, signature: Optional[FileSignature], entity: Any) -> None:
+        """Store an entity with the signature of the file it corresponds to.
+
+        Args:
+            key: Cache key of the entity
+            signature: Stat signature of the entity's file. If None the entry is
+                       dropped instead, since it could never be validated.
+            entity: The deserialized entity
+        """
+        if self.max_size == 0:
+            return
+
+        with self._lock:
+            if signature is None:
+                self._entries.pop(key, None)
+                return
+
+            self._entries[key] = (signature, entity)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove an entity from the cache if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with size, max_size, hits, misses and evictions
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,239 @@
+"""JSON encoding of entities shared by the file-based data stores.
+
+This module implements the EntityCodec mixin which converts projects, task
+lists and tasks to and from JSON-compatible dictionaries. It is used by
+FilesystemStore (one JSON file per entity) and LogStore (entities embedded in
+log records and snapshots), so both stores read and write the same format.
+
+Requirements: 1.2, 1.4
+"""
+
+import copy
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from task_manager.models.entities import (
+    ActionPlanItem,
+    Dependency,
+    ExitCriteria,
+    Note,
+    Project,
+    Task,
+    TaskList,
+)
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+
+
+class EntityCodec:
+    """Mixin providing JSON serialization and copying of entities.
+
+    Attributes:
+        codec_error: Exception type raised for entities that cannot be serialized.
+                     Stores override this with their own error type.
+    """
+
+    codec_error: type[Exception] = ValueError
+
+    def _serialize_entity(self, entity: Any) -> dict:
+        """Serialize an entity to a JSON-compatible dictionary.
+
+        Args:
+            entity: The entity to serialize (Project, TaskList, or Task)
+
+        Returns:
+            A dictionary representation of the entity
+        """
+        if isinstance(entity, Project):
+            return {
+                "id": str(entity.id),
+                "name": entity.name,
+                "is_default": entity.is_default,
+                "agent_instructions_template": entity.agent_instructions_template,
+                "created_at": entity.created_at.isoformat(),
+                "updated_at": entity.updated_at.isoformat(),
+            }
+        elif isinstance(entity, TaskList):
+            return {
+                "id": str(entity.id),
+                "name": entity.name,
+                "project_id": str(entity.project_id),
+                "agent_instructions_template": entity.agent_instructions_template,
+                "created_at": entity.created_at.isoformat(),
+                "updated_at": entity.updated_at.isoformat(),
+            }
+        elif isinstance(entity, Task):
+            return {
+                "id": str(entity.id),
+                "task_list_id": str(entity.task_list_id),
+                "title": entity.title,
+                "description": entity.description,
+                "status": entity.status.value,
+                "dependencies": [
+                    {"task_id": str(dep.task_id), "task_list_id": str(dep.task_list_id)}
+                    for dep in entity.dependencies
+                ],
+                "exit_criteria": [
+                    {"criteria": ec.criteria, "status": ec.status.value, "comment": ec.comment}
+                    for ec in entity.exit_criteria
+                ],
+                "priority": entity.priority.value,
+                "notes": [
+                    {"content": note.content, "timestamp": note.timestamp.isoformat()}
+                    for note in entity.notes
+                ],
+                "created_at": entity.created_at.isoformat(),
+                "updated_at": entity.updated_at.isoformat(),
+                "research_notes": (
+                    [
+                        {"content": note.content, "timestamp": note.timestamp.isoformat()}
+                        for note in entity.research_notes
+                    ]
+                    if entity.research_notes
+                    else None
+                ),
+                "action_plan": (
+                    [
+                        {"sequence": item.sequence, "content": item.content}
+                        for item in entity.action_plan
+                    ]
+                    if entity.action_plan
+                    else None
+                ),
+                "execution_notes": (
+                    [
+                        {"content": note.content, "timestamp": note.timestamp.isoformat()}
+                        for note in entity.execution_notes
+                    ]
+                    if entity.execution_notes
+                    else None
+                ),
+                "agent_instructions_template": entity.agent_instructions_template,
+                "tags": entity.tags,
+            }
+        else:
+            raise self.codec_error(f"Unknown entity type: {type(entity)}")
+
+    def _deserialize_project(self, data: dict) -> Project:
+        """Deserialize a project from a JSON dictionary.
+
+        Args:
+            data: The dictionary representation of the project
+
+        Returns:
+            A Project instance
+        """
+        return Project(
+            id=UUID(data["id"]),
+            name=data["name"],
+            is_default=data["is_default"],
+            agent_instructions_template=data.get("agent_instructions_template"),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+        )
+
+    def _deserialize_task_list(self, data: dict) -> TaskList:
+        """Deserialize a task list from a JSON dictionary.
+
+        Args:
+            data: The dictionary representation of the task list
+
+        Returns:
+            A TaskList instance
+        """
+        return TaskList(
+            id=UUID(data["id"]),
+            name=data["name"],
+            project_id=UUID(data["project_id"]),
+            agent_instructions_template=data.get("agent_instructions_template"),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+        )
+
+    def _deserialize_task(self, data: dict) -> Task:
+        """Deserialize a task from a JSON dictionary.
+
+        Args:
+            data: The dictionary representation of the task
+
+        Returns:
+            A Task instance
+        """
+        return Task(
+            id=UUID(data["id"]),
+            task_list_id=UUID(data["task_list_id"]),
+            title=data["title"],
+            description=data["description"],
+            status=Status(data["status"]),
+            dependencies=[
+                Dependency(task_id=UUID(dep["task_id"]), task_list_id=UUID(dep["task_list_id"]))
+                for dep in data["dependencies"]
+            ],
+            exit_criteria=[
+                ExitCriteria(
+                    criteria=ec["criteria"],
+                    status=ExitCriteriaStatus(ec["status"]),
+                    comment=ec.get("comment"),
+                )
+                for ec in data["exit_criteria"]
+            ],
+            priority=Priority(data["priority"]),
+            notes=[
+                Note(content=note["content"], timestamp=datetime.fromisoformat(note["timestamp"]))
+                for note in data["notes"]
+            ],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            research_notes=(
+                [
+                    Note(
+                        content=note["content"], timestamp=datetime.fromisoformat(note["timestamp"])
+                    )
+                    for note in data["research_notes"]
+                ]
+                if data.get("research_notes")
+                else None
+            ),
+            action_plan=(
+                [
+                    ActionPlanItem(sequence=item["sequence"], content=item["content"])
+                    for item in data["action_plan"]
+                ]
+                if data.get("action_plan")
+                else None
+            ),
+            execution_notes=(
+                [
+                    Note(
+                        content=note["content"], timestamp=datetime.fromisoformat(note["timestamp"])
+                    )
+                    for note in data["execution_notes"]
+                ]
+                if data.get("execution_notes")
+                else None
+            ),
+            agent_instructions_template=data.get("agent_instructions_template"),
+            tags=data.get("tags", []),
+        )
+
+    def _copy_entity(self, entity: Any) -> Any:
+        """Copy an entity so callers cannot mutate a stored instance.
+
+        Projects and task lists only hold immutable values, so a shallow copy is
+        enough. Tasks also get copies of their lists and list items.
+        """
+        if not isinstance(entity, Task):
+            return copy.copy(entity)
+
+        task = copy.copy(entity)
+        task.dependencies = [copy.copy(dep) for dep in entity.dependencies]
+        task.exit_criteria = [copy.copy(ec) for ec in entity.exit_criteria]
+        task.notes = [copy.copy(note) for note in entity.notes]
+        if entity.research_notes is not None:
+            task.research_notes = [copy.copy(note) for note in entity.research_notes]
+        if entity.action_plan is not None:
+            task.action_plan = [copy.copy(item) for item in entity.action_plan]
+        if entity.execution_notes is not None:
+            task.execution_notes = [copy.copy(note) for note in entity.execution_notes]
+        task.tags = list(entity.tags)
+        return task
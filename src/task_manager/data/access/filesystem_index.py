@@ -0,0 +1,312 @@
+"""In-process secondary indexes for the filesystem data store.
+
+This module implements the FilesystemIndex class which keeps lookup tables
+over the entity files written by FilesystemStore. The indexes let scoped
+reads (tasks of one task list, task lists of one project, tasks with a given
+status or tag, tasks depending on a given task) resolve the matching entity
+IDs without scanning and parsing every JSON file in the store.
+
+Indexes maintained:
+- project_id -> task list IDs
+- task_list_id -> task IDs
+- status -> task IDs
+- priority -> task IDs
+- tag -> task IDs
+- dependency graph: dependents of each task and the ready tasks of each task
+  list and status (see DependencyGraph)
+
+The index only stores identifiers. Entities themselves are always read from
+their JSON files so results reflect the current file contents.
+
+It also keeps a generation counter that advances with every task posting
+change, overall and per task list, from which task version tokens are built.
+
+Requirements: 1.2, 1.5
+"""
+
+from typing import Iterable, Optional
+from uuid import UUID, uuid4
+
+from task_manager.data.access.dependency_graph import DependencyGraph
+from task_manager.models.entities import Task, TaskList
+from task_manager.models.enums import Priority, Status
+
+
+class FilesystemIndex:
+    """Secondary indexes over task lists and tasks stored on the filesystem.
+
+    All posting sets are keyed by the indexed value and contain entity IDs.
+    Empty posting sets are removed so the key sets only contain values that
+    are currently in use.
+
+    Attributes:
+        task_list_ids_by_project: Maps project IDs to the IDs of their task lists
+        task_ids_by_task_list: Maps task list IDs to the IDs of their tasks
+        task_ids_by_status: Maps task statuses to the IDs of tasks in that status
+        task_ids_by_priority: Maps task priorities to the IDs of tasks with that priority
+        task_ids_by_tag: Maps tags to the IDs of tasks carrying that tag
+        graph: Dependency graph tracking dependents and ready tasks
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.task_list_ids_by_project: dict[UUID, set[UUID]] = {}
+        self.task_ids_by_task_list: dict[UUID, set[UUID]] = {}
+        self.task_ids_by_status: dict[Status, set[UUID]] = {}
+        self.task_ids_by_priority: dict[Priority, set[UUID]] = {}
+        self.task_ids_by_tag: dict[str, set[UUID]] = {}
+        self.graph = DependencyGraph()
+
+        # Reverse entries used to remove stale postings on update and delete
+        self._task_list_entries: dict[UUID, UUID] = {}
+        self._task_entries: dict[UUID, tuple[UUID, Status, Priority, tuple[str, ...]]] = {}
+
+        # Generation of the last task change, overall and per task list. The
+        # counter is never reset, and the epoch tells indexes apart, so a
+        # version token is not reissued for different contents.
+        self._epoch = uuid4().hex
+        self._generation = 0
+        self._task_list_generations: dict[UUID, int] = {}
+
+    @staticmethod
+    def _add_posting(postings: dict, key, entity_id: UUID) -> None:
+        """Add an entity ID to the posting set for a key."""
+        postings.setdefault(key, set()).add(entity_id)
+
+    @staticmethod
+    def _remove_posting(postings: dict, key, entity_id: UUID) -> None:
+        """Remove an entity ID from the posting set for a key, dropping empty sets."""
+        ids = postings.get(key)
+        if ids is None:
+            return
+        ids.discard(entity_id)
+        if not ids:
+            del postings[key]
+
+    # Task list postings
+
+    def clear_task_lists(self) -> None:
+        """Remove all task list postings."""
+        self.task_list_ids_by_project.clear()
+        self._task_list_entries.clear()
+
+    def add_task_list(self, task_list: TaskList) -> None:
+        """Index a task list, replacing any previous entry for the same ID.
+
+        Args:
+            task_list: The task list to index
+        """
+        self.remove_task_list(task_list.id)
+        self._task_list_entries[task_list.id] = task_list.project_id
+        self._add_posting(self.task_list_ids_by_project, task_list.project_id, task_list.id)
+
+    def remove_task_list(self, task_list_id: UUID) -> None:
+        """Remove a task list from the index if present.
+
+        Args:
+            task_list_id: The UUID of the task list to remove
+        """
+        project_id = self._task_list_entries.pop(task_list_id, None)
+        if project_id is not None:
+            self._remove_posting(self.task_list_ids_by_project, project_id, task_list_id)
+
+    def task_list_ids_for_project(self, project_id: UUID) -> set[UUID]:
+        """Get the IDs of all task lists belonging to a project.
+
+        Args:
+            project_id: The UUID of the project
+
+        Returns:
+            A new set of task list IDs (empty if the project has none)
+        """
+        return set(self.task_list_ids_by_project.get(project_id, ()))
+
+    # Task postings
+
+    def _advance_generation(self, task_list_id: UUID) -> None:
+        """Record a change to the tasks of a task list."""
+        self._generation += 1
+        self._task_list_generations[task_list_id] = self._generation
+
+    def clear_tasks(self) -> None:
+        """Remove all task postings."""
+        for task_list_id in self.task_ids_by_task_list:
+            self._advance_generation(task_list_id)
+        self.task_ids_by_task_list.clear()
+        self.task_ids_by_status.clear()
+        self.task_ids_by_priority.clear()
+        self.task_ids_by_tag.clear()
+        self.graph.clear()
+        self._task_entries.clear()
+
+    def add_task(self, task: Task) -> None:
+        """Index a task, replacing any previous entry for the same ID.
+
+        Args:
+            task: The task to index
+        """
+        self.remove_task(task.id)
+        tags = tuple(task.tags) if task.tags else ()
+        self._task_entries[task.id] = (task.task_list_id, task.status, task.priority, tags)
+        self._add_posting(self.task_ids_by_task_list, task.task_list_id, task.id)
+        self._add_posting(self.task_ids_by_status, task.status, task.id)
+        self._add_posting(self.task_ids_by_priority, task.priority, task.id)
+        for tag in tags:
+            self._add_posting(self.task_ids_by_tag, tag, task.id)
+        self.graph.add_task(task)
+        self._advance_generation(task.task_list_id)
+
+    def remove_task(self, task_id: UUID) -> None:
+        """Remove a task from the index if present.
+
+        Args:
+            task_id: The UUID of the task to remove
+        """
+        entry = self._task_entries.pop(task_id, None)
+        if entry is None:
+            return
+
+        task_list_id, status, priority, tags = entry
+        self._remove_posting(self.task_ids_by_task_list, task_list_id, task_id)
+        self._remove_posting(self.task_ids_by_status, status, task_id)
+        self._remove_posting(self.task_ids_by_priority, priority, task_id)
+        for tag in tags:
+            self._remove_posting(self.task_ids_by_tag, tag, task_id)
+        self.graph.remove_task(task_id)
+        self._advance_generation(task_list_id)
+
+    def tasks_version(self, task_list_id: Optional[UUID] = None) -> str:
+        """Get a token that changes whenever an indexed task is added, updated or removed.
+
+        Args:
+            task_list_id: Optional UUID to restrict the token to one task list.
+                         If None, covers all tasks.
+
+        Returns:
+            An opaque version token
+        """
+        if task_list_id is None:
+            generation = self._generation
+        else:
+            generation = self._task_list_generations.get(task_list_id, 0)
+        return f"{self._epoch}:{generation}"
+
+    def has_task(self, task_id: UUID) -> bool:
+        """Check whether a task is present in the index."""
+        return task_id in self._task_entries
+
+    def all_task_ids(self) -> set[UUID]:
+        """Get the IDs of all indexed tasks."""
+        return set(self._task_entries)
+
+    def task_ids_for_task_list(self, task_list_id: UUID) -> set[UUID]:
+        """Get the IDs of all tasks belonging to a task list.
+
+        Args:
+            task_list_id: The UUID of the task list
+
+        Returns:
+            A new set of task IDs (empty if the task list has none)
+        """
+        return set(self.task_ids_by_task_list.get(task_list_id, ()))
+
+    def dependent_task_ids(self, task_id: UUID) -> set[UUID]:
+        """Get the IDs of all tasks that depend on a task.
+
+        Args:
+            task_id: The UUID of the task depended on
+
+        Returns:
+            A new set of task IDs (empty if no task depends on it)
+        """
+        return self.graph.dependent_task_ids(task_id)
+
+    def task_ids_for_statuses(self, statuses: Iterable[Status]) -> set[UUID]:
+        """Get the IDs of all tasks in any of the given statuses.
+
+        Args:
+            statuses: Statuses to match
+
+        Returns:
+            A new set containing the union of the status postings
+        """
+        result: set[UUID] = set()
+        for status in statuses:
+            result |= self.task_ids_by_status.get(status, set())
+        return result
+
+    def task_ids_for_priorities(self, priorities: Iterable[Priority]) -> set[UUID]:
+        """Get the IDs of all tasks with any of the given priorities.
+
+        Args:
+            priorities: Priorities to match
+
+        Returns:
+            A new set containing the union of the priority postings
+        """
+        result: set[UUID] = set()
+        for priority in priorities:
+            result |= self.task_ids_by_priority.get(priority, set())
+        return result
+
+    def task_ids_for_tags(self, tags: Iterable[str]) -> set[UUID]:
+        """Get the IDs of all tasks carrying at least one of the given tags.
+
+        Args:
+            tags: Tags to match
+
+        Returns:
+            A new set containing the union of the tag postings
+        """
+        result: set[UUID] = set()
+        for tag in tags:
+            result |= self.task_ids_by_tag.get(tag, set())
+        return result
+
+    def matching_task_ids(
+        self,
+        statuses: Optional[Iterable[Status]] = None,
+        priorities: Optional[Iterable[Priority]] = None,
+        tags: Optional[Iterable[str]] = None,
+        task_list_ids: Optional[Iterable[UUID]] = None,
+    ) -> set[UUID]:
+        """Get the IDs of all tasks matching every given filter.
+
+        Each filter matches tasks having any of its values. The posting unions
+        are intersected smallest first, and filters that are None are ignored.
+
+        Args:
+            statuses: Statuses to match
+            priorities: Priorities to match
+            tags: Tags to match
+            task_list_ids: Task lists the tasks must belong to
+
+        Returns:
+            A new set of matching task IDs (all task IDs if no filter is given)
+        """
+        candidates = []
+        if statuses is not None:
+            candidates.append(self.task_ids_for_statuses(statuses))
+        if priorities is not None:
+            candidates.append(self.task_ids_for_priorities(priorities))
+        if tags is not None:
+            candidates.append(self.task_ids_for_tags(tags))
+        if task_list_ids is not None:
+            task_ids: set[UUID] = set()
+            for task_list_id in task_list_ids:
+                task_ids |= self.task_ids_by_task_list.get(task_list_id, set())
+            candidates.append(task_ids)
+
+        if not candidates:
+            return self.all_task_ids()
+
+        candidates.sort(key=len)
+        result = candidates[0]
+        for task_ids in candidates[1:]:
+            result &= task_ids
+        return result
+
+    def task_list_id_for_task(self, task_id: UUID) -> Optional[UUID]:
+        """Get the task list ID recorded for a task, or None if not indexed."""
+        entry = self._task_entries.get(task_id)
+        return entry[0] if entry is not None else None
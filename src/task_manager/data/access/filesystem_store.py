@@ -20,7 +20,11 @@ Features:
 - Atomic file writes using temp files and rename
 - Path validation and sanitization to prevent directory traversal
 - File locking for concurrent access safety (future enhancement)
-- Direct store access without caching
+- In-process secondary indexes for scoped reads (see filesystem_index.py),
+  revalidated against directory modification times so that writes from other
+  processes are picked up
+- Write-through LRU cache of deserialized entities (see entity_cache.py),
+  validated against each file's inode, mtime and size on every read
 
 Requirements: 1.2, 1.4, 1.5
 """
@@ -29,22 +33,33 @@ import json
 import os
 import pathlib
 import tempfile
+import threading
 from datetime import datetime
-from typing import Any, Optional
+from fnmatch import fnmatchcase
+from itertools import islice
+from typing import Any, Callable, Iterator, Optional
 from uuid import UUID
 
-from task_manager.data.delegation.data_store import DataStore
+from task_manager.data.access.entity_cache import (
+    EntityCache,
+    FileSignature,
+    file_signature,
+)
+from task_manager.data.access.entity_codec import EntityCodec
+from task_manager.data.access.filesystem_index import FilesystemIndex
+from task_manager.data.delegation.data_store import (
+    ITER_TASKS_BATCH_SIZE,
+    DataStore,
+    check_batch_size,
+)
 from task_manager.models.entities import (
     DEFAULT_PROJECTS,
-    ActionPlanItem,
-    Dependency,
-    ExitCriteria,
-    Note,
     Project,
+    SearchCriteria,
     Task,
     TaskList,
 )
-from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+from task_manager.models.enums import ExitCriteriaStatus, Status
 
 
 class FilesystemStoreError(Exception):
@@ -53,28 +68,54 @@ class FilesystemStoreError(Exception):
     pass
 
 
-class FilesystemStore(DataStore):
+# Entity files in a directory. Unlike shell globs, pathlib also matches hidden
+# files, so the pattern excludes the ".tmp_" files of in-progress atomic writes.
+ENTITY_FILE_PATTERN = "[!.]*.json"
+
+
+class FilesystemStore(EntityCodec, DataStore):
     """Filesystem-based implementation of the DataStore interface.
 
     This implementation stores entities as JSON files in a directory structure.
-    All operations are performed directly on the filesystem without caching.
+    Entities are always read from their files. Secondary indexes over entity IDs
+    (task list -> tasks, project -> task lists, status and tag postings) are kept
+    in memory so scoped reads only open the files they return. The index's
+    dependency graph tracks which tasks are ready, so get_ready_tasks() only
+    opens the files of ready tasks.
+
+    Recently used entities are kept in a bounded LRU cache. A cached entity is
+    only returned while its file's stat signature is unchanged, so files
+    rewritten by other processes are re-read. Callers always receive copies and
+    may mutate them freely.
 
     Args:
         base_path: Root directory for storing all data files.
                   Defaults to "/tmp/tasks" if not specified.
+        cache_size: Maximum number of cached entities (0 disables the cache).
 
     Attributes:
         base_path: Root directory path (validated and sanitized)
         projects_dir: Directory for project JSON files
         task_lists_dir: Directory for task list JSON files
         tasks_dir: Directory for task JSON files
+        index: Secondary indexes over task lists and tasks
+        cache: LRU cache of deserialized entities with hit/miss counters
     """
 
-    def __init__(self, base_path: str = "/tmp/tasks"):
+    codec_error = FilesystemStoreError
+
+    # Ready tasks are resolved through the dependency graph of the index
+    supports_ready_task_query = True
+
+    # Default maximum number of cached entities
+    DEFAULT_CACHE_SIZE = 10000
+
+    def __init__(self, base_path: str = "/tmp/tasks", cache_size: int = DEFAULT_CACHE_SIZE):
         """Initialize the filesystem store with validated paths.
 
         Args:
             base_path: Root directory for storing data files.
+            cache_size: Maximum number of cached entities (0 disables the cache).
 
         Raises:
             FilesystemStoreError: If the base path is invalid or cannot be created.
@@ -83,6 +124,16 @@ class FilesystemStore(DataStore):
         self.projects_dir = self.base_path / "projects"
         self.task_lists_dir = self.base_path / "task_lists"
         self.tasks_dir = self.base_path / "tasks"
+        self.index = FilesystemIndex()
+        # Guards the indexes and their mtimes against concurrent rebuilds, since
+        # one store instance is shared by all request handler threads
+        self._index_lock = threading.RLock()
+        self.cache = EntityCache(cache_size)
+
+        # Directory mtimes the index reflects, taken before each scan and kept
+        # across our own writes. A different mtime means the directory was
+        # changed by someone else.
+        self._indexed_mtimes: dict[pathlib.Path, int] = {}
 
     def _validate_and_sanitize_path(self, path: str) -> pathlib.Path:
         """Validate and sanitize a filesystem path.
@@ -155,188 +206,7 @@ class FilesystemStore(DataStore):
         except OSError as e:
             raise FilesystemStoreError(f"Failed to create directory structure: {e}")
 
-    def _serialize_entity(self, entity: Any) -> dict:
-        """Serialize an entity to a JSON-compatible dictionary.
-
-        Args:
-            entity: The entity to serialize (Project, TaskList, or Task)
-
-        Returns:
-            A dictionary representation of the entity
-        """
-        if isinstance(entity, Project):
-            return {
-                "id": str(entity.id),
-                "name": entity.name,
-                "is_default": entity.is_default,
-                "agent_instructions_template": entity.agent_instructions_template,
-                "created_at": entity.created_at.isoformat(),
-                "updated_at": entity.updated_at.isoformat(),
-            }
-        elif isinstance(entity, TaskList):
-            return {
-                "id": str(entity.id),
-                "name": entity.name,
-                "project_id": str(entity.project_id),
-                "agent_instructions_template": entity.agent_instructions_template,
-                "created_at": entity.created_at.isoformat(),
-                "updated_at": entity.updated_at.isoformat(),
-            }
-        elif isinstance(entity, Task):
-            return {
-                "id": str(entity.id),
-                "task_list_id": str(entity.task_list_id),
-                "title": entity.title,
-                "description": entity.description,
-                "status": entity.status.value,
-                "dependencies": [
-                    {"task_id": str(dep.task_id), "task_list_id": str(dep.task_list_id)}
-                    for dep in entity.dependencies
-                ],
-                "exit_criteria": [
-                    {"criteria": ec.criteria, "status": ec.status.value, "comment": ec.comment}
-                    for ec in entity.exit_criteria
-                ],
-                "priority": entity.priority.value,
-                "notes": [
-                    {"content": note.content, "timestamp": note.timestamp.isoformat()}
-                    for note in entity.notes
-                ],
-                "created_at": entity.created_at.isoformat(),
-                "updated_at": entity.updated_at.isoformat(),
-                "research_notes": (
-                    [
-                        {"content": note.content, "timestamp": note.timestamp.isoformat()}
-                        for note in entity.research_notes
-                    ]
-                    if entity.research_notes
-                    else None
-                ),
-                "action_plan": (
-                    [
-                        {"sequence": item.sequence, "content": item.content}
-                        for item in entity.action_plan
-                    ]
-                    if entity.action_plan
-                    else None
-                ),
-                "execution_notes": (
-                    [
-                        {"content": note.content, "timestamp": note.timestamp.isoformat()}
-                        for note in entity.execution_notes
-                    ]
-                    if entity.execution_notes
-                    else None
-                ),
-                "agent_instructions_template": entity.agent_instructions_template,
-                "tags": entity.tags,
-            }
-        else:
-            raise FilesystemStoreError(f"Unknown entity type: {type(entity)}")
-
-    def _deserialize_project(self, data: dict) -> Project:
-        """Deserialize a project from a JSON dictionary.
-
-        Args:
-            data: The dictionary representation of the project
-
-        Returns:
-            A Project instance
-        """
-        return Project(
-            id=UUID(data["id"]),
-            name=data["name"],
-            is_default=data["is_default"],
-            agent_instructions_template=data.get("agent_instructions_template"),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
-        )
-
-    def _deserialize_task_list(self, data: dict) -> TaskList:
-        """Deserialize a task list from a JSON dictionary.
-
-        Args:
-            data: The dictionary representation of the task list
-
-        Returns:
-            A TaskList instance
-        """
-        return TaskList(
-            id=UUID(data["id"]),
-            name=data["name"],
-            project_id=UUID(data["project_id"]),
-            agent_instructions_template=data.get("agent_instructions_template"),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
-        )
-
-    def _deserialize_task(self, data: dict) -> Task:
-        """Deserialize a task from a JSON dictionary.
-
-        Args:
-            data: The dictionary representation of the task
-
-        Returns:
-            A Task instance
-        """
-        return Task(
-            id=UUID(data["id"]),
-            task_list_id=UUID(data["task_list_id"]),
-            title=data["title"],
-            description=data["description"],
-            status=Status(data["status"]),
-            dependencies=[
-                Dependency(task_id=UUID(dep["task_id"]), task_list_id=UUID(dep["task_list_id"]))
-                for dep in data["dependencies"]
-            ],
-            exit_criteria=[
-                ExitCriteria(
-                    criteria=ec["criteria"],
-                    status=ExitCriteriaStatus(ec["status"]),
-                    comment=ec.get("comment"),
-                )
-                for ec in data["exit_criteria"]
-            ],
-            priority=Priority(data["priority"]),
-            notes=[
-                Note(content=note["content"], timestamp=datetime.fromisoformat(note["timestamp"]))
-                for note in data["notes"]
-            ],
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
-            research_notes=(
-                [
-                    Note(
-                        content=note["content"], timestamp=datetime.fromisoformat(note["timestamp"])
-                    )
-                    for note in data["research_notes"]
-                ]
-                if data.get("research_notes")
-                else None
-            ),
-            action_plan=(
-                [
-                    ActionPlanItem(sequence=item["sequence"], content=item["content"])
-                    for item in data["action_plan"]
-                ]
-                if data.get("action_plan")
-                else None
-            ),
-            execution_notes=(
-                [
-                    Note(
-                        content=note["content"], timestamp=datetime.fromisoformat(note["timestamp"])
-                    )
-                    for note in data["execution_notes"]
-                ]
-                if data.get("execution_notes")
-                else None
-            ),
-            agent_instructions_template=data.get("agent_instructions_template"),
-            tags=data.get("tags", []),
-        )
-
-    def _write_json_atomic(self, file_path: pathlib.Path, data: dict) -> None:
+    def _write_json_atomic(self, file_path: pathlib.Path, data: dict) -> Optional[FileSignature]:
         """Write JSON data to a file atomically using temp file and rename.
 
         This method ensures that the file is either fully written or not written at all,
@@ -346,6 +216,11 @@ class FilesystemStore(DataStore):
             file_path: The path to the file to write
             data: The dictionary to serialize as JSON
 
+        Returns:
+            The stat signature of the written file. It is taken from the temp file
+            before the rename (rename preserves inode and mtime), so a concurrent
+            writer replacing the file right after us cannot be mistaken for our write.
+
         Raises:
             FilesystemStoreError: If the file cannot be written
         """
@@ -361,9 +236,13 @@ class FilesystemStore(DataStore):
                 with os.fdopen(temp_fd, "w") as f:
                     json.dump(data, f, indent=2)
 
+                signature = file_signature(pathlib.Path(temp_path))
+
                 # Atomically rename the temp file to the target file
                 # This is atomic on POSIX systems
                 os.replace(temp_path, file_path)
+
+                return signature
             except Exception:
                 # Clean up the temp file if something goes wrong
                 try:
@@ -397,6 +276,165 @@ class FilesystemStore(DataStore):
         except Exception as e:
             raise FilesystemStoreError(f"Failed to read file {file_path}: {e}")
 
+    def _read_entity(self, file_path: pathlib.Path, deserialize: Callable[[dict], Any]) -> Any:
+        """Read an entity file through the entity cache.
+
+        The file is stat'ed before it is read, so if it is replaced between the
+        stat and the read the cached signature is already outdated and the next
+        lookup re-reads the file.
+
+        Args:
+            file_path: The entity's JSON file
+            deserialize: Function converting the JSON dictionary to an entity
+
+        Returns:
+            A copy of the entity, or None if the file doesn't exist
+
+        Raises:
+            FilesystemStoreError: If the file exists but cannot be read or parsed
+        """
+        key = (file_path.parent.name, file_path.stem)
+        signature = file_signature(file_path)
+        if signature is None:
+            self.cache.invalidate(key)
+            return None
+
+        entity = self.cache.get(key, signature)
+        if entity is None:
+            data = self._read_json(file_path)
+            if not data:
+                return None
+            entity = deserialize(data)
+            self.cache.put(key, signature, entity)
+
+        return self._copy_entity(entity)
+
+    def _write_entity(self, file_path: pathlib.Path, entity: Any) -> None:
+        """Serialize and atomically write an entity, updating the cache.
+
+        Args:
+            file_path: The entity's JSON file
+            entity: The entity to persist
+
+        Raises:
+            FilesystemStoreError: If the file cannot be written
+        """
+        key = (file_path.parent.name, file_path.stem)
+        data = self._serialize_entity(entity)
+        try:
+            signature = self._write_json_atomic(file_path, data)
+        except FilesystemStoreError:
+            self.cache.invalidate(key)
+            raise
+        self.cache.put(key, signature, self._copy_entity(entity))
+
+    def _delete_entity_file(self, file_path: pathlib.Path, entity_name: str) -> None:
+        """Delete an entity file and drop it from the cache.
+
+        Args:
+            file_path: The entity's JSON file
+            entity_name: Human-readable entity type used in error messages
+
+        Raises:
+            FilesystemStoreError: If the file cannot be deleted
+        """
+        self.cache.invalidate((file_path.parent.name, file_path.stem))
+        try:
+            file_path.unlink()
+        except OSError as e:
+            raise FilesystemStoreError(f"Failed to delete {entity_name} file: {e}")
+
+    def cache_stats(self) -> dict[str, int]:
+        """Get entity cache statistics.
+
+        Returns:
+            Dictionary with size, max_size, hits, misses and evictions
+        """
+        return self.cache.stats()
+
+    def _directory_mtime(self, directory: pathlib.Path) -> Optional[int]:
+        """Get the modification time of a directory in nanoseconds.
+
+        Args:
+            directory: The directory to stat
+
+        Returns:
+            The directory mtime, or None if the directory does not exist
+        """
+        try:
+            return directory.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _record_indexed_mtime(self, directory: pathlib.Path, mtime: Optional[int]) -> None:
+        """Record the directory mtime the index reflects, or forget it if None."""
+        if mtime is None:
+            self._indexed_mtimes.pop(directory, None)
+        else:
+            self._indexed_mtimes[directory] = mtime
+
+    def _mark_index_current(
+        self, directory: pathlib.Path, mtime_before_write: Optional[int]
+    ) -> None:
+        """Record the directory mtime after the index was updated for our own write.
+
+        The index is only marked current if the directory was unchanged between
+        the last synchronization and the write, i.e. mtime_before_write (taken
+        just before writing) is still the indexed mtime. Otherwise another
+        process wrote to the directory in the meantime and the indexed mtime is
+        dropped, so the next synchronization rebuilds the index.
+
+        Args:
+            directory: The directory that was written to
+            mtime_before_write: The directory mtime observed just before the write
+        """
+        if mtime_before_write is None or self._indexed_mtimes.get(directory) != mtime_before_write:
+            self._indexed_mtimes.pop(directory, None)
+            return
+        self._record_indexed_mtime(directory, self._directory_mtime(directory))
+
+    def _sync_task_list_index(self) -> None:
+        """Rebuild the task list index if the task_lists directory changed.
+
+        Raises:
+            FilesystemStoreError: If a task list file cannot be read
+        """
+        # The mtime is taken before scanning, so a file written during the scan
+        # leaves the directory newer than the index and triggers another rebuild
+        mtime = self._directory_mtime(self.task_lists_dir)
+        if mtime is not None and self._indexed_mtimes.get(self.task_lists_dir) == mtime:
+            return
+
+        self.index.clear_task_lists()
+        if self.task_lists_dir.exists():
+            for file_path in self.task_lists_dir.glob(ENTITY_FILE_PATTERN):
+                task_list = self._read_entity(file_path, self._deserialize_task_list)
+                if task_list:
+                    self.index.add_task_list(task_list)
+
+        self._record_indexed_mtime(self.task_lists_dir, mtime)
+
+    def _sync_task_index(self) -> None:
+        """Rebuild the task index if the tasks directory changed.
+
+        Raises:
+            FilesystemStoreError: If a task file cannot be read
+        """
+        # The mtime is taken before scanning, so a file written during the scan
+        # leaves the directory newer than the index and triggers another rebuild
+        mtime = self._directory_mtime(self.tasks_dir)
+        if mtime is not None and self._indexed_mtimes.get(self.tasks_dir) == mtime:
+            return
+
+        self.index.clear_tasks()
+        if self.tasks_dir.exists():
+            for file_path in self.tasks_dir.glob(ENTITY_FILE_PATTERN):
+                task = self._read_entity(file_path, self._deserialize_task)
+                if task:
+                    self.index.add_task(task)
+
+        self._record_indexed_mtime(self.tasks_dir, mtime)
+
     def initialize(self) -> None:
         """Initialize the filesystem store and create default projects.
 
@@ -404,6 +442,7 @@ class FilesystemStore(DataStore):
         1. Creates the directory structure (projects/, task_lists/, tasks/)
         2. Creates the "Chore" default project if it doesn't exist
         3. Creates the "Repeatable" default project if it doesn't exist
+        4. Builds the in-memory secondary indexes from the existing files
 
         This method is idempotent - calling it multiple times is safe.
 
@@ -434,6 +473,11 @@ class FilesystemStore(DataStore):
             )
             self.create_project(project)
 
+        # Build secondary indexes
+        with self._index_lock:
+            self._sync_task_list_index()
+            self._sync_task_index()
+
     def create_project(self, project: Project) -> Project:
         """Persist a new project to the filesystem.
 
@@ -446,8 +490,7 @@ class FilesystemStore(DataStore):
 
         # Write the project to a JSON file
         file_path = self.projects_dir / f"{project.id}.json"
-        data = self._serialize_entity(project)
-        self._write_json_atomic(file_path, data)
+        self._write_entity(file_path, project)
 
         return project
 
@@ -457,12 +500,7 @@ class FilesystemStore(DataStore):
         Requirements: 3.2
         """
         file_path = self.projects_dir / f"{project_id}.json"
-        data = self._read_json(file_path)
-
-        if data is None:
-            return None
-
-        return self._deserialize_project(data)
+        return self._read_entity(file_path, self._deserialize_project)
 
     def list_projects(self) -> list[Project]:
         """Retrieve all projects including default projects.
@@ -475,10 +513,10 @@ class FilesystemStore(DataStore):
         if not self.projects_dir.exists():
             return projects
 
-        for file_path in self.projects_dir.glob("*.json"):
-            data = self._read_json(file_path)
-            if data:
-                projects.append(self._deserialize_project(data))
+        for file_path in self.projects_dir.glob(ENTITY_FILE_PATTERN):
+            project = self._read_entity(file_path, self._deserialize_project)
+            if project:
+                projects.append(project)
 
         return projects
 
@@ -497,8 +535,7 @@ class FilesystemStore(DataStore):
         project.updated_at = datetime.now()
 
         # Write the updated project
-        data = self._serialize_entity(project)
-        self._write_json_atomic(file_path, data)
+        self._write_entity(file_path, project)
 
         return project
 
@@ -524,10 +561,7 @@ class FilesystemStore(DataStore):
             self.delete_task_list(task_list.id)
 
         # Delete the project file
-        try:
-            file_path.unlink()
-        except OSError as e:
-            raise FilesystemStoreError(f"Failed to delete project file: {e}")
+        self._delete_entity_file(file_path, "project")
 
     def create_task_list(self, task_list: TaskList) -> TaskList:
         """Persist a new task list to the filesystem.
@@ -539,10 +573,16 @@ class FilesystemStore(DataStore):
         if project is None:
             raise ValueError(f"Project with id '{task_list.project_id}' does not exist")
 
-        # Write the task list to a JSON file
-        file_path = self.task_lists_dir / f"{task_list.id}.json"
-        data = self._serialize_entity(task_list)
-        self._write_json_atomic(file_path, data)
+        with self._index_lock:
+            self._sync_task_list_index()
+            mtime = self._directory_mtime(self.task_lists_dir)
+
+            # Write the task list to a JSON file
+            file_path = self.task_lists_dir / f"{task_list.id}.json"
+            self._write_entity(file_path, task_list)
+
+            self.index.add_task_list(task_list)
+            self._mark_index_current(self.task_lists_dir, mtime)
 
         return task_list
 
@@ -552,26 +592,33 @@ class FilesystemStore(DataStore):
         Requirements: 4.6
         """
         file_path = self.task_lists_dir / f"{task_list_id}.json"
-        data = self._read_json(file_path)
-
-        if data is None:
-            return None
-
-        return self._deserialize_task_list(data)
+        return self._read_entity(file_path, self._deserialize_task_list)
 
     def list_task_lists(self, project_id: Optional[UUID] = None) -> list[TaskList]:
-        """Retrieve task lists, optionally filtered by project."""
+        """Retrieve task lists, optionally filtered by project.
+
+        When filtering by project, only the files of the project's task lists
+        (as resolved through the index) are read.
+        """
         task_lists = []
 
         # Scan all JSON files in the task_lists directory
         if not self.task_lists_dir.exists():
             return task_lists
 
-        for file_path in self.task_lists_dir.glob("*.json"):
-            data = self._read_json(file_path)
-            if data:
-                task_list = self._deserialize_task_list(data)
+        if project_id is not None:
+            with self._index_lock:
+                self._sync_task_list_index()
+                task_list_ids = self.index.task_list_ids_for_project(project_id)
+            for task_list_id in task_list_ids:
+                task_list = self.get_task_list(task_list_id)
+                if task_list is not None and task_list.project_id == project_id:
+                    task_lists.append(task_list)
+            return task_lists
 
+        for file_path in self.task_lists_dir.glob(ENTITY_FILE_PATTERN):
+            task_list = self._read_entity(file_path, self._deserialize_task_list)
+            if task_list:
                 # Filter by project_id if specified
                 if project_id is None or task_list.project_id == project_id:
                     task_lists.append(task_list)
@@ -589,12 +636,18 @@ class FilesystemStore(DataStore):
         if not file_path.exists():
             raise ValueError(f"Task list with id '{task_list.id}' does not exist")
 
-        # Update the updated_at timestamp
-        task_list.updated_at = datetime.now()
+        with self._index_lock:
+            self._sync_task_list_index()
+            mtime = self._directory_mtime(self.task_lists_dir)
+
+            # Update the updated_at timestamp
+            task_list.updated_at = datetime.now()
+
+            # Write the updated task list
+            self._write_entity(file_path, task_list)
 
-        # Write the updated task list
-        data = self._serialize_entity(task_list)
-        self._write_json_atomic(file_path, data)
+            self.index.add_task_list(task_list)
+            self._mark_index_current(self.task_lists_dir, mtime)
 
         return task_list
 
@@ -614,11 +667,15 @@ class FilesystemStore(DataStore):
         for task in tasks:
             self.delete_task(task.id)
 
-        # Delete the task list file
-        try:
-            file_path.unlink()
-        except OSError as e:
-            raise FilesystemStoreError(f"Failed to delete task list file: {e}")
+        with self._index_lock:
+            self._sync_task_list_index()
+            mtime = self._directory_mtime(self.task_lists_dir)
+
+            # Delete the task list file
+            self._delete_entity_file(file_path, "task list")
+
+            self.index.remove_task_list(task_list_id)
+            self._mark_index_current(self.task_lists_dir, mtime)
 
     def reset_task_list(self, task_list_id: UUID) -> None:
         """Reset a repeatable task list to its initial state.
@@ -660,45 +717,188 @@ class FilesystemStore(DataStore):
         if not task.description or not task.description.strip():
             raise ValueError("Task description is required")
 
-        # Write the task to a JSON file
-        file_path = self.tasks_dir / f"{task.id}.json"
-        data = self._serialize_entity(task)
-        self._write_json_atomic(file_path, data)
+        with self._index_lock:
+            self._sync_task_index()
+            mtime = self._directory_mtime(self.tasks_dir)
+
+            # Write the task to a JSON file
+            file_path = self.tasks_dir / f"{task.id}.json"
+            self._write_entity(file_path, task)
+
+            self.index.add_task(task)
+            self._mark_index_current(self.tasks_dir, mtime)
 
         return task
 
+    def create_tasks(self, tasks: list[Task]) -> list[Task]:
+        """Persist several new tasks with one index synchronization.
+
+        Each task list is looked up once. The task files are written under a
+        single acquisition of the index lock; if a write fails, the files
+        already written are removed again so that no task is created.
+        """
+        for task_list_id in {task.task_list_id for task in tasks}:
+            if self.get_task_list(task_list_id) is None:
+                raise ValueError(f"Task list with id '{task_list_id}' does not exist")
+
+        # Validate required fields (exit_criteria is validated in Task.__post_init__)
+        for task in tasks:
+            if not task.title or not task.title.strip():
+                raise ValueError("Task title is required")
+            if not task.description or not task.description.strip():
+                raise ValueError("Task description is required")
+
+        with self._index_lock:
+            self._sync_task_index()
+            mtime = self._directory_mtime(self.tasks_dir)
+
+            originals: dict[pathlib.Path, Optional[Task]] = {}
+            try:
+                for task in tasks:
+                    file_path = self.tasks_dir / f"{task.id}.json"
+                    originals[file_path] = None
+                    self._write_entity(file_path, task)
+            except FilesystemStoreError:
+                self._restore_task_files(originals, mtime)
+                raise
+
+            for task in tasks:
+                self.index.add_task(task)
+            self._mark_index_current(self.tasks_dir, mtime)
+
+        return tasks
+
+    def _restore_task_files(
+        self, originals: dict[pathlib.Path, Optional[Task]], mtime_before_write: Optional[int]
+    ) -> None:
+        """Undo a failed batched write by restoring the task files it touched.
+
+        The index is not updated until a batch has been written, so it still
+        describes the original files. It is marked current only if all of them
+        could be restored; otherwise the next synchronization rebuilds it.
+
+        Args:
+            originals: The original task of each file written or deleted by the
+                batch, or None for files the batch created
+            mtime_before_write: The tasks directory mtime observed before the batch
+        """
+        restored = True
+        for file_path, original in originals.items():
+            try:
+                if original is None:
+                    if file_path.exists():
+                        self._delete_entity_file(file_path, "task")
+                else:
+                    self._write_entity(file_path, original)
+            except FilesystemStoreError:
+                restored = False
+
+        if restored:
+            self._mark_index_current(self.tasks_dir, mtime_before_write)
+        else:
+            self._record_indexed_mtime(self.tasks_dir, None)
+
     def get_task(self, task_id: UUID) -> Optional[Task]:
         """Retrieve a task by its unique identifier.
 
         Requirements: 5.6
         """
         file_path = self.tasks_dir / f"{task_id}.json"
-        data = self._read_json(file_path)
+        return self._read_entity(file_path, self._deserialize_task)
 
-        if data is None:
-            return None
+    def get_dependents(self, task_id: UUID) -> list[Task]:
+        """Retrieve the tasks that depend on a task.
 
-        return self._deserialize_task(data)
+        The dependents are resolved through the dependency index, so only
+        their files are read.
+        """
+        with self._index_lock:
+            self._sync_task_index()
+            dependent_ids = self.index.dependent_task_ids(task_id)
+        return [
+            task
+            for task in self.get_tasks(dependent_ids)
+            if any(dep.task_id == task_id for dep in task.dependencies)
+        ]
 
     def list_tasks(self, task_list_id: Optional[UUID] = None) -> list[Task]:
-        """Retrieve tasks, optionally filtered by task list."""
+        """Retrieve tasks, optionally filtered by task list.
+
+        When filtering by task list, only the files of the task list's tasks
+        (as resolved through the index) are read.
+        """
         tasks = []
 
         # Scan all JSON files in the tasks directory
         if not self.tasks_dir.exists():
             return tasks
 
-        for file_path in self.tasks_dir.glob("*.json"):
-            data = self._read_json(file_path)
-            if data:
-                task = self._deserialize_task(data)
+        if task_list_id is not None:
+            with self._index_lock:
+                self._sync_task_index()
+                task_ids = self.index.task_ids_for_task_list(task_list_id)
+            for task_id in task_ids:
+                task = self.get_task(task_id)
+                if task is not None and task.task_list_id == task_list_id:
+                    tasks.append(task)
+            return tasks
 
+        for file_path in self.tasks_dir.glob(ENTITY_FILE_PATTERN):
+            task = self._read_entity(file_path, self._deserialize_task)
+            if task:
                 # Filter by task_list_id if specified
                 if task_list_id is None or task.task_list_id == task_list_id:
                     tasks.append(task)
 
         return tasks
 
+    def iter_tasks(
+        self, task_list_id: Optional[UUID] = None, batch_size: int = ITER_TASKS_BATCH_SIZE
+    ) -> Iterator[Task]:
+        """Iterate over tasks, scanning the tasks directory batch_size entries at a time.
+
+        The directory is read incrementally with os.scandir() rather than
+        listed up front, and each task file is read when its batch is reached.
+        When filtering by task list, the task's files are resolved through the
+        index as in list_tasks().
+        """
+        check_batch_size(batch_size)
+        if not self.tasks_dir.exists():
+            return
+
+        if task_list_id is not None:
+            with self._index_lock:
+                self._sync_task_index()
+                task_ids = list(self.index.task_ids_for_task_list(task_list_id))
+            for task_id in task_ids:
+                task = self.get_task(task_id)
+                if task is not None and task.task_list_id == task_list_id:
+                    yield task
+            return
+
+        with os.scandir(self.tasks_dir) as entries:
+            while True:
+                batch = list(islice(entries, batch_size))
+                if not batch:
+                    return
+                for entry in batch:
+                    if not fnmatchcase(entry.name, ENTITY_FILE_PATTERN):
+                        continue
+                    task = self._read_entity(pathlib.Path(entry.path), self._deserialize_task)
+                    if task:
+                        yield task
+
+    def get_tasks_version(self, task_list_id: Optional[UUID] = None) -> str:
+        """Retrieve a token that changes whenever tasks are created, modified or deleted.
+
+        The token is the index generation of the tasks (see FilesystemIndex),
+        so no task file is read unless another process changed the tasks
+        directory and the index is rebuilt.
+        """
+        with self._index_lock:
+            self._sync_task_index()
+            return self.index.tasks_version(task_list_id)
+
     def update_task(self, task: Task) -> Task:
         """Update an existing task in the filesystem.
 
@@ -710,12 +910,18 @@ class FilesystemStore(DataStore):
         if not file_path.exists():
             raise ValueError(f"Task with id '{task.id}' does not exist")
 
-        # Update the updated_at timestamp
-        task.updated_at = datetime.now()
+        with self._index_lock:
+            self._sync_task_index()
+            mtime = self._directory_mtime(self.tasks_dir)
+
+            # Update the updated_at timestamp
+            task.updated_at = datetime.now()
 
-        # Write the updated task
-        data = self._serialize_entity(task)
-        self._write_json_atomic(file_path, data)
+            # Write the updated task
+            self._write_entity(file_path, task)
+
+            self.index.add_task(task)
+            self._mark_index_current(self.tasks_dir, mtime)
 
         return task
 
@@ -735,68 +941,204 @@ class FilesystemStore(DataStore):
         if task is None:
             raise ValueError(f"Task with id '{task_id}' does not exist")
 
-        # Remove this task from the dependencies of all other tasks
-        all_tasks = self.list_tasks()
-        for other_task in all_tasks:
-            # Check if this task depends on the task being deleted
-            original_deps = other_task.dependencies
-            updated_deps = [dep for dep in other_task.dependencies if dep.task_id != task_id]
+        # Remove this task from the dependencies of the tasks depending on it
+        for other_task in self.get_dependents(task_id):
+            other_task.dependencies = [
+                dep for dep in other_task.dependencies if dep.task_id != task_id
+            ]
+            self.update_task(other_task)
 
-            # If dependencies changed, update the task
-            if len(updated_deps) != len(original_deps):
-                other_task.dependencies = updated_deps
-                self.update_task(other_task)
+        with self._index_lock:
+            self._sync_task_index()
+            mtime = self._directory_mtime(self.tasks_dir)
 
-        # Delete the task file
-        try:
-            file_path.unlink()
-        except OSError as e:
-            raise FilesystemStoreError(f"Failed to delete task file: {e}")
+            # Delete the task file
+            self._delete_entity_file(file_path, "task")
+
+            self.index.remove_task(task_id)
+            self._mark_index_current(self.tasks_dir, mtime)
+
+    def update_tasks(self, tasks: list[Task]) -> list[Task]:
+        """Update several existing tasks with one index synchronization.
+
+        The task files are written under a single acquisition of the index
+        lock; if a write fails, the files already written are restored to
+        their previous contents so that no task is updated.
+        """
+        with self._index_lock:
+            originals: dict[pathlib.Path, Optional[Task]] = {}
+            for task in tasks:
+                file_path = self.tasks_dir / f"{task.id}.json"
+                original = self._read_entity(file_path, self._deserialize_task)
+                if original is None:
+                    raise ValueError(f"Task with id '{task.id}' does not exist")
+                originals[file_path] = original
+
+            self._sync_task_index()
+            mtime = self._directory_mtime(self.tasks_dir)
+
+            now = datetime.now()
+            written: dict[pathlib.Path, Optional[Task]] = {}
+            try:
+                for task in tasks:
+                    file_path = self.tasks_dir / f"{task.id}.json"
+                    written[file_path] = originals[file_path]
+                    task.updated_at = now
+                    self._write_entity(file_path, task)
+            except FilesystemStoreError:
+                self._restore_task_files(written, mtime)
+                raise
+
+            for task in tasks:
+                self.index.add_task(task)
+            self._mark_index_current(self.tasks_dir, mtime)
+
+        return tasks
 
-    def get_ready_tasks(self, scope_type: str, scope_id: UUID) -> list[Task]:
+    def delete_tasks(self, task_ids: list[UUID]) -> None:
+        """Remove several tasks and update the tasks depending on them together.
+
+        The dependents are written and the task files deleted under a single
+        acquisition of the index lock; if a write or delete fails, every file
+        already changed is restored so that no task is deleted.
+        """
+        ids = list(dict.fromkeys(task_ids))
+        with self._index_lock:
+            originals: dict[pathlib.Path, Optional[Task]] = {}
+            for task_id in ids:
+                file_path = self.tasks_dir / f"{task_id}.json"
+                original = self._read_entity(file_path, self._deserialize_task)
+                if original is None:
+                    raise ValueError(f"Task with id '{task_id}' does not exist")
+                originals[file_path] = original
+
+            self._sync_task_index()
+            mtime = self._directory_mtime(self.tasks_dir)
+
+            deleted = set(ids)
+            dependent_ids: set[UUID] = set()
+            for task_id in ids:
+                dependent_ids |= self.index.dependent_task_ids(task_id)
+
+            now = datetime.now()
+            dependents = []
+            for other_task in self.get_tasks(list(dependent_ids - deleted)):
+                original = self._copy_entity(other_task)
+                other_task.dependencies = [
+                    dep for dep in other_task.dependencies if dep.task_id not in deleted
+                ]
+                if len(other_task.dependencies) != len(original.dependencies):
+                    other_task.updated_at = now
+                    dependents.append((original, other_task))
+
+            changed: dict[pathlib.Path, Optional[Task]] = {}
+            try:
+                for original, other_task in dependents:
+                    file_path = self.tasks_dir / f"{other_task.id}.json"
+                    changed[file_path] = original
+                    self._write_entity(file_path, other_task)
+                for task_id in ids:
+                    file_path = self.tasks_dir / f"{task_id}.json"
+                    changed[file_path] = originals[file_path]
+                    self._delete_entity_file(file_path, "task")
+            except FilesystemStoreError:
+                self._restore_task_files(changed, mtime)
+                raise
+
+            for _, other_task in dependents:
+                self.index.add_task(other_task)
+            for task_id in ids:
+                self.index.remove_task(task_id)
+            self._mark_index_current(self.tasks_dir, mtime)
+
+    def get_ready_tasks(
+        self, scope_type: str, scope_id: UUID, statuses: Optional[list[Status]] = None
+    ) -> list[Task]:
         """Retrieve tasks that are ready for execution.
 
+        The ready tasks are read from the dependency graph's ready postings,
+        so only the files of ready tasks in the requested statuses are read.
+
         Requirements: 9.1, 9.2, 9.3
         """
         # Validate scope_type
         if scope_type not in ["project", "task_list"]:
             raise ValueError(f"Invalid scope_type: {scope_type}. Must be 'project' or 'task_list'")
 
-        # Get tasks based on scope
         if scope_type == "project":
-            # Get all task lists for the project
-            project = self.get_project(scope_id)
-            if project is None:
+            if self.get_project(scope_id) is None:
                 raise ValueError(f"Project with id '{scope_id}' does not exist")
+        elif self.get_task_list(scope_id) is None:
+            raise ValueError(f"Task list with id '{scope_id}' does not exist")
+
+        with self._index_lock:
+            self._sync_task_list_index()
+            self._sync_task_index()
+            if scope_type == "project":
+                task_list_ids = self.index.task_list_ids_for_project(scope_id)
+            else:
+                task_list_ids = {scope_id}
+            ready_ids = self.index.graph.ready_task_ids(task_list_ids, statuses)
 
-            task_lists = self.list_task_lists(scope_id)
-            tasks = []
-            for task_list in task_lists:
-                tasks.extend(self.list_tasks(task_list.id))
-        else:  # task_list
-            # Get tasks for the task list
-            task_list = self.get_task_list(scope_id)
-            if task_list is None:
-                raise ValueError(f"Task list with id '{scope_id}' does not exist")
+        # Files may have changed since the index was read
+        return [
+            task
+            for task in self.get_tasks(ready_ids)
+            if statuses is None or task.status in statuses
+        ]
 
-            tasks = self.list_tasks(scope_id)
+    def count_tasks(self, criteria: SearchCriteria) -> int:
+        """Count the tasks matching search criteria, ignoring pagination and sorting.
 
-        # Filter for ready tasks
-        ready_tasks = []
-        for task in tasks:
-            # A task is ready if it has no dependencies or all dependencies are completed
-            if not task.dependencies:
-                ready_tasks.append(task)
-            else:
-                # Check if all dependencies are completed
-                all_completed = True
-                for dep in task.dependencies:
-                    dep_task = self.get_task(dep.task_id)
-                    if dep_task is None or dep_task.status != Status.COMPLETED:
-                        all_completed = False
-                        break
-
-                if all_completed:
-                    ready_tasks.append(task)
-
-        return ready_tasks
+        Status, priority, tag and project filters are resolved by intersecting
+        index postings, so without a text query no task file is read. A text
+        query is matched like SearchOrchestrator does, case-folded substring
+        matching on title and description, reading only the remaining
+        candidates.
+
+        Args:
+            criteria: SearchCriteria object with filter parameters
+
+        Returns:
+            Number of matching tasks
+
+        Raises:
+            FilesystemStoreError: If a file cannot be read
+
+        Requirements: 4.8
+        """
+        # Project ID takes precedence over project name
+        project_id = criteria.project_id
+        if project_id is None and criteria.project_name:
+            project_id = next(
+                (p.id for p in self.list_projects() if p.name == criteria.project_name), None
+            )
+            if project_id is None:
+                return 0
+
+        with self._index_lock:
+            self._sync_task_list_index()
+            self._sync_task_index()
+            task_ids = self.index.matching_task_ids(
+                statuses=criteria.status or None,
+                priorities=criteria.priority or None,
+                tags=criteria.tags or None,
+                task_list_ids=(
+                    self.index.task_list_ids_for_project(project_id)
+                    if project_id is not None
+                    else None
+                ),
+            )
+
+        if not criteria.query:
+            return len(task_ids)
+
+        query_folded = criteria.query.casefold()
+        count = 0
+        for task_id in task_ids:
+            task = self.get_task(task_id)
+            if task is not None and (
+                query_folded in task.title.casefold() or query_folded in task.description.casefold()
+            ):
+                count += 1
+        return count
@@ -0,0 +1,903 @@
+"""Append-only log + snapshot implementation of the DataStore interface.
+
+This module implements the LogStore class which keeps the whole data set in
+memory and persists every mutation as one record appended to a write-ahead
+log. The log is periodically compacted into a snapshot of the live state.
+
+File structure:
+- {base_path}/snapshot.json - Live state as of the last compaction
+- {base_path}/wal.log - Newline-delimited JSON records written since the snapshot
+- {base_path}/store.lock - Lock file coordinating processes sharing the store
+
+Each log record holds every entity change made by one operation (for example
+a task delete together with the dependency updates it causes), so an
+operation is either fully replayed or not at all. A torn record left by a
+crash mid-append is ignored on replay and truncated by the next write.
+
+Features:
+- Startup reads the snapshot and the log sequentially, once
+- Writes cost a single fsync'd append instead of one file replace per entity
+- Reads are served from memory through the same secondary indexes as
+  FilesystemStore (see filesystem_index.py)
+- Several processes can share one store: writes hold an exclusive file lock
+  and every operation first replays records appended by other processes
+
+Requirements: 1.2, 1.4, 1.5
+"""
+
+import fcntl
+import json
+import os
+import pathlib
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Iterable, Iterator, Optional
+from uuid import UUID, uuid4
+
+from task_manager.data.access.entity_cache import FileSignature, file_signature
+from task_manager.data.access.entity_codec import EntityCodec
+from task_manager.data.access.filesystem_index import FilesystemIndex
+from task_manager.data.delegation.data_store import (
+    ITER_TASKS_BATCH_SIZE,
+    DataStore,
+    check_batch_size,
+)
+from task_manager.models.entities import (
+    DEFAULT_PROJECTS,
+    Project,
+    SearchCriteria,
+    Task,
+    TaskList,
+)
+from task_manager.models.enums import ExitCriteriaStatus, Status
+
+
+class LogStoreError(Exception):
+    """Raised when log or snapshot operations fail."""
+
+    pass
+
+
+class LogStore(EntityCodec, DataStore):
+    """Log-structured implementation of the DataStore interface.
+
+    The live state is held in memory. Mutations are validated against it,
+    appended to the write-ahead log with an fsync, and then applied. Once
+    compact_threshold records have been appended since the last snapshot, the
+    state is written to a new snapshot and the log is started afresh.
+
+    Callers always receive copies of the stored entities and may mutate them
+    freely.
+
+    Args:
+        base_path: Directory holding the snapshot, log and lock files.
+                   Defaults to "/tmp/tasks" if not specified.
+        compact_threshold: Number of log records after which the log is
+                           compacted into a new snapshot.
+
+    Attributes:
+        base_path: Directory holding the store files
+        snapshot_path: Path of the snapshot file
+        log_path: Path of the write-ahead log
+        index: Secondary indexes over task lists and tasks
+    """
+
+    codec_error = LogStoreError
+
+    # Ready tasks are computed from the in-memory state under one lock
+    supports_ready_task_query = True
+
+    SNAPSHOT_FILE = "snapshot.json"
+    LOG_FILE = "wal.log"
+    LOCK_FILE = "store.lock"
+
+    # Default number of log records between compactions
+    DEFAULT_COMPACT_THRESHOLD = 1000
+
+    def __init__(
+        self, base_path: str = "/tmp/tasks", compact_threshold: int = DEFAULT_COMPACT_THRESHOLD
+    ):
+        """Initialize the log store.
+
+        Args:
+            base_path: Directory holding the store files.
+            compact_threshold: Number of log records between compactions.
+
+        Raises:
+            LogStoreError: If the base path is empty
+            ValueError: If compact_threshold is not positive
+        """
+        if not base_path or not base_path.strip():
+            raise LogStoreError("Path cannot be empty")
+        if compact_threshold < 1:
+            raise ValueError("Compact threshold must be at least 1")
+
+        self.base_path = pathlib.Path(base_path).expanduser().absolute()
+        self.snapshot_path = self.base_path / self.SNAPSHOT_FILE
+        self.log_path = self.base_path / self.LOG_FILE
+        self.compact_threshold = compact_threshold
+        self.index = FilesystemIndex()
+
+        self._projects: dict[UUID, Project] = {}
+        self._task_lists: dict[UUID, TaskList] = {}
+        self._tasks: dict[UUID, Task] = {}
+
+        # Position in the store files up to which the in-memory state is current
+        self._loaded = False
+        self._snapshot_signature: Optional[FileSignature] = None
+        self._log_inode: Optional[int] = None
+        self._log_offset = 0
+        self._records_since_snapshot = 0
+
+        self._lock_fd: Optional[int] = None
+        self._thread_lock = threading.RLock()
+
+    # Locking and synchronization
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """Hold the store lock and bring the in-memory state up to date.
+
+        Args:
+            exclusive: True for writes, False for reads
+        """
+        with self._thread_lock:
+            if self._lock_fd is None:
+                self._open_lock_file()
+
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                self._refresh()
+                yield
+            finally:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _open_lock_file(self) -> None:
+        """Create the store directory and open the lock file.
+
+        Raises:
+            LogStoreError: If the directory or lock file cannot be created
+        """
+        try:
+            self.base_path.mkdir(parents=True, exist_ok=True)
+            self._lock_fd = os.open(self.base_path / self.LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            raise LogStoreError(f"Failed to open store directory {self.base_path}: {e}")
+
+    def _refresh(self) -> None:
+        """Apply changes made by other processes since the last operation.
+
+        A replaced snapshot or log file (compaction) triggers a full reload;
+        otherwise only the records appended after the known offset are read.
+        """
+        try:
+            log_stat: Optional[os.stat_result] = os.stat(self.log_path)
+        except FileNotFoundError:
+            log_stat = None
+        except OSError as e:
+            raise LogStoreError(f"Failed to stat log file: {e}")
+
+        log_inode = log_stat.st_ino if log_stat is not None else None
+        if (
+            not self._loaded
+            or log_inode != self._log_inode
+            or file_signature(self.snapshot_path) != self._snapshot_signature
+            or (log_stat is not None and log_stat.st_size < self._log_offset)
+        ):
+            self._load_snapshot()
+            self._log_inode = log_inode
+            self._log_offset = 0
+            self._records_since_snapshot = 0
+            self._loaded = True
+
+        if log_stat is not None and log_stat.st_size > self._log_offset:
+            self._replay_log()
+
+    def _load_snapshot(self) -> None:
+        """Replace the in-memory state with the contents of the snapshot.
+
+        Raises:
+            LogStoreError: If the snapshot exists but cannot be read or parsed
+        """
+        self._projects.clear()
+        self._task_lists.clear()
+        self._tasks.clear()
+        self.index.clear_task_lists()
+        self.index.clear_tasks()
+
+        self._snapshot_signature = file_signature(self.snapshot_path)
+        if self._snapshot_signature is None:
+            return
+
+        try:
+            with open(self.snapshot_path, "r") as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise LogStoreError(f"Invalid JSON in snapshot {self.snapshot_path}: {e}")
+        except OSError as e:
+            raise LogStoreError(f"Failed to read snapshot {self.snapshot_path}: {e}")
+
+        for project_data in data.get("projects", []):
+            self._put_entity(self._deserialize_project(project_data))
+        for task_list_data in data.get("task_lists", []):
+            self._put_entity(self._deserialize_task_list(task_list_data))
+        for task_data in data.get("tasks", []):
+            self._put_entity(self._deserialize_task(task_data))
+
+    def _replay_log(self) -> None:
+        """Apply the complete log records after the current offset.
+
+        A trailing record without a newline is a torn write and is left for the
+        next append to truncate.
+
+        Raises:
+            LogStoreError: If the log cannot be read or a complete record is corrupt
+        """
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(self._log_offset)
+                data = f.read()
+        except OSError as e:
+            raise LogStoreError(f"Failed to read log file: {e}")
+
+        position = 0
+        while True:
+            end = data.find(b"\n", position)
+            if end == -1:
+                break
+
+            line = data[position:end]
+            if line.strip():
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise LogStoreError(
+                        f"Corrupt log record at offset {self._log_offset + position}: {e}"
+                    )
+                self._apply_changes(record["changes"])
+                self._records_since_snapshot += 1
+
+            position = end + 1
+
+        self._log_offset += position
+
+    # In-memory state
+
+    def _put_entity(self, entity: Any) -> None:
+        """Insert or replace an entity in memory and in the indexes."""
+        if isinstance(entity, Project):
+            self._projects[entity.id] = entity
+        elif isinstance(entity, TaskList):
+            self._task_lists[entity.id] = entity
+            self.index.add_task_list(entity)
+        else:
+            self._tasks[entity.id] = entity
+            self.index.add_task(entity)
+
+    def _apply_changes(self, changes: list[dict]) -> None:
+        """Apply the changes of one log record to the in-memory state."""
+        for change in changes:
+            kind = change["kind"]
+            if change["op"] == "put":
+                if kind == "project":
+                    self._put_entity(self._deserialize_project(change["data"]))
+                elif kind == "task_list":
+                    self._put_entity(self._deserialize_task_list(change["data"]))
+                else:
+                    self._put_entity(self._deserialize_task(change["data"]))
+            else:
+                entity_id = UUID(change["id"])
+                if kind == "project":
+                    self._projects.pop(entity_id, None)
+                elif kind == "task_list":
+                    self._task_lists.pop(entity_id, None)
+                    self.index.remove_task_list(entity_id)
+                else:
+                    self._tasks.pop(entity_id, None)
+                    self.index.remove_task(entity_id)
+
+    def _put_change(self, entity: Any) -> dict:
+        """Build the log change recording an entity write."""
+        if isinstance(entity, Project):
+            kind = "project"
+        elif isinstance(entity, TaskList):
+            kind = "task_list"
+        else:
+            kind = "task"
+        return {"op": "put", "kind": kind, "data": self._serialize_entity(entity)}
+
+    @staticmethod
+    def _delete_change(kind: str, entity_id: UUID) -> dict:
+        """Build the log change recording an entity delete."""
+        return {"op": "delete", "kind": kind, "id": str(entity_id)}
+
+    # Persistence
+
+    def _commit(self, changes: list[dict]) -> None:
+        """Durably append one record and apply it to the in-memory state.
+
+        Must be called while holding the exclusive lock.
+
+        Args:
+            changes: The entity changes making up the record
+
+        Raises:
+            LogStoreError: If the record cannot be written
+        """
+        payload = (json.dumps({"changes": changes}, separators=(",", ":")) + "\n").encode()
+
+        try:
+            fd = os.open(self.log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                log_stat = os.fstat(fd)
+                if log_stat.st_size > self._log_offset:
+                    # Drop a torn record left behind by a crashed writer
+                    os.ftruncate(fd, self._log_offset)
+
+                written = 0
+                while written < len(payload):
+                    written += os.write(fd, payload[written:])
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+            if log_stat.st_ino != self._log_inode:
+                self._fsync_directory()
+        except OSError as e:
+            raise LogStoreError(f"Failed to append to log file: {e}")
+
+        self._log_inode = log_stat.st_ino
+        self._log_offset += len(payload)
+        self._records_since_snapshot += 1
+        self._apply_changes(changes)
+
+        if self._records_since_snapshot >= self.compact_threshold:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Write the live state to a new snapshot and start an empty log.
+
+        The snapshot is replaced before the log, so a crash in between only
+        means the old log is replayed on top of a snapshot that already
+        contains its changes, which is harmless.
+
+        Must be called while holding the exclusive lock.
+
+        Raises:
+            LogStoreError: If the snapshot or log cannot be written
+        """
+        snapshot = {
+            "projects": [self._serialize_entity(p) for p in self._projects.values()],
+            "task_lists": [self._serialize_entity(tl) for tl in self._task_lists.values()],
+            "tasks": [self._serialize_entity(t) for t in self._tasks.values()],
+        }
+
+        self._snapshot_signature = self._replace_file(
+            self.snapshot_path, json.dumps(snapshot, separators=(",", ":")).encode()
+        )
+        self._replace_file(self.log_path, b"")
+
+        self._log_inode = os.stat(self.log_path).st_ino
+        self._log_offset = 0
+        self._records_since_snapshot = 0
+
+    def _replace_file(self, file_path: pathlib.Path, content: bytes) -> Optional[FileSignature]:
+        """Durably replace a file's contents using a temp file and rename.
+
+        Args:
+            file_path: The file to replace
+            content: The new contents
+
+        Returns:
+            The stat signature of the new file
+
+        Raises:
+            LogStoreError: If the file cannot be written
+        """
+        try:
+            temp_fd, temp_path = tempfile.mkstemp(dir=self.base_path, prefix=".tmp_")
+            try:
+                with os.fdopen(temp_fd, "wb") as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                signature = file_signature(pathlib.Path(temp_path))
+                os.replace(temp_path, file_path)
+            except Exception:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
+
+            self._fsync_directory()
+            return signature
+        except OSError as e:
+            raise LogStoreError(f"Failed to write {file_path}: {e}")
+
+    def _fsync_directory(self) -> None:
+        """Persist directory entries (new or renamed files) of the store directory."""
+        dir_fd = os.open(self.base_path, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def compact(self) -> None:
+        """Compact the log into a new snapshot immediately.
+
+        Raises:
+            LogStoreError: If the snapshot or log cannot be written
+        """
+        with self._locked(exclusive=True):
+            self._compact()
+
+    def close(self) -> None:
+        """Release the lock file. The store reopens it on next use."""
+        with self._thread_lock:
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+    # DataStore implementation
+
+    def initialize(self) -> None:
+        """Load the store from disk and create default projects.
+
+        This method:
+        1. Creates the store directory
+        2. Loads the snapshot and replays the log
+        3. Creates the "Chore" and "Repeatable" default projects if they don't exist
+
+        This method is idempotent - calling it multiple times is safe.
+
+        Raises:
+            LogStoreError: If the store files cannot be read or written.
+
+        Requirements: 1.2, 1.4, 2.1, 2.2
+        """
+        with self._locked(exclusive=True):
+            existing_names = {p.name for p in self._projects.values()}
+            now = datetime.now()
+            changes = [
+                self._put_change(
+                    Project(
+                        id=uuid4(),
+                        name=project_name,
+                        is_default=True,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                )
+                for project_name in sorted(DEFAULT_PROJECTS)
+                if project_name not in existing_names
+            ]
+            if changes:
+                self._commit(changes)
+
+    def create_project(self, project: Project) -> Project:
+        """Persist a new project.
+
+        Requirements: 3.1
+        """
+        with self._locked(exclusive=True):
+            if any(p.name == project.name for p in self._projects.values()):
+                raise ValueError(f"Project with name '{project.name}' already exists")
+
+            self._commit([self._put_change(project)])
+
+        return project
+
+    def get_project(self, project_id: UUID) -> Optional[Project]:
+        """Retrieve a project by its unique identifier.
+
+        Requirements: 3.2
+        """
+        with self._locked(exclusive=False):
+            project = self._projects.get(project_id)
+            return self._copy_entity(project) if project is not None else None
+
+    def list_projects(self) -> list[Project]:
+        """Retrieve all projects including default projects.
+
+        Requirements: 3.5
+        """
+        with self._locked(exclusive=False):
+            return [self._copy_entity(p) for p in self._projects.values()]
+
+    def update_project(self, project: Project) -> Project:
+        """Update an existing project.
+
+        Requirements: 3.3
+        """
+        with self._locked(exclusive=True):
+            if project.id not in self._projects:
+                raise ValueError(f"Project with id '{project.id}' does not exist")
+
+            project.updated_at = datetime.now()
+            self._commit([self._put_change(project)])
+
+        return project
+
+    def delete_project(self, project_id: UUID) -> None:
+        """Remove a project and all its task lists and tasks in one record.
+
+        Requirements: 3.4
+        """
+        with self._locked(exclusive=True):
+            project = self._projects.get(project_id)
+            if project is None:
+                raise ValueError(f"Project with id '{project_id}' does not exist")
+            if project.is_default_project():
+                raise ValueError(f"Cannot delete default project '{project.name}'")
+
+            task_list_ids = self.index.task_list_ids_for_project(project_id)
+            task_ids: set[UUID] = set()
+            for task_list_id in task_list_ids:
+                task_ids |= self.index.task_ids_for_task_list(task_list_id)
+
+            changes = self._task_delete_changes(task_ids)
+            changes.extend(self._delete_change("task_list", tl_id) for tl_id in task_list_ids)
+            changes.append(self._delete_change("project", project_id))
+            self._commit(changes)
+
+    def create_task_list(self, task_list: TaskList) -> TaskList:
+        """Persist a new task list.
+
+        Requirements: 4.5
+        """
+        with self._locked(exclusive=True):
+            if task_list.project_id not in self._projects:
+                raise ValueError(f"Project with id '{task_list.project_id}' does not exist")
+
+            self._commit([self._put_change(task_list)])
+
+        return task_list
+
+    def get_task_list(self, task_list_id: UUID) -> Optional[TaskList]:
+        """Retrieve a task list by its unique identifier.
+
+        Requirements: 4.6
+        """
+        with self._locked(exclusive=False):
+            task_list = self._task_lists.get(task_list_id)
+            return self._copy_entity(task_list) if task_list is not None else None
+
+    def list_task_lists(self, project_id: Optional[UUID] = None) -> list[TaskList]:
+        """Retrieve task lists, optionally filtered by project."""
+        with self._locked(exclusive=False):
+            if project_id is None:
+                return [self._copy_entity(tl) for tl in self._task_lists.values()]
+
+            return [
+                self._copy_entity(self._task_lists[task_list_id])
+                for task_list_id in self.index.task_list_ids_for_project(project_id)
+            ]
+
+    def update_task_list(self, task_list: TaskList) -> TaskList:
+        """Update an existing task list.
+
+        Requirements: 4.7
+        """
+        with self._locked(exclusive=True):
+            if task_list.id not in self._task_lists:
+                raise ValueError(f"Task list with id '{task_list.id}' does not exist")
+
+            task_list.updated_at = datetime.now()
+            self._commit([self._put_change(task_list)])
+
+        return task_list
+
+    def delete_task_list(self, task_list_id: UUID) -> None:
+        """Remove a task list and all its tasks in one record.
+
+        Requirements: 4.8
+        """
+        with self._locked(exclusive=True):
+            if task_list_id not in self._task_lists:
+                raise ValueError(f"Task list with id '{task_list_id}' does not exist")
+
+            changes = self._task_delete_changes(self.index.task_ids_for_task_list(task_list_id))
+            changes.append(self._delete_change("task_list", task_list_id))
+            self._commit(changes)
+
+    def reset_task_list(self, task_list_id: UUID) -> None:
+        """Reset a repeatable task list to its initial state in one record.
+
+        Requirements: 16.1, 16.2, 16.3, 16.4
+        """
+        with self._locked(exclusive=True):
+            now = datetime.now()
+            changes = []
+            for task_id in self.index.task_ids_for_task_list(task_list_id):
+                task = self._copy_entity(self._tasks[task_id])
+                task.status = Status.NOT_STARTED
+                for ec in task.exit_criteria:
+                    ec.status = ExitCriteriaStatus.INCOMPLETE
+                    ec.comment = None
+                task.execution_notes = None
+                task.updated_at = now
+                changes.append(self._put_change(task))
+
+            if changes:
+                self._commit(changes)
+
+    def create_task(self, task: Task) -> Task:
+        """Persist a new task.
+
+        Requirements: 5.2
+        """
+        with self._locked(exclusive=True):
+            if task.task_list_id not in self._task_lists:
+                raise ValueError(f"Task list with id '{task.task_list_id}' does not exist")
+
+            # Validate required fields (exit_criteria is validated in Task.__post_init__)
+            if not task.title or not task.title.strip():
+                raise ValueError("Task title is required")
+            if not task.description or not task.description.strip():
+                raise ValueError("Task description is required")
+
+            self._commit([self._put_change(task)])
+
+        return task
+
+    def create_tasks(self, tasks: list[Task]) -> list[Task]:
+        """Persist several new tasks in one record, with a single fsync."""
+        with self._locked(exclusive=True):
+            for task in tasks:
+                if task.task_list_id not in self._task_lists:
+                    raise ValueError(f"Task list with id '{task.task_list_id}' does not exist")
+
+                # Validate required fields (exit_criteria is validated in Task.__post_init__)
+                if not task.title or not task.title.strip():
+                    raise ValueError("Task title is required")
+                if not task.description or not task.description.strip():
+                    raise ValueError("Task description is required")
+
+            if tasks:
+                self._commit([self._put_change(task) for task in tasks])
+
+        return tasks
+
+    def get_task(self, task_id: UUID) -> Optional[Task]:
+        """Retrieve a task by its unique identifier.
+
+        Requirements: 5.6
+        """
+        with self._locked(exclusive=False):
+            task = self._tasks.get(task_id)
+            return self._copy_entity(task) if task is not None else None
+
+    def get_tasks(self, task_ids: Iterable[UUID]) -> list[Task]:
+        """Retrieve several tasks under one acquisition of the lock."""
+        with self._locked(exclusive=False):
+            return [
+                self._copy_entity(self._tasks[task_id])
+                for task_id in dict.fromkeys(task_ids)
+                if task_id in self._tasks
+            ]
+
+    def get_dependents(self, task_id: UUID) -> list[Task]:
+        """Retrieve the tasks that depend on a task through the dependency index."""
+        with self._locked(exclusive=False):
+            return [
+                self._copy_entity(self._tasks[dependent_id])
+                for dependent_id in self.index.dependent_task_ids(task_id)
+            ]
+
+    def list_tasks(self, task_list_id: Optional[UUID] = None) -> list[Task]:
+        """Retrieve tasks, optionally filtered by task list."""
+        with self._locked(exclusive=False):
+            if task_list_id is None:
+                return [self._copy_entity(t) for t in self._tasks.values()]
+
+            return [
+                self._copy_entity(self._tasks[task_id])
+                for task_id in self.index.task_ids_for_task_list(task_list_id)
+            ]
+
+    def iter_tasks(
+        self, task_list_id: Optional[UUID] = None, batch_size: int = ITER_TASKS_BATCH_SIZE
+    ) -> Iterator[Task]:
+        """Iterate over tasks, copying batch_size of them per lock acquisition.
+
+        The lock is not held while tasks are yielded; tasks deleted between
+        batches are skipped.
+        """
+        check_batch_size(batch_size)
+        with self._locked(exclusive=False):
+            if task_list_id is None:
+                task_ids = list(self._tasks)
+            else:
+                task_ids = list(self.index.task_ids_for_task_list(task_list_id))
+
+        for start in range(0, len(task_ids), batch_size):
+            with self._locked(exclusive=False):
+                batch = [
+                    self._copy_entity(self._tasks[task_id])
+                    for task_id in task_ids[start : start + batch_size]
+                    if task_id in self._tasks
+                ]
+            yield from batch
+
+    def get_tasks_version(self, task_list_id: Optional[UUID] = None) -> str:
+        """Retrieve a token that changes whenever tasks are created, modified or deleted.
+
+        The token is the index generation of the tasks (see FilesystemIndex).
+        """
+        with self._locked(exclusive=False):
+            return self.index.tasks_version(task_list_id)
+
+    def update_task(self, task: Task) -> Task:
+        """Update an existing task.
+
+        Requirements: 5.7
+        """
+        with self._locked(exclusive=True):
+            if task.id not in self._tasks:
+                raise ValueError(f"Task with id '{task.id}' does not exist")
+
+            task.updated_at = datetime.now()
+            self._commit([self._put_change(task)])
+
+        return task
+
+    def delete_task(self, task_id: UUID) -> None:
+        """Remove a task and update dependent tasks in one record.
+
+        Requirements: 5.8, 8.5
+        """
+        with self._locked(exclusive=True):
+            if task_id not in self._tasks:
+                raise ValueError(f"Task with id '{task_id}' does not exist")
+
+            self._commit(self._task_delete_changes({task_id}))
+
+    def update_tasks(self, tasks: list[Task]) -> list[Task]:
+        """Update several existing tasks in one record, with a single fsync."""
+        with self._locked(exclusive=True):
+            for task in tasks:
+                if task.id not in self._tasks:
+                    raise ValueError(f"Task with id '{task.id}' does not exist")
+
+            now = datetime.now()
+            for task in tasks:
+                task.updated_at = now
+            if tasks:
+                self._commit([self._put_change(task) for task in tasks])
+
+        return tasks
+
+    def delete_tasks(self, task_ids: list[UUID]) -> None:
+        """Remove several tasks and update the tasks depending on them in one record."""
+        with self._locked(exclusive=True):
+            for task_id in task_ids:
+                if task_id not in self._tasks:
+                    raise ValueError(f"Task with id '{task_id}' does not exist")
+
+            if task_ids:
+                self._commit(self._task_delete_changes(set(task_ids)))
+
+    def _update_tags(
+        self, task_ids: list[UUID], change: Callable[[list[str]], list[str]]
+    ) -> list[Task]:
+        """Change the tags of several tasks in one record.
+
+        The tasks are read and written under one exclusive lock, so no
+        concurrent write is lost.
+        """
+        ids = list(dict.fromkeys(task_ids))
+        with self._locked(exclusive=True):
+            for task_id in ids:
+                if task_id not in self._tasks:
+                    raise ValueError(f"Task with id '{task_id}' does not exist")
+
+            now = datetime.now()
+            tasks = []
+            for task_id in ids:
+                task = self._copy_entity(self._tasks[task_id])
+                task.tags = change(task.tags or [])
+                task.updated_at = now
+                tasks.append(task)
+            if tasks:
+                self._commit([self._put_change(task) for task in tasks])
+
+        return tasks
+
+    def _task_delete_changes(self, task_ids: set[UUID]) -> list[dict]:
+        """Build the changes deleting tasks and removing them from other tasks' dependencies.
+
+        Args:
+            task_ids: IDs of the tasks being deleted
+
+        Returns:
+            Put changes for the affected remaining tasks followed by the deletes
+        """
+        changes = []
+        now = datetime.now()
+        dependent_ids: set[UUID] = set()
+        for task_id in task_ids:
+            dependent_ids |= self.index.dependent_task_ids(task_id)
+
+        for dependent_id in dependent_ids - task_ids:
+            other_task = self._tasks[dependent_id]
+            updated = self._copy_entity(other_task)
+            updated.dependencies = [
+                dep for dep in other_task.dependencies if dep.task_id not in task_ids
+            ]
+            updated.updated_at = now
+            changes.append(self._put_change(updated))
+
+        changes.extend(self._delete_change("task", task_id) for task_id in task_ids)
+        return changes
+
+    def get_ready_tasks(
+        self, scope_type: str, scope_id: UUID, statuses: Optional[list[Status]] = None
+    ) -> list[Task]:
+        """Retrieve tasks that are ready for execution.
+
+        The ready tasks are read from the dependency graph's ready postings,
+        so only ready tasks in the requested statuses are visited.
+
+        Requirements: 9.1, 9.2, 9.3
+        """
+        if scope_type not in ["project", "task_list"]:
+            raise ValueError(f"Invalid scope_type: {scope_type}. Must be 'project' or 'task_list'")
+
+        with self._locked(exclusive=False):
+            if scope_type == "project":
+                if scope_id not in self._projects:
+                    raise ValueError(f"Project with id '{scope_id}' does not exist")
+                task_list_ids = self.index.task_list_ids_for_project(scope_id)
+            else:
+                if scope_id not in self._task_lists:
+                    raise ValueError(f"Task list with id '{scope_id}' does not exist")
+                task_list_ids = {scope_id}
+
+            return [
+                self._copy_entity(self._tasks[task_id])
+                for task_id in self.index.graph.ready_task_ids(task_list_ids, statuses)
+            ]
+
+    def count_tasks(self, criteria: SearchCriteria) -> int:
+        """Count the tasks matching search criteria, ignoring pagination and sorting.
+
+        Filters other than the text query are resolved through the index.
+
+        Requirements: 4.8
+        """
+        with self._locked(exclusive=False):
+            # Project ID takes precedence over project name
+            project_id = criteria.project_id
+            if project_id is None and criteria.project_name:
+                project_id = next(
+                    (p.id for p in self._projects.values() if p.name == criteria.project_name),
+                    None,
+                )
+                if project_id is None:
+                    return 0
+
+            task_ids = self.index.matching_task_ids(
+                statuses=criteria.status or None,
+                priorities=criteria.priority or None,
+                tags=criteria.tags or None,
+                task_list_ids=(
+                    self.index.task_list_ids_for_project(project_id)
+                    if project_id is not None
+                    else None
+                ),
+            )
+
+            if not criteria.query:
+                return len(task_ids)
+
+            query_folded = criteria.query.casefold()
+            return sum(
+                1
+                for task_id in task_ids
+                if query_folded in self._tasks[task_id].title.casefold()
+                or query_folded in self._tasks[task_id].description.casefold()
+            )
@@ -161,3 +161,57 @@ def migrate_add_tags_column(engine: Engine) -> None:
 
     except Exception as e:
         raise MigrationError(f"Failed to add tags column: {e}") from e
+
+
+# Child tables ordered by a position column, with the columns the position is
+# counted within
+POSITION_COLUMN_TABLES = {
+    "dependencies": ("source_task_id",),
+    "exit_criteria": ("task_id",),
+    "notes": ("task_id", "note_type"),
+}
+
+
+def migrate_add_position_columns(engine: Engine) -> None:
+    """Add position columns to the ordered child tables if they don't exist.
+
+    Dependencies, exit criteria and notes are read back ordered by position.
+    Existing rows are numbered in their physical order, which is the order
+    they were read back in before the column existed. It is idempotent - safe
+    to run multiple times.
+
+    Args:
+        engine: SQLAlchemy engine connected to the database
+
+    Raises:
+        MigrationError: If migration fails
+    """
+    try:
+        inspector = inspect(engine)
+        existing_tables = set(inspector.get_table_names())
+        row_order = "ctid" if engine.dialect.name == "postgresql" else "rowid"
+
+        for table, partition in POSITION_COLUMN_TABLES.items():
+            if table not in existing_tables:
+                continue
+
+            columns = [col["name"] for col in inspector.get_columns(table)]
+            if "position" in columns:
+                continue
+
+            with engine.begin() as conn:
+                conn.execute(
+                    text(f"ALTER TABLE {table} ADD COLUMN position INTEGER NOT NULL DEFAULT 0")
+                )
+                conn.execute(
+                    text(
+                        f"UPDATE {table} SET position = ranked.position "
+                        f"FROM (SELECT id, ROW_NUMBER() OVER "
+                        f"(PARTITION BY {', '.join(partition)} ORDER BY {row_order}) - 1 "
+                        f"AS position FROM {table}) AS ranked "
+                        f"WHERE {table}.id = ranked.id"
+                    )
+                )
+
+    except Exception as e:
+        raise MigrationError(f"Failed to add position columns: {e}") from e
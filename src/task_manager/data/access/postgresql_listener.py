@@ -0,0 +1,230 @@
+"""Cross-process change notifications for the PostgreSQL data store.
+
+PostgreSQLStore sends a NOTIFY on CHANGE_CHANNEL in the transaction of every
+mutation, with a small JSON payload identifying the changed entity. PostgreSQL
+delivers it to every listening connection when the transaction commits, so
+processes sharing the database (e.g. several REST API replicas) learn about
+each other's changes within milliseconds and without polling.
+
+ChangeListener runs the LISTEN loop on a dedicated connection in a background
+thread and hands each notification to a callback. If the connection is lost,
+it reconnects and calls the callback with None, because notifications sent
+while disconnected are not delivered; consumers that keep derived state
+should then rebuild it.
+
+Requirements: 9.1
+"""
+
+import json
+import logging
+import select
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Channel on which committed entity mutations are announced with NOTIFY
+CHANGE_CHANNEL = "task_manager_changes"
+
+
+@dataclass
+class ChangeNotification:
+    """A committed change announced by a store instance.
+
+    Attributes:
+        entity: "project", "task_list" or "task"
+        operation: "created", "updated" or "deleted"
+        entity_id: UUID of the changed entity
+        task_list_id: UUID of the task list containing a changed task, if any
+        origin: Instance ID of the store that made the change
+    """
+
+    entity: str
+    operation: str
+    entity_id: UUID
+    task_list_id: Optional[UUID]
+    origin: str
+
+    @classmethod
+    def from_payload(cls, payload: str) -> "ChangeNotification":
+        """Parse the JSON payload of a notification.
+
+        Args:
+            payload: Payload sent by PostgreSQLStore
+
+        Returns:
+            The parsed notification
+
+        Raises:
+            ValueError: If the payload is not a valid change notification
+        """
+        try:
+            data = json.loads(payload)
+            task_list_id = data.get("task_list_id")
+            return cls(
+                entity=data["entity"],
+                operation=data["operation"],
+                entity_id=UUID(data["id"]),
+                task_list_id=UUID(task_list_id) if task_list_id else None,
+                origin=data["origin"],
+            )
+        except (TypeError, KeyError, AttributeError, ValueError) as e:
+            raise ValueError(f"Invalid change notification payload: {payload!r}") from e
+
+
+class ChangeListener:
+    """Receives change notifications on a background thread.
+
+    The LISTEN connection is taken from the engine and detached from its pool,
+    so it does not reduce the number of connections available to queries.
+
+    Attributes:
+        channel: Notification channel listened on
+        ignore_origin: Instance ID whose notifications are skipped, if any
+        poll_interval: Seconds between checks of the stop flag while idle
+        keepalive_interval: Seconds of silence after which the connection is
+            checked with a query, so broken connections are detected
+        reconnect_delay: Seconds to wait before reconnecting after an error
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        callback: Callable[[Optional[ChangeNotification]], None],
+        channel: str = CHANGE_CHANNEL,
+        ignore_origin: Optional[str] = None,
+        poll_interval: float = 1.0,
+        keepalive_interval: float = 30.0,
+        reconnect_delay: float = 1.0,
+    ):
+        """Initialize the ChangeListener.
+
+        Args:
+            engine: Engine of a PostgreSQL database using the psycopg2 driver
+            callback: Called with each notification, or with None after a
+                reconnect; exceptions it raises are logged and ignored
+            channel: Notification channel to listen on
+            ignore_origin: Instance ID whose notifications are skipped
+            poll_interval: Seconds between checks of the stop flag while idle
+            keepalive_interval: Seconds of silence before checking the connection
+            reconnect_delay: Seconds to wait before reconnecting after an error
+        """
+        self.engine = engine
+        self.channel = channel
+        self.ignore_origin = ignore_origin
+        self.poll_interval = poll_interval
+        self.keepalive_interval = keepalive_interval
+        self.reconnect_delay = reconnect_delay
+        self._callback = callback
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the listener thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the listener thread.
+
+        Raises:
+            RuntimeError: If the listener is already running
+        """
+        if self.running:
+            raise RuntimeError("Change listener is already running")
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="pg-change-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the listener thread and close its connection.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the thread
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def handle_payload(self, payload: str) -> None:
+        """Parse a notification payload and pass it to the callback.
+
+        Malformed payloads and notifications from ignore_origin are skipped.
+
+        Args:
+            payload: Payload of a received notification
+        """
+        try:
+            notification = ChangeNotification.from_payload(payload)
+        except ValueError as e:
+            logger.warning(str(e))
+            return
+        if notification.origin == self.ignore_origin:
+            return
+        self._dispatch(notification)
+
+    def _dispatch(self, notification: Optional[ChangeNotification]) -> None:
+        """Call the callback, logging its errors."""
+        try:
+            self._callback(notification)
+        except Exception:
+            logger.exception("Change notification callback failed")
+
+    def _run(self) -> None:
+        """Listen until stopped, reconnecting after connection errors."""
+        connected_before = False
+        while not self._stopped.is_set():
+            connection = None
+            try:
+                connection = self._connect()
+                if connected_before:
+                    self._dispatch(None)
+                connected_before = True
+                self._listen(connection.dbapi_connection)
+            except Exception as e:
+                logger.warning(f"Change listener connection failed: {e}")
+            finally:
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+            self._stopped.wait(self.reconnect_delay)
+
+    def _connect(self) -> Any:
+        """Open a LISTEN connection detached from the engine's pool.
+
+        Returns:
+            The pool's connection proxy, whose close() closes the connection
+        """
+        connection = self.engine.raw_connection()
+        connection.detach()
+        dbapi_connection = connection.dbapi_connection
+        dbapi_connection.autocommit = True
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel}"')
+        return connection
+
+    def _listen(self, dbapi_connection: Any) -> None:
+        """Dispatch notifications until stopped.
+
+        Args:
+            dbapi_connection: psycopg2 connection listening on the channel
+        """
+        last_activity = time.monotonic()
+        while not self._stopped.is_set():
+            ready, _, _ = select.select([dbapi_connection], [], [], self.poll_interval)
+            if ready:
+                dbapi_connection.poll()
+                last_activity = time.monotonic()
+            elif time.monotonic() - last_activity >= self.keepalive_interval:
+                with dbapi_connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                last_activity = time.monotonic()
+            while dbapi_connection.notifies:
+                self.handle_payload(dbapi_connection.notifies.pop(0).payload)
@@ -25,6 +25,8 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    func,
+    literal_column,
 )
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
@@ -133,6 +135,30 @@ class TaskListModel(Base):
     )
 
 
+# Text search configuration of the full-text index. "simple" only lower-cases
+# words, so prefix queries behave like case-insensitive word matching.
+TEXT_SEARCH_CONFIG = "simple"
+
+
+def task_search_vector(title, description):
+    """Build the tsvector expression indexed for full-text task search.
+
+    Title words are weighted A and description words B, so ts_rank scores
+    title matches higher.
+
+    Args:
+        title: Title column or expression
+        description: Description column or expression
+
+    Returns:
+        SQL expression producing the weighted tsvector
+    """
+    config = literal_column(f"'{TEXT_SEARCH_CONFIG}'::regconfig")
+    return func.setweight(func.to_tsvector(config, title), literal_column("'A'")).op("||")(
+        func.setweight(func.to_tsvector(config, description), literal_column("'B'"))
+    )
+
+
 class TaskModel(Base):
     """SQLAlchemy model for tasks table.
 
@@ -170,15 +196,21 @@ class TaskModel(Base):
         back_populates="source_task",
         cascade="all, delete-orphan",
         passive_deletes=True,
+        order_by="DependencyModel.position",
     )
     exit_criteria = relationship(
         "ExitCriteriaModel",
         back_populates="task",
         cascade="all, delete-orphan",
         passive_deletes=True,
+        order_by="ExitCriteriaModel.position",
     )
     notes = relationship(
-        "NoteModel", back_populates="task", cascade="all, delete-orphan", passive_deletes=True
+        "NoteModel",
+        back_populates="task",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="NoteModel.position",
     )
     action_plan_items = relationship(
         "ActionPlanItemModel",
@@ -194,6 +226,12 @@ class TaskModel(Base):
         Index("ix_tasks_status", "status"),
         Index("ix_tasks_priority", "priority"),
         Index("ix_tasks_tags", "tags", postgresql_using="gin"),
+        # GIN index backing full-text search (PostgreSQL only)
+        Index(
+            "ix_tasks_search_vector",
+            task_search_vector(title, description),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
     )
 
 
@@ -211,6 +249,8 @@ class DependencyModel(Base):
     )
     target_task_id = Column(PGUUID(as_uuid=True), nullable=False)
     target_task_list_id = Column(PGUUID(as_uuid=True), nullable=False)
+    # Position of the dependency in the task's list
+    position = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Relationships
     source_task = relationship(
@@ -245,6 +285,8 @@ class ExitCriteriaModel(Base):
         default=ExitCriteriaStatus.INCOMPLETE,
     )
     comment = Column(Text, nullable=True)
+    # Position of the criterion in the task's list
+    position = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Relationships
     task = relationship("TaskModel", back_populates="exit_criteria")
@@ -275,6 +317,8 @@ class NoteModel(Base):
     )
     content = Column(Text, nullable=False)
     timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
+    # Position of the note among the task's notes of the same type
+    position = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Relationships
     task = relationship("TaskModel", back_populates="notes")
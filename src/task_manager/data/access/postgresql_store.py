@@ -7,15 +7,41 @@ to ensure data consistency.
 Requirements: 1.3, 1.5, 2.1, 2.2, 3.1-3.5, 4.5-4.8, 5.2, 5.6-5.8, 9.1-9.3, 16.1-16.4
 """
 
+import json
+import re
 from datetime import datetime, timezone
-from typing import Optional
-from uuid import UUID
-
-from sqlalchemy import create_engine, delete, select
+from typing import Any, Callable, Iterable, Iterator, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    Float,
+    String,
+    and_,
+    case,
+    cast,
+    create_engine,
+    delete,
+    exists,
+    func,
+    literal_column,
+    or_,
+    select,
+    text,
+    type_coerce,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session, aliased, selectinload, sessionmaker
 
+from task_manager.data.access.migrations import MigrationError, migrate_add_position_columns
+from task_manager.data.access.postgresql_listener import (
+    CHANGE_CHANNEL,
+    ChangeListener,
+    ChangeNotification,
+)
 from task_manager.data.access.postgresql_schema import (
+    TEXT_SEARCH_CONFIG,
     ActionPlanItemModel,
     Base,
     DependencyModel,
@@ -24,8 +50,13 @@ from task_manager.data.access.postgresql_schema import (
     ProjectModel,
     TaskListModel,
     TaskModel,
+    task_search_vector,
+)
+from task_manager.data.delegation.data_store import (
+    ITER_TASKS_BATCH_SIZE,
+    DataStore,
+    check_batch_size,
 )
-from task_manager.data.delegation.data_store import DataStore
 from task_manager.models.entities import (
     DEFAULT_PROJECTS,
     ActionPlanItem,
@@ -33,10 +64,38 @@ from task_manager.models.entities import (
     ExitCriteria,
     Note,
     Project,
+    SearchCriteria,
+    SearchPage,
     Task,
     TaskList,
 )
-from task_manager.models.enums import ExitCriteriaStatus, NoteType, Status
+from task_manager.models.enums import ExitCriteriaStatus, NoteType, Priority, Status
+from task_manager.models.pagination import decode_cursor, encode_cursor
+
+# Loader options fetching every child collection of a task with one batched
+# IN query per relationship, so converting N tasks costs a constant number of
+# queries instead of four lazy loads per task.
+TASK_RELATIONSHIP_OPTIONS = (
+    selectinload(TaskModel.dependencies),
+    selectinload(TaskModel.exit_criteria),
+    selectinload(TaskModel.notes),
+    selectinload(TaskModel.action_plan_items),
+)
+
+# Queues one NOTIFY per payload of an array with a single statement, so a batch
+# of changes costs one round trip instead of one per changed entity.
+NOTIFY_CHANGES = text(
+    "SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"
+)
+
+# Priority ordering for sorting (higher priority = higher value)
+PRIORITY_ORDER = {
+    Priority.CRITICAL: 5,
+    Priority.HIGH: 4,
+    Priority.MEDIUM: 3,
+    Priority.LOW: 2,
+    Priority.TRIVIAL: 1,
+}
 
 
 class StorageError(Exception):
@@ -52,12 +111,24 @@ class PostgreSQLStore(DataStore):
     database access. All operations execute directly against the database without
     caching to maintain consistency across multiple interfaces and users.
 
+    Every mutation also sends a NOTIFY on CHANGE_CHANNEL in its transaction, so
+    other processes sharing the database (e.g. the replicas of the REST API)
+    learn about committed changes through listen_for_changes().
+
     Attributes:
         connection_string: PostgreSQL connection URL
         engine: SQLAlchemy engine with connection pooling
         SessionLocal: SQLAlchemy session factory
+        instance_id: Random ID of this store, sent with its change notifications
+        notify_changes: Whether mutations send change notifications (PostgreSQL only)
     """
 
+    # Ready tasks are computed by a single anti-join query
+    supports_ready_task_query = True
+
+    # Mutations send NOTIFY only on PostgreSQL; set per instance from the dialect
+    notify_changes = False
+
     def __init__(self, connection_string: str):
         """Initialize the PostgreSQL store.
 
@@ -94,6 +165,9 @@ class PostgreSQLStore(DataStore):
         except Exception as e:
             raise StorageError(f"Invalid PostgreSQL connection string: {e}")
 
+        self.instance_id = uuid4().hex
+        self.notify_changes = self.engine.dialect.name == "postgresql"
+
     def _get_session(self) -> Session:
         """Get a new database session.
 
@@ -102,6 +176,86 @@ class PostgreSQLStore(DataStore):
         """
         return self.SessionLocal()
 
+    def _notify_change(
+        self,
+        session: Session,
+        entity: str,
+        operation: str,
+        entity_id: UUID,
+        task_list_id: Optional[UUID] = None,
+    ) -> None:
+        """Queue a change notification in the session's transaction.
+
+        PostgreSQL delivers the notification to listeners when the transaction
+        commits and discards it on rollback.
+
+        Args:
+            session: Session of the mutation's transaction
+            entity: "project", "task_list" or "task"
+            operation: "created", "updated" or "deleted"
+            entity_id: UUID of the changed entity
+            task_list_id: UUID of the task list containing a changed task
+        """
+        self._notify_changes(session, entity, operation, [(entity_id, task_list_id)])
+
+    def _notify_changes(
+        self,
+        session: Session,
+        entity: str,
+        operation: str,
+        changes: Iterable[tuple[UUID, Optional[UUID]]],
+    ) -> None:
+        """Queue the notifications of several changes with one statement.
+
+        Args:
+            session: Session of the mutation's transaction
+            entity: "project", "task_list" or "task"
+            operation: "created", "updated" or "deleted"
+            changes: (entity_id, task_list_id) of each changed entity, where
+                task_list_id is the task list containing a changed task or None
+        """
+        if not self.notify_changes:
+            return
+        payloads = [
+            json.dumps(
+                {
+                    "origin": self.instance_id,
+                    "entity": entity,
+                    "operation": operation,
+                    "id": str(entity_id),
+                    "task_list_id": str(task_list_id) if task_list_id else None,
+                }
+            )
+            for entity_id, task_list_id in changes
+        ]
+        if payloads:
+            session.execute(NOTIFY_CHANGES, {"channel": CHANGE_CHANNEL, "payloads": payloads})
+
+    def listen_for_changes(
+        self, callback: Callable[[Optional[ChangeNotification]], None]
+    ) -> ChangeListener:
+        """Start receiving the change notifications of other store instances.
+
+        Notifications sent by this instance are skipped, since its own callers
+        already know about its changes.
+
+        Args:
+            callback: Called on the listener thread with each notification, or
+                with None after a reconnect, when notifications may have been
+                missed
+
+        Returns:
+            The started listener; call stop() to end it
+
+        Raises:
+            StorageError: If the database is not PostgreSQL
+        """
+        if not self.notify_changes:
+            raise StorageError("Change notifications require a PostgreSQL database")
+        listener = ChangeListener(self.engine, callback, ignore_origin=self.instance_id)
+        listener.start()
+        return listener
+
     def initialize(self) -> None:
         """Initialize the backing store and create default projects.
 
@@ -114,6 +268,14 @@ class PostgreSQLStore(DataStore):
             # Create all tables
             Base.metadata.create_all(bind=self.engine)
 
+            # create_all() skips columns and indexes of existing tables, so
+            # databases created before they were added get them here
+            migrate_add_position_columns(self.engine)
+            if self.engine.dialect.name == "postgresql":
+                for index in TaskModel.__table__.indexes:
+                    if index.name == "ix_tasks_search_vector":
+                        index.create(bind=self.engine, checkfirst=True)
+
             # Create default projects
             session = self._get_session()
             try:
@@ -139,7 +301,7 @@ class PostgreSQLStore(DataStore):
             finally:
                 session.close()
 
-        except SQLAlchemyError as e:
+        except (SQLAlchemyError, MigrationError) as e:
             raise StorageError(f"Failed to initialize PostgreSQL store: {e}")
 
     # Project CRUD operations
@@ -169,6 +331,7 @@ class PostgreSQLStore(DataStore):
             )
 
             session.add(project_model)
+            self._notify_change(session, "project", "created", project.id)
             session.commit()
             session.refresh(project_model)
 
@@ -235,6 +398,7 @@ class PostgreSQLStore(DataStore):
             project_model.agent_instructions_template = project.agent_instructions_template
             project_model.updated_at = datetime.now(timezone.utc)
 
+            self._notify_change(session, "project", "updated", project.id)
             session.commit()
             session.refresh(project_model)
 
@@ -264,6 +428,7 @@ class PostgreSQLStore(DataStore):
 
             # Delete project (cascade will handle task lists and tasks)
             session.delete(project_model)
+            self._notify_change(session, "project", "deleted", project_id)
             session.commit()
 
         except SQLAlchemyError as e:
@@ -296,6 +461,7 @@ class PostgreSQLStore(DataStore):
             )
 
             session.add(task_list_model)
+            self._notify_change(session, "task_list", "created", task_list.id)
             session.commit()
             session.refresh(task_list_model)
 
@@ -361,6 +527,7 @@ class PostgreSQLStore(DataStore):
             task_list_model.agent_instructions_template = task_list.agent_instructions_template
             task_list_model.updated_at = datetime.now(timezone.utc)
 
+            self._notify_change(session, "task_list", "updated", task_list.id)
             session.commit()
             session.refresh(task_list_model)
 
@@ -395,6 +562,10 @@ class PostgreSQLStore(DataStore):
 
             # Delete task list (cascade will handle tasks and their dependencies)
             session.delete(task_list_model)
+            self._notify_changes(
+                session, "task", "deleted", [(task_id, task_list_id) for task_id in task_ids]
+            )
+            self._notify_change(session, "task_list", "deleted", task_list_id)
             session.commit()
 
         except SQLAlchemyError as e:
@@ -410,12 +581,18 @@ class PostgreSQLStore(DataStore):
         """
         session = self._get_session()
         try:
-            task_list_model = session.get(TaskListModel, task_list_id)
+            # Load the tasks and their exit criteria up front in two queries
+            task_list_model = session.get(
+                TaskListModel,
+                task_list_id,
+                options=[selectinload(TaskListModel.tasks).selectinload(TaskModel.exit_criteria)],
+            )
 
             if not task_list_model:
                 raise ValueError(f"Task list with id '{task_list_id}' does not exist")
 
             # Reset all tasks in the task list
+            changes = []
             for task_model in task_list_model.tasks:
                 # Reset status to NOT_STARTED
                 task_model.status = Status.NOT_STARTED
@@ -435,7 +612,9 @@ class PostgreSQLStore(DataStore):
 
                 # Update timestamp
                 task_model.updated_at = datetime.now(timezone.utc)
+                changes.append((task_model.id, task_list_id))
 
+            self._notify_changes(session, "task", "updated", changes)
             session.commit()
 
         except SQLAlchemyError as e:
@@ -458,105 +637,213 @@ class PostgreSQLStore(DataStore):
             if not task_list:
                 raise ValueError(f"Task list with id '{task.task_list_id}' does not exist")
 
-            # Create task model
-            task_model = TaskModel(
-                id=task.id,
-                task_list_id=task.task_list_id,
-                title=task.title,
-                description=task.description,
-                status=task.status,
-                priority=task.priority,
-                agent_instructions_template=task.agent_instructions_template,
-                tags=task.tags,
-                created_at=task.created_at,
-                updated_at=task.updated_at,
+            task_model = self._add_task_rows(session, task)
+
+            self._notify_change(session, "task", "created", task.id, task.task_list_id)
+            session.commit()
+            session.refresh(task_model)
+
+            return self._task_model_to_entity(task_model)
+
+        except SQLAlchemyError as e:
+            session.rollback()
+            raise StorageError(f"Failed to create task: {e}")
+        finally:
+            session.close()
+
+    def create_tasks(self, tasks: list[Task]) -> list[Task]:
+        """Persist several new tasks in one transaction.
+
+        The task lists are verified with one query, and the rows of all tasks
+        are flushed together, so SQLAlchemy sends each table's rows as batched
+        multi-row INSERTs before the single commit.
+        """
+        if not tasks:
+            return []
+
+        session = self._get_session()
+        try:
+            task_list_ids = {task.task_list_id for task in tasks}
+            existing_ids = set(
+                session.scalars(select(TaskListModel.id).where(TaskListModel.id.in_(task_list_ids)))
             )
+            for task in tasks:
+                if task.task_list_id not in existing_ids:
+                    raise ValueError(f"Task list with id '{task.task_list_id}' does not exist")
+
+            for task in tasks:
+                self._add_task_rows(session, task)
+            self._notify_changes(
+                session, "task", "created", [(task.id, task.task_list_id) for task in tasks]
+            )
+            session.commit()
+
+        except SQLAlchemyError as e:
+            session.rollback()
+            raise StorageError(f"Failed to create tasks: {e}")
+        finally:
+            session.close()
+
+        return self.get_tasks([task.id for task in tasks])
+
+    def _add_task_rows(self, session: Session, task: Task) -> TaskModel:
+        """Add the rows of a new task and its child collections to a session.
+
+        Args:
+            session: Session of the creating transaction
+            task: The task to create
+
+        Returns:
+            The added task model
+        """
+        # Create task model
+        task_model = TaskModel(
+            id=task.id,
+            task_list_id=task.task_list_id,
+            title=task.title,
+            description=task.description,
+            status=task.status,
+            priority=task.priority,
+            agent_instructions_template=task.agent_instructions_template,
+            tags=task.tags,
+            created_at=task.created_at,
+            updated_at=task.updated_at,
+        )
 
-            session.add(task_model)
+        session.add(task_model)
+
+        # Add dependencies
+        for position, dep in enumerate(task.dependencies):
+            dep_model = DependencyModel(
+                source_task_id=task.id,
+                target_task_id=dep.task_id,
+                target_task_list_id=dep.task_list_id,
+                position=position,
+            )
+            session.add(dep_model)
+
+        # Add exit criteria
+        for position, ec in enumerate(task.exit_criteria):
+            ec_model = ExitCriteriaModel(
+                task_id=task.id,
+                criteria=ec.criteria,
+                status=ec.status,
+                comment=ec.comment,
+                position=position,
+            )
+            session.add(ec_model)
+
+        # Add notes
+        for position, note in enumerate(task.notes):
+            note_model = NoteModel(
+                task_id=task.id,
+                note_type=NoteType.GENERAL,
+                content=note.content,
+                timestamp=note.timestamp,
+                position=position,
+            )
+            session.add(note_model)
 
-            # Add dependencies
-            for dep in task.dependencies:
-                dep_model = DependencyModel(
-                    source_task_id=task.id,
-                    target_task_id=dep.task_id,
-                    target_task_list_id=dep.task_list_id,
+        # Add research notes
+        if task.research_notes:
+            for position, note in enumerate(task.research_notes):
+                note_model = NoteModel(
+                    task_id=task.id,
+                    note_type=NoteType.RESEARCH,
+                    content=note.content,
+                    timestamp=note.timestamp,
+                    position=position,
                 )
-                session.add(dep_model)
+                session.add(note_model)
 
-            # Add exit criteria
-            for ec in task.exit_criteria:
-                ec_model = ExitCriteriaModel(
-                    task_id=task.id, criteria=ec.criteria, status=ec.status, comment=ec.comment
+        # Add action plan
+        if task.action_plan:
+            for item in task.action_plan:
+                item_model = ActionPlanItemModel(
+                    task_id=task.id, sequence=item.sequence, content=item.content
                 )
-                session.add(ec_model)
+                session.add(item_model)
 
-            # Add notes
-            for note in task.notes:
+        # Add execution notes
+        if task.execution_notes:
+            for position, note in enumerate(task.execution_notes):
                 note_model = NoteModel(
                     task_id=task.id,
-                    note_type=NoteType.GENERAL,
+                    note_type=NoteType.EXECUTION,
                     content=note.content,
                     timestamp=note.timestamp,
+                    position=position,
                 )
                 session.add(note_model)
 
-            # Add research notes
-            if task.research_notes:
-                for note in task.research_notes:
-                    note_model = NoteModel(
-                        task_id=task.id,
-                        note_type=NoteType.RESEARCH,
-                        content=note.content,
-                        timestamp=note.timestamp,
-                    )
-                    session.add(note_model)
+        return task_model
 
-            # Add action plan
-            if task.action_plan:
-                for item in task.action_plan:
-                    item_model = ActionPlanItemModel(
-                        task_id=task.id, sequence=item.sequence, content=item.content
-                    )
-                    session.add(item_model)
-
-            # Add execution notes
-            if task.execution_notes:
-                for note in task.execution_notes:
-                    note_model = NoteModel(
-                        task_id=task.id,
-                        note_type=NoteType.EXECUTION,
-                        content=note.content,
-                        timestamp=note.timestamp,
-                    )
-                    session.add(note_model)
+    def get_task(self, task_id: UUID) -> Optional[Task]:
+        """Retrieve a task by its unique identifier.
 
-            session.commit()
-            session.refresh(task_model)
+        Requirements: 5.6
+        """
+        session = self._get_session()
+        try:
+            task_model = session.get(TaskModel, task_id, options=TASK_RELATIONSHIP_OPTIONS)
+
+            if not task_model:
+                return None
 
             return self._task_model_to_entity(task_model)
 
         except SQLAlchemyError as e:
-            session.rollback()
-            raise StorageError(f"Failed to create task: {e}")
+            raise StorageError(f"Failed to retrieve task: {e}")
         finally:
             session.close()
 
-    def get_task(self, task_id: UUID) -> Optional[Task]:
-        """Retrieve a task by its unique identifier.
+    def get_tasks(self, task_ids: Iterable[UUID]) -> list[Task]:
+        """Retrieve several tasks with one SELECT ... WHERE id IN (...) per batch.
 
-        Requirements: 5.6
+        IDs are sent in batches of ITER_TASKS_BATCH_SIZE to stay within the
+        bind parameter limits of the database; PostgreSQL plans each batch as
+        id = ANY(...) on the primary key index. The child rows of a batch are
+        loaded with one SELECT ... IN per relationship.
         """
+        ids = list(dict.fromkeys(task_ids))
         session = self._get_session()
         try:
-            task_model = session.get(TaskModel, task_id)
+            found = {}
+            for start in range(0, len(ids), ITER_TASKS_BATCH_SIZE):
+                query = (
+                    select(TaskModel)
+                    .options(*TASK_RELATIONSHIP_OPTIONS)
+                    .where(TaskModel.id.in_(ids[start : start + ITER_TASKS_BATCH_SIZE]))
+                )
+                for task_model in session.scalars(query):
+                    found[task_model.id] = self._task_model_to_entity(task_model)
+            return [found[task_id] for task_id in ids if task_id in found]
 
-            if not task_model:
-                return None
+        except SQLAlchemyError as e:
+            raise StorageError(f"Failed to retrieve tasks: {e}")
+        finally:
+            session.close()
 
-            return self._task_model_to_entity(task_model)
+    def get_dependents(self, task_id: UUID) -> list[Task]:
+        """Retrieve the tasks that depend on a task.
+
+        The dependents are found through the index on
+        dependencies.target_task_id, so only their rows are read.
+        """
+        session = self._get_session()
+        try:
+            dependent_ids = select(DependencyModel.source_task_id).where(
+                DependencyModel.target_task_id == task_id
+            )
+            query = (
+                select(TaskModel)
+                .options(*TASK_RELATIONSHIP_OPTIONS)
+                .where(TaskModel.id.in_(dependent_ids))
+            )
+            return [self._task_model_to_entity(t) for t in session.scalars(query)]
 
         except SQLAlchemyError as e:
-            raise StorageError(f"Failed to retrieve task: {e}")
+            raise StorageError(f"Failed to retrieve dependent tasks: {e}")
         finally:
             session.close()
 
@@ -564,7 +851,7 @@ class PostgreSQLStore(DataStore):
         """Retrieve tasks, optionally filtered by task list."""
         session = self._get_session()
         try:
-            query = select(TaskModel)
+            query = select(TaskModel).options(*TASK_RELATIONSHIP_OPTIONS)
 
             if task_list_id:
                 query = query.where(TaskModel.task_list_id == task_list_id)
@@ -577,89 +864,99 @@ class PostgreSQLStore(DataStore):
         finally:
             session.close()
 
+    def iter_tasks(
+        self, task_list_id: Optional[UUID] = None, batch_size: int = ITER_TASKS_BATCH_SIZE
+    ) -> Iterator[Task]:
+        """Iterate over tasks, fetching batch_size rows at a time.
+
+        The query streams through a server-side cursor (yield_per); the child
+        rows of each batch are loaded with one SELECT ... IN per relationship.
+        The session stays open until the iterator is exhausted or closed.
+        """
+        check_batch_size(batch_size)
+        session = self._get_session()
+        try:
+            query = (
+                select(TaskModel)
+                .options(*TASK_RELATIONSHIP_OPTIONS)
+                .execution_options(yield_per=batch_size)
+            )
+
+            if task_list_id:
+                query = query.where(TaskModel.task_list_id == task_list_id)
+
+            for task_model in session.scalars(query):
+                yield self._task_model_to_entity(task_model)
+
+        except SQLAlchemyError as e:
+            raise StorageError(f"Failed to list tasks: {e}")
+        finally:
+            session.close()
+
+    def get_task_version(self, task_id: UUID) -> Optional[str]:
+        """Read only the updated_at timestamp of a task.
+
+        Requirements: 5.6
+        """
+        session = self._get_session()
+        try:
+            updated_at = session.execute(
+                select(TaskModel.updated_at).where(TaskModel.id == task_id)
+            ).scalar_one_or_none()
+            return updated_at.isoformat() if updated_at else None
+
+        except SQLAlchemyError as e:
+            raise StorageError(f"Failed to retrieve task version: {e}")
+        finally:
+            session.close()
+
+    def get_tasks_version(self, task_list_id: Optional[UUID] = None) -> str:
+        """Derive the version of a set of tasks from their count and latest updated_at.
+
+        Deleting a task changes the count and every other change sets
+        updated_at, so the token changes without any task row being loaded.
+        """
+        session = self._get_session()
+        try:
+            query = select(func.count(), func.max(TaskModel.updated_at)).select_from(TaskModel)
+
+            if task_list_id:
+                query = query.where(TaskModel.task_list_id == task_list_id)
+
+            count, latest = session.execute(query).one()
+            return f"{count}:{latest.isoformat() if latest else ''}"
+
+        except SQLAlchemyError as e:
+            raise StorageError(f"Failed to retrieve tasks version: {e}")
+        finally:
+            session.close()
+
     def update_task(self, task: Task) -> Task:
         """Update an existing task in the backing store.
 
+        Child rows (dependencies, exit criteria, notes and action plan items) are
+        updated in place. Unchanged rows are left untouched, so appending a note
+        inserts a single row.
+
         Requirements: 5.7
         """
         session = self._get_session()
         try:
-            task_model = session.get(TaskModel, task.id)
+            task_model = session.get(TaskModel, task.id, options=TASK_RELATIONSHIP_OPTIONS)
 
             if not task_model:
                 raise ValueError(f"Task with id '{task.id}' does not exist")
 
-            # Update basic fields
-            task_model.title = task.title
-            task_model.description = task.description
-            task_model.status = task.status
-            task_model.priority = task.priority
-            task_model.agent_instructions_template = task.agent_instructions_template
-            task_model.tags = task.tags
-            task_model.updated_at = datetime.now(timezone.utc)
-
-            # Update dependencies - delete all and recreate
-            session.execute(
-                delete(DependencyModel).where(DependencyModel.source_task_id == task.id)
-            )
-            for dep in task.dependencies:
-                dep_model = DependencyModel(
-                    source_task_id=task.id,
-                    target_task_id=dep.task_id,
-                    target_task_list_id=dep.task_list_id,
-                )
-                session.add(dep_model)
-
-            # Update exit criteria - delete all and recreate
-            session.execute(delete(ExitCriteriaModel).where(ExitCriteriaModel.task_id == task.id))
-            for ec in task.exit_criteria:
-                ec_model = ExitCriteriaModel(
-                    task_id=task.id, criteria=ec.criteria, status=ec.status, comment=ec.comment
-                )
-                session.add(ec_model)
-
-            # Update notes - delete all and recreate
-            session.execute(delete(NoteModel).where(NoteModel.task_id == task.id))
-            for note in task.notes:
-                note_model = NoteModel(
-                    task_id=task.id,
-                    note_type=NoteType.GENERAL,
-                    content=note.content,
-                    timestamp=note.timestamp,
-                )
-                session.add(note_model)
-
-            if task.research_notes:
-                for note in task.research_notes:
-                    note_model = NoteModel(
-                        task_id=task.id,
-                        note_type=NoteType.RESEARCH,
-                        content=note.content,
-                        timestamp=note.timestamp,
-                    )
-                    session.add(note_model)
-
-            if task.execution_notes:
-                for note in task.execution_notes:
-                    note_model = NoteModel(
-                        task_id=task.id,
-                        note_type=NoteType.EXECUTION,
-                        content=note.content,
-                        timestamp=note.timestamp,
-                    )
-                    session.add(note_model)
+            stale_rows, new_rows = self._apply_task_update(task_model, task)
 
-            # Update action plan - delete all and recreate
-            session.execute(
-                delete(ActionPlanItemModel).where(ActionPlanItemModel.task_id == task.id)
-            )
-            if task.action_plan:
-                for item in task.action_plan:
-                    item_model = ActionPlanItemModel(
-                        task_id=task.id, sequence=item.sequence, content=item.content
-                    )
-                    session.add(item_model)
+            # Delete before inserting so re-added rows do not hit unique constraints
+            for row in stale_rows:
+                session.delete(row)
+            if stale_rows:
+                session.flush()
+            session.add_all(new_rows)
 
+            self._notify_change(session, "task", "updated", task.id, task_model.task_list_id)
             session.commit()
             session.refresh(task_model)
 
@@ -671,6 +968,148 @@ class PostgreSQLStore(DataStore):
         finally:
             session.close()
 
+    def update_tasks(self, tasks: list[Task]) -> list[Task]:
+        """Update several existing tasks in one transaction.
+
+        The stored tasks are loaded with one SELECT ... IN per batch, and the
+        changed rows of all tasks are flushed together before the single
+        commit, so SQLAlchemy groups the UPDATEs of the task rows into one
+        executemany per set of changed columns.
+        """
+        if not tasks:
+            return []
+
+        ids = [task.id for task in tasks]
+        session = self._get_session()
+        try:
+            task_models = {}
+            for start in range(0, len(ids), ITER_TASKS_BATCH_SIZE):
+                query = (
+                    select(TaskModel)
+                    .options(*TASK_RELATIONSHIP_OPTIONS)
+                    .where(TaskModel.id.in_(ids[start : start + ITER_TASKS_BATCH_SIZE]))
+                )
+                for task_model in session.scalars(query):
+                    task_models[task_model.id] = task_model
+
+            stale_rows, new_rows, changes = [], [], []
+            for task in tasks:
+                task_model = task_models.get(task.id)
+                if task_model is None:
+                    raise ValueError(f"Task with id '{task.id}' does not exist")
+
+                stale, new = self._apply_task_update(task_model, task)
+                stale_rows += stale
+                new_rows += new
+                changes.append((task.id, task_model.task_list_id))
+
+            # Delete before inserting so re-added rows do not hit unique constraints
+            for row in stale_rows:
+                session.delete(row)
+            if stale_rows:
+                session.flush()
+            session.add_all(new_rows)
+            self._notify_changes(session, "task", "updated", changes)
+            session.commit()
+
+        except SQLAlchemyError as e:
+            session.rollback()
+            raise StorageError(f"Failed to update tasks: {e}")
+        finally:
+            session.close()
+
+        return self.get_tasks(ids)
+
+    def _apply_task_update(self, task_model: TaskModel, task: Task) -> tuple[list[Any], list[Any]]:
+        """Copy the fields of an updated task onto its model.
+
+        Child rows (dependencies, exit criteria, notes and action plan items) are
+        updated in place where possible. Unchanged rows are left untouched.
+
+        Args:
+            task_model: The stored task, with its child collections loaded
+            task: The task with updated fields
+
+        Returns:
+            Tuple of (child rows to delete, child rows to insert)
+        """
+        # Update basic fields
+        task_model.title = task.title
+        task_model.description = task.description
+        task_model.status = task.status
+        task_model.priority = task.priority
+        task_model.agent_instructions_template = task.agent_instructions_template
+        task_model.tags = task.tags
+        task_model.updated_at = datetime.now(timezone.utc)
+
+        # Dependencies are unique per target, so they are matched by target and
+        # only their position is updated
+        stale_rows, new_rows = [], []
+        stored_deps = {
+            (dep.target_task_id, dep.target_task_list_id): dep for dep in task_model.dependencies
+        }
+        for position, dep in enumerate(task.dependencies):
+            dep_model = stored_deps.pop((dep.task_id, dep.task_list_id), None)
+            if dep_model is None:
+                new_rows.append(
+                    DependencyModel(
+                        source_task_id=task.id,
+                        target_task_id=dep.task_id,
+                        target_task_list_id=dep.task_list_id,
+                        position=position,
+                    )
+                )
+            elif dep_model.position != position:
+                dep_model.position = position
+        stale_rows += stored_deps.values()
+
+        # Exit criteria and notes are matched by position, so changed rows are
+        # updated in place
+        stale, new = self._update_positioned_rows(
+            task_model.exit_criteria,
+            task.exit_criteria,
+            values=lambda ec: {"criteria": ec.criteria, "status": ec.status, "comment": ec.comment},
+            create=lambda **values: ExitCriteriaModel(task_id=task.id, **values),
+        )
+        stale_rows += stale
+        new_rows += new
+
+        for note_type, notes in (
+            (NoteType.GENERAL, task.notes),
+            (NoteType.RESEARCH, task.research_notes or []),
+            (NoteType.EXECUTION, task.execution_notes or []),
+        ):
+            stale, new = self._update_positioned_rows(
+                [m for m in task_model.notes if m.note_type == note_type],
+                notes,
+                values=lambda note: {
+                    "content": note.content,
+                    "timestamp": self._naive(note.timestamp),
+                },
+                create=lambda note_type=note_type, **values: NoteModel(
+                    task_id=task.id, note_type=note_type, **values
+                ),
+            )
+            stale_rows += stale
+            new_rows += new
+
+        # Action plan items are keyed by sequence, so changed content is
+        # updated in place
+        stored_items = {item.sequence: item for item in task_model.action_plan_items}
+        for item in task.action_plan or []:
+            item_model = stored_items.pop(item.sequence, None)
+            if item_model is None:
+                new_rows.append(
+                    ActionPlanItemModel(
+                        task_id=task.id, sequence=item.sequence, content=item.content
+                    )
+                )
+            elif item_model.content != item.content:
+                item_model.content = item.content
+        stale_rows += stored_items.values()
+
+        return stale_rows, new_rows
+
     def delete_task(self, task_id: UUID) -> None:
         """Remove a task and update dependent tasks.
 
@@ -683,13 +1122,24 @@ class PostgreSQLStore(DataStore):
             if not task_model:
                 raise ValueError(f"Task with id '{task_id}' does not exist")
 
-            # Delete dependencies from other tasks that reference this task
+            # Delete dependencies from other tasks that reference this task, marking
+            # those tasks as updated
+            dependent_ids = select(DependencyModel.source_task_id).where(
+                DependencyModel.target_task_id == task_id
+            )
+            session.execute(
+                update(TaskModel)
+                .where(TaskModel.id.in_(dependent_ids))
+                .values(updated_at=datetime.now(timezone.utc))
+                .execution_options(synchronize_session=False)
+            )
             session.execute(
                 delete(DependencyModel).where(DependencyModel.target_task_id == task_id)
             )
 
             # Delete task (cascade will handle its own dependencies, exit criteria, notes, etc.)
             session.delete(task_model)
+            self._notify_change(session, "task", "deleted", task_id, task_model.task_list_id)
             session.commit()
 
         except SQLAlchemyError as e:
@@ -698,11 +1148,177 @@ class PostgreSQLStore(DataStore):
         finally:
             session.close()
 
+    def delete_tasks(self, task_ids: list[UUID]) -> None:
+        """Remove several tasks in one transaction.
+
+        Each batch of IDs is deleted with one DELETE ... WHERE id IN (...), after
+        one UPDATE marking the dependent tasks as updated and one DELETE of the
+        dependencies on the batch. The child rows of the tasks are removed by
+        ON DELETE CASCADE.
+        """
+        ids = list(dict.fromkeys(task_ids))
+        if not ids:
+            return
+
+        session = self._get_session()
+        try:
+            task_list_ids = self._existing_task_list_ids(session, ids)
+
+            now = datetime.now(timezone.utc)
+            for start in range(0, len(ids), ITER_TASKS_BATCH_SIZE):
+                batch = ids[start : start + ITER_TASKS_BATCH_SIZE]
+                dependent_ids = select(DependencyModel.source_task_id).where(
+                    DependencyModel.target_task_id.in_(batch)
+                )
+                session.execute(
+                    update(TaskModel)
+                    .where(TaskModel.id.in_(dependent_ids))
+                    .values(updated_at=now)
+                    .execution_options(synchronize_session=False)
+                )
+                session.execute(
+                    delete(DependencyModel).where(DependencyModel.target_task_id.in_(batch))
+                )
+                session.execute(
+                    delete(TaskModel)
+                    .where(TaskModel.id.in_(batch))
+                    .execution_options(synchronize_session=False)
+                )
+
+            self._notify_changes(
+                session, "task", "deleted", [(task_id, task_list_ids[task_id]) for task_id in ids]
+            )
+            session.commit()
+
+        except SQLAlchemyError as e:
+            session.rollback()
+            raise StorageError(f"Failed to delete tasks: {e}")
+        finally:
+            session.close()
+
+    def add_tags_to_tasks(self, task_ids: list[UUID], tags: list[str]) -> list[Task]:
+        """Add tags to several tasks with one UPDATE per batch of tasks.
+
+        The new tags are computed in the database from the stored ones, see
+        _tags_added().
+        """
+        return self._update_tags_in_place(task_ids, self._tags_added(list(dict.fromkeys(tags))))
+
+    def remove_tags_from_tasks(self, task_ids: list[UUID], tags: list[str]) -> list[Task]:
+        """Remove tags from several tasks with one UPDATE per batch of tasks.
+
+        The remaining tags are computed in the database, see _tags_removed().
+        """
+        return self._update_tags_in_place(task_ids, self._tags_removed(list(dict.fromkeys(tags))))
+
+    def _tags_added(self, tags: list[str]) -> Any:
+        """Build the expression of a task's tags with tags appended.
+
+        Tags already on the task are removed with array_remove() before the new
+        tags are appended with array_cat(), so no tag is repeated.
+
+        Args:
+            tags: The tags to add, without repetitions
+
+        Returns:
+            SQL expression of the new tags
+        """
+        return func.array_cat(self._tags_removed(tags), type_coerce(tags, ARRAY(String)))
+
+    def _tags_removed(self, tags: list[str]) -> Any:
+        """Build the expression of a task's tags without some tags.
+
+        Args:
+            tags: The tags to remove
+
+        Returns:
+            SQL expression of the remaining tags
+        """
+        remaining = TaskModel.tags
+        for tag in tags:
+            remaining = func.array_remove(remaining, tag)
+        return remaining
+
+    def _update_tags_in_place(self, task_ids: list[UUID], new_tags: Any) -> list[Task]:
+        """Set the tags of several tasks to an expression in one transaction.
+
+        Args:
+            task_ids: The UUIDs of the tasks; repeated IDs are ignored
+            new_tags: SQL expression computing the new tags of a task
+
+        Returns:
+            The updated tasks, in the order of their IDs in task_ids
+
+        Raises:
+            ValueError: If a task does not exist
+            StorageError: If the tasks cannot be updated
+        """
+        ids = list(dict.fromkeys(task_ids))
+        if not ids:
+            return []
+
+        session = self._get_session()
+        try:
+            task_list_ids = self._existing_task_list_ids(session, ids)
+
+            now = datetime.now(timezone.utc)
+            for start in range(0, len(ids), ITER_TASKS_BATCH_SIZE):
+                session.execute(
+                    update(TaskModel)
+                    .where(TaskModel.id.in_(ids[start : start + ITER_TASKS_BATCH_SIZE]))
+                    .values(tags=new_tags, updated_at=now)
+                    .execution_options(synchronize_session=False)
+                )
+
+            self._notify_changes(
+                session, "task", "updated", [(task_id, task_list_ids[task_id]) for task_id in ids]
+            )
+            session.commit()
+
+        except SQLAlchemyError as e:
+            session.rollback()
+            raise StorageError(f"Failed to update task tags: {e}")
+        finally:
+            session.close()
+
+        return self.get_tasks(ids)
+
+    def _existing_task_list_ids(self, session: Session, task_ids: list[UUID]) -> dict[UUID, UUID]:
+        """Look up the task lists of several tasks, which must all exist.
+
+        Args:
+            session: Session of the calling transaction
+            task_ids: The UUIDs of the tasks, without repetitions
+
+        Returns:
+            The task list ID of each task, by task ID
+
+        Raises:
+            ValueError: If a task does not exist
+        """
+        task_list_ids = {}
+        for start in range(0, len(task_ids), ITER_TASKS_BATCH_SIZE):
+            query = select(TaskModel.id, TaskModel.task_list_id).where(
+                TaskModel.id.in_(task_ids[start : start + ITER_TASKS_BATCH_SIZE])
+            )
+            task_list_ids.update(session.execute(query).all())
+
+        for task_id in task_ids:
+            if task_id not in task_list_ids:
+                raise ValueError(f"Task with id '{task_id}' does not exist")
+        return task_list_ids
+
     # Specialized operations
 
-    def get_ready_tasks(self, scope_type: str, scope_id: UUID) -> list[Task]:
+    def get_ready_tasks(
+        self, scope_type: str, scope_id: UUID, statuses: Optional[list[Status]] = None
+    ) -> list[Task]:
         """Retrieve tasks that are ready for execution.
 
+        Readiness is evaluated in a single query with an anti-join: a task is
+        returned unless one of its dependencies points at a task that is missing
+        or not COMPLETED.
+
         Requirements: 9.1, 9.2, 9.3
         """
         session = self._get_session()
@@ -713,55 +1329,323 @@ class PostgreSQLStore(DataStore):
                     f"Invalid scope_type: '{scope_type}'. Must be 'project' or 'task_list'"
                 )
 
-            # Get tasks based on scope
             if scope_type == "project":
                 # Verify project exists
-                project = session.get(ProjectModel, scope_id)
-                if not project:
+                if not session.get(ProjectModel, scope_id):
                     raise ValueError(f"Project with id '{scope_id}' does not exist")
-
-                # Get all tasks in all task lists of this project
-                query = (
-                    select(TaskModel)
-                    .join(TaskListModel)
-                    .where(TaskListModel.project_id == scope_id)
+                in_scope = TaskModel.task_list_id.in_(
+                    select(TaskListModel.id).where(TaskListModel.project_id == scope_id)
                 )
             else:  # task_list
                 # Verify task list exists
-                task_list = session.get(TaskListModel, scope_id)
-                if not task_list:
+                if not session.get(TaskListModel, scope_id):
                     raise ValueError(f"Task list with id '{scope_id}' does not exist")
+                in_scope = TaskModel.task_list_id == scope_id
+
+            dependency_task = aliased(TaskModel)
+            has_pending_dependency = exists(
+                select(DependencyModel.id)
+                .outerjoin(dependency_task, dependency_task.id == DependencyModel.target_task_id)
+                .where(
+                    DependencyModel.source_task_id == TaskModel.id,
+                    or_(
+                        dependency_task.id.is_(None),
+                        dependency_task.status != Status.COMPLETED,
+                    ),
+                )
+            )
 
-                # Get all tasks in this task list
-                query = select(TaskModel).where(TaskModel.task_list_id == scope_id)
-
-            tasks = session.execute(query).scalars().all()
+            query = select(TaskModel).where(in_scope, ~has_pending_dependency)
+            if statuses is not None:
+                query = query.where(TaskModel.status.in_(statuses))
 
-            # Filter for ready tasks
-            ready_tasks = []
-            for task_model in tasks:
-                # A task is ready if it has no dependencies or all dependencies are completed
-                if not task_model.dependencies:
-                    ready_tasks.append(self._task_model_to_entity(task_model))
-                else:
-                    # Check if all dependency tasks are completed
-                    all_completed = True
-                    for dep in task_model.dependencies:
-                        dep_task = session.get(TaskModel, dep.target_task_id)
-                        if not dep_task or dep_task.status != Status.COMPLETED:
-                            all_completed = False
-                            break
-
-                    if all_completed:
-                        ready_tasks.append(self._task_model_to_entity(task_model))
-
-            return ready_tasks
+            tasks = session.execute(query.options(*TASK_RELATIONSHIP_OPTIONS)).scalars().all()
+            return [self._task_model_to_entity(t) for t in tasks]
 
         except SQLAlchemyError as e:
             raise StorageError(f"Failed to get ready tasks: {e}")
         finally:
             session.close()
 
+    def search_tasks(self, criteria: SearchCriteria) -> list[Task]:
+        """Search tasks with filtering, relevance scoring, sorting and pagination in SQL.
+
+        See search_task_page().
+
+        Args:
+            criteria: SearchCriteria object with filter parameters
+
+        Returns:
+            One page of matching tasks
+
+        Raises:
+            StorageError: If the query fails
+
+        Requirements: 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8
+        """
+        return self.search_task_page(criteria).tasks
+
+    def search_task_page(self, criteria: SearchCriteria) -> SearchPage:
+        """Search tasks in SQL and return one page with the cursor of the next.
+
+        The text query matches tasks whose title or description contains it,
+        like the other stores, and additionally tasks where every word of the
+        query occurs as a word prefix in the full-text index on title and
+        description. Relevance is the ts_rank of the full-text match with title
+        words weighted above description words. Tags match if any of them is in the task's tag
+        array. Ties are broken newest first, then by task ID.
+
+        The sort key values are selected along with each task. A cursor
+        becomes a keyset condition on (sort keys, task ID), so the page is read
+        from the index position after the cursor instead of skipping rows.
+        One row beyond the limit is fetched to tell whether a next page
+        exists. The criteria are expected to be validated by the caller.
+
+        Args:
+            criteria: SearchCriteria object with filter parameters
+
+        Returns:
+            SearchPage with the tasks and the next cursor (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is invalid
+            StorageError: If the query fails
+
+        Requirements: 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8
+        """
+        session = self._get_session()
+        try:
+            conditions, relevance = self._search_conditions(criteria)
+
+            if criteria.sort_by == "created_at":
+                sort_keys = [TaskModel.created_at]
+            elif criteria.sort_by == "updated_at":
+                sort_keys = [TaskModel.updated_at]
+            elif criteria.sort_by == "priority":
+                priority_rank = case(
+                    *[(TaskModel.priority == p, rank) for p, rank in PRIORITY_ORDER.items()],
+                    else_=0,
+                )
+                sort_keys = [priority_rank, TaskModel.created_at]
+            elif relevance is not None:
+                sort_keys = [relevance, TaskModel.created_at]
+            else:
+                sort_keys = [TaskModel.created_at]
+
+            if criteria.cursor:
+                cursor_keys, cursor_id = decode_cursor(
+                    criteria.cursor, criteria.sort_by, len(sort_keys)
+                )
+                conditions.append(self._after_cursor(sort_keys, cursor_keys, cursor_id))
+
+            query = (
+                select(TaskModel, *sort_keys)
+                .where(*conditions)
+                .order_by(*[key.desc() for key in sort_keys], TaskModel.id)
+                .limit(criteria.limit + 1)
+                .offset(criteria.offset)
+                .options(*TASK_RELATIONSHIP_OPTIONS)
+            )
+            rows = session.execute(query).all()
+
+            next_cursor = None
+            if len(rows) > criteria.limit:
+                rows = rows[: criteria.limit]
+                last = rows[-1]
+                next_cursor = encode_cursor(criteria.sort_by, last[1:], last[0].id)
+            return SearchPage(
+                tasks=[self._task_model_to_entity(row[0]) for row in rows],
+                next_cursor=next_cursor,
+            )
+
+        except SQLAlchemyError as e:
+            raise StorageError(f"Failed to search tasks: {e}")
+        finally:
+            session.close()
+
+    def count_tasks(self, criteria: SearchCriteria) -> int:
+        """Count the tasks matching search criteria with a single SELECT count(*).
+
+        Uses the same filters as search_tasks(); pagination and sorting are
+        ignored.
+
+        Args:
+            criteria: SearchCriteria object with filter parameters
+
+        Returns:
+            Number of matching tasks
+
+        Raises:
+            StorageError: If the query fails
+
+        Requirements: 4.8
+        """
+        session = self._get_session()
+        try:
+            conditions, _ = self._search_conditions(criteria)
+            query = select(func.count()).select_from(TaskModel).where(*conditions)
+            return session.execute(query).scalar_one()
+
+        except SQLAlchemyError as e:
+            raise StorageError(f"Failed to count tasks: {e}")
+        finally:
+            session.close()
+
+    # Helper methods for search
+
+    def _search_conditions(self, criteria: SearchCriteria) -> tuple[list[Any], Any]:
+        """Build the WHERE conditions for search criteria.
+
+        Args:
+            criteria: SearchCriteria object with filter parameters
+
+        Returns:
+            Tuple of (conditions, relevance expression or None without a text query)
+        """
+        conditions: list[Any] = []
+
+        if criteria.status:
+            conditions.append(TaskModel.status.in_(criteria.status))
+
+        if criteria.priority:
+            conditions.append(TaskModel.priority.in_(criteria.priority))
+
+        if criteria.tags:
+            conditions.append(self._tags_match(criteria.tags))
+
+        # Project ID takes precedence over project name
+        if criteria.project_id:
+            conditions.append(
+                TaskModel.task_list_id.in_(
+                    select(TaskListModel.id).where(TaskListModel.project_id == criteria.project_id)
+                )
+            )
+        elif criteria.project_name:
+            conditions.append(
+                TaskModel.task_list_id.in_(
+                    select(TaskListModel.id)
+                    .join(ProjectModel)
+                    .where(ProjectModel.name == criteria.project_name)
+                )
+            )
+
+        relevance = None
+        if criteria.query:
+            condition, relevance = self._text_match(criteria.query)
+            conditions.append(condition)
+
+        return conditions, relevance
+
+    @staticmethod
+    def _after_cursor(sort_keys: list[Any], cursor_keys: list[Any], cursor_id: UUID) -> Any:
+        """Build the keyset condition selecting rows after a cursor position.
+
+        Rows are ordered by the sort keys descending and then by ID ascending,
+        so a row comes after the cursor if its first differing key is smaller,
+        or if all keys are equal and its ID is greater.
+
+        Args:
+            sort_keys: Sort key expressions
+            cursor_keys: Sort key values stored in the cursor
+            cursor_id: Task ID stored in the cursor
+
+        Returns:
+            SQL condition
+        """
+        clauses = []
+        for i, key in enumerate(sort_keys):
+            equal = [k == v for k, v in zip(sort_keys[:i], cursor_keys[:i])]
+            clauses.append(and_(*equal, key < cursor_keys[i]))
+        equal = [k == v for k, v in zip(sort_keys, cursor_keys)]
+        clauses.append(and_(*equal, TaskModel.id > cursor_id))
+        return or_(*clauses)
+
+    def _tags_match(self, tags: list[str]) -> Any:
+        """Build a condition matching tasks that have at least one of the tags.
+
+        Uses the array overlap operator, which the GIN index on tags serves.
+        """
+        return type_coerce(TaskModel.tags, ARRAY(String)).overlap(tags)
+
+    def _text_match(self, query_text: str) -> tuple[Any, Any]:
+        """Build the text search condition and relevance expression.
+
+        A task matches if the query occurs case-insensitively in its title or
+        description, as with the other stores, or if every word of the query
+        occurs as a word prefix in the full-text index, in any order.
+
+        Args:
+            query_text: The search text
+
+        Returns:
+            Tuple of (condition, relevance expression or None if matches are unranked)
+        """
+        substring_match = or_(
+            TaskModel.title.icontains(query_text, autoescape=True),
+            TaskModel.description.icontains(query_text, autoescape=True),
+        )
+        words = re.findall(r"\w+", query_text)
+        if not words:
+            # Nothing to look up in the index, e.g. a query of only punctuation
+            return substring_match, None
+
+        search_vector = task_search_vector(TaskModel.title, TaskModel.description)
+        ts_query = func.to_tsquery(
+            literal_column(f"'{TEXT_SEARCH_CONFIG}'::regconfig"),
+            " & ".join(f"{word}:*" for word in words),
+        )
+        condition = or_(search_vector.op("@@")(ts_query), substring_match)
+        # ts_rank returns real, which a double from a cursor never equals;
+        # ranking in double precision keeps the keyset comparison exact
+        relevance = cast(func.ts_rank(search_vector, ts_query), Float(53))
+        return condition, relevance
+
+    # Helper methods for updating child rows
+
+    @staticmethod
+    def _update_positioned_rows(
+        stored: Iterable[Any],
+        desired: Iterable[Any],
+        values: Callable[[Any], dict[str, Any]],
+        create: Callable[..., Any],
+    ) -> tuple[list[Any], list[Any]]:
+        """Update a child collection ordered by its position column in place.
+
+        The stored row at each position takes the column values of the desired
+        value at that position. Only columns whose value differs are assigned,
+        so unchanged rows are not written. Surplus stored rows are deleted and
+        surplus desired values are inserted.
+
+        Args:
+            stored: Stored rows ordered by position
+            desired: Desired values in order
+            values: Column values of the row for a desired value
+            create: Builds a new row from column values
+
+        Returns:
+            Tuple of (rows to delete, rows to insert)
+        """
+        stored = list(stored)
+        desired = list(desired)
+
+        new_rows = []
+        for position, value in enumerate(desired):
+            columns = {"position": position, **values(value)}
+            if position >= len(stored):
+                new_rows.append(create(**columns))
+                continue
+            row = stored[position]
+            for name, column_value in columns.items():
+                if getattr(row, name) != column_value:
+                    setattr(row, name, column_value)
+
+        return stored[len(desired) :], new_rows
+
+    @staticmethod
+    def _naive(timestamp: Optional[datetime]) -> Optional[datetime]:
+        """Drop the timezone, which TIMESTAMP WITHOUT TIME ZONE columns do not keep."""
+        return timestamp.replace(tzinfo=None) if timestamp is not None else None
+
     # Helper methods for converting between models and entities
 
     def _project_model_to_entity(self, model: ProjectModel) -> Project:
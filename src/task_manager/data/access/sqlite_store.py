@@ -0,0 +1,165 @@
+"""Embedded SQLite backing store implementation.
+
+This module implements the SQLiteStore class, a DataStore backed by a local
+SQLite database file. It shares the SQLAlchemy schema (tables and indexes) and
+CRUD implementation with PostgreSQLStore and adds SQLite specific tuning:
+
+- WAL journaling so readers never block the writer
+- synchronous=NORMAL, which is durable in WAL mode except on power loss
+- Foreign keys enabled so ON DELETE CASCADE removes child rows
+- A per-connection prepared statement cache
+- Substring text search and JSON tag matching and editing in place of PostgreSQL's
+  full-text index and array operators
+
+Requirements: 1.3, 1.5, 4.1-4.8, 9.1-9.3
+"""
+
+import pathlib
+import sqlite3
+from typing import Any
+
+from sqlalchemy import create_engine, event, exists, func, or_, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
+
+from task_manager.data.access.postgresql_schema import TaskModel
+from task_manager.data.access.postgresql_store import PostgreSQLStore, StorageError
+
+
+def _casefold(value: Any) -> Any:
+    """SQL function performing Python's Unicode case-folding."""
+    return value.casefold() if isinstance(value, str) else value
+
+
+class SQLiteStore(PostgreSQLStore):
+    """SQLite implementation of the DataStore interface.
+
+    All operations execute directly against the database file, so several
+    processes can share one database.
+
+    Attributes:
+        database_path: Path of the SQLite database file
+        connection_string: SQLAlchemy connection URL of the database
+        engine: SQLAlchemy engine
+        SessionLocal: SQLAlchemy session factory
+    """
+
+    # Number of prepared statements cached per connection
+    STATEMENT_CACHE_SIZE = 256
+
+    # Seconds a connection waits for a lock held by another writer
+    BUSY_TIMEOUT = 30
+
+    def __init__(self, database_path: str = "/tmp/tasks.db"):
+        """Initialize the SQLite store.
+
+        Args:
+            database_path: Path of the database file. Parent directories are
+                           created if needed.
+
+        Raises:
+            StorageError: If the path is empty or the engine cannot be created
+        """
+        if not database_path or not database_path.strip():
+            raise StorageError("SQLite database path cannot be empty")
+
+        self.database_path = pathlib.Path(database_path).expanduser().absolute()
+        self.connection_string = f"sqlite:///{self.database_path}"
+
+        try:
+            self.database_path.parent.mkdir(parents=True, exist_ok=True)
+            self.engine = create_engine(
+                self.connection_string,
+                connect_args={
+                    "check_same_thread": False,
+                    "timeout": self.BUSY_TIMEOUT,
+                    "cached_statements": self.STATEMENT_CACHE_SIZE,
+                },
+                echo=False,  # Set to True for SQL debugging
+            )
+            event.listen(self.engine, "connect", self._configure_connection)
+
+            self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        except (OSError, SQLAlchemyError) as e:
+            raise StorageError(f"Invalid SQLite database path: {e}")
+
+    @staticmethod
+    def _configure_connection(dbapi_connection: sqlite3.Connection, connection_record: Any) -> None:
+        """Apply pragmas and register SQL functions on every new connection."""
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+        finally:
+            cursor.close()
+
+        dbapi_connection.create_function("casefold", 1, _casefold, deterministic=True)
+
+    # Helper methods for search
+
+    def _tags_match(self, tags: list[str]) -> Any:
+        """Build a condition matching tasks that have at least one of the tags.
+
+        Tags are stored as a JSON array and expanded with json_each.
+        """
+        task_tags = func.json_each(TaskModel.tags).table_valued("value")
+        return exists(select(task_tags.c.value).where(task_tags.c.value.in_(tags)))
+
+    def _tags_added(self, tags: list[str]) -> Any:
+        """Build the expression of a task's tags with tags appended.
+
+        Each tag is appended to the JSON array with json_insert() and the
+        '$[#]' path, after removing the tags already on the task.
+        """
+        remaining = self._tags_removed(tags)
+        if not tags:
+            return remaining
+        arguments = []
+        for tag in tags:
+            arguments += ["$[#]", tag]
+        return func.json_insert(remaining, *arguments)
+
+    def _tags_removed(self, tags: list[str]) -> Any:
+        """Build the expression of a task's tags without some tags.
+
+        The JSON array is expanded with json_each and the remaining tags are
+        collected again with json_group_array.
+        """
+        task_tags = func.json_each(TaskModel.tags).table_valued("value")
+        return (
+            select(func.json_group_array(task_tags.c.value))
+            .where(task_tags.c.value.not_in(tags))
+            .scalar_subquery()
+        )
+
+    def _text_match(self, query_text: str) -> tuple[Any, Any]:
+        """Build the text search condition and relevance expression.
+
+        Matches the semantics of SearchOrchestrator: case-folded substring
+        matching on title and description, and a relevance score of two points
+        per title occurrence and one per description occurrence.
+
+        Args:
+            query_text: The search text
+
+        Returns:
+            Tuple of (condition, relevance expression)
+        """
+        query_folded = query_text.casefold()
+        title_folded = func.casefold(TaskModel.title)
+        description_folded = func.casefold(TaskModel.description)
+        condition = or_(
+            func.instr(title_folded, query_folded) > 0,
+            func.instr(description_folded, query_folded) > 0,
+        )
+        relevance = self._occurrences(title_folded, query_folded) * 2 + self._occurrences(
+            description_folded, query_folded
+        )
+        return condition, relevance
+
+    @staticmethod
+    def _occurrences(text: Any, needle: str) -> Any:
+        """Build a SQL expression counting non-overlapping occurrences of needle in text."""
+        return (func.length(text) - func.length(func.replace(text, needle, ""))) / len(needle)
@@ -4,9 +4,10 @@ This module provides environment variable reading and a factory function
 that returns the appropriate DataStore implementation based on configuration.
 
 Environment Variables:
-- DATA_STORE_TYPE: "postgresql" or "filesystem" (default: "filesystem")
+- DATA_STORE_TYPE: "postgresql", "filesystem", "log" or "sqlite" (default: "filesystem")
 - POSTGRES_URL: PostgreSQL connection string (required if DATA_STORE_TYPE="postgresql")
-- FILESYSTEM_PATH: Path for filesystem storage (default: "/tmp/tasks")
+- FILESYSTEM_PATH: Path for filesystem or log storage (default: "/tmp/tasks")
+- SQLITE_PATH: SQLite database file (default: "/tmp/tasks.db")
 - MULTI_AGENT_ENVIRONMENT_BEHAVIOR: "true" or "false" (default: "false")
   Controls whether IN_PROGRESS tasks appear in ready tasks list
 
@@ -16,6 +17,7 @@ Requirements: 1.1, 1.2, 1.3, 1.4
 import os
 from typing import Optional
 
+from task_manager.data.delegation.async_data_store import AsyncDataStore
 from task_manager.data.delegation.data_store import DataStore
 
 
@@ -29,7 +31,7 @@ def get_data_store_type() -> str:
     """Get the backing store type from environment variable.
 
     Returns:
-        The backing store type: "postgresql" or "filesystem"
+        The backing store type: "postgresql", "filesystem", "log" or "sqlite"
         Defaults to "filesystem" if DATA_STORE_TYPE is not set.
 
     Requirements: 1.1, 1.4
@@ -60,6 +62,18 @@ def get_filesystem_path() -> str:
     return os.environ.get("FILESYSTEM_PATH", "/tmp/tasks")
 
 
+def get_sqlite_path() -> str:
+    """Get the SQLite database path from environment variable.
+
+    Returns:
+        The SQLite database file path.
+        Defaults to "/tmp/tasks.db" if SQLITE_PATH is not set.
+
+    Requirements: 1.4
+    """
+    return os.environ.get("SQLITE_PATH", "/tmp/tasks.db")
+
+
 def create_data_store() -> DataStore:
     """Factory function that returns the appropriate DataStore implementation.
 
@@ -67,6 +81,8 @@ def create_data_store() -> DataStore:
     the corresponding DataStore implementation:
     - "postgresql": Returns PostgreSQL DataStore using POSTGRES_URL
     - "filesystem" or unset: Returns Filesystem DataStore using FILESYSTEM_PATH
+    - "log": Returns append-only log DataStore using FILESYSTEM_PATH
+    - "sqlite": Returns embedded SQLite DataStore using SQLITE_PATH
 
     Returns:
         A DataStore implementation configured based on environment variables.
@@ -109,7 +125,55 @@ def create_data_store() -> DataStore:
         except ImportError as e:
             raise ConfigurationError(f"Filesystem store implementation not available: {e}")
 
+    elif store_type == "log":
+        filesystem_path = get_filesystem_path()
+
+        try:
+            from task_manager.data.access.log_store import LogStore
+
+            return LogStore(filesystem_path)
+        except ImportError as e:
+            raise ConfigurationError(f"Log store implementation not available: {e}")
+
+    elif store_type == "sqlite":
+        sqlite_path = get_sqlite_path()
+
+        try:
+            from task_manager.data.access.sqlite_store import SQLiteStore
+
+            return SQLiteStore(sqlite_path)
+        except ImportError as e:
+            raise ConfigurationError(f"SQLite store implementation not available: {e}")
+
     else:
         raise ConfigurationError(
-            f"Invalid DATA_STORE_TYPE: '{store_type}'. " f"Must be 'postgresql' or 'filesystem'."
+            f"Invalid DATA_STORE_TYPE: '{store_type}'. "
+            f"Must be 'postgresql', 'filesystem', 'log' or 'sqlite'."
         )
+
+
+def create_async_data_store() -> Optional[AsyncDataStore]:
+    """Factory function that returns the AsyncDataStore of the configured store, if any.
+
+    Only "postgresql" has an asynchronous implementation, AsyncPostgreSQLStore,
+    and it requires the "postgresql-async" extra. The interfaces serve their
+    read paths from it when it is available, and from the DataStore of
+    create_data_store() otherwise.
+
+    Returns:
+        An AsyncPostgreSQLStore using POSTGRES_URL, or None if the configured
+        store has no asynchronous implementation or the extra is not installed.
+    """
+    postgres_url = get_postgres_url()
+    if get_data_store_type() != "postgresql" or not postgres_url:
+        return None
+
+    try:
+        import asyncpg  # noqa: F401
+        import greenlet  # noqa: F401
+
+        from task_manager.data.access.async_postgresql_store import AsyncPostgreSQLStore
+    except ImportError:
+        return None
+
+    return AsyncPostgreSQLStore(postgres_url)
@@ -1,5 +1,6 @@
 """Data store abstraction layer."""
 
+from .async_data_store import AsyncDataStore
 from .data_store import DataStore
 
-__all__ = ["DataStore"]
+__all__ = ["AsyncDataStore", "DataStore"]
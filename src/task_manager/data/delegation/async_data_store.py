@@ -0,0 +1,258 @@
+"""Abstract asynchronous data store interface for the task management system.
+
+This module defines the coroutine counterpart of DataStore for backends with
+native async drivers. Awaiting a store call suspends only the calling task,
+so a single event loop can keep many queries in flight without worker
+threads. The semantics of every operation are those of the DataStore method
+of the same name.
+
+Unlike DataStore, searching and counting are part of the interface: async
+stores are expected to evaluate them in the backend rather than having tasks
+loaded and filtered in memory.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+from uuid import UUID
+
+from task_manager.models.entities import Project, SearchCriteria, SearchPage, Task, TaskList
+from task_manager.models.enums import Status
+
+
+class AsyncDataStore(ABC):
+    """Abstract interface for asynchronous data store implementations.
+
+    Implementations:
+    - PostgreSQL: Uses SQLAlchemy's async engine with the asyncpg driver
+
+    Attributes:
+        supports_ready_task_query: Always True; get_ready_tasks() is evaluated
+            natively by async stores
+    """
+
+    supports_ready_task_query: bool = True
+
+    @abstractmethod
+    async def initialize(self) -> None:
+        """Initialize the backing store and create default projects.
+
+        See DataStore.initialize().
+
+        Raises:
+            StorageError: If the backing store cannot be initialized
+        """
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the connections held by the store.
+
+        Raises:
+            StorageError: If the connections cannot be released
+        """
+        pass
+
+    # Project CRUD operations
+
+    @abstractmethod
+    async def create_project(self, project: Project) -> Project:
+        """Persist a new project. See DataStore.create_project().
+
+        Requirements: 3.1
+        """
+        pass
+
+    @abstractmethod
+    async def get_project(self, project_id: UUID) -> Optional[Project]:
+        """Retrieve a project by ID. See DataStore.get_project().
+
+        Requirements: 3.2
+        """
+        pass
+
+    @abstractmethod
+    async def list_projects(self) -> list[Project]:
+        """Retrieve all projects. See DataStore.list_projects().
+
+        Requirements: 3.5
+        """
+        pass
+
+    @abstractmethod
+    async def update_project(self, project: Project) -> Project:
+        """Update an existing project. See DataStore.update_project().
+
+        Requirements: 3.3
+        """
+        pass
+
+    @abstractmethod
+    async def delete_project(self, project_id: UUID) -> None:
+        """Remove a project with its task lists and tasks. See DataStore.delete_project().
+
+        Requirements: 3.4
+        """
+        pass
+
+    # TaskList CRUD operations
+
+    @abstractmethod
+    async def create_task_list(self, task_list: TaskList) -> TaskList:
+        """Persist a new task list. See DataStore.create_task_list().
+
+        Requirements: 4.5
+        """
+        pass
+
+    @abstractmethod
+    async def get_task_list(self, task_list_id: UUID) -> Optional[TaskList]:
+        """Retrieve a task list by ID. See DataStore.get_task_list().
+
+        Requirements: 4.6
+        """
+        pass
+
+    @abstractmethod
+    async def list_task_lists(self, project_id: Optional[UUID] = None) -> list[TaskList]:
+        """Retrieve task lists, optionally of one project. See DataStore.list_task_lists()."""
+        pass
+
+    @abstractmethod
+    async def update_task_list(self, task_list: TaskList) -> TaskList:
+        """Update an existing task list. See DataStore.update_task_list().
+
+        Requirements: 4.7
+        """
+        pass
+
+    @abstractmethod
+    async def delete_task_list(self, task_list_id: UUID) -> None:
+        """Remove a task list and its tasks. See DataStore.delete_task_list().
+
+        Requirements: 4.8
+        """
+        pass
+
+    @abstractmethod
+    async def reset_task_list(self, task_list_id: UUID) -> None:
+        """Reset a repeatable task list. See DataStore.reset_task_list().
+
+        Requirements: 16.1, 16.2, 16.3, 16.4
+        """
+        pass
+
+    # Task CRUD operations
+
+    @abstractmethod
+    async def create_task(self, task: Task) -> Task:
+        """Persist a new task. See DataStore.create_task().
+
+        Requirements: 5.2
+        """
+        pass
+
+    @abstractmethod
+    async def create_tasks(self, tasks: list[Task]) -> list[Task]:
+        """Persist several new tasks together. See DataStore.create_tasks()."""
+        pass
+
+    @abstractmethod
+    async def get_task(self, task_id: UUID) -> Optional[Task]:
+        """Retrieve a task by ID. See DataStore.get_task().
+
+        Requirements: 5.6
+        """
+        pass
+
+    @abstractmethod
+    async def get_tasks(self, task_ids: Iterable[UUID]) -> list[Task]:
+        """Retrieve several tasks by ID. See DataStore.get_tasks()."""
+        pass
+
+    @abstractmethod
+    async def list_tasks(self, task_list_id: Optional[UUID] = None) -> list[Task]:
+        """Retrieve tasks, optionally of one task list. See DataStore.list_tasks()."""
+        pass
+
+    @abstractmethod
+    async def update_task(self, task: Task) -> Task:
+        """Update an existing task. See DataStore.update_task().
+
+        Requirements: 5.7
+        """
+        pass
+
+    @abstractmethod
+    async def delete_task(self, task_id: UUID) -> None:
+        """Remove a task and the dependencies on it. See DataStore.delete_task().
+
+        Requirements: 5.8, 8.5
+        """
+        pass
+
+    @abstractmethod
+    async def update_tasks(self, tasks: list[Task]) -> list[Task]:
+        """Update several existing tasks together. See DataStore.update_tasks()."""
+        pass
+
+    @abstractmethod
+    async def delete_tasks(self, task_ids: list[UUID]) -> None:
+        """Remove several tasks together. See DataStore.delete_tasks()."""
+        pass
+
+    @abstractmethod
+    async def add_tags_to_tasks(self, task_ids: list[UUID], tags: list[str]) -> list[Task]:
+        """Add tags to several tasks together. See DataStore.add_tags_to_tasks()."""
+        pass
+
+    @abstractmethod
+    async def remove_tags_from_tasks(self, task_ids: list[UUID], tags: list[str]) -> list[Task]:
+        """Remove tags from several tasks together. See DataStore.remove_tags_from_tasks()."""
+        pass
+
+    # Specialized operations
+
+    @abstractmethod
+    async def get_ready_tasks(
+        self, scope_type: str, scope_id: UUID, statuses: Optional[list[Status]] = None
+    ) -> list[Task]:
+        """Retrieve tasks that are ready for execution. See DataStore.get_ready_tasks().
+
+        Requirements: 9.1, 9.2, 9.3
+        """
+        pass
+
+    @abstractmethod
+    async def search_task_page(self, criteria: SearchCriteria) -> SearchPage:
+        """Search tasks and return one page with the cursor of the next.
+
+        Args:
+            criteria: Validated SearchCriteria
+
+        Returns:
+            SearchPage with the tasks and the next cursor (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is invalid
+            StorageError: If the backing store cannot be accessed
+
+        Requirements: 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8
+        """
+        pass
+
+    @abstractmethod
+    async def count_tasks(self, criteria: SearchCriteria) -> int:
+        """Count the tasks matching search criteria, ignoring pagination.
+
+        Args:
+            criteria: SearchCriteria with filter parameters
+
+        Returns:
+            Number of matching tasks
+
+        Raises:
+            StorageError: If the backing store cannot be accessed
+
+        Requirements: 4.8
+        """
+        pass
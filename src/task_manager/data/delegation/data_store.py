@@ -5,29 +5,62 @@ must implement. The interface provides CRUD operations for projects, task lists,
 and tasks, as well as specialized operations like initialization, ready task
 retrieval, and task list reset.
 
-All implementations must operate directly on the backing store without caching
-to ensure consistency across multiple agents and users (Requirement 1.5).
+All implementations must reflect the current contents of the backing store to
+ensure consistency across multiple agents and users (Requirement 1.5). An
+implementation may cache entities or indexes in memory only if it validates
+them against the backing store before use, so that changes made by other
+processes are never hidden.
 """
 
+import hashlib
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Iterator, Optional
 from uuid import UUID
 
 from task_manager.models.entities import Project, Task, TaskList
+from task_manager.models.enums import Status
+
+# Default number of tasks fetched per round trip by iter_tasks()
+ITER_TASKS_BATCH_SIZE = 500
+
+
+def check_batch_size(batch_size: int) -> None:
+    """Validate the batch size given to iter_tasks().
+
+    Args:
+        batch_size: Number of tasks fetched at a time
+
+    Raises:
+        ValueError: If batch_size is less than 1
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1")
 
 
 class DataStore(ABC):
     """Abstract interface for data store implementations.
 
     This interface defines all operations that backing stores (filesystem, PostgreSQL)
-    must implement. All methods operate directly on the backing store without caching
-    to maintain consistency across multiple interfaces and users.
+    must implement. All methods return the current contents of the backing store to
+    maintain consistency across multiple interfaces and users. In-memory caches are
+    allowed only when validated against the backing store on every use, such as the
+    filesystem store's entity cache, which checks each file's stat signature.
 
     Implementations:
     - PostgreSQL: Uses database transactions and connection pooling
     - Filesystem: Uses JSON files with atomic writes and file locking
+    - Log: Uses an append-only write-ahead log compacted into snapshots
+    - SQLite: Uses an embedded database in WAL mode sharing the PostgreSQL schema
+
+    Attributes:
+        supports_ready_task_query: True if get_ready_tasks() evaluates readiness
+            natively in the store, so orchestrators should delegate to it instead
+            of composing list and get calls
     """
 
+    supports_ready_task_query: bool = False
+
     @abstractmethod
     def initialize(self) -> None:
         """Initialize the backing store and create default projects.
@@ -282,6 +315,27 @@ class DataStore(ABC):
         """
         pass
 
+    def create_tasks(self, tasks: list[Task]) -> list[Task]:
+        """Persist several new tasks together.
+
+        The tasks may depend on each other. Stores override this to write all
+        of them in one transaction or one batched write, so either every task
+        is created or none is. This default implementation calls create_task()
+        for each task, and tasks created before a failure remain.
+
+        Args:
+            tasks: The tasks to create with all required fields populated
+
+        Returns:
+            The created tasks, in the order of tasks
+
+        Raises:
+            ValueError: If the task list of a task does not exist or if
+                       required fields are missing
+            StorageError: If the tasks cannot be persisted
+        """
+        return [self.create_task(task) for task in tasks]
+
     @abstractmethod
     def get_task(self, task_id: UUID) -> Optional[Task]:
         """Retrieve a task by its unique identifier.
@@ -299,6 +353,54 @@ class DataStore(ABC):
         """
         pass
 
+    def get_tasks(self, task_ids: Iterable[UUID]) -> list[Task]:
+        """Retrieve several tasks by their unique identifiers.
+
+        Lets callers load a known set of tasks, such as the nodes of a
+        dependency tree, in one call instead of one get_task() per ID. This
+        default implementation calls get_task() for each ID; stores that can
+        fetch many tasks per round trip override it.
+
+        Args:
+            task_ids: UUIDs of the tasks to retrieve; repeated IDs are ignored
+
+        Returns:
+            The tasks found, in the order of their IDs in task_ids. IDs of
+            tasks that do not exist are skipped.
+
+        Raises:
+            StorageError: If the backing store cannot be accessed
+        """
+        tasks = []
+        for task_id in dict.fromkeys(task_ids):
+            task = self.get_task(task_id)
+            if task is not None:
+                tasks.append(task)
+        return tasks
+
+    def get_dependents(self, task_id: UUID) -> list[Task]:
+        """Retrieve the tasks that depend on a task.
+
+        This default implementation iterates over all tasks; stores keeping a
+        reverse dependency index override it so the cost is proportional to
+        the number of dependents.
+
+        Args:
+            task_id: The UUID of the task depended on
+
+        Returns:
+            Tasks whose dependencies include task_id, in no particular order
+            (empty if the task does not exist or nothing depends on it)
+
+        Raises:
+            StorageError: If the backing store cannot be accessed
+        """
+        return [
+            task
+            for task in self.iter_tasks()
+            if any(dep.task_id == task_id for dep in task.dependencies)
+        ]
+
     @abstractmethod
     def list_tasks(self, task_list_id: Optional[UUID] = None) -> list[Task]:
         """Retrieve tasks, optionally filtered by task list.
@@ -315,6 +417,81 @@ class DataStore(ABC):
         """
         pass
 
+    def iter_tasks(
+        self, task_list_id: Optional[UUID] = None, batch_size: int = ITER_TASKS_BATCH_SIZE
+    ) -> Iterator[Task]:
+        """Iterate over tasks lazily, optionally filtered by task list.
+
+        Yields the tasks of list_tasks() without holding all of them at once.
+        Stores fetch about batch_size tasks per round trip; this default
+        implementation loads one task list at a time instead.
+
+        Args:
+            task_list_id: Optional UUID to filter tasks by task list.
+                         If None, iterates over all tasks.
+            batch_size: Number of tasks fetched from the backing store at a time
+
+        Yields:
+            Tasks matching the filter criteria
+
+        Raises:
+            ValueError: If batch_size is less than 1
+            StorageError: If the backing store cannot be accessed
+        """
+        check_batch_size(batch_size)
+        if task_list_id is not None:
+            yield from self.list_tasks(task_list_id)
+            return
+        for task_list in self.list_task_lists():
+            yield from self.list_tasks(task_list.id)
+
+    def get_task_version(self, task_id: UUID) -> Optional[str]:
+        """Retrieve a token that changes whenever a task is modified.
+
+        Lets callers check whether a task changed without loading it. This
+        default implementation loads the task and uses its updated_at
+        timestamp; stores that can read the timestamp alone override it.
+
+        Args:
+            task_id: The UUID of the task
+
+        Returns:
+            An opaque version token, or None if the task does not exist
+
+        Raises:
+            StorageError: If the backing store cannot be accessed
+        """
+        task = self.get_task(task_id)
+        return task.updated_at.isoformat() if task else None
+
+    def get_tasks_version(self, task_list_id: Optional[UUID] = None) -> str:
+        """Retrieve a token that changes whenever tasks are created, modified or deleted.
+
+        This default implementation iterates over the tasks and combines the
+        ID and updated_at timestamp of each one, in any order, with the task
+        count. Stores that aggregate timestamps natively or track changes in
+        their indexes override it.
+
+        Args:
+            task_list_id: Optional UUID to restrict the token to one task list.
+                         If None, covers all tasks.
+
+        Returns:
+            An opaque version token
+
+        Raises:
+            StorageError: If the backing store cannot be accessed
+        """
+        count = 0
+        combined = 0
+        for task in self.iter_tasks(task_list_id):
+            digest = hashlib.blake2b(
+                f"{task.id}:{task.updated_at.isoformat()}".encode(), digest_size=16
+            ).digest()
+            combined ^= int.from_bytes(digest, "big")
+            count += 1
+        return f"{count}:{combined:032x}"
+
     @abstractmethod
     def update_task(self, task: Task) -> Task:
         """Update an existing task in the backing store.
@@ -354,10 +531,121 @@ class DataStore(ABC):
         """
         pass
 
+    def update_tasks(self, tasks: list[Task]) -> list[Task]:
+        """Update several existing tasks together.
+
+        Stores override this to write all tasks in one transaction or one
+        batched write, so either every task is updated or none is. This default
+        implementation calls update_task() for each task, and tasks updated
+        before a failure remain updated.
+
+        Args:
+            tasks: The tasks with updated fields; each task appears once
+
+        Returns:
+            The updated tasks, in the order of tasks
+
+        Raises:
+            ValueError: If a task does not exist
+            StorageError: If the tasks cannot be updated
+        """
+        return [self.update_task(task) for task in tasks]
+
+    def delete_tasks(self, task_ids: list[UUID]) -> None:
+        """Remove several tasks together and update the tasks depending on them.
+
+        Stores override this to delete all tasks in one transaction or one
+        batched write. This default implementation calls delete_task() for
+        each task, and tasks deleted before a failure remain deleted.
+
+        Args:
+            task_ids: The UUIDs of the tasks to delete; repeated IDs are ignored
+
+        Raises:
+            ValueError: If a task does not exist
+            StorageError: If the tasks cannot be deleted
+        """
+        for task_id in dict.fromkeys(task_ids):
+            self.delete_task(task_id)
+
+    def add_tags_to_tasks(self, task_ids: list[UUID], tags: list[str]) -> list[Task]:
+        """Add tags to several tasks together.
+
+        Tags already on a task are moved to the end instead of being repeated.
+        The tags are not validated; callers check their format and the number
+        of tags per task. This default implementation reads the tasks and
+        writes them back with update_tasks().
+
+        Args:
+            task_ids: The UUIDs of the tasks; repeated IDs are ignored
+            tags: The tags to add to each task
+
+        Returns:
+            The updated tasks, in the order of their IDs in task_ids
+
+        Raises:
+            ValueError: If a task does not exist
+            StorageError: If the tasks cannot be updated
+        """
+        new_tags = list(dict.fromkeys(tags))
+        return self._update_tags(
+            task_ids, lambda current: [t for t in current if t not in new_tags] + new_tags
+        )
+
+    def remove_tags_from_tasks(self, task_ids: list[UUID], tags: list[str]) -> list[Task]:
+        """Remove tags from several tasks together.
+
+        Tags that are not on a task are ignored. This default implementation
+        reads the tasks and writes them back with update_tasks().
+
+        Args:
+            task_ids: The UUIDs of the tasks; repeated IDs are ignored
+            tags: The tags to remove from each task
+
+        Returns:
+            The updated tasks, in the order of their IDs in task_ids
+
+        Raises:
+            ValueError: If a task does not exist
+            StorageError: If the tasks cannot be updated
+        """
+        removed = set(tags)
+        return self._update_tags(task_ids, lambda current: [t for t in current if t not in removed])
+
+    def _update_tags(
+        self, task_ids: list[UUID], change: Callable[[list[str]], list[str]]
+    ) -> list[Task]:
+        """Apply a change to the tags of several tasks and write them back together.
+
+        Args:
+            task_ids: The UUIDs of the tasks; repeated IDs are ignored
+            change: Computes the new tags of a task from its current tags
+
+        Returns:
+            The updated tasks, in the order of their IDs in task_ids
+
+        Raises:
+            ValueError: If a task does not exist
+        """
+        ids = list(dict.fromkeys(task_ids))
+        tasks = self.get_tasks(ids)
+        found = {task.id for task in tasks}
+        for task_id in ids:
+            if task_id not in found:
+                raise ValueError(f"Task with id '{task_id}' does not exist")
+
+        now = datetime.now(timezone.utc)
+        for task in tasks:
+            task.tags = change(task.tags or [])
+            task.updated_at = now
+        return self.update_tasks(tasks)
+
     # Specialized operations
 
     @abstractmethod
-    def get_ready_tasks(self, scope_type: str, scope_id: UUID) -> list[Task]:
+    def get_ready_tasks(
+        self, scope_type: str, scope_id: UUID, statuses: Optional[list[Status]] = None
+    ) -> list[Task]:
         """Retrieve tasks that are ready for execution.
 
         A task is "ready" if:
@@ -367,6 +655,8 @@ class DataStore(ABC):
         Args:
             scope_type: Either "project" or "task_list" to specify the scope
             scope_id: The UUID of the project or task list to query
+            statuses: If given, only tasks whose status is in this list are returned
+                      (e.g. only NOT_STARTED in multi-agent environments)
 
         Returns:
             List of tasks that are ready for execution within the specified scope
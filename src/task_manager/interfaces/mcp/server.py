@@ -26,9 +26,14 @@ except ImportError:
 
 from task_manager.data.access.filesystem_store import FilesystemStoreError
 from task_manager.data.access.postgresql_store import StorageError
-from task_manager.data.config import ConfigurationError, create_data_store
+from task_manager.data.config import (
+    ConfigurationError,
+    create_async_data_store,
+    create_data_store,
+)
 from task_manager.data.delegation.data_store import DataStore
 from task_manager.formatting.error_formatter import ErrorFormatter
+from task_manager.orchestration.async_search_orchestrator import AsyncSearchOrchestrator
 from task_manager.orchestration.dependency_orchestrator import DependencyOrchestrator
 from task_manager.orchestration.project_orchestrator import ProjectOrchestrator
 from task_manager.orchestration.tag_orchestrator import TagOrchestrator
@@ -59,9 +64,11 @@ class TaskManagerMCPServer:
         """Initialize the MCP server and backing store.
 
         Reads environment variables to configure the backing store:
-        - DATA_STORE_TYPE: "postgresql" or "filesystem" (default: "filesystem")
+        - DATA_STORE_TYPE: "postgresql", "filesystem", "log" or "sqlite"
+          (default: "filesystem")
         - POSTGRES_URL: PostgreSQL connection string (if using PostgreSQL)
-        - FILESYSTEM_PATH: Filesystem storage path (default: "/tmp/tasks")
+        - FILESYSTEM_PATH: Filesystem or log storage path (default: "/tmp/tasks")
+        - SQLITE_PATH: SQLite database file (default: "/tmp/tasks.db")
 
         Raises:
             ConfigurationError: If the configuration is invalid
@@ -91,6 +98,14 @@ class TaskManagerMCPServer:
         from task_manager.orchestration.search_orchestrator import SearchOrchestrator
 
         self.search_orchestrator = SearchOrchestrator(self.data_store)
+        # Searches are awaited on the asynchronous store when the backing store
+        # has one, so they do not block the event loop
+        self.async_data_store = create_async_data_store()
+        self.async_search_orchestrator = (
+            AsyncSearchOrchestrator(self.async_data_store)
+            if self.async_data_store is not None
+            else None
+        )
         self.dependency_analyzer = DependencyAnalyzer(self.data_store)
         self.blocking_detector = BlockingDetector(self.data_store)
 
@@ -777,6 +792,10 @@ class TaskManagerMCPServer:
                                 "description": "Sort criteria (default: relevance)",
                                 "default": "relevance",
                             },
+                            "cursor": {
+                                "type": "string",
+                                "description": "Optional cursor from a previous search to continue after its last result (use with the same criteria and offset 0)",
+                            },
                         },
                         "required": [],
                     },
@@ -1966,6 +1985,9 @@ class TaskManagerMCPServer:
             # Parse sort criteria
             sort_by = arguments.get("sort_by", "relevance")
 
+            # Parse cursor (optional)
+            cursor = arguments.get("cursor")
+
             # Create SearchCriteria object
             criteria = SearchCriteria(
                 query=query,
@@ -1976,13 +1998,17 @@ class TaskManagerMCPServer:
                 limit=limit,
                 offset=offset,
                 sort_by=sort_by,
+                cursor=cursor,
             )
 
             # Search tasks through orchestrator
-            tasks = self.search_orchestrator.search_tasks(criteria)
-
-            # Get total count for pagination info
-            total_count = self.search_orchestrator.count_results(criteria)
+            if self.async_search_orchestrator is not None:
+                page = await self.async_search_orchestrator.search_page(criteria)
+                total_count = await self.async_search_orchestrator.count_results(criteria)
+            else:
+                page = self.search_orchestrator.search_page(criteria)
+                total_count = self.search_orchestrator.count_results(criteria)
+            tasks = page.tasks
 
             # Format search results as text
             if not tasks:
@@ -2028,12 +2054,14 @@ class TaskManagerMCPServer:
                     lines.append(f"   Created: {task.created_at.isoformat()}")
                     lines.append("")
 
-                # Show pagination info
-                if total_count > offset + len(tasks):
+                # Show pagination info (offsets do not apply to cursor pages)
+                if not cursor and total_count > offset + len(tasks):
                     remaining = total_count - offset - len(tasks)
                     lines.append(
                         f"Note: {remaining} more results available. Use offset={offset + len(tasks)} to see more."
                     )
+                if page.next_cursor:
+                    lines.append(f"Next page: use cursor={page.next_cursor}")
 
                 result = "\n".join(lines)
 
@@ -2086,6 +2114,14 @@ class TaskManagerMCPServer:
             # Analyze dependencies through dependency analyzer
             analysis = self.dependency_analyzer.analyze(scope_type, scope_id)
 
+            # Load every task listed below in one call
+            listed_ids = [
+                *analysis.critical_path,
+                *(task_id for task_id, _ in analysis.bottleneck_tasks),
+                *analysis.leaf_tasks,
+            ]
+            tasks_by_id = {task.id: task for task in self.data_store.get_tasks(listed_ids)}
+
             # Format analysis results as text
             lines = [f"Dependency Analysis for {scope_type} (ID: {scope_id})"]
             lines.append("=" * 60)
@@ -2104,8 +2140,7 @@ class TaskManagerMCPServer:
                 lines.append(f"  Length: {analysis.critical_path_length} tasks")
                 lines.append("  Tasks in critical path:")
                 for task_id in analysis.critical_path:
-                    # Get task details
-                    task = self.data_store.get_task(task_id)
+                    task = tasks_by_id.get(task_id)
                     if task:
                         status_symbol = {
                             "NOT_STARTED": "○",
@@ -2123,7 +2158,7 @@ class TaskManagerMCPServer:
             if analysis.bottleneck_tasks:
                 lines.append(f"  Found {len(analysis.bottleneck_tasks)} bottleneck(s)")
                 for task_id, blocked_count in analysis.bottleneck_tasks:
-                    task = self.data_store.get_task(task_id)
+                    task = tasks_by_id.get(task_id)
                     if task:
                         status_symbol = {
                             "NOT_STARTED": "○",
@@ -2144,7 +2179,7 @@ class TaskManagerMCPServer:
             if analysis.leaf_tasks:
                 lines.append(f"  Found {len(analysis.leaf_tasks)} leaf task(s)")
                 for task_id in analysis.leaf_tasks:
-                    task = self.data_store.get_task(task_id)
+                    task = tasks_by_id.get(task_id)
                     if task:
                         status_symbol = {
                             "NOT_STARTED": "○",
@@ -2160,7 +2195,9 @@ class TaskManagerMCPServer:
             # Circular Dependencies
             lines.append("🔄 Circular Dependencies:")
             if analysis.circular_dependencies:
-                lines.append(f"  ⚠️  WARNING: Found {len(analysis.circular_dependencies)} cycle(s)!")
+                lines.append(
+                    f"  ⚠️  WARNING: Found {len(analysis.circular_dependencies)} cycle(s)!"
+                )
                 for i, cycle in enumerate(analysis.circular_dependencies, 1):
                     lines.append(f"  Cycle {i}:")
                     for task_id in cycle:
@@ -2254,10 +2291,14 @@ class TaskManagerMCPServer:
         Starts the server using stdio transport for communication with
         the MCP client (typically an agentic environment).
         """
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream, write_stream, self.server.create_initialization_options()
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream, write_stream, self.server.create_initialization_options()
+                )
+        finally:
+            if self.async_data_store is not None:
+                await self.async_data_store.close()
 
 
 def main() -> None:
@@ -0,0 +1,193 @@
+"""Opt-in response compression for the REST API.
+
+Dependency visualizations (DOT, Mermaid) and large task lists are highly
+compressible text. When enabled, responses of at least a minimum size are
+gzip-compressed for clients that send "Accept-Encoding: gzip"; smaller
+responses and clients that do not accept gzip get the identity encoding.
+Streamed responses (NDJSON) are compressed chunk by chunk and flushed after
+each chunk, so clients still receive tasks as they are produced. Event
+streams (requests accepting text/event-stream) are never compressed, so
+events are not held back in the compressor.
+
+A compressed body is a different representation from the uncompressed one,
+so strong ETags are downgraded to weak ETags on compressed responses. The
+conditional GET handling compares ETags weakly, so a client revalidating
+with the weak tag still gets 304 Not Modified.
+
+Environment Variables:
+- REST_COMPRESSION: "gzip" to compress responses, "none" to disable
+  compression (default: "none")
+- REST_COMPRESSION_MIN_SIZE: Minimum body size in bytes before a response
+  is compressed (default: 1000)
+- REST_COMPRESSION_LEVEL: gzip compression level from 1 (fastest) to 9
+  (smallest) (default: 6)
+
+Requirements: 2.3, 9.2
+"""
+
+import os
+from typing import Optional
+
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from task_manager.data.config import ConfigurationError
+
+SUPPORTED_ENCODINGS = ("gzip", "none")
+DEFAULT_MINIMUM_SIZE = 1000
+DEFAULT_COMPRESSION_LEVEL = 6
+
+
+def _read_int(name: str, default: int, minimum: int, maximum: Optional[int] = None) -> int:
+    """Read a bounded integer from an environment variable.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is not set
+        minimum: Smallest accepted value
+        maximum: Largest accepted value, or None for no upper bound
+
+    Returns:
+        The configured value
+
+    Raises:
+        ConfigurationError: If the variable is not an integer within bounds
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    if maximum is None:
+        expected = f"an integer of at least {minimum}"
+    else:
+        expected = f"an integer from {minimum} to {maximum}"
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise ConfigurationError(f"{name} must be {expected}, got '{value}'")
+    if parsed < minimum or (maximum is not None and parsed > maximum):
+        raise ConfigurationError(f"{name} must be {expected}, got '{value}'")
+    return parsed
+
+
+def get_compression_encoding() -> str:
+    """Get the response compression encoding from environment variable.
+
+    Returns:
+        "gzip" or "none". Defaults to "none" if REST_COMPRESSION is not set.
+
+    Raises:
+        ConfigurationError: If the value is not a supported encoding
+    """
+    encoding = os.environ.get("REST_COMPRESSION", "none").strip().lower()
+    if encoding not in SUPPORTED_ENCODINGS:
+        raise ConfigurationError(
+            f"REST_COMPRESSION must be one of {', '.join(SUPPORTED_ENCODINGS)}, "
+            f"got '{encoding}'"
+        )
+    return encoding
+
+
+def get_compression_minimum_size() -> int:
+    """Get the minimum size of compressed responses from environment variable.
+
+    Returns:
+        The minimum body size in bytes.
+        Defaults to 1000 if REST_COMPRESSION_MIN_SIZE is not set.
+
+    Raises:
+        ConfigurationError: If the value is not a non-negative integer
+    """
+    return _read_int("REST_COMPRESSION_MIN_SIZE", DEFAULT_MINIMUM_SIZE, 0)
+
+
+def get_compression_level() -> int:
+    """Get the gzip compression level from environment variable.
+
+    Returns:
+        The compression level.
+        Defaults to 6 if REST_COMPRESSION_LEVEL is not set.
+
+    Raises:
+        ConfigurationError: If the value is not an integer from 1 to 9
+    """
+    return _read_int("REST_COMPRESSION_LEVEL", DEFAULT_COMPRESSION_LEVEL, 1, 9)
+
+
+class CompressionMiddleware:
+    """ASGI middleware that gzip-compresses responses above a minimum size.
+
+    Wraps Starlette's GZipMiddleware, which handles Accept-Encoding
+    negotiation, the size threshold, streaming and the Vary header, and
+    weakens the ETag of every response it compresses.
+
+    Attributes:
+        minimum_size: Minimum body size in bytes before a response is compressed
+        compresslevel: gzip compression level from 1 to 9
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        compresslevel: int = DEFAULT_COMPRESSION_LEVEL,
+    ):
+        """Initialize the CompressionMiddleware.
+
+        Args:
+            app: ASGI application to wrap
+            minimum_size: Minimum body size in bytes before a response is compressed
+            compresslevel: gzip compression level from 1 to 9
+
+        Raises:
+            ValueError: If minimum_size is negative or compresslevel is out of range
+        """
+        if minimum_size < 0:
+            raise ValueError("Compression minimum size must not be negative")
+        if not 1 <= compresslevel <= 9:
+            raise ValueError("Compression level must be from 1 to 9")
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+        self._app = app
+        self._gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._gzip(scope, receive, send)
+            return
+        if "text/event-stream" in Headers(scope=scope).get("accept", ""):
+            await self._app(scope, receive, send)
+            return
+
+        async def send_with_weak_etag(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                etag = headers.get("etag")
+                if "content-encoding" in headers and etag and not etag.startswith("W/"):
+                    headers["etag"] = "W/" + etag
+            await send(message)
+
+        await self._gzip(scope, receive, send_with_weak_etag)
+
+
+def install_compression(app: FastAPI) -> bool:
+    """Add CompressionMiddleware to an app if compression is enabled.
+
+    Args:
+        app: FastAPI application
+
+    Returns:
+        True if compression was enabled, False otherwise
+
+    Raises:
+        ConfigurationError: If the configuration is invalid
+    """
+    if get_compression_encoding() == "none":
+        return False
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=get_compression_minimum_size(),
+        compresslevel=get_compression_level(),
+    )
+    return True
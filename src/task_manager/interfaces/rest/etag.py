@@ -0,0 +1,63 @@
+"""ETag computation and conditional GET handling for the REST API.
+
+Entity endpoints tag their responses with a strong ETag derived from the
+entity's version (its updated_at timestamp, or for task collections a token
+combining the task count and timestamps). Clients that send the tag back in
+If-None-Match get 304 Not Modified as long as the version is unchanged. The
+version is checked before the entity is loaded and serialized, so an
+unchanged entity costs a single lightweight lookup.
+
+Requirements: 2.2, 2.3, 9.1
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi.responses import Response
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong ETag from the parts identifying a representation.
+
+    Args:
+        *parts: Values identifying the resource and its version, e.g. the
+            resource kind, its ID and its version token
+
+    Returns:
+        Quoted entity tag, e.g. '"3f2a..."'
+    """
+    key = "\x1f".join(str(part) for part in parts)
+    return '"' + hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against the current ETag.
+
+    Uses the weak comparison required for If-None-Match: a W/ prefix on
+    either tag is ignored.
+
+    Args:
+        if_none_match: Value of the If-None-Match header, if any
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the header is "*" or lists the current ETag
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == current for tag in if_none_match.split(","))
+
+
+def not_modified_response(etag: str) -> Response:
+    """Build a 304 Not Modified response.
+
+    Args:
+        etag: Current ETag of the resource
+
+    Returns:
+        Empty response carrying the ETag
+    """
+    return Response(status_code=304, headers={"ETag": etag})
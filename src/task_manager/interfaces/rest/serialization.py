@@ -0,0 +1,164 @@
+"""Fast JSON serialization of task lists for REST responses.
+
+Endpoints returning many tasks (GET /tasks, GET /tasks/ready, POST
+/tasks/search) convert Task entities straight to plain dictionaries in the
+TaskResponse schema and encode them to JSON bytes in one call, instead of
+building a TaskResponse model per task and having FastAPI validate and encode
+the result again. The bytes are returned in a raw Response, or streamed as
+newline-delimited JSON (one task per line) by GET /tasks/stream. Task events
+are encoded the same way as Server-Sent Events for GET /events.
+
+Encoding uses orjson when it is installed (the "rest-fast" extra) and the
+standard library json module otherwise; both produce the same JSON text as
+FastAPI's JSONResponse.
+
+Requirements: 2.3, 2.4, 9.2
+"""
+
+import json
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from fastapi.responses import Response
+
+from task_manager.models.entities import Note, Task
+from task_manager.orchestration.event_bus import TaskEvent
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content to compact UTF-8 JSON bytes.
+
+    Args:
+        content: JSON-compatible value of dicts, lists, strings, numbers,
+            booleans and None
+
+    Returns:
+        The JSON document, without whitespace between tokens
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def _note_to_dict(note: Note) -> Dict[str, Any]:
+    """Convert a Note entity to a NoteModel dictionary.
+
+    Args:
+        note: Note entity
+
+    Returns:
+        Dictionary with content and ISO 8601 timestamp
+    """
+    return {
+        "content": note.content,
+        "timestamp": note.timestamp.isoformat() if note.timestamp else None,
+    }
+
+
+def task_to_dict(task: Task) -> Dict[str, Any]:
+    """Convert a Task entity to a dictionary in the TaskResponse schema.
+
+    The result equals TaskResponse(...).model_dump() for the same task, with
+    keys in the same order.
+
+    Args:
+        task: Task entity
+
+    Returns:
+        Dictionary with the task's fields as JSON-compatible values
+    """
+    return {
+        "id": str(task.id),
+        "task_list_id": str(task.task_list_id),
+        "title": task.title,
+        "description": task.description,
+        "status": task.status.value,
+        "priority": task.priority.value,
+        "dependencies": [
+            {"task_id": str(dep.task_id), "task_list_id": str(dep.task_list_id)}
+            for dep in task.dependencies
+        ],
+        "exit_criteria": [
+            {"criteria": ec.criteria, "status": ec.status.value, "comment": ec.comment}
+            for ec in task.exit_criteria
+        ],
+        "notes": [_note_to_dict(note) for note in task.notes],
+        "research_notes": (
+            [_note_to_dict(note) for note in task.research_notes] if task.research_notes else None
+        ),
+        "action_plan": (
+            [{"sequence": item.sequence, "content": item.content} for item in task.action_plan]
+            if task.action_plan
+            else None
+        ),
+        "execution_notes": (
+            [_note_to_dict(note) for note in task.execution_notes] if task.execution_notes else None
+        ),
+        "agent_instructions_template": task.agent_instructions_template,
+        "tags": list(task.tags) if task.tags else [],
+        "created_at": task.created_at.isoformat(),
+        "updated_at": task.updated_at.isoformat(),
+    }
+
+
+def task_list_response(tasks: Iterable[Task], extra: Optional[Dict[str, Any]] = None) -> Response:
+    """Build a JSON response with a "tasks" array in the TaskResponse schema.
+
+    Args:
+        tasks: Task entities to return, in order
+        extra: Optional additional top-level keys, placed after "tasks"
+
+    Returns:
+        Response with the encoded body and an application/json media type
+    """
+    content: Dict[str, Any] = {"tasks": [task_to_dict(task) for task in tasks]}
+    if extra:
+        content.update(extra)
+    return Response(content=dumps(content), media_type="application/json")
+
+
+def ndjson_chunk(tasks: Iterator[Task], max_tasks: int) -> bytes:
+    """Encode the next tasks of an iterator as newline-delimited JSON.
+
+    Args:
+        tasks: Iterator over Task entities; advanced by up to max_tasks items
+        max_tasks: Maximum number of tasks to encode
+
+    Returns:
+        One TaskResponse JSON object per line, or b"" once tasks is exhausted
+    """
+    return b"".join(dumps(task_to_dict(task)) + b"\n" for task in islice(tasks, max_tasks))
+
+
+def sse_event(event: TaskEvent) -> bytes:
+    """Encode a task event as a Server-Sent Events message.
+
+    The SSE event name is the event type and the SSE id its sequence number.
+    The data is a JSON object with the event's fields; "task" holds the task
+    in the TaskResponse schema, or null for deletions.
+
+    Args:
+        event: Published task event
+
+    Returns:
+        The message, terminated by a blank line
+    """
+    data = dumps(
+        {
+            "type": event.type,
+            "sequence": event.sequence,
+            "task_id": str(event.task_id),
+            "task_list_id": str(event.task_list_id),
+            "project_id": str(event.project_id) if event.project_id else None,
+            "task": task_to_dict(event.task) if event.task is not None else None,
+            "timestamp": event.timestamp.isoformat(),
+        }
+    )
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (event.sequence, event.type.encode(), data)
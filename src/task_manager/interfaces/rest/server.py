@@ -7,20 +7,30 @@ and comprehensive error handling.
 Requirements: 2.1, 2.2, 2.3, 6.1, 6.2
 """
 
+import asyncio
+import functools
 import logging
 import sys
 import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Dict, List
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, TypeVar
 
 from fastapi import Body, FastAPI, Query, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
-from task_manager.data.config import ConfigurationError, create_data_store
+from task_manager.data.access.postgresql_listener import ChangeListener
+from task_manager.data.config import (
+    ConfigurationError,
+    create_async_data_store,
+    create_data_store,
+)
+from task_manager.data.delegation.async_data_store import AsyncDataStore
 from task_manager.data.delegation.data_store import DataStore
 from task_manager.health.health_check_service import HealthCheckService
+from task_manager.interfaces.rest.compression import install_compression
+from task_manager.interfaces.rest.etag import etag_matches, make_etag, not_modified_response
 from task_manager.interfaces.rest.models import (
     ActionPlanItemModel,
     BulkOperationResultResponse,
@@ -40,10 +50,19 @@ from task_manager.interfaces.rest.models import (
     TaskResponse,
     TaskUpdateRequest,
 )
+from task_manager.interfaces.rest.serialization import (
+    ndjson_chunk,
+    sse_event,
+    task_list_response,
+)
+from task_manager.interfaces.rest.worker_pool import ServerBusyError, WorkerPool
+from task_manager.orchestration.async_search_orchestrator import AsyncSearchOrchestrator
+from task_manager.orchestration.async_task_orchestrator import AsyncTaskOrchestrator
 from task_manager.orchestration.blocking_detector import BlockingDetector
 from task_manager.orchestration.bulk_operations_handler import BulkOperationsHandler
 from task_manager.orchestration.dependency_analyzer import DependencyAnalyzer
 from task_manager.orchestration.dependency_orchestrator import DependencyOrchestrator
+from task_manager.orchestration.event_bus import EventBus, Subscription, publish_remote_change
 from task_manager.orchestration.project_orchestrator import ProjectOrchestrator
 from task_manager.orchestration.search_orchestrator import SearchOrchestrator
 from task_manager.orchestration.tag_orchestrator import TagOrchestrator
@@ -59,10 +78,151 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 # Global state for orchestrators (initialized in lifespan)
 data_store: DataStore = None  # type: ignore
+# Asynchronous counterpart of data_store serving read paths, if it has one
+async_data_store: Optional[AsyncDataStore] = None
 orchestrators: Dict[str, Any] = {}
+# Number of tasks fetched and encoded per worker pool call when streaming
+STREAM_CHUNK_TASKS = 100
+# Maximum number of task IDs accepted by POST /tasks/batch-get
+MAX_BATCH_GET_TASKS = 1000
+# Seconds without events after which an SSE stream sends a keep-alive comment
+SSE_HEARTBEAT_SECONDS = 15.0
+worker_pool: WorkerPool = None  # type: ignore
+event_bus: EventBus = None  # type: ignore
+change_listener: Optional[ChangeListener] = None
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking orchestrator or store call on the worker pool.
+
+    Keeps the event loop free for other requests while the call runs.
+
+    Args:
+        func: Callable to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The return value of func
+
+    Raises:
+        ServerBusyError: If the worker pool is full (handled as HTTP 503)
+    """
+    return await worker_pool.run(func, *args, **kwargs)
+
+
+async def run_read(name: str, method: str, *args: Any, **kwargs: Any) -> Any:
+    """Run a read of an orchestrator, as a coroutine when the store supports it.
+
+    When the backing store has an asynchronous counterpart, the read is
+    awaited on the async orchestrator registered as "async_<name>", which has
+    the same method. Otherwise the synchronous orchestrator runs it on the
+    worker pool.
+
+    Args:
+        name: Key of the synchronous orchestrator in orchestrators
+        method: Name of the read method
+        *args: Positional arguments for the method
+        **kwargs: Keyword arguments for the method
+
+    Returns:
+        The return value of the method
+
+    Raises:
+        ServerBusyError: If the worker pool is full (handled as HTTP 503)
+    """
+    async_orchestrator = orchestrators.get(f"async_{name}")
+    if async_orchestrator is not None:
+        return await getattr(async_orchestrator, method)(*args, **kwargs)
+    return await run_blocking(getattr(orchestrators[name], method), *args, **kwargs)
+
+
+async def close_on_worker_pool(close: Callable[[], Any]) -> None:
+    """Release a store iterator's resources on the worker pool.
+
+    Closing runs the iterator's cleanup, such as closing its database session,
+    which must not block the event loop. The close is shielded from the
+    cancellation of the request, so it still completes after a disconnect.
+    If the worker pool is full, the iterator is closed inline instead of
+    being left open.
+
+    Args:
+        close: The iterator's close method
+    """
+    try:
+        await asyncio.shield(run_blocking(close))
+    except ServerBusyError:
+        close()
+
+
+async def stream_ndjson(tasks: Iterator[Any], first_chunk: bytes) -> AsyncIterator[bytes]:
+    """Stream tasks as newline-delimited JSON, fetching them on the worker pool.
+
+    The tasks are pulled from the iterator in chunks of STREAM_CHUNK_TASKS,
+    so only one chunk is held in memory at a time.
+
+    Args:
+        tasks: Lazy iterator over Task entities
+        first_chunk: Already encoded first chunk of tasks
+
+    Yields:
+        Chunks of NDJSON lines until the iterator is exhausted
+    """
+    fetch: Optional[asyncio.Future] = None
+    try:
+        chunk = first_chunk
+        while chunk:
+            yield chunk
+            fetch = asyncio.ensure_future(run_blocking(ndjson_chunk, tasks, STREAM_CHUNK_TASKS))
+            chunk = await asyncio.shield(fetch)
+    finally:
+        # If the client disconnected while a chunk was being fetched, its
+        # worker thread is still inside the iterator, which cannot be closed
+        # until it has left
+        if fetch is not None:
+            await asyncio.wait([fetch])
+        close = getattr(tasks, "close", None)
+        if close is not None:
+            await close_on_worker_pool(close)
+
+
+async def stream_events(request: Request, subscription: Subscription) -> AsyncIterator[bytes]:
+    """Stream task events as Server-Sent Events until the client disconnects.
+
+    Sends a comment every SSE_HEARTBEAT_SECONDS without events, which keeps
+    proxies from closing the idle connection and detects disconnected
+    clients. If the subscriber falls behind and events are dropped, or
+    changes of other processes may have been missed, an "overflow" event is
+    sent and the stream ends; the client should refetch the state it
+    displays and reconnect.
+
+    Args:
+        request: The incoming request, for disconnect detection
+        subscription: Event bus subscription to forward; closed on exit
+
+    Yields:
+        SSE messages and keep-alive comments
+    """
+    try:
+        yield b": connected\n\n"
+        while not subscription.overflowed:
+            event = await subscription.get(timeout=SSE_HEARTBEAT_SECONDS)
+            if event is not None:
+                yield sse_event(event)
+            elif subscription.overflowed:
+                break
+            elif await request.is_disconnected():
+                return
+            else:
+                yield b": heartbeat\n\n"
+        yield b"event: overflow\ndata: {}\n\n"
+    finally:
+        subscription.close()
 
 
 @asynccontextmanager
@@ -71,20 +231,26 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     This function handles:
     - Backing store initialization from environment variables on startup
-    - Orchestrator initialization
+    - Orchestrator and worker pool initialization
+    - Serving task and search reads from AsyncPostgreSQLStore when the store is
+      PostgreSQL and the "postgresql-async" extra is installed
+    - Listening for other processes' changes when the store is PostgreSQL
     - Resource cleanup on shutdown
 
     Environment Variables:
-    - DATA_STORE_TYPE: "postgresql" or "filesystem" (default: "filesystem")
+    - DATA_STORE_TYPE: "postgresql", "filesystem", "log" or "sqlite" (default: "filesystem")
     - POSTGRES_URL: PostgreSQL connection string (if using PostgreSQL)
-    - FILESYSTEM_PATH: Filesystem storage path (default: "/tmp/tasks")
+    - FILESYSTEM_PATH: Filesystem or log storage path (default: "/tmp/tasks")
+    - SQLITE_PATH: SQLite database file (default: "/tmp/tasks.db")
+    - REST_WORKER_THREADS: Threads running blocking calls (see worker_pool)
+    - REST_MAX_PENDING_CALLS: Calls admitted before returning 503 (see worker_pool)
 
     Raises:
         ConfigurationError: If the configuration is invalid
 
     Requirements: 2.1, 2.2, 2.3
     """
-    global data_store, orchestrators
+    global data_store, async_data_store, orchestrators, worker_pool, event_bus, change_listener
 
     # Startup: Initialize backing store from environment variables
     logger.info("Initializing Task Management System REST API...")
@@ -97,21 +263,46 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         data_store.initialize()
         logger.info("Data store initialized successfully")
 
-        # Initialize orchestrators
+        # Initialize orchestrators; task mutations are published on the event bus
+        event_bus = EventBus()
         orchestrators = {
             "project": ProjectOrchestrator(data_store),
             "task_list": TaskListOrchestrator(data_store),
-            "task": TaskOrchestrator(data_store),
+            "task": TaskOrchestrator(data_store, event_bus),
             "dependency": DependencyOrchestrator(data_store),
-            "tag": TagOrchestrator(data_store),
+            "tag": TagOrchestrator(data_store, event_bus),
             "search": SearchOrchestrator(data_store),
-            "bulk": BulkOperationsHandler(data_store),
+            "bulk": BulkOperationsHandler(data_store, event_bus),
             "template": TemplateEngine(data_store),
             "blocking": BlockingDetector(data_store),
             "dependency_analyzer": DependencyAnalyzer(data_store),
         }
 
+        # Serve task and search reads as coroutines when the store has an
+        # asynchronous counterpart; the schema was created by data_store
+        async_data_store = create_async_data_store()
+        if async_data_store is not None:
+            async_task_orchestrator = AsyncTaskOrchestrator(async_data_store)
+            orchestrators["async_task"] = async_task_orchestrator
+            orchestrators["async_blocking"] = async_task_orchestrator
+            orchestrators["async_search"] = AsyncSearchOrchestrator(async_data_store)
+            logger.info(f"Serving reads from {type(async_data_store).__name__}")
+
         logger.info("Orchestrators initialized successfully")
+
+        # Publish changes made by other processes sharing a PostgreSQL database,
+        # such as the other replicas of this API
+        if getattr(data_store, "notify_changes", False) is True:
+            change_listener = data_store.listen_for_changes(
+                functools.partial(publish_remote_change, event_bus, data_store)
+            )
+            logger.info("Listening for change notifications of other processes")
+
+        worker_pool = WorkerPool.from_environment()
+        logger.info(
+            f"Worker pool started: {worker_pool.max_workers} threads, "
+            f"{worker_pool.max_pending} pending calls"
+        )
         logger.info("REST API startup complete")
 
     except ConfigurationError as e:
@@ -125,6 +316,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     # Shutdown: Clean up resources
     logger.info("Shutting down Task Management System REST API...")
+    if change_listener is not None:
+        change_listener.stop()
+    if async_data_store is not None:
+        await async_data_store.close()
+    worker_pool.shutdown()
     logger.info("REST API shutdown complete")
 
 
@@ -177,10 +373,18 @@ Currently, no authentication is required. This API is designed for local or trus
 
 ## Data Stores
 
-Supports both PostgreSQL and filesystem-based storage. Configure via environment variables:
-- `DATA_STORE_TYPE`: "postgresql" or "filesystem" (default: "filesystem")
+Supports PostgreSQL, filesystem, append-only log and SQLite storage. Configure via
+environment variables:
+- `DATA_STORE_TYPE`: "postgresql", "filesystem", "log" or "sqlite" (default: "filesystem")
 - `POSTGRES_URL`: PostgreSQL connection string (if using PostgreSQL)
-- `FILESYSTEM_PATH`: Filesystem storage path (default: "/tmp/tasks")
+- `FILESYSTEM_PATH`: Filesystem or log storage path (default: "/tmp/tasks")
+- `SQLITE_PATH`: SQLite database file (default: "/tmp/tasks.db")
+
+## Compression
+
+Set `REST_COMPRESSION=gzip` to gzip responses of at least `REST_COMPRESSION_MIN_SIZE`
+bytes (default: 1000) for clients sending `Accept-Encoding: gzip`, at
+`REST_COMPRESSION_LEVEL` 1-9 (default: 6). Compressed responses carry weak ETags.
 
 ## Response Format
 
@@ -251,6 +455,10 @@ All responses follow consistent patterns:
             "name": "Agent Instructions",
             "description": "Generate AI agent instructions using template hierarchy.",
         },
+        {
+            "name": "Events",
+            "description": "Receive task changes as Server-Sent Events instead of polling.",
+        },
     ],
 )
 
@@ -297,6 +505,12 @@ async def add_process_time_header(request: Request, call_next):
     return response
 
 
+# Compress large responses if enabled via REST_COMPRESSION. Added last so that
+# it wraps the other middleware and compresses their final output.
+if install_compression(app):
+    logger.info("REST response compression enabled")
+
+
 # ============================================================================
 # Error Handling
 # ============================================================================
@@ -431,6 +645,33 @@ async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse
         )
 
 
+@app.exception_handler(ServerBusyError)
+async def server_busy_handler(request: Request, exc: ServerBusyError) -> JSONResponse:
+    """Handle requests rejected because the worker pool is full.
+
+    Returns HTTP 503 with a Retry-After header so that clients back off
+    instead of queueing more work behind a slow backing store.
+
+    Args:
+        request: The incoming request
+        exc: The ServerBusyError exception
+
+    Returns:
+        JSONResponse with error details
+    """
+    logger.warning(f"Rejected {request.method} {request.url.path}: {exc}")
+
+    return JSONResponse(
+        status_code=503,
+        headers={"Retry-After": "1"},
+        content=format_error_response(
+            code="SERVER_BUSY",
+            message=str(exc),
+            details={},
+        ),
+    )
+
+
 @app.exception_handler(Exception)
 async def generic_error_handler(request: Request, exc: Exception) -> JSONResponse:
     """Handle unexpected exceptions.
@@ -640,9 +881,11 @@ async def health_check() -> JSONResponse:
 
     Requirements: 15.1, 15.2, 15.3, 15.4, 15.5
     """
-    # Use HealthCheckService to perform comprehensive health checks
+    # Use HealthCheckService to perform comprehensive health checks. They run
+    # on the default executor rather than the worker pool so that health stays
+    # observable while the pool is saturated.
     health_service = HealthCheckService()
-    health_status = health_service.check_health()
+    health_status = await asyncio.to_thread(health_service.check_health)
 
     # Determine HTTP status code based on health status
     status_code = 200 if health_status.status == "healthy" else 503
@@ -760,7 +1003,8 @@ async def create_project(
     """
     try:
         # Create project via orchestrator
-        project = orchestrators["project"].create_project(
+        project = await run_blocking(
+            orchestrators["project"].create_project,
             name=request.name,
             agent_instructions_template=request.agent_instructions_template,
         )
@@ -779,8 +1023,8 @@ async def create_project(
             "message": f"Project '{project.name}' created successfully",
             "project": project_response.model_dump(),
         }
-    except ValueError:
-        # Let ValueError handler catch it
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -836,7 +1080,7 @@ async def list_projects() -> Dict[str, Any]:
     """
     try:
         # Get all projects from orchestrator
-        projects = orchestrators["project"].list_projects()
+        projects = await run_blocking(orchestrators["project"].list_projects)
 
         # Convert to response models
         project_responses = [
@@ -854,8 +1098,8 @@ async def list_projects() -> Dict[str, Any]:
         return {
             "projects": [p.model_dump() for p in project_responses],
         }
-    except ValueError:
-        # Let ValueError handler catch it
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -893,7 +1137,7 @@ async def get_project(project_id: str) -> Dict[str, Any]:
             raise ValueError(f"Invalid project ID format: {project_id}")
 
         # Get project from orchestrator
-        project = orchestrators["project"].get_project(project_uuid)
+        project = await run_blocking(orchestrators["project"].get_project, project_uuid)
 
         if project is None:
             raise ValueError(f"Project with ID {project_id} does not exist")
@@ -911,8 +1155,8 @@ async def get_project(project_id: str) -> Dict[str, Any]:
         return {
             "project": project_response.model_dump(),
         }
-    except ValueError:
-        # Let ValueError handler catch it
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -972,7 +1216,8 @@ async def update_project(
             raise ValueError(f"Invalid project ID format: {project_id}")
 
         # Update project via orchestrator
-        project = orchestrators["project"].update_project(
+        project = await run_blocking(
+            orchestrators["project"].update_project,
             project_id=project_uuid,
             name=request.name,
             agent_instructions_template=request.agent_instructions_template,
@@ -992,8 +1237,8 @@ async def update_project(
             "message": f"Project '{project.name}' updated successfully",
             "project": project_response.model_dump(),
         }
-    except ValueError:
-        # Let ValueError handler catch it
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -1033,13 +1278,13 @@ async def delete_project(project_id: str) -> Dict[str, Any]:
             raise ValueError(f"Invalid project ID format: {project_id}")
 
         # Delete project via orchestrator
-        orchestrators["project"].delete_project(project_uuid)
+        await run_blocking(orchestrators["project"].delete_project, project_uuid)
 
         return {
             "message": f"Project with ID {project_id} deleted successfully",
         }
-    except ValueError:
-        # Let ValueError handler catch it
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -1106,7 +1351,8 @@ async def create_task_list(
             raise ValueError(f"Invalid project ID format: {request.project_id}")
 
         # Create task list via orchestrator
-        task_list = orchestrators["task_list"].create_task_list(
+        task_list = await run_blocking(
+            orchestrators["task_list"].create_task_list,
             name=request.name,
             project_id=project_uuid,
             agent_instructions_template=request.agent_instructions_template,
@@ -1126,8 +1372,8 @@ async def create_task_list(
             "message": f"Task list '{task_list.name}' created successfully",
             "task_list": task_list_response.model_dump(),
         }
-    except ValueError:
-        # Let ValueError handler catch it
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -1171,7 +1417,7 @@ async def list_task_lists(
                 raise ValueError(f"Invalid project ID format: {project_id}")
 
         # Get task lists from orchestrator
-        task_lists = orchestrators["task_list"].list_task_lists(project_uuid)
+        task_lists = await run_blocking(orchestrators["task_list"].list_task_lists, project_uuid)
 
         # Convert to response models
         task_list_responses = [
@@ -1189,8 +1435,8 @@ async def list_task_lists(
         return {
             "task_lists": [tl.model_dump() for tl in task_list_responses],
         }
-    except ValueError:
-        # Let ValueError handler catch it
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -1202,13 +1448,16 @@ async def list_task_lists(
 
 
 @app.get("/task-lists/{task_list_id}", tags=["Task Lists"])
-async def get_task_list(task_list_id: str) -> Dict[str, Any]:
+async def get_task_list(task_list_id: str, request: Request, response: Response) -> Dict[str, Any]:
     """Get a single task list by ID.
 
-    Retrieves a specific task list by its UUID.
+    Retrieves a specific task list by its UUID. The response carries an ETag;
+    a request whose If-None-Match matches it gets 304 Not Modified.
 
     Args:
         task_list_id: UUID of the task list to retrieve
+        request: The incoming request, for its If-None-Match header
+        response: The outgoing response, for its ETag header
 
     Returns:
         Dictionary with the task list
@@ -1229,11 +1478,16 @@ async def get_task_list(task_list_id: str) -> Dict[str, Any]:
             raise ValueError(f"Invalid task list ID format: {task_list_id}")
 
         # Get task list from orchestrator
-        task_list = orchestrators["task_list"].get_task_list(task_list_uuid)
+        task_list = await run_blocking(orchestrators["task_list"].get_task_list, task_list_uuid)
 
         if task_list is None:
             raise ValueError(f"Task list with ID {task_list_id} does not exist")
 
+        etag = make_etag("task_list", task_list.id, task_list.updated_at.isoformat())
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return not_modified_response(etag)
+        response.headers["ETag"] = etag
+
         # Convert to response model
         task_list_response = TaskListResponse(
             id=str(task_list.id),
@@ -1247,8 +1501,8 @@ async def get_task_list(task_list_id: str) -> Dict[str, Any]:
         return {
             "task_list": task_list_response.model_dump(),
         }
-    except ValueError:
-        # Let ValueError handler catch it
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -1305,7 +1559,8 @@ async def update_task_list(
             raise ValueError(f"Invalid task list ID format: {task_list_id}")
 
         # Update task list via orchestrator
-        task_list = orchestrators["task_list"].update_task_list(
+        task_list = await run_blocking(
+            orchestrators["task_list"].update_task_list,
             task_list_id=task_list_uuid,
             name=request.name,
             agent_instructions_template=request.agent_instructions_template,
@@ -1325,8 +1580,8 @@ async def update_task_list(
             "message": f"Task list '{task_list.name}' updated successfully",
             "task_list": task_list_response.model_dump(),
         }
-    except ValueError:
-        # Let ValueError handler catch it
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -1365,13 +1620,13 @@ async def delete_task_list(task_list_id: str) -> Dict[str, Any]:
             raise ValueError(f"Invalid task list ID format: {task_list_id}")
 
         # Delete task list via orchestrator
-        orchestrators["task_list"].delete_task_list(task_list_uuid)
+        await run_blocking(orchestrators["task_list"].delete_task_list, task_list_uuid)
 
         return {
             "message": f"Task list with ID {task_list_id} deleted successfully",
         }
-    except ValueError:
-        # Let ValueError handler catch it
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -1413,10 +1668,10 @@ async def reset_task_list(task_list_id: str) -> Dict[str, Any]:
             raise ValueError(f"Invalid task list ID format: {task_list_id}")
 
         # Reset task list via orchestrator
-        orchestrators["task_list"].reset_task_list(task_list_uuid)
+        await run_blocking(orchestrators["task_list"].reset_task_list, task_list_uuid)
 
         # Retrieve the reset task list
-        task_list = orchestrators["task_list"].get_task_list(task_list_uuid)
+        task_list = await run_blocking(orchestrators["task_list"].get_task_list, task_list_uuid)
         if task_list is None:
             raise ValueError(f"Task list with ID {task_list_id} does not exist")
 
@@ -1434,8 +1689,8 @@ async def reset_task_list(task_list_id: str) -> Dict[str, Any]:
             "message": f"Task list '{task_list.name}' reset successfully",
             "task_list": task_list_response.model_dump(),
         }
-    except ValueError:
-        # Let ValueError handler catch it
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -1455,7 +1710,7 @@ async def reset_task_list(task_list_id: str) -> Dict[str, Any]:
 async def get_ready_tasks(
     scope_type: str = Query(..., description="Scope type: 'project' or 'task_list'"),
     scope_id: str = Query(..., description="UUID of the project or task list to query"),
-) -> Dict[str, Any]:
+) -> Response:
     """Get tasks that are ready for execution.
 
     Returns tasks that have no pending dependencies and are in an appropriate
@@ -1499,79 +1754,17 @@ async def get_ready_tasks(
         )
 
         # Get ready tasks via blocking detector
-        ready_tasks = orchestrators["blocking"].get_ready_tasks(
+        ready_tasks = await run_read(
+            "blocking",
+            "get_ready_tasks",
             scope_type=scope_type,
             scope_id=scope_uuid,
             multi_agent_mode=multi_agent_mode,
         )
 
-        # Convert to response models
-        task_responses = [
-            TaskResponse(
-                id=str(t.id),
-                task_list_id=str(t.task_list_id),
-                title=t.title,
-                description=t.description,
-                status=t.status.value,
-                priority=t.priority.value,
-                dependencies=[
-                    DependencyModel(
-                        task_id=str(d.task_id),
-                        task_list_id=str(d.task_list_id),
-                    )
-                    for d in t.dependencies
-                ],
-                exit_criteria=[
-                    ExitCriteriaModel(
-                        criteria=ec["criteria"],
-                        status=ec["status"],
-                        comment=ec.get("comment"),
-                    )
-                    for ec in t.exit_criteria
-                ],
-                notes=[
-                    NoteModel(content=n["content"], timestamp=n.get("timestamp")) for n in t.notes
-                ],
-                research_notes=(
-                    [
-                        NoteModel(content=n["content"], timestamp=n.get("timestamp"))
-                        for n in t.research_notes
-                    ]
-                    if t.research_notes is not None
-                    else None
-                ),
-                action_plan=(
-                    [
-                        ActionPlanItemModel(
-                            sequence=item["sequence"],
-                            content=item["content"],
-                        )
-                        for item in t.action_plan
-                    ]
-                    if t.action_plan is not None
-                    else None
-                ),
-                execution_notes=(
-                    [
-                        NoteModel(content=n["content"], timestamp=n.get("timestamp"))
-                        for n in t.execution_notes
-                    ]
-                    if t.execution_notes is not None
-                    else None
-                ),
-                agent_instructions_template=t.agent_instructions_template,
-                tags=t.tags,
-                created_at=t.created_at.isoformat(),
-                updated_at=t.updated_at.isoformat(),
-            )
-            for t in ready_tasks
-        ]
-
-        return {
-            "tasks": [t.model_dump() for t in task_responses],
-        }
-    except ValueError:
-        # Let ValueError handler catch it
+        return task_list_response(ready_tasks)
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -1840,7 +2033,8 @@ async def create_task(
 
     try:
         # Create task via orchestrator
-        task = orchestrators["task"].create_task(
+        task = await run_blocking(
+            orchestrators["task"].create_task,
             task_list_id=task_list_uuid,
             title=request.title,
             description=request.description,
@@ -1911,8 +2105,8 @@ async def create_task(
             "message": f"Task '{task.title}' created successfully",
             "task": task_response.model_dump(),
         }
-    except ValueError:
-        # Let ValueError handler catch it
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -2069,7 +2263,7 @@ async def bulk_create_tasks(
     task_definitions = tasks
 
     # Perform bulk create
-    result = orchestrators["bulk"].bulk_create_tasks(task_definitions)
+    result = await run_blocking(orchestrators["bulk"].bulk_create_tasks, task_definitions)
 
     # Convert to response model
     response = BulkOperationResultResponse(
@@ -2182,7 +2376,7 @@ async def bulk_update_tasks(
         update_dicts = request.get("updates", [])
 
     # Perform bulk update
-    result = orchestrators["bulk"].bulk_update_tasks(update_dicts)
+    result = await run_blocking(orchestrators["bulk"].bulk_update_tasks, update_dicts)
 
     # Convert to response model
     response = BulkOperationResultResponse(
@@ -2276,7 +2470,7 @@ async def bulk_delete_tasks(request: Any = Body(...)) -> JSONResponse:
         task_ids = request.get("task_ids", [])
 
     # Perform bulk delete
-    result = orchestrators["bulk"].bulk_delete_tasks(task_ids)
+    result = await run_blocking(orchestrators["bulk"].bulk_delete_tasks, task_ids)
 
     # Convert to response model
     response = BulkOperationResultResponse(
@@ -2384,7 +2578,7 @@ async def bulk_add_tags(
     tags = request.get("tags", [])
 
     # Perform bulk add tags
-    result = orchestrators["bulk"].bulk_add_tags(task_ids, tags)
+    result = await run_blocking(orchestrators["bulk"].bulk_add_tags, task_ids, tags)
 
     # Convert to response model
     response = BulkOperationResultResponse(
@@ -2476,7 +2670,7 @@ async def bulk_remove_tags(request: Dict[str, Any]) -> JSONResponse:
     tags = request.get("tags", [])
 
     # Perform bulk remove tags
-    result = orchestrators["bulk"].bulk_remove_tags(task_ids, tags)
+    result = await run_blocking(orchestrators["bulk"].bulk_remove_tags, task_ids, tags)
 
     # Convert to response model
     response = BulkOperationResultResponse(
@@ -2507,15 +2701,21 @@ async def bulk_remove_tags(request: Dict[str, Any]) -> JSONResponse:
 # ============================================================================
 @app.get("/tasks", tags=["Tasks"])
 async def list_tasks(
+    request: Request,
     task_list_id: str = Query(
         None, description="Optional task list UUID to filter tasks by task list"
-    )
-) -> Dict[str, Any]:
+    ),
+) -> Response:
     """List all tasks.
 
     Retrieves all tasks in the system, optionally filtered by task list.
+    Requests accepting application/x-ndjson get the streamed response of
+    GET /tasks/stream instead. The response carries an ETag derived from the
+    tasks' versions; a request whose If-None-Match matches it gets 304 Not
+    Modified without the tasks being loaded.
 
     Args:
+        request: The incoming request, for its Accept header
         task_list_id: Optional task list UUID to filter by
 
     Returns:
@@ -2528,6 +2728,9 @@ async def list_tasks(
     """
     from uuid import UUID
 
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        return await stream_tasks(task_list_id)
+
     try:
         # Parse task_list_id if provided
         task_list_uuid = None
@@ -2537,72 +2740,139 @@ async def list_tasks(
             except ValueError:
                 raise ValueError(f"Invalid task list ID format: {task_list_id}")
 
+        # Answer conditional requests from the version, before loading the tasks
+        version = await run_blocking(orchestrators["task"].get_tasks_version, task_list_uuid)
+        etag = make_etag("tasks", task_list_uuid or "", version)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return not_modified_response(etag)
+
         # Get tasks from orchestrator
-        tasks = orchestrators["task"].list_tasks(task_list_uuid)
+        tasks = await run_read("task", "list_tasks", task_list_uuid)
 
-        # Convert to response models
-        task_responses = []
-        for task in tasks:
-            task_response = TaskResponse(
-                id=str(task.id),
-                task_list_id=str(task.task_list_id),
-                title=task.title,
-                description=task.description,
-                status=task.status.name,
-                priority=task.priority.name,
-                dependencies=[
-                    DependencyModel(
-                        task_id=str(dep.task_id),
-                        task_list_id=str(dep.task_list_id),
-                    )
-                    for dep in task.dependencies
-                ],
-                exit_criteria=[
-                    ExitCriteriaModel(
-                        criteria=ec.criteria,
-                        status=ec.status.name,
-                        comment=ec.comment,
-                    )
-                    for ec in task.exit_criteria
-                ],
-                notes=[note_to_model(note) for note in task.notes],
-                research_notes=(
-                    [note_to_model(note) for note in task.research_notes]
-                    if task.research_notes
-                    else None
-                ),
-                action_plan=(
-                    [
-                        ActionPlanItemModel(
-                            sequence=item.sequence,
-                            content=item.content,
-                        )
-                        for item in task.action_plan
-                    ]
-                    if task.action_plan
-                    else None
-                ),
-                execution_notes=(
-                    [note_to_model(note) for note in task.execution_notes]
-                    if task.execution_notes
-                    else None
-                ),
-                agent_instructions_template=task.agent_instructions_template,
-                tags=task.tags if task.tags else [],
-                created_at=task.created_at.isoformat(),
-                updated_at=task.updated_at.isoformat(),
+        response = task_list_response(tasks)
+        response.headers["ETag"] = etag
+        return response
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
+        raise
+    except Exception as e:
+        # Explicitly handle storage errors
+        logger.error(f"Storage error in list_tasks: {e}", exc_info=True)
+        return JSONResponse(
+            status_code=500,
+            content=format_error_response(code="STORAGE_ERROR", message=str(e), details={}),
+        )
+
+
+@app.get("/tasks/stream", tags=["Tasks"])
+async def stream_tasks(
+    task_list_id: str = Query(
+        None, description="Optional task list UUID to filter tasks by task list"
+    )
+) -> Response:
+    """Stream all tasks as newline-delimited JSON.
+
+    Returns the tasks of GET /tasks as application/x-ndjson, one task object
+    per line. Tasks are read from the store lazily and sent as they are
+    encoded, so memory use stays constant however many tasks there are.
+
+    Args:
+        task_list_id: Optional task list UUID to filter by
+
+    Returns:
+        Streaming response with one task per line
+
+    Raises:
+        400 VALIDATION_ERROR: If task_list_id format is invalid
+
+    Requirements: 2.3, 2.4, 9.2
+    """
+    from uuid import UUID
+
+    try:
+        # Parse task_list_id if provided
+        task_list_uuid = None
+        if task_list_id is not None:
+            try:
+                task_list_uuid = UUID(task_list_id)
+            except ValueError:
+                raise ValueError(f"Invalid task list ID format: {task_list_id}")
+
+        # Fetch the first chunk before responding so that errors still get a status code
+        tasks = orchestrators["task"].iter_tasks(task_list_uuid)
+        first_chunk = await run_blocking(ndjson_chunk, tasks, STREAM_CHUNK_TASKS)
+
+        return StreamingResponse(
+            stream_ndjson(tasks, first_chunk), media_type="application/x-ndjson"
+        )
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
+        raise
+    except Exception as e:
+        # Explicitly handle storage errors
+        logger.error(f"Storage error in stream_tasks: {e}", exc_info=True)
+        return JSONResponse(
+            status_code=500,
+            content=format_error_response(code="STORAGE_ERROR", message=str(e), details={}),
+        )
+
+
+@app.post("/tasks/batch-get", tags=["Tasks"])
+async def batch_get_tasks(
+    task_ids: List[str] = Body(
+        ...,
+        embed=True,
+        description=f"UUIDs of the tasks to retrieve (at most {MAX_BATCH_GET_TASKS})",
+        examples=[["770e8400-e29b-41d4-a716-446655440000"]],
+    )
+) -> Response:
+    """Get several tasks by ID in one request.
+
+    Loads the tasks with one store call (one query per batch of IDs on
+    PostgreSQL), so clients rendering a dependency tree need one request
+    instead of one GET /tasks/{task_id} per node. Tasks are returned in the
+    order of their IDs; repeated IDs are returned once, and IDs of tasks
+    that do not exist are listed in "not_found".
+
+    Args:
+        task_ids: UUIDs of the tasks to retrieve
+
+    Returns:
+        Dictionary with the tasks found and the IDs not found
+
+    Raises:
+        400 VALIDATION_ERROR: If an ID format is invalid or too many IDs are given
+
+    Requirements: 2.3, 9.1
+    """
+    from uuid import UUID
+
+    try:
+        if len(task_ids) > MAX_BATCH_GET_TASKS:
+            raise ValueError(
+                f"At most {MAX_BATCH_GET_TASKS} task IDs can be retrieved at once, "
+                f"got {len(task_ids)}"
             )
-            task_responses.append(task_response)
 
-        return {
-            "tasks": [t.model_dump() for t in task_responses],
-        }
-    except ValueError:
-        # Let ValueError handler catch it
+        task_uuids = []
+        for task_id in task_ids:
+            try:
+                task_uuids.append(UUID(task_id))
+            except ValueError:
+                raise ValueError(f"Invalid task ID format: {task_id}")
+        task_uuids = list(dict.fromkeys(task_uuids))
+
+        tasks = await run_read("task", "get_tasks", task_uuids)
+
+        found = {task.id for task in tasks}
+        not_found = [str(task_uuid) for task_uuid in task_uuids if task_uuid not in found]
+        return task_list_response(tasks, {"not_found": not_found})
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
-        logger.error(f"Storage error in list_tasks: {e}", exc_info=True)
+        logger.error(f"Storage error in batch_get_tasks: {e}", exc_info=True)
         return JSONResponse(
             status_code=500,
             content=format_error_response(code="STORAGE_ERROR", message=str(e), details={}),
@@ -2610,13 +2880,17 @@ async def list_tasks(
 
 
 @app.get("/tasks/{task_id}", tags=["Tasks"])
-async def get_task(task_id: str) -> Dict[str, Any]:
+async def get_task(task_id: str, request: Request, response: Response) -> Dict[str, Any]:
     """Get a single task by ID.
 
-    Retrieves a specific task by its UUID.
+    Retrieves a specific task by its UUID. The response carries an ETag; a
+    request whose If-None-Match matches it gets 304 Not Modified, which is
+    decided from the task's version alone, without loading the task.
 
     Args:
         task_id: UUID of the task to retrieve
+        request: The incoming request, for its If-None-Match header
+        response: The outgoing response, for its ETag header
 
     Returns:
         Dictionary with the task
@@ -2636,11 +2910,20 @@ async def get_task(task_id: str) -> Dict[str, Any]:
         except ValueError:
             raise ValueError(f"Invalid task ID format: {task_id}")
 
+        # Answer conditional requests from the version, before loading the task
+        version = await run_blocking(orchestrators["task"].get_task_version, task_uuid)
+        if version is None:
+            raise ValueError(f"Task with ID {task_id} does not exist")
+        etag = make_etag("task", task_uuid, version)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return not_modified_response(etag)
+
         # Get task from orchestrator
-        task = orchestrators["task"].get_task(task_uuid)
+        task = await run_read("task", "get_task", task_uuid)
 
         if task is None:
             raise ValueError(f"Task with ID {task_id} does not exist")
+        response.headers["ETag"] = etag
 
         # Convert to response model
         task_response = TaskResponse(
@@ -2696,8 +2979,8 @@ async def get_task(task_id: str) -> Dict[str, Any]:
         return {
             "task": task_response.model_dump(),
         }
-    except ValueError:
-        # Let ValueError handler catch it
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -2778,7 +3061,8 @@ async def update_task(
                 raise ValueError(f"Invalid priority: {request.priority}")
 
         # Update task via orchestrator
-        task = orchestrators["task"].update_task(
+        task = await run_blocking(
+            orchestrators["task"].update_task,
             task_id=task_uuid,
             title=request.title,
             description=request.description,
@@ -2842,8 +3126,8 @@ async def update_task(
             "message": f"Task '{task.title}' updated successfully",
             "task": task_response.model_dump(),
         }
-    except ValueError:
-        # Let ValueError handler catch it
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -2882,13 +3166,13 @@ async def delete_task(task_id: str) -> Dict[str, Any]:
             raise ValueError(f"Invalid task ID format: {task_id}")
 
         # Delete task via orchestrator
-        orchestrators["task"].delete_task(task_uuid)
+        await run_blocking(orchestrators["task"].delete_task, task_uuid)
 
         return {
             "message": f"Task with ID {task_id} deleted successfully",
         }
-    except ValueError:
-        # Let ValueError handler catch it
+    except (ValueError, ServerBusyError):
+        # Let the ValueError and ServerBusyError handlers catch it
         raise
     except Exception as e:
         # Explicitly handle storage errors
@@ -2943,7 +3227,8 @@ async def add_note(
         raise ValueError(f"Invalid task ID format: {task_id}")
 
     # Add note via orchestrator
-    task = orchestrators["task"].add_note(
+    task = await run_blocking(
+        orchestrators["task"].add_note,
         task_id=task_uuid,
         content=request.content,
     )
@@ -3040,7 +3325,8 @@ async def add_research_note(
         raise ValueError(f"Invalid task ID format: {task_id}")
 
     # Add research note via orchestrator
-    task = orchestrators["task"].add_research_note(
+    task = await run_blocking(
+        orchestrators["task"].add_research_note,
         task_id=task_uuid,
         content=request.content,
     )
@@ -3139,7 +3425,8 @@ async def add_execution_note(
         raise ValueError(f"Invalid task ID format: {task_id}")
 
     # Add execution note via orchestrator
-    task = orchestrators["task"].add_execution_note(
+    task = await run_blocking(
+        orchestrators["task"].add_execution_note,
         task_id=task_uuid,
         content=request.content,
     )
@@ -3253,7 +3540,8 @@ async def update_action_plan(
         )
 
     # Update action plan via orchestrator
-    task = orchestrators["task"].update_action_plan(
+    task = await run_blocking(
+        orchestrators["task"].update_action_plan,
         task_id=task_uuid,
         action_plan=action_plan,
     )
@@ -3373,7 +3661,8 @@ async def update_exit_criteria(
         )
 
     # Update exit criteria via orchestrator
-    task = orchestrators["task"].update_exit_criteria(
+    task = await run_blocking(
+        orchestrators["task"].update_exit_criteria,
         task_id=task_uuid,
         exit_criteria=exit_criteria,
     )
@@ -3498,7 +3787,8 @@ async def update_dependencies(
             raise ValueError(f"Invalid dependency ID format: {e}")
 
     # Update dependencies via orchestrator
-    task = orchestrators["task"].update_dependencies(
+    task = await run_blocking(
+        orchestrators["task"].update_dependencies,
         task_id=task_uuid,
         dependencies=dependencies,
     )
@@ -3592,7 +3882,8 @@ async def add_tags(
         raise ValueError(f"Invalid task ID format: {task_id}")
 
     # Add tags via orchestrator
-    task = orchestrators["tag"].add_tags(
+    task = await run_blocking(
+        orchestrators["tag"].add_tags,
         task_id=task_uuid,
         tags=request.tags,
     )
@@ -3678,7 +3969,8 @@ async def remove_tags(task_id: str, request: TagsRequest) -> Dict[str, Any]:
         raise ValueError(f"Invalid task ID format: {task_id}")
 
     # Remove tags via orchestrator
-    task = orchestrators["tag"].remove_tags(
+    task = await run_blocking(
+        orchestrators["tag"].remove_tags,
         task_id=task_uuid,
         tags=request.tags,
     )
@@ -3775,7 +4067,8 @@ async def remove_tags(task_id: str, request: TagsRequest) -> Dict[str, Any]:
                                 "created_at": "2024-01-01T12:00:00Z",
                                 "updated_at": "2024-01-01T13:00:00Z",
                             }
-                        ]
+                        ],
+                        "next_cursor": None,
                     }
                 }
             },
@@ -3819,22 +4112,31 @@ async def search_tasks(
                 "value": {"tags": ["backend", "api"], "limit": 50, "offset": 0},
             },
         },
-    )
-) -> Dict[str, Any]:
+    ),
+    cursor: str = Query(
+        None, description="Optional next_cursor of a previous page to continue after it"
+    ),
+) -> Response:
     """Search tasks with multiple filter criteria.
 
     Searches for tasks matching the specified criteria including text search,
     status filtering, priority filtering, tag filtering, and project filtering.
     Supports pagination and sorting.
 
+    Besides offset pagination, results can be paged with a cursor: each
+    response carries a next_cursor (null on the last page) which, passed back
+    with the same criteria and offset 0, returns the following page. Cursor
+    pages cost the same at any depth and are not shifted by new tasks.
+
     Args:
         request: Search criteria including query, filters, pagination, and sorting
+        cursor: Optional cursor returned by a previous search
 
     Returns:
-        Dictionary with list of matching tasks
+        Dictionary with list of matching tasks and the next cursor
 
     Raises:
-        400 VALIDATION_ERROR: If sort_by is invalid or limit is out of range
+        400 VALIDATION_ERROR: If sort_by, limit, offset or cursor is invalid
 
     Requirements: 10.1, 10.2, 10.3, 10.4, 10.5
     """
@@ -3878,77 +4180,12 @@ async def search_tasks(
         limit=request.limit,
         offset=request.offset,
         sort_by=request.sort_by,
+        cursor=cursor,
     )
 
     # Perform search
-    tasks = orchestrators["search"].search_tasks(criteria)
-
-    # Convert tasks to response models
-    task_responses = []
-    for task in tasks:
-        task_response = TaskResponse(
-            id=str(task.id),
-            task_list_id=str(task.task_list_id),
-            title=task.title,
-            description=task.description,
-            status=task.status.value,
-            priority=task.priority.value,
-            dependencies=[
-                DependencyModel(
-                    task_id=str(dep.task_id),
-                    task_list_id=str(dep.task_list_id),
-                )
-                for dep in task.dependencies
-            ],
-            exit_criteria=[
-                ExitCriteriaModel(
-                    criteria=ec["criteria"],
-                    status=ec["status"],
-                    comment=ec.get("comment"),
-                )
-                for ec in task.exit_criteria
-            ],
-            notes=[
-                NoteModel(content=note["content"], timestamp=note.get("timestamp"))
-                for note in task.notes
-            ],
-            research_notes=(
-                [
-                    NoteModel(content=note["content"], timestamp=note.get("timestamp"))
-                    for note in task.research_notes
-                ]
-                if task.research_notes
-                else None
-            ),
-            action_plan=(
-                [
-                    ActionPlanItemModel(
-                        sequence=item["sequence"],
-                        content=item["content"],
-                    )
-                    for item in task.action_plan
-                ]
-                if task.action_plan
-                else None
-            ),
-            execution_notes=(
-                [
-                    NoteModel(content=note["content"], timestamp=note.get("timestamp"))
-                    for note in task.execution_notes
-                ]
-                if task.execution_notes
-                else None
-            ),
-            agent_instructions_template=task.agent_instructions_template,
-            tags=task.tags,
-            created_at=task.created_at.isoformat(),
-            updated_at=task.updated_at.isoformat(),
-        )
-        task_responses.append(task_response)
-
-    return {
-        "tasks": [t.model_dump() for t in task_responses],
-    }
+    page = await run_read("search", "search_page", criteria)
+    return task_list_response(page.tasks, {"next_cursor": page.next_cursor})
 
 
 # ============================================================================
@@ -3989,7 +4226,9 @@ async def analyze_dependencies(
         raise ValueError(f"Invalid scope ID format: {scope_id}")
 
     # Perform analysis via dependency analyzer
-    analysis = orchestrators["dependency_analyzer"].analyze(scope_type, scope_uuid)
+    analysis = await run_blocking(
+        orchestrators["dependency_analyzer"].analyze, scope_type, scope_uuid
+    )
 
     # Convert UUIDs to strings in the analysis result
     analysis_dict = {
@@ -4058,12 +4297,16 @@ async def visualize_dependencies(
     # Generate visualization based on format
     visualization: str
     if viz_format == "ascii":
-        visualization = orchestrators["dependency_analyzer"].visualize_ascii(scope_type, scope_uuid)
+        visualization = await run_blocking(
+            orchestrators["dependency_analyzer"].visualize_ascii, scope_type, scope_uuid
+        )
     elif viz_format == "dot":
-        visualization = orchestrators["dependency_analyzer"].visualize_dot(scope_type, scope_uuid)
+        visualization = await run_blocking(
+            orchestrators["dependency_analyzer"].visualize_dot, scope_type, scope_uuid
+        )
     else:  # mermaid
-        visualization = orchestrators["dependency_analyzer"].visualize_mermaid(
-            scope_type, scope_uuid
+        visualization = await run_blocking(
+            orchestrators["dependency_analyzer"].visualize_mermaid, scope_type, scope_uuid
         )
 
     return {
@@ -4112,14 +4355,14 @@ async def get_agent_instructions(task_id: str) -> Dict[str, Any]:
         raise ValueError(f"Invalid task ID format: {task_id}")
 
     # Get task from data store
-    task = data_store.get_task(task_uuid)
+    task = await run_blocking(data_store.get_task, task_uuid)
 
     if task is None:
         raise ValueError(f"Task with ID {task_id} does not exist")
 
     # Generate agent instructions using template engine
     try:
-        instructions = orchestrators["template"].get_agent_instructions(task)
+        instructions = await run_blocking(orchestrators["template"].get_agent_instructions, task)
     except (ValueError, KeyError, RuntimeError) as e:
         logger.error(f"Failed to generate agent instructions for task {task_id}: {e}")
         raise RuntimeError(f"Failed to generate agent instructions: {str(e)}") from e
@@ -4129,6 +4372,59 @@ async def get_agent_instructions(task_id: str) -> Dict[str, Any]:
     }
 
 
+# ============================================================================
+# Event Endpoints
+# ============================================================================
+
+
+@app.get("/events", tags=["Events"])
+async def get_events(
+    request: Request,
+    project_id: str = Query(None, description="Optional project UUID to filter events by"),
+    task_list_id: str = Query(None, description="Optional task list UUID to filter events by"),
+) -> Response:
+    """Stream task changes as Server-Sent Events.
+
+    Sends an event for every task created, updated, deleted, whose status
+    changed or that received a note, optionally limited to one project or
+    task list. Each event is named after its type (task.created,
+    task.updated, task.deleted, task.status_changed, task.note_added) and
+    carries the task in the TaskResponse schema (null for deletions), so
+    clients can apply the change without refetching. Only changes made
+    after connecting are sent.
+
+    Args:
+        request: The incoming request, for disconnect detection
+        project_id: Optional project UUID to filter by
+        task_list_id: Optional task list UUID to filter by
+
+    Returns:
+        Streaming text/event-stream response
+
+    Raises:
+        400 VALIDATION_ERROR: If project_id or task_list_id format is invalid
+
+    Requirements: 2.3, 9.1
+    """
+    from uuid import UUID
+
+    try:
+        project_uuid = UUID(project_id) if project_id is not None else None
+    except ValueError:
+        raise ValueError(f"Invalid project ID format: {project_id}")
+    try:
+        task_list_uuid = UUID(task_list_id) if task_list_id is not None else None
+    except ValueError:
+        raise ValueError(f"Invalid task list ID format: {task_list_id}")
+
+    subscription = event_bus.subscribe(project_id=project_uuid, task_list_id=task_list_uuid)
+    return StreamingResponse(
+        stream_events(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # ============================================================================
 # Alternative Endpoint Paths (for backwards compatibility and convenience)
 # ============================================================================
@@ -4144,21 +4440,24 @@ async def search_tasks_alt(
                 "value": {"query": "authentication", "limit": 10, "offset": 0},
             }
         },
-    )
-) -> Dict[str, Any]:
+    ),
+    cursor: str = Query(
+        None, description="Optional next_cursor of a previous page to continue after it"
+    ),
+) -> Response:
     """Alternative path for task search: POST /search/tasks.
 
     This is an alternative endpoint path for searching tasks.
     See POST /tasks/search for full documentation.
     """
-    return await search_tasks(request)
+    return await search_tasks(request, cursor)
 
 
 @app.get("/ready-tasks", tags=["Ready Tasks"], include_in_schema=True)
 async def get_ready_tasks_alt(
     scope_type: str = Query(..., description="Scope type: 'project' or 'task_list'"),
     scope_id: str = Query(..., description="UUID of the project or task list to query"),
-) -> Dict[str, Any]:
+) -> Response:
     """Alternative path for ready tasks: GET /ready-tasks.
 
     This is an alternative endpoint path for getting ready tasks.
@@ -0,0 +1,182 @@
+"""Bounded worker pool for blocking calls made by the async REST handlers.
+
+Orchestrator and store calls are synchronous (database sessions, file reads,
+JSON parsing). Running them directly inside an async handler blocks the event
+loop for every other request. The REST handlers therefore hand them to a
+WorkerPool, which runs them on a fixed number of threads and admits only a
+bounded number of calls at a time: once that many calls are queued or
+running, further calls fail fast with ServerBusyError (HTTP 503) instead of
+piling up behind a slow backend.
+
+Environment Variables:
+- REST_WORKER_THREADS: Number of worker threads (default: min(32, CPU count + 4))
+- REST_MAX_PENDING_CALLS: Maximum number of calls queued or running at once
+  (default: 4 x REST_WORKER_THREADS)
+
+Requirements: 15.1
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from task_manager.data.config import ConfigurationError
+
+T = TypeVar("T")
+
+
+class ServerBusyError(Exception):
+    """Raised when the worker pool already holds its maximum number of calls."""
+
+    pass
+
+
+def _read_positive_int(name: str, default: int) -> int:
+    """Read a positive integer from an environment variable.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is not set
+
+    Returns:
+        The configured value
+
+    Raises:
+        ConfigurationError: If the variable is not a positive integer
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise ConfigurationError(f"{name} must be a positive integer, got '{value}'")
+    if parsed < 1:
+        raise ConfigurationError(f"{name} must be a positive integer, got '{value}'")
+    return parsed
+
+
+def get_worker_threads() -> int:
+    """Get the number of REST worker threads from environment variable.
+
+    Returns:
+        The number of worker threads.
+        Defaults to min(32, CPU count + 4) if REST_WORKER_THREADS is not set.
+
+    Raises:
+        ConfigurationError: If the value is not a positive integer
+    """
+    return _read_positive_int("REST_WORKER_THREADS", min(32, (os.cpu_count() or 1) + 4))
+
+
+def get_max_pending_calls(worker_threads: int) -> int:
+    """Get the maximum number of queued or running calls from environment variable.
+
+    Args:
+        worker_threads: Number of worker threads the limit applies to
+
+    Returns:
+        The maximum number of pending calls.
+        Defaults to 4 x worker_threads if REST_MAX_PENDING_CALLS is not set.
+
+    Raises:
+        ConfigurationError: If the value is not a positive integer
+    """
+    return _read_positive_int("REST_MAX_PENDING_CALLS", 4 * worker_threads)
+
+
+class WorkerPool:
+    """Runs blocking calls on a bounded thread pool with admission control.
+
+    A call counts as pending from the moment it is admitted until its worker
+    thread finishes it, even if the awaiting request has been cancelled in
+    the meantime, so the limit reflects the work actually held by the pool.
+
+    Attributes:
+        max_workers: Number of worker threads
+        max_pending: Maximum number of calls queued or running at once
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        """Initialize the WorkerPool.
+
+        Args:
+            max_workers: Number of worker threads
+            max_pending: Maximum number of calls queued or running at once
+
+        Raises:
+            ValueError: If either limit is less than 1
+        """
+        if max_workers < 1 or max_pending < 1:
+            raise ValueError("Worker pool limits must be at least 1")
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="rest-worker"
+        )
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls) -> "WorkerPool":
+        """Create a WorkerPool configured from environment variables.
+
+        Returns:
+            A new WorkerPool
+
+        Raises:
+            ConfigurationError: If the configuration is invalid
+        """
+        max_workers = get_worker_threads()
+        return cls(max_workers, get_max_pending_calls(max_workers))
+
+    @property
+    def pending(self) -> int:
+        """Number of calls currently queued or running."""
+        return self._pending
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable on a worker thread and await its result.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The return value of func
+
+        Raises:
+            ServerBusyError: If max_pending calls are already queued or running
+            Exception: Any exception raised by func
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise ServerBusyError(
+                    f"Server is busy: {self._pending} requests are already being processed"
+                )
+            self._pending += 1
+
+        try:
+            future = self._executor.submit(functools.partial(func, *args, **kwargs))
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting calls, drop queued ones and release the worker threads.
+
+        Args:
+            wait: Whether to wait for running calls to finish
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _release(self) -> None:
+        """Mark one admitted call as finished."""
+        with self._lock:
+            self._pending -= 1
@@ -11,6 +11,7 @@ from .entities import (
     Note,
     Project,
     SearchCriteria,
+    SearchPage,
     Task,
     TaskList,
 )
@@ -29,6 +30,7 @@ __all__ = [
     "TaskList",
     "Task",
     "SearchCriteria",
+    "SearchPage",
     "BlockReason",
     "DependencyAnalysis",
     "BulkOperationResult",
@@ -144,6 +144,7 @@ class SearchCriteria:
         limit: Maximum number of results to return (default: 50)
         offset: Number of results to skip for pagination (default: 0)
         sort_by: Sort criteria - "relevance", "created_at", "updated_at", or "priority" (default: "relevance")
+        cursor: Optional cursor from a previous SearchPage; the page starts after it
     """
 
     query: Optional[str] = None
@@ -155,6 +156,7 @@ class SearchCriteria:
     limit: int = 50
     offset: int = 0
     sort_by: str = "relevance"
+    cursor: Optional[str] = None
 
 
 @dataclass
@@ -309,3 +311,16 @@ class Task:
         return all(
             criteria.status == ExitCriteriaStatus.COMPLETE for criteria in self.exit_criteria
         )
+
+
+@dataclass
+class SearchPage:
+    """One page of search results.
+
+    Attributes:
+        tasks: Tasks of the page, in sort order
+        next_cursor: Cursor for the following page, or None if this is the last page
+    """
+
+    tasks: list[Task]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,131 @@
+"""Opaque cursors for keyset pagination of search results.
+
+A cursor records the sort keys and ID of the last task of a page. The next
+page starts right after that position, so its cost does not depend on how
+deep it is and tasks inserted meanwhile do not shift it.
+
+Results are ordered by their sort keys descending and then by ID ascending,
+which makes the (sort keys, ID) tuple unique and the order total.
+
+Requirements: 4.8
+"""
+
+import base64
+import binascii
+import json
+import math
+from datetime import datetime
+from typing import Any, Sequence
+from uuid import UUID
+
+# Types of the sort keys of each sort order. Every order ends with a
+# timestamp; a relevance order without a text query has only that key.
+SORT_KEY_TYPES = {
+    "relevance": (float, datetime),
+    "created_at": (datetime,),
+    "updated_at": (datetime,),
+    "priority": (float, datetime),
+}
+
+
+def encode_cursor(sort_by: str, keys: Sequence[Any], task_id: UUID) -> str:
+    """Encode the position of a task in a sorted result set.
+
+    Args:
+        sort_by: Sort criteria the position refers to
+        keys: Sort key values of the task (numbers or datetimes)
+        task_id: ID of the task
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = {
+        "sort_by": sort_by,
+        "keys": [{"dt": k.isoformat()} if isinstance(k, datetime) else k for k in keys],
+        "id": str(task_id),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, key_count: int) -> tuple[list[Any], UUID]:
+    """Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: Cursor string
+        sort_by: Sort criteria of the current request
+        key_count: Number of sort keys the current request orders by
+
+    Returns:
+        Tuple of (sort key values, task ID)
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort order
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        raw_keys = payload["keys"]
+        task_id = UUID(payload["id"])
+        cursor_sort_by = payload["sort_by"]
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+
+    if cursor_sort_by != sort_by:
+        raise ValueError(f"Cursor was issued for sort_by '{cursor_sort_by}', not '{sort_by}'")
+
+    key_types = SORT_KEY_TYPES.get(sort_by, ())[-key_count:]
+    if not isinstance(raw_keys, list) or not len(raw_keys) == len(key_types) == key_count:
+        raise ValueError("Invalid cursor")
+    return [_decode_key(k, key_type) for k, key_type in zip(raw_keys, key_types)], task_id
+
+
+def _decode_key(value: Any, key_type: type) -> Any:
+    """Decode one sort key value of a cursor, checking it has the expected type.
+
+    Args:
+        value: Key value as stored in the cursor payload
+        key_type: Expected type, datetime or float
+
+    Returns:
+        The decoded key value
+
+    Raises:
+        ValueError: If the value does not have the expected type
+    """
+    if key_type is datetime:
+        if isinstance(value, dict) and isinstance(value.get("dt"), str):
+            try:
+                return datetime.fromisoformat(value["dt"])
+            except ValueError:
+                pass
+    elif isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value):
+        return float(value)
+    raise ValueError("Invalid cursor")
+
+
+def is_after_cursor(
+    keys: Sequence[Any], task_id: UUID, cursor_keys: Sequence[Any], cursor_id: UUID
+) -> bool:
+    """Check whether a task sorts after the cursor position.
+
+    Args:
+        keys: Sort key values of the task
+        task_id: ID of the task
+        cursor_keys: Sort key values stored in the cursor
+        cursor_id: Task ID stored in the cursor
+
+    Returns:
+        True if the task comes after the cursor (keys descending, ID ascending)
+
+    Raises:
+        ValueError: If the cursor keys cannot be compared with the task's, e.g.
+            a timestamp without a timezone against one with a timezone
+    """
+    try:
+        for key, cursor_key in zip(keys, cursor_keys):
+            if key != cursor_key:
+                return key < cursor_key
+    except TypeError:
+        raise ValueError("Invalid cursor")
+    return task_id > cursor_id
@@ -1,5 +1,7 @@
 """Business logic and CRUD operations."""
 
+from .async_search_orchestrator import AsyncSearchOrchestrator
+from .async_task_orchestrator import AsyncTaskOrchestrator
 from .blocking_detector import BlockingDetector
 from .dependency_analyzer import DependencyAnalyzer
 from .dependency_orchestrator import DependencyOrchestrator
@@ -11,6 +13,8 @@ from .task_orchestrator import TaskOrchestrator
 from .template_engine import TemplateEngine
 
 __all__ = [
+    "AsyncSearchOrchestrator",
+    "AsyncTaskOrchestrator",
     "BlockingDetector",
     "DependencyAnalyzer",
     "DependencyOrchestrator",
@@ -0,0 +1,76 @@
+"""Asynchronous search orchestration over an AsyncDataStore.
+
+This module implements the AsyncSearchOrchestrator class, the coroutine
+counterpart of SearchOrchestrator. Criteria are validated with the same rules,
+and the search itself is evaluated by the store.
+
+Requirements: 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8
+"""
+
+from task_manager.data.delegation.async_data_store import AsyncDataStore
+from task_manager.models.entities import SearchCriteria, SearchPage, Task
+from task_manager.orchestration.search_orchestrator import SearchOrchestrator
+
+
+class AsyncSearchOrchestrator:
+    """Manages unified task search on an asynchronous backing store.
+
+    Attributes:
+        data_store: The AsyncDataStore implementation evaluating the search
+    """
+
+    def __init__(self, data_store: AsyncDataStore):
+        """Initialize the AsyncSearchOrchestrator.
+
+        Args:
+            data_store: The AsyncDataStore implementation to use for persistence
+        """
+        self.data_store = data_store
+
+    async def search_tasks(self, criteria: SearchCriteria) -> list[Task]:
+        """Search tasks with multiple criteria. See SearchOrchestrator.search_tasks().
+
+        Args:
+            criteria: SearchCriteria object with filter parameters
+
+        Returns:
+            List of tasks matching the search criteria, sorted and paginated
+
+        Raises:
+            ValueError: If sort criteria, limit, offset or cursor is invalid
+
+        Requirements: 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8
+        """
+        return (await self.search_page(criteria)).tasks
+
+    async def search_page(self, criteria: SearchCriteria) -> SearchPage:
+        """Search tasks and return one page with the cursor of the next.
+
+        See SearchOrchestrator.search_page().
+
+        Args:
+            criteria: SearchCriteria object with filter parameters
+
+        Returns:
+            SearchPage with the tasks and the next cursor (None on the last page)
+
+        Raises:
+            ValueError: If sort criteria, limit, offset or cursor is invalid
+
+        Requirements: 4.7, 4.8
+        """
+        SearchOrchestrator.validate_criteria(criteria)
+        return await self.data_store.search_task_page(criteria)
+
+    async def count_results(self, criteria: SearchCriteria) -> int:
+        """Count matching tasks without retrieving them.
+
+        Args:
+            criteria: SearchCriteria object with filter parameters
+
+        Returns:
+            Number of tasks matching the search criteria
+
+        Requirements: 4.8
+        """
+        return await self.data_store.count_tasks(criteria)
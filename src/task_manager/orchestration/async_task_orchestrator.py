@@ -0,0 +1,105 @@
+"""Asynchronous task reads over an AsyncDataStore.
+
+This module implements the AsyncTaskOrchestrator class, which serves the
+read paths of TaskOrchestrator and BlockingDetector as coroutines: single
+tasks, task listings and ready tasks. Each operation is one awaited store
+call, so many of them can be in flight on one event loop.
+
+Task creation and updates validate dependencies across several store reads
+and remain with TaskOrchestrator.
+
+Requirements: 5.6, 12.1, 12.2, 12.3, 12.4, 12.5
+"""
+
+from typing import Iterable, Optional
+from uuid import UUID
+
+from task_manager.data.delegation.async_data_store import AsyncDataStore
+from task_manager.models.entities import Task
+from task_manager.models.enums import Status
+
+
+class AsyncTaskOrchestrator:
+    """Serves task reads from an asynchronous backing store.
+
+    Attributes:
+        data_store: The AsyncDataStore implementation for data access
+    """
+
+    def __init__(self, data_store: AsyncDataStore):
+        """Initialize the AsyncTaskOrchestrator.
+
+        Args:
+            data_store: The AsyncDataStore implementation to use for persistence
+        """
+        self.data_store = data_store
+
+    async def get_task(self, task_id: UUID) -> Optional[Task]:
+        """Retrieve a task by its unique identifier.
+
+        Args:
+            task_id: The UUID of the task to retrieve
+
+        Returns:
+            The task if found, None otherwise
+
+        Requirements: 5.6
+        """
+        return await self.data_store.get_task(task_id)
+
+    async def get_tasks(self, task_ids: Iterable[UUID]) -> list[Task]:
+        """Retrieve several tasks by their unique identifiers.
+
+        Args:
+            task_ids: UUIDs of the tasks to retrieve
+
+        Returns:
+            The tasks found, in the order of task_ids; unknown IDs are skipped
+        """
+        return await self.data_store.get_tasks(task_ids)
+
+    async def list_tasks(self, task_list_id: Optional[UUID] = None) -> list[Task]:
+        """Retrieve tasks, optionally filtered by task list.
+
+        Args:
+            task_list_id: Optional UUID to filter tasks by task list.
+                         If None, returns all tasks.
+
+        Returns:
+            List of tasks matching the filter criteria
+        """
+        return await self.data_store.list_tasks(task_list_id)
+
+    async def get_ready_tasks(
+        self, scope_type: str, scope_id: UUID, multi_agent_mode: bool = False
+    ) -> list[Task]:
+        """Get tasks that are ready for execution within a scope.
+
+        Same rules as BlockingDetector.get_ready_tasks(): a task is ready if
+        all its dependencies are COMPLETED and its status is NOT_STARTED, or
+        also IN_PROGRESS when multi_agent_mode is False.
+
+        Args:
+            scope_type: Either "project" or "task_list"
+            scope_id: UUID of the project or task list
+            multi_agent_mode: Whether to use multi-agent environment behavior
+
+        Returns:
+            List of tasks that are ready for execution; empty if the scope
+            does not exist
+
+        Raises:
+            ValueError: If scope_type is invalid
+
+        Requirements: 12.1, 12.2, 12.3, 12.4, 12.5
+        """
+        if scope_type not in ("project", "task_list"):
+            raise ValueError(f"Invalid scope_type: {scope_type}. Must be 'project' or 'task_list'")
+        statuses = (
+            [Status.NOT_STARTED] if multi_agent_mode else [Status.NOT_STARTED, Status.IN_PROGRESS]
+        )
+        try:
+            return await self.data_store.get_ready_tasks(scope_type, scope_id, statuses=statuses)
+        except ValueError:
+            # The store rejects a scope that does not exist, which has no ready tasks
+            return []
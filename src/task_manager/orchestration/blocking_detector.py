@@ -123,26 +123,43 @@ class BlockingDetector:
             multi_agent_mode: Whether to use multi-agent environment behavior
 
         Returns:
-            List of tasks that are ready for execution
+            List of tasks that are ready for execution; empty if the scope
+            does not exist
 
         Requirements: 12.1, 12.2, 12.3, 12.4, 12.5
         """
-        # Get all tasks in the scope
+        # Let stores that evaluate readiness natively do it in one round trip
+        if getattr(self.data_store, "supports_ready_task_query", False) is True:
+            if scope_type not in ("project", "task_list"):
+                raise ValueError(
+                    f"Invalid scope_type: {scope_type}. Must be 'project' or 'task_list'"
+                )
+            statuses = (
+                [Status.NOT_STARTED]
+                if multi_agent_mode
+                else [Status.NOT_STARTED, Status.IN_PROGRESS]
+            )
+            try:
+                return self.data_store.get_ready_tasks(scope_type, scope_id, statuses=statuses)
+            except ValueError:
+                # The store rejects a scope that does not exist, which has no ready tasks
+                return []
+
+        # Iterate over the tasks in the scope; only ready tasks are kept in memory
         if scope_type == "project":
             # Get all task lists in the project
             task_lists = self.data_store.list_task_lists()
             task_lists_in_project = [tl for tl in task_lists if tl.project_id == scope_id]
 
-            # Get all tasks from these task lists
-            all_tasks = []
-            for task_list in task_lists_in_project:
-                tasks = self.data_store.list_tasks()
-                tasks_in_list = [t for t in tasks if t.task_list_id == task_list.id]
-                all_tasks.extend(tasks_in_list)
+            # Iterate over the tasks of these task lists
+            all_tasks = (
+                task
+                for task_list in task_lists_in_project
+                for task in self.data_store.iter_tasks(task_list.id)
+            )
         elif scope_type == "task_list":
-            # Get all tasks in the task list
-            all_tasks = self.data_store.list_tasks()
-            all_tasks = [t for t in all_tasks if t.task_list_id == scope_id]
+            # Iterate over the tasks in the task list
+            all_tasks = self.data_store.iter_tasks(scope_id)
         else:
             raise ValueError(f"Invalid scope_type: {scope_type}. Must be 'project' or 'task_list'")
 
@@ -8,7 +8,7 @@ Requirements: 7.1, 7.2, 7.3, 7.4, 7.5, 7.6
 
 from datetime import datetime, timezone
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from task_manager.data.delegation.data_store import DataStore
 from task_manager.models.entities import (
@@ -17,9 +17,11 @@ from task_manager.models.entities import (
     Dependency,
     ExitCriteria,
     Note,
+    Task,
 )
 from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
 from task_manager.orchestration.dependency_orchestrator import DependencyOrchestrator
+from task_manager.orchestration.event_bus import EventBus
 from task_manager.orchestration.tag_orchestrator import TagOrchestrator
 from task_manager.orchestration.task_orchestrator import TaskOrchestrator
 
@@ -41,23 +43,29 @@ class BulkOperationsHandler:
         dependency_orchestrator: Orchestrator for dependency validation
     """
 
-    def __init__(self, data_store: DataStore):
+    def __init__(self, data_store: DataStore, event_bus: Optional[EventBus] = None):
         """Initialize the BulkOperationsHandler.
 
         Args:
             data_store: The DataStore implementation to use for persistence
+            event_bus: Optional event bus to publish task changes to
         """
         self.data_store = data_store
-        self.task_orchestrator = TaskOrchestrator(data_store)
-        self.tag_orchestrator = TagOrchestrator(data_store)
+        self.task_orchestrator = TaskOrchestrator(data_store, event_bus)
+        self.tag_orchestrator = TagOrchestrator(data_store, event_bus)
         self.dependency_orchestrator = DependencyOrchestrator(data_store)
 
-    def _validate_task_definition(self, task_def: dict, index: int) -> Optional[str]:
+    def _validate_task_definition(
+        self, task_def: dict, index: int, batch_size: int, task_lists: dict[UUID, bool]
+    ) -> Optional[str]:
         """Validate a task definition for bulk creation.
 
         Args:
             task_def: Dictionary containing task fields
             index: Index of this task in the bulk operation (for error reporting)
+            batch_size: Number of task definitions in the bulk operation
+            task_lists: Whether each task list looked up so far exists; shared by
+                the definitions of a bulk operation so each list is looked up once
 
         Returns:
             Error message if validation fails, None if valid
@@ -83,8 +91,9 @@ class BulkOperationsHandler:
         # Validate task_list exists
         try:
             task_list_id = UUID(task_def["task_list_id"])
-            task_list = self.data_store.get_task_list(task_list_id)
-            if task_list is None:
+            if task_list_id not in task_lists:
+                task_lists[task_list_id] = self.data_store.get_task_list(task_list_id) is not None
+            if not task_lists[task_list_id]:
                 return f"Task {index}: Task list '{task_list_id}' does not exist"
         except (ValueError, TypeError):
             return f"Task {index}: Invalid task_list_id format"
@@ -115,13 +124,36 @@ class BulkOperationsHandler:
                     f"{TagOrchestrator.MAX_TAGS_PER_TASK} tags"
                 )
 
+        # Validate dependencies: a task of the batch is referenced by its index
+        for dep in task_def.get("dependencies") or []:
+            if not isinstance(dep, dict):
+                return f"Task {index}: Invalid dependency format"
+            if "task_index" in dep:
+                task_index = dep["task_index"]
+                if (
+                    not isinstance(task_index, int)
+                    or isinstance(task_index, bool)
+                    or not 0 <= task_index < batch_size
+                ):
+                    return f"Task {index}: Invalid dependency task_index '{task_index}'"
+                continue
+            try:
+                UUID(dep["task_id"])
+                UUID(dep["task_list_id"])
+            except (KeyError, ValueError, TypeError, AttributeError):
+                return f"Task {index}: Invalid dependency format"
+
         return None
 
-    def _parse_task_definition(self, task_def: dict) -> dict:
+    def _parse_task_definition(
+        self, task_def: dict, batch_references: Optional[list[Dependency]] = None
+    ) -> dict:
         """Parse a task definition dictionary into proper types.
 
         Args:
             task_def: Dictionary containing task fields
+            batch_references: Dependencies on the tasks of the bulk operation,
+                by index, used to resolve dependencies given as a task_index
 
         Returns:
             Dictionary with parsed types
@@ -137,7 +169,10 @@ class BulkOperationsHandler:
 
         # Parse dependencies
         dependencies = []
-        for dep in task_def.get("dependencies", []):
+        for dep in task_def.get("dependencies") or []:
+            if "task_index" in dep and batch_references is not None:
+                dependencies.append(batch_references[dep["task_index"]])
+                continue
             dependencies.append(
                 Dependency(task_id=UUID(dep["task_id"]), task_list_id=UUID(dep["task_list_id"]))
             )
@@ -207,11 +242,64 @@ class BulkOperationsHandler:
 
         return parsed
 
+    def _validate_task_ids(self, task_ids: list[str]) -> tuple[list[UUID], list[dict]]:
+        """Parse the task IDs of a bulk operation and check that the tasks exist.
+
+        The tasks are looked up with one get_tasks() call.
+
+        Args:
+            task_ids: List of task ID strings
+
+        Returns:
+            Tuple of (parsed IDs of the existing tasks, validation errors by index)
+        """
+        parsed: dict[int, UUID] = {}
+        validation_errors = []
+        for i, task_id_str in enumerate(task_ids):
+            try:
+                parsed[i] = UUID(task_id_str)
+            except (ValueError, TypeError):
+                validation_errors.append({"index": i, "error": "Invalid task_id format"})
+
+        found = (
+            {task.id for task in self.data_store.get_tasks(parsed.values())} if parsed else set()
+        )
+        parsed_ids = []
+        for i, task_id in parsed.items():
+            if task_id in found:
+                parsed_ids.append(task_id)
+            else:
+                validation_errors.append({"index": i, "error": f"Task '{task_id}' does not exist"})
+
+        validation_errors.sort(key=lambda error: error["index"])
+        return parsed_ids, validation_errors
+
+    def _failed_result(self, total: int, error: Exception) -> BulkOperationResult:
+        """Build the result of a bulk operation whose store write failed.
+
+        The operations are applied together, so none of them took effect.
+
+        Args:
+            total: Number of items in the bulk operation
+            error: The error raised while applying the operations
+
+        Returns:
+            BulkOperationResult reporting every item as failed
+        """
+        return BulkOperationResult(
+            total=total, succeeded=0, failed=total, results=[], errors=[{"error": str(error)}]
+        )
+
     def bulk_create_tasks(self, task_definitions: list[dict]) -> BulkOperationResult:
         """Create multiple tasks in a single operation.
 
         Validates all task definitions before creating any tasks. If any validation
-        fails, no tasks are created.
+        fails, no tasks are created. A dependency may reference another task of
+        the operation as {"task_index": i}, where i is the index of its definition.
+
+        The tasks are then created together: the dependency graph of the whole
+        batch is validated at once and the store persists all tasks in one
+        transaction or batched write, so either all tasks are created or none.
 
         Args:
             task_definitions: List of dictionaries containing task fields
@@ -232,8 +320,9 @@ class BulkOperationsHandler:
 
         # Phase 1: Validate all task definitions
         validation_errors = []
+        task_lists: dict[UUID, bool] = {}
         for i, task_def in enumerate(task_definitions):
-            error = self._validate_task_definition(task_def, i)
+            error = self._validate_task_definition(task_def, i, len(task_definitions), task_lists)
             if error:
                 validation_errors.append({"index": i, "error": error})
 
@@ -247,54 +336,61 @@ class BulkOperationsHandler:
                 errors=validation_errors,
             )
 
-        # Phase 2: Create all tasks
-        results = []
-        errors = []
-        succeeded = 0
-        failed = 0
-
-        for i, task_def in enumerate(task_definitions):
-            try:
-                # Parse the task definition
-                parsed = self._parse_task_definition(task_def)
-
-                # Create the task using the orchestrator
-                task = self.task_orchestrator.create_task(
-                    task_list_id=parsed["task_list_id"],
-                    title=parsed["title"],
-                    description=parsed["description"],
-                    status=parsed["status"],
-                    dependencies=parsed["dependencies"],
-                    exit_criteria=parsed["exit_criteria"],
-                    priority=parsed["priority"],
-                    notes=parsed["notes"],
-                    research_notes=parsed.get("research_notes"),
-                    action_plan=parsed.get("action_plan"),
-                    execution_notes=parsed.get("execution_notes"),
-                    agent_instructions_template=parsed.get("agent_instructions_template"),
-                    tags=parsed.get("tags", []),
+        # Phase 2: Create all tasks together
+        try:
+            # Assign the IDs first so that tasks can reference each other
+            batch_references = [
+                Dependency(task_id=uuid4(), task_list_id=UUID(task_def["task_list_id"]))
+                for task_def in task_definitions
+            ]
+            now = datetime.now(timezone.utc)
+            tasks = []
+            for reference, task_def in zip(batch_references, task_definitions):
+                parsed = self._parse_task_definition(task_def, batch_references)
+                tasks.append(
+                    Task(
+                        id=reference.task_id,
+                        task_list_id=parsed["task_list_id"],
+                        title=parsed["title"],
+                        description=parsed["description"],
+                        status=parsed["status"],
+                        dependencies=parsed["dependencies"],
+                        exit_criteria=parsed["exit_criteria"],
+                        priority=parsed["priority"],
+                        notes=parsed["notes"],
+                        research_notes=parsed.get("research_notes"),
+                        action_plan=parsed.get("action_plan"),
+                        execution_notes=parsed.get("execution_notes"),
+                        agent_instructions_template=parsed.get("agent_instructions_template"),
+                        tags=parsed.get("tags") or [],
+                        created_at=now,
+                        updated_at=now,
+                    )
                 )
 
-                results.append({"index": i, "task_id": str(task.id), "status": "created"})
-                succeeded += 1
+            created = self.task_orchestrator.create_tasks(tasks)
 
-            except Exception as e:
-                errors.append({"index": i, "error": str(e)})
-                failed += 1
+        except Exception as e:
+            return self._failed_result(len(task_definitions), e)
 
         return BulkOperationResult(
             total=len(task_definitions),
-            succeeded=succeeded,
-            failed=failed,
-            results=results,
-            errors=errors,
+            succeeded=len(created),
+            failed=0,
+            results=[
+                {"index": i, "task_id": str(task.id), "status": "created"}
+                for i, task in enumerate(created)
+            ],
+            errors=[],
         )
 
     def bulk_update_tasks(self, updates: list[dict]) -> BulkOperationResult:
         """Update multiple tasks in a single operation.
 
         Each update dictionary must contain a 'task_id' field and at least one field to update.
-        Validates all updates before applying any changes.
+        Validates all updates before applying any changes. The updates are then
+        applied together: the store writes all tasks in one transaction or batched
+        write, so either all updates are applied or none.
 
         Args:
             updates: List of dictionaries containing task_id and fields to update
@@ -315,6 +411,12 @@ class BulkOperationsHandler:
 
         # Phase 1: Validate all updates
         validation_errors = []
+        with_task_id = [i for i, update in enumerate(updates) if "task_id" in update]
+        parsed_ids, id_errors = self._validate_task_ids(
+            [updates[i]["task_id"] for i in with_task_id]
+        )
+        invalid = {with_task_id[error["index"]]: error["error"] for error in id_errors}
+
         for i, update in enumerate(updates):
             # Check task_id is present
             if "task_id" not in update:
@@ -322,16 +424,8 @@ class BulkOperationsHandler:
                 continue
 
             # Validate task exists
-            try:
-                task_id = UUID(update["task_id"])
-                task = self.data_store.get_task(task_id)
-                if task is None:
-                    validation_errors.append(
-                        {"index": i, "error": f"Task '{task_id}' does not exist"}
-                    )
-                    continue
-            except (ValueError, TypeError):
-                validation_errors.append({"index": i, "error": "Invalid task_id format"})
+            if i in invalid:
+                validation_errors.append({"index": i, "error": invalid[i]})
                 continue
 
             # Validate fields if present
@@ -369,16 +463,10 @@ class BulkOperationsHandler:
                 errors=validation_errors,
             )
 
-        # Phase 2: Apply all updates
-        results = []
-        errors = []
-        succeeded = 0
-        failed = 0
-
-        for i, update in enumerate(updates):
-            try:
-                task_id = UUID(update["task_id"])
-
+        # Phase 2: Apply all updates together
+        try:
+            changes = []
+            for update in updates:
                 # Build update parameters
                 update_params = {}
                 if "title" in update:
@@ -393,25 +481,29 @@ class BulkOperationsHandler:
                     update_params["agent_instructions_template"] = update[
                         "agent_instructions_template"
                     ]
+                changes.append((UUID(update["task_id"]), update_params))
 
-                # Update the task
-                task = self.task_orchestrator.update_task(task_id, **update_params)
-
-                results.append({"index": i, "task_id": str(task.id), "status": "updated"})
-                succeeded += 1
+            tasks = self.task_orchestrator.update_tasks(changes)
 
-            except Exception as e:
-                errors.append({"index": i, "error": str(e)})
-                failed += 1
+        except Exception as e:
+            return self._failed_result(len(updates), e)
 
         return BulkOperationResult(
-            total=len(updates), succeeded=succeeded, failed=failed, results=results, errors=errors
+            total=len(updates),
+            succeeded=len(tasks),
+            failed=0,
+            results=[
+                {"index": i, "task_id": str(task.id), "status": "updated"}
+                for i, task in enumerate(tasks)
+            ],
+            errors=[],
         )
 
     def bulk_delete_tasks(self, task_ids: list[str]) -> BulkOperationResult:
         """Delete multiple tasks in a single operation.
 
-        Validates all task IDs before deleting any tasks.
+        Validates all task IDs before deleting any tasks. The tasks are then
+        deleted together in one transaction or batched write.
 
         Args:
             task_ids: List of task ID strings to delete
@@ -431,21 +523,7 @@ class BulkOperationsHandler:
             )
 
         # Phase 1: Validate all task IDs
-        validation_errors = []
-        parsed_ids = []
-
-        for i, task_id_str in enumerate(task_ids):
-            try:
-                task_id = UUID(task_id_str)
-                task = self.data_store.get_task(task_id)
-                if task is None:
-                    validation_errors.append(
-                        {"index": i, "error": f"Task '{task_id}' does not exist"}
-                    )
-                else:
-                    parsed_ids.append(task_id)
-            except (ValueError, TypeError):
-                validation_errors.append({"index": i, "error": "Invalid task_id format"})
+        parsed_ids, validation_errors = self._validate_task_ids(task_ids)
 
         # If any validation failed, return without deleting any tasks
         if validation_errors:
@@ -457,30 +535,28 @@ class BulkOperationsHandler:
                 errors=validation_errors,
             )
 
-        # Phase 2: Delete all tasks
-        results = []
-        errors = []
-        succeeded = 0
-        failed = 0
-
-        for i, task_id in enumerate(parsed_ids):
-            try:
-                self.task_orchestrator.delete_task(task_id)
-                results.append({"index": i, "task_id": str(task_id), "status": "deleted"})
-                succeeded += 1
-
-            except Exception as e:
-                errors.append({"index": i, "error": str(e)})
-                failed += 1
+        # Phase 2: Delete all tasks together
+        try:
+            self.task_orchestrator.delete_tasks(parsed_ids)
+        except Exception as e:
+            return self._failed_result(len(task_ids), e)
 
         return BulkOperationResult(
-            total=len(task_ids), succeeded=succeeded, failed=failed, results=results, errors=errors
+            total=len(task_ids),
+            succeeded=len(parsed_ids),
+            failed=0,
+            results=[
+                {"index": i, "task_id": str(task_id), "status": "deleted"}
+                for i, task_id in enumerate(parsed_ids)
+            ],
+            errors=[],
         )
 
     def bulk_add_tags(self, task_ids: list[str], tags: list[str]) -> BulkOperationResult:
         """Add tags to multiple tasks in a single operation.
 
-        Validates all task IDs and tags before adding tags to any tasks.
+        Validates all task IDs and tags before adding tags to any tasks. The tags
+        are then added to all tasks together in one transaction or batched write.
 
         Args:
             task_ids: List of task ID strings
@@ -523,21 +599,7 @@ class BulkOperationsHandler:
                 )
 
         # Phase 2: Validate all task IDs
-        validation_errors = []
-        parsed_ids = []
-
-        for i, task_id_str in enumerate(task_ids):
-            try:
-                task_id = UUID(task_id_str)
-                task = self.data_store.get_task(task_id)
-                if task is None:
-                    validation_errors.append(
-                        {"index": i, "error": f"Task '{task_id}' does not exist"}
-                    )
-                else:
-                    parsed_ids.append(task_id)
-            except (ValueError, TypeError):
-                validation_errors.append({"index": i, "error": "Invalid task_id format"})
+        parsed_ids, validation_errors = self._validate_task_ids(task_ids)
 
         # If any validation failed, return without adding tags to any tasks
         if validation_errors:
@@ -549,32 +611,35 @@ class BulkOperationsHandler:
                 errors=validation_errors,
             )
 
-        # Phase 3: Add tags to all tasks
-        results = []
-        errors = []
-        succeeded = 0
-        failed = 0
-
-        for i, task_id in enumerate(parsed_ids):
-            try:
-                task = self.tag_orchestrator.add_tags(task_id, tags)
-                results.append(
-                    {"index": i, "task_id": str(task.id), "status": "tags_added", "tags": task.tags}
-                )
-                succeeded += 1
+        # Phase 3: Add tags to all tasks together
+        try:
+            updated = self.tag_orchestrator.add_tags_to_tasks(parsed_ids, tags)
+        except Exception as e:
+            return self._failed_result(len(task_ids), e)
 
-            except Exception as e:
-                errors.append({"index": i, "error": str(e)})
-                failed += 1
+        tags_by_id = {task.id: task.tags for task in updated}
 
         return BulkOperationResult(
-            total=len(task_ids), succeeded=succeeded, failed=failed, results=results, errors=errors
+            total=len(task_ids),
+            succeeded=len(parsed_ids),
+            failed=0,
+            results=[
+                {
+                    "index": i,
+                    "task_id": str(task_id),
+                    "status": "tags_added",
+                    "tags": tags_by_id[task_id],
+                }
+                for i, task_id in enumerate(parsed_ids)
+            ],
+            errors=[],
         )
 
     def bulk_remove_tags(self, task_ids: list[str], tags: list[str]) -> BulkOperationResult:
         """Remove tags from multiple tasks in a single operation.
 
-        Validates all task IDs before removing tags from any tasks.
+        Validates all task IDs before removing tags from any tasks. The tags are
+        then removed from all tasks together in one transaction or batched write.
 
         Args:
             task_ids: List of task ID strings
@@ -604,21 +669,7 @@ class BulkOperationsHandler:
             )
 
         # Phase 1: Validate all task IDs
-        validation_errors = []
-        parsed_ids = []
-
-        for i, task_id_str in enumerate(task_ids):
-            try:
-                task_id = UUID(task_id_str)
-                task = self.data_store.get_task(task_id)
-                if task is None:
-                    validation_errors.append(
-                        {"index": i, "error": f"Task '{task_id}' does not exist"}
-                    )
-                else:
-                    parsed_ids.append(task_id)
-            except (ValueError, TypeError):
-                validation_errors.append({"index": i, "error": "Invalid task_id format"})
+        parsed_ids, validation_errors = self._validate_task_ids(task_ids)
 
         # If any validation failed, return without removing tags from any tasks
         if validation_errors:
@@ -630,29 +681,25 @@ class BulkOperationsHandler:
                 errors=validation_errors,
             )
 
-        # Phase 2: Remove tags from all tasks
-        results = []
-        errors = []
-        succeeded = 0
-        failed = 0
-
-        for i, task_id in enumerate(parsed_ids):
-            try:
-                task = self.tag_orchestrator.remove_tags(task_id, tags)
-                results.append(
-                    {
-                        "index": i,
-                        "task_id": str(task.id),
-                        "status": "tags_removed",
-                        "tags": task.tags,
-                    }
-                )
-                succeeded += 1
-
-            except Exception as e:
-                errors.append({"index": i, "error": str(e)})
-                failed += 1
+        # Phase 2: Remove tags from all tasks together
+        try:
+            updated = self.tag_orchestrator.remove_tags_from_tasks(parsed_ids, tags)
+        except Exception as e:
+            return self._failed_result(len(task_ids), e)
 
+        tags_by_id = {task.id: task.tags for task in updated}
         return BulkOperationResult(
-            total=len(task_ids), succeeded=succeeded, failed=failed, results=results, errors=errors
+            total=len(task_ids),
+            succeeded=len(parsed_ids),
+            failed=0,
+            results=[
+                {
+                    "index": i,
+                    "task_id": str(task_id),
+                    "status": "tags_removed",
+                    "tags": tags_by_id[task_id],
+                }
+                for i, task_id in enumerate(parsed_ids)
+            ],
+            errors=[],
         )
@@ -86,11 +86,14 @@ class DependencyAnalyzer:
         # Detect circular dependencies first
         circular_deps = self._detect_circular_dependencies(tasks, task_map)
 
+        # Build the reverse adjacency shared by the path and bottleneck analyses
+        dependents = self._build_dependents(tasks, task_map)
+
         # Calculate critical path
-        critical_path = self._calculate_critical_path(tasks, task_map)
+        critical_path = self._calculate_critical_path(tasks, dependents)
 
         # Detect bottlenecks
-        bottlenecks = self._detect_bottlenecks(tasks, task_map)
+        bottlenecks = self._detect_bottlenecks(dependents)
 
         # Identify leaf tasks
         leaf_tasks = self._identify_leaf_tasks(tasks)
@@ -149,7 +152,29 @@ class DependencyAnalyzer:
             # Get all tasks in the task list
             return self.data_store.list_tasks(scope_id)
 
-    def _calculate_critical_path(self, tasks: list[Task], task_map: dict[UUID, Task]) -> list[UUID]:
+    def _build_dependents(
+        self, tasks: list[Task], task_map: dict[UUID, Task]
+    ) -> dict[UUID, list[UUID]]:
+        """Map each task in scope to the tasks in scope that depend on it.
+
+        Args:
+            tasks: List of all tasks in scope
+            task_map: Dictionary mapping task IDs to Task objects
+
+        Returns:
+            Dictionary mapping task IDs to the IDs of their dependents; tasks
+            without dependents are absent
+        """
+        dependents: dict[UUID, list[UUID]] = defaultdict(list)
+        for task in tasks:
+            for dep in task.dependencies:
+                if dep.task_id in task_map:
+                    dependents[dep.task_id].append(task.id)
+        return dependents
+
+    def _calculate_critical_path(
+        self, tasks: list[Task], dependents: dict[UUID, list[UUID]]
+    ) -> list[UUID]:
         """Calculate the critical path (longest dependency chain).
 
         Uses topological sort and dynamic programming to find the longest path
@@ -158,7 +183,7 @@ class DependencyAnalyzer:
 
         Args:
             tasks: List of all tasks in scope
-            task_map: Dictionary mapping task IDs to Task objects
+            dependents: Dictionary mapping task IDs to the IDs of their dependents
 
         Returns:
             List of task IDs forming the critical path (from leaf to root)
@@ -168,15 +193,11 @@ class DependencyAnalyzer:
         if not tasks:
             return []
 
-        # Build adjacency list (reverse direction: task -> dependents)
-        dependents: dict[UUID, list[UUID]] = defaultdict(list)
+        # Count the in-scope dependencies of each task
         in_degree: dict[UUID, int] = {task.id: 0 for task in tasks}
-
-        for task in tasks:
-            for dep in task.dependencies:
-                if dep.task_id in task_map:
-                    dependents[dep.task_id].append(task.id)
-                    in_degree[task.id] += 1
+        for dependent_ids in dependents.values():
+            for dependent_id in dependent_ids:
+                in_degree[dependent_id] += 1
 
         # Find all leaf tasks (no dependencies)
         queue = deque([task_id for task_id, degree in in_degree.items() if degree == 0])
@@ -190,7 +211,7 @@ class DependencyAnalyzer:
             current = queue.popleft()
 
             # Update all dependents
-            for dependent in dependents[current]:
+            for dependent in dependents.get(current, ()):
                 # Check if this path is longer
                 new_length = longest_path_length[current] + 1
                 if new_length > longest_path_length[dependent]:
@@ -217,33 +238,26 @@ class DependencyAnalyzer:
 
         return critical_path
 
-    def _detect_bottlenecks(
-        self, tasks: list[Task], task_map: dict[UUID, Task]
-    ) -> list[tuple[UUID, int]]:
+    def _detect_bottlenecks(self, dependents: dict[UUID, list[UUID]]) -> list[tuple[UUID, int]]:
         """Detect bottleneck tasks (tasks that block multiple other tasks).
 
         A bottleneck is a task that has multiple other tasks depending on it.
         These tasks are critical because their delay affects many downstream tasks.
 
         Args:
-            tasks: List of all tasks in scope
-            task_map: Dictionary mapping task IDs to Task objects
+            dependents: Dictionary mapping task IDs to the IDs of their dependents
 
         Returns:
             List of (task_id, blocked_count) tuples, sorted by blocked_count descending
 
         Requirements: 5.2
         """
-        # Count how many tasks depend on each task
-        dependent_count: dict[UUID, int] = defaultdict(int)
-
-        for task in tasks:
-            for dep in task.dependencies:
-                if dep.task_id in task_map:
-                    dependent_count[dep.task_id] += 1
-
         # Filter for tasks that block multiple others (2 or more)
-        bottlenecks = [(task_id, count) for task_id, count in dependent_count.items() if count >= 2]
+        bottlenecks = [
+            (task_id, len(dependent_ids))
+            for task_id, dependent_ids in dependents.items()
+            if len(dependent_ids) >= 2
+        ]
 
         # Sort by blocked count (descending)
         bottlenecks.sort(key=lambda x: x[1], reverse=True)
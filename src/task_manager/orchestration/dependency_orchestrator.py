@@ -8,6 +8,7 @@ Acyclic Graph) integrity.
 Requirements: 8.1, 8.2, 8.3, 8.4, 9.1, 9.2, 9.3
 """
 
+from typing import Optional
 from uuid import UUID
 
 from task_manager.data.delegation.data_store import DataStore
@@ -20,7 +21,7 @@ class DependencyOrchestrator:
 
     This orchestrator provides operations for:
     - Validating dependencies (ensuring referenced tasks exist)
-    - Detecting circular dependencies using depth-first search
+    - Detecting circular dependencies with a breadth-first graph search
     - Identifying ready tasks (tasks with no pending dependencies)
 
     Attributes:
@@ -68,64 +69,168 @@ class DependencyOrchestrator:
                     f"task list '{dep.task_list_id}'"
                 )
 
-    def detect_circular_dependency(self, task_id: UUID, new_dependencies: list[Dependency]) -> bool:
+    def validate_batch_dependencies(self, tasks: list[Task]) -> None:
+        """Validate the dependencies of new tasks created together.
+
+        Dependencies may reference other tasks of the batch or existing tasks.
+        The existing tasks referenced by the whole batch are loaded with one
+        bulk read.
+
+        Args:
+            tasks: The new tasks, with their IDs assigned
+
+        Raises:
+            ValueError: If any dependency references a non-existent task or a
+                task of another task list
+
+        Requirements: 8.1, 8.2
+        """
+        task_list_ids = {task.id: task.task_list_id for task in tasks}
+        existing_ids = [
+            dep.task_id
+            for task in tasks
+            for dep in task.dependencies
+            if dep.task_id not in task_list_ids
+        ]
+        if existing_ids:
+            for referenced_task in self.data_store.get_tasks(existing_ids):
+                task_list_ids[referenced_task.id] = referenced_task.task_list_id
+
+        for task in tasks:
+            for dep in task.dependencies:
+                referenced_task_list_id = task_list_ids.get(dep.task_id)
+                if referenced_task_list_id is None:
+                    raise ValueError(
+                        f"Dependency references non-existent task with id '{dep.task_id}'"
+                    )
+                if referenced_task_list_id != dep.task_list_id:
+                    raise ValueError(
+                        f"Dependency task '{dep.task_id}' does not belong to "
+                        f"task list '{dep.task_list_id}'"
+                    )
+
+    def detect_circular_dependency_in_batch(self, tasks: list[Task]) -> bool:
+        """Detect if the dependencies of new tasks created together form a cycle.
+
+        No existing task depends on a new task, so a cycle can only run through
+        tasks of the batch and no task needs to be read. Tasks of the batch
+        without dependencies on other unvisited batch tasks are removed until
+        none are left (Kahn's algorithm); tasks that remain lie on or behind a
+        cycle.
+
+        Args:
+            tasks: The new tasks, with their IDs assigned
+
+        Returns:
+            True if the dependencies between the tasks form a cycle, False otherwise
+
+        Requirements: 8.3, 8.4
+        """
+        batch_ids = {task.id for task in tasks}
+        pending: dict[UUID, int] = {}
+        dependents: dict[UUID, list[UUID]] = {}
+        for task in tasks:
+            dependency_ids = {dep.task_id for dep in task.dependencies if dep.task_id in batch_ids}
+            pending[task.id] = len(dependency_ids)
+            for dependency_id in dependency_ids:
+                dependents.setdefault(dependency_id, []).append(task.id)
+
+        unblocked = [task_id for task_id, count in pending.items() if count == 0]
+        removed = 0
+        while unblocked:
+            task_id = unblocked.pop()
+            removed += 1
+            for dependent_id in dependents.get(task_id, ()):
+                pending[dependent_id] -= 1
+                if pending[dependent_id] == 0:
+                    unblocked.append(dependent_id)
+
+        return removed < len(pending)
+
+    def detect_circular_dependency(
+        self,
+        task_id: UUID,
+        new_dependencies: list[Dependency],
+        adjacency: Optional[dict[UUID, tuple[UUID, ...]]] = None,
+    ) -> bool:
         """Detect if adding dependencies would create a circular dependency.
 
-        Uses depth-first search to detect cycles in the dependency graph.
         A circular dependency exists if following the dependency chain from
         any of the new dependencies eventually leads back to the original task.
+        All new dependencies are searched together, breadth first, so each
+        task is visited at most once and deep chains do not recurse.
 
         Args:
             task_id: The UUID of the task that would have the new dependencies
             new_dependencies: List of dependencies to check for circular references
+            adjacency: Optional snapshot mapping task IDs to the IDs of their
+                dependencies. Tasks it contains are not read from the store,
+                and tasks read from the store are added to it
 
         Returns:
             True if adding the dependencies would create a cycle, False otherwise
 
         Requirements: 8.3, 8.4
         """
-        # For each new dependency, check if it creates a cycle
-        for dep in new_dependencies:
-            if self._has_path_to_task(dep.task_id, task_id, set()):
-                return True
-
-        return False
-
-    def _has_path_to_task(self, from_task_id: UUID, to_task_id: UUID, visited: set[UUID]) -> bool:
-        """Check if there is a path from one task to another via dependencies.
-
-        Uses depth-first search to traverse the dependency graph.
+        if adjacency is None:
+            adjacency = {}
+        return self._reaches_task([dep.task_id for dep in new_dependencies], task_id, adjacency)
+
+    def _reaches_task(
+        self,
+        start_task_ids: list[UUID],
+        target_task_id: UUID,
+        adjacency: dict[UUID, tuple[UUID, ...]],
+    ) -> bool:
+        """Check if there is a path from any start task to a task via dependencies.
+
+        Searches the dependency graph level by level. The dependencies of the
+        tasks of a level that are not in the adjacency snapshot are loaded with
+        one bulk read.
 
         Args:
-            from_task_id: Starting task UUID
-            to_task_id: Target task UUID to reach
-            visited: Set of already visited task UUIDs to prevent infinite loops
+            start_task_ids: Task UUIDs to start from
+            target_task_id: Target task UUID to reach
+            adjacency: Snapshot of the dependency graph, completed as tasks are read
 
         Returns:
-            True if a path exists from from_task_id to to_task_id, False otherwise
+            True if a path exists from a start task to target_task_id, False otherwise
         """
-        # Base case: we've reached the target
-        if from_task_id == to_task_id:
-            return True
+        visited: set[UUID] = set()
+        frontier = list(dict.fromkeys(start_task_ids))
 
-        # Avoid revisiting nodes
-        if from_task_id in visited:
-            return False
+        while frontier:
+            if target_task_id in frontier:
+                return True
+            visited.update(frontier)
+            self._load_adjacency([tid for tid in frontier if tid not in adjacency], adjacency)
 
-        visited.add(from_task_id)
+            next_frontier: dict[UUID, None] = {}
+            for current_id in frontier:
+                for dependency_id in adjacency[current_id]:
+                    if dependency_id not in visited:
+                        next_frontier[dependency_id] = None
+            frontier = list(next_frontier)
 
-        # Get the task and check its dependencies
-        task = self.data_store.get_task(from_task_id)
+        return False
 
-        if task is None:
-            return False
+    def _load_adjacency(
+        self, task_ids: list[UUID], adjacency: dict[UUID, tuple[UUID, ...]]
+    ) -> None:
+        """Add the dependencies of tasks to an adjacency snapshot.
 
-        # Recursively check each dependency
-        for dep in task.dependencies:
-            if self._has_path_to_task(dep.task_id, to_task_id, visited):
-                return True
+        Tasks that do not exist are added without dependencies.
 
-        return False
+        Args:
+            task_ids: UUIDs of the tasks to load
+            adjacency: Snapshot of the dependency graph to add them to
+        """
+        if not task_ids:
+            return
+        for task in self.data_store.get_tasks(task_ids):
+            adjacency[task.id] = tuple(dep.task_id for dep in task.dependencies)
+        for task_id in task_ids:
+            adjacency.setdefault(task_id, ())
 
     def get_ready_tasks(self, scope_type: str, scope_id: UUID) -> list[Task]:
         """Retrieve tasks that are ready for execution within a scope.
@@ -154,6 +259,12 @@ class DependencyOrchestrator:
         if scope_type not in ["project", "task_list"]:
             raise ValueError(f"Invalid scope_type '{scope_type}'. Must be 'project' or 'task_list'")
 
+        # Let stores that evaluate readiness natively do it in one round trip
+        if getattr(self.data_store, "supports_ready_task_query", False) is True:
+            return self.data_store.get_ready_tasks(
+                scope_type, scope_id, statuses=self._ready_statuses()
+            )
+
         # Get all tasks in the scope
         if scope_type == "project":
             # Verify project exists
@@ -187,6 +298,22 @@ class DependencyOrchestrator:
 
         return ready_tasks
 
+    def _ready_statuses(self) -> list[Status]:
+        """Get the statuses a task may have to be ready in the current environment.
+
+        Returns:
+            [NOT_STARTED] in multi-agent environments, otherwise every status
+            except COMPLETED
+        """
+        import os
+
+        multi_agent_mode = (
+            os.environ.get("MULTI_AGENT_ENVIRONMENT_BEHAVIOR", "false").lower() == "true"
+        )
+        if multi_agent_mode:
+            return [Status.NOT_STARTED]
+        return [status for status in Status if status != Status.COMPLETED]
+
     def _is_task_ready(self, task: Task) -> bool:
         """Check if a task is ready for execution.
 
@@ -0,0 +1,326 @@
+"""In-process event bus for task change notifications.
+
+Task mutations made through the orchestrators publish a TaskEvent to an
+EventBus. Subscribers (such as the REST /events Server-Sent Events stream)
+register with an optional project or task list filter and receive only the
+matching events, so clients learn about changes without polling the store.
+
+Orchestrator calls run on worker threads while subscribers consume events on
+an asyncio event loop, so publish() is thread-safe and hands each event to
+the subscriber's loop. Each subscription buffers a bounded number of events;
+a subscriber that falls behind is marked as overflowed and must resynchronize
+by fetching the current state.
+
+Changes made by other processes sharing a PostgreSQL database arrive as
+change notifications (see postgresql_listener) and are published with
+publish_remote_change().
+
+Requirements: 2.3, 9.1
+"""
+
+import asyncio
+import itertools
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from task_manager.data.access.postgresql_listener import ChangeNotification
+from task_manager.data.delegation.data_store import DataStore
+from task_manager.models.entities import Task
+
+TASK_CREATED = "task.created"
+TASK_UPDATED = "task.updated"
+TASK_DELETED = "task.deleted"
+TASK_STATUS_CHANGED = "task.status_changed"
+TASK_NOTE_ADDED = "task.note_added"
+
+# Default number of events buffered per subscriber before it is overflowed
+DEFAULT_MAX_PENDING_EVENTS = 1000
+
+# Event types of the operations reported by store change notifications
+REMOTE_EVENT_TYPES = {
+    "created": TASK_CREATED,
+    "updated": TASK_UPDATED,
+    "deleted": TASK_DELETED,
+}
+
+
+@dataclass
+class TaskEvent:
+    """Notification that a task was created, changed or deleted.
+
+    Attributes:
+        type: Event type, one of the TASK_* constants
+        task_id: UUID of the affected task
+        task_list_id: UUID of the task list containing the task
+        project_id: UUID of the project containing the task list, if known
+        task: The task after the change, or None for deletions
+        sequence: Number increasing with each event published on the bus
+        timestamp: When the event was published
+    """
+
+    type: str
+    task_id: UUID
+    task_list_id: UUID
+    project_id: Optional[UUID] = None
+    task: Optional[Task] = None
+    sequence: int = 0
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class Subscription:
+    """A subscriber's filtered, bounded queue of events.
+
+    Must be created and consumed on a running asyncio event loop.
+
+    Attributes:
+        project_id: Only events of tasks in this project are delivered, if set
+        task_list_id: Only events of tasks in this task list are delivered, if set
+        overflowed: True once events were dropped because the queue was full
+    """
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        project_id: Optional[UUID],
+        task_list_id: Optional[UUID],
+        max_pending: int,
+    ):
+        """Initialize the Subscription.
+
+        Args:
+            bus: Event bus the subscription belongs to
+            project_id: Optional project filter
+            task_list_id: Optional task list filter
+            max_pending: Maximum number of undelivered events
+
+        Raises:
+            ValueError: If max_pending is less than 1
+        """
+        if max_pending < 1:
+            raise ValueError("Subscription queue size must be at least 1")
+        self.project_id = project_id
+        self.task_list_id = task_list_id
+        self.overflowed = False
+        self._bus = bus
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue(max_pending)
+
+    def matches(self, event: TaskEvent) -> bool:
+        """Check whether an event passes the subscription's filters.
+
+        Args:
+            event: Published event
+
+        Returns:
+            True if the event should be delivered to this subscriber
+        """
+        if self.task_list_id is not None and event.task_list_id != self.task_list_id:
+            return False
+        if self.project_id is not None and event.project_id != self.project_id:
+            return False
+        return True
+
+    def _deliver(self, event: TaskEvent) -> None:
+        """Queue an event; runs on the subscriber's event loop."""
+        if self.overflowed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    def _overflow(self) -> None:
+        """Mark the subscription overflowed and wake up the consumer."""
+        self.overflowed = True
+        try:
+            self._queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+
+    def _call_soon(self, callback: Callable[..., None], *args: Any) -> None:
+        """Run a callback on the subscriber's event loop from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            # The subscriber's loop is closed; it will never consume events
+            self._bus.unsubscribe(self)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[TaskEvent]:
+        """Wait for the next event.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait forever
+
+        Returns:
+            The next event, or None if the timeout expired first or the
+            subscription was overflowed
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        self._bus.unsubscribe(self)
+
+
+class EventBus:
+    """Thread-safe publish/subscribe hub for task events."""
+
+    def __init__(self):
+        """Initialize an EventBus without subscribers."""
+        self._subscriptions: list[Subscription] = []
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Whether any subscriber is registered."""
+        return bool(self._subscriptions)
+
+    def subscribe(
+        self,
+        project_id: Optional[UUID] = None,
+        task_list_id: Optional[UUID] = None,
+        max_pending: int = DEFAULT_MAX_PENDING_EVENTS,
+    ) -> Subscription:
+        """Register a subscriber on the running event loop.
+
+        Args:
+            project_id: Optional UUID to receive only events of this project
+            task_list_id: Optional UUID to receive only events of this task list
+            max_pending: Maximum number of undelivered events before the
+                subscription is overflowed
+
+        Returns:
+            The new subscription; close it to unsubscribe
+
+        Raises:
+            ValueError: If max_pending is less than 1
+        """
+        subscription = Subscription(self, project_id, task_list_id, max_pending)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber; does nothing if it is not registered.
+
+        Args:
+            subscription: Subscription returned by subscribe()
+        """
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def publish(self, event: TaskEvent) -> None:
+        """Deliver an event to every matching subscriber.
+
+        Assigns the event its sequence number. Safe to call from any thread.
+
+        Args:
+            event: Event to publish
+        """
+        with self._lock:
+            event.sequence = next(self._sequence)
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            if subscription.matches(event):
+                subscription._call_soon(subscription._deliver, event)
+
+    def overflow_all(self) -> None:
+        """Mark every subscription overflowed.
+
+        Used when events may have been lost, e.g. while the connection
+        receiving other processes' change notifications was down.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription._call_soon(subscription._overflow)
+
+
+def publish_task_event(
+    event_bus: Optional[EventBus],
+    data_store: DataStore,
+    event_type: str,
+    task: Task,
+) -> None:
+    """Publish an event for a task if anyone is subscribed.
+
+    Looks up the task's project only when there are subscribers, so
+    mutations cost nothing extra while nobody listens.
+
+    Args:
+        event_bus: Event bus to publish to, or None if events are disabled
+        data_store: Store used to look up the task list's project
+        event_type: One of the TASK_* constants
+        task: The task after the change, or before its deletion; deletion
+            events carry only its IDs
+    """
+    if event_bus is None or not event_bus.has_subscribers:
+        return
+    task_list = data_store.get_task_list(task.task_list_id)
+    event_bus.publish(
+        TaskEvent(
+            type=event_type,
+            task_id=task.id,
+            task_list_id=task.task_list_id,
+            project_id=task_list.project_id if task_list else None,
+            task=None if event_type == TASK_DELETED else task,
+        )
+    )
+
+
+def publish_remote_change(
+    event_bus: EventBus,
+    data_store: DataStore,
+    notification: Optional[ChangeNotification],
+) -> None:
+    """Publish a task change made by another process sharing the store.
+
+    Created and updated tasks are reloaded so the event carries their current
+    state; status changes and notes are reported as task.updated. A None
+    notification means changes may have been missed, so every subscriber is
+    overflowed and resynchronizes.
+
+    Args:
+        event_bus: Event bus to publish to
+        data_store: Store used to load the task and its task list
+        notification: Change notification, or None after a reconnect
+    """
+    if not event_bus.has_subscribers:
+        return
+    if notification is None:
+        event_bus.overflow_all()
+        return
+    event_type = REMOTE_EVENT_TYPES.get(notification.operation)
+    if notification.entity != "task" or event_type is None:
+        return
+
+    if event_type == TASK_DELETED:
+        task = None
+        task_list_id = notification.task_list_id
+    else:
+        task = data_store.get_task(notification.entity_id)
+        if task is None:
+            # Deleted again before the notification arrived
+            return
+        task_list_id = task.task_list_id
+    if task_list_id is None:
+        return
+
+    task_list = data_store.get_task_list(task_list_id)
+    event_bus.publish(
+        TaskEvent(
+            type=event_type,
+            task_id=notification.entity_id,
+            task_list_id=task_list_id,
+            project_id=task_list.project_id if task_list else None,
+            task=task,
+        )
+    )
@@ -7,9 +7,12 @@ priority filtering, tag filtering, project filtering, pagination, and sorting.
 Requirements: 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8
 """
 
+from typing import Iterable, Iterator
+
 from task_manager.data.delegation.data_store import DataStore
-from task_manager.models.entities import SearchCriteria, Task
+from task_manager.models.entities import SearchCriteria, SearchPage, Task
 from task_manager.models.enums import Priority
+from task_manager.models.pagination import decode_cursor, encode_cursor, is_after_cursor
 
 
 class SearchOrchestrator:
@@ -21,9 +24,15 @@ class SearchOrchestrator:
     - Priority filtering (exact match)
     - Tag filtering (exact match)
     - Project filtering (by project ID or project name)
-    - Pagination (limit and offset)
+    - Pagination (limit and offset, or keyset cursors)
     - Sorting (relevance, created_at, updated_at, priority)
 
+    Stores that implement search_task_page(criteria) themselves (PostgreSQLStore
+    and SQLiteStore) receive the validated criteria and evaluate the search
+    natively; otherwise all tasks are loaded and filtered in memory. Likewise,
+    count_results() delegates to count_tasks(criteria) where a store provides
+    it (all built-in stores).
+
     Attributes:
         data_store: The backing store implementation for data persistence
     """
@@ -31,6 +40,9 @@ class SearchOrchestrator:
     # Valid sort criteria
     VALID_SORT_CRITERIA = {"relevance", "created_at", "updated_at", "priority"}
 
+    # Number of sort keys per sort criteria, before the task ID tiebreak
+    SORT_KEY_COUNT = {"relevance": 2, "created_at": 1, "updated_at": 1, "priority": 2}
+
     # Priority ordering for sorting (higher priority = higher value)
     PRIORITY_ORDER = {
         Priority.CRITICAL: 5,
@@ -65,24 +77,38 @@ class SearchOrchestrator:
             List of tasks matching the search criteria, sorted and paginated
 
         Raises:
-            ValueError: If sort criteria is invalid or limit is out of range
+            ValueError: If sort criteria, limit, offset or cursor is invalid
 
         Requirements: 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8
         """
-        # Validate sort criteria
-        if criteria.sort_by not in self.VALID_SORT_CRITERIA:
-            raise ValueError(
-                f"Invalid sort field '{criteria.sort_by}'. "
-                f"Use: {', '.join(sorted(self.VALID_SORT_CRITERIA))}"
-            )
+        return self.search_page(criteria).tasks
 
-        # Validate limit
-        if criteria.limit < 1 or criteria.limit > 100:
-            raise ValueError("Limit must be between 1 and 100")
+    def search_page(self, criteria: SearchCriteria) -> SearchPage:
+        """Search tasks and return one page together with the cursor of the next.
 
-        # Validate offset
-        if criteria.offset < 0:
-            raise ValueError("Offset must be non-negative")
+        Same as search_tasks(), but also returns an opaque cursor positioned
+        after the last task of the page. Passing it back as criteria.cursor
+        (with offset 0) continues from that position by seeking on the
+        (sort keys, task ID) tuple, so deep pages cost the same as the first
+        one and tasks created in between do not shift the pages.
+
+        Args:
+            criteria: SearchCriteria object with filter parameters
+
+        Returns:
+            SearchPage with the tasks and the next cursor (None on the last page)
+
+        Raises:
+            ValueError: If sort criteria, limit, offset or cursor is invalid
+
+        Requirements: 4.7, 4.8
+        """
+        self.validate_criteria(criteria)
+
+        # Let the store evaluate the search natively when it can
+        store_search = getattr(self.data_store, "search_task_page", None)
+        if callable(store_search):
+            return store_search(criteria)
 
         # Get all tasks from all task lists
         all_tasks = self._get_all_tasks()
@@ -100,6 +126,19 @@ class SearchOrchestrator:
             # No query, all tasks have same relevance
             tasks_with_scores = [(task, 0) for task in filtered_tasks]
 
+        # Skip everything up to and including the cursor position
+        if criteria.cursor:
+            cursor_keys, cursor_id = decode_cursor(
+                criteria.cursor, criteria.sort_by, self.SORT_KEY_COUNT[criteria.sort_by]
+            )
+            tasks_with_scores = [
+                (task, score)
+                for task, score in tasks_with_scores
+                if is_after_cursor(
+                    self._sort_keys(task, score, criteria.sort_by), task.id, cursor_keys, cursor_id
+                )
+            ]
+
         # Sort results
         sorted_tasks = self._sort_tasks(tasks_with_scores, criteria.sort_by)
 
@@ -108,7 +147,45 @@ class SearchOrchestrator:
         end_idx = start_idx + criteria.limit
         paginated_tasks = sorted_tasks[start_idx:end_idx]
 
-        return paginated_tasks
+        next_cursor = None
+        if len(sorted_tasks) > end_idx:
+            last = paginated_tasks[-1]
+            score = self._calculate_relevance_score(last, criteria.query) if criteria.query else 0
+            next_cursor = encode_cursor(
+                criteria.sort_by, self._sort_keys(last, score, criteria.sort_by), last.id
+            )
+
+        return SearchPage(tasks=paginated_tasks, next_cursor=next_cursor)
+
+    @classmethod
+    def validate_criteria(cls, criteria: SearchCriteria) -> None:
+        """Validate the sorting and pagination parameters of search criteria.
+
+        Args:
+            criteria: SearchCriteria object to validate
+
+        Raises:
+            ValueError: If sort criteria, limit or offset is invalid, or if an
+                offset is combined with a cursor
+
+        Requirements: 4.7, 4.8
+        """
+        # Validate sort criteria
+        if criteria.sort_by not in cls.VALID_SORT_CRITERIA:
+            raise ValueError(
+                f"Invalid sort field '{criteria.sort_by}'. "
+                f"Use: {', '.join(sorted(cls.VALID_SORT_CRITERIA))}"
+            )
+
+        # Validate limit
+        if criteria.limit < 1 or criteria.limit > 100:
+            raise ValueError("Limit must be between 1 and 100")
+
+        # Validate offset
+        if criteria.offset < 0:
+            raise ValueError("Offset must be non-negative")
+        if criteria.cursor and criteria.offset:
+            raise ValueError("Offset cannot be combined with a cursor")
 
     def count_results(self, criteria: SearchCriteria) -> int:
         """Count matching tasks without retrieving them.
@@ -124,6 +201,11 @@ class SearchOrchestrator:
 
         Requirements: 4.8
         """
+        # Let the store count natively when it can
+        store_count = getattr(self.data_store, "count_tasks", None)
+        if callable(store_count):
+            return store_count(criteria)
+
         # Get all tasks
         all_tasks = self._get_all_tasks()
 
@@ -132,20 +214,19 @@ class SearchOrchestrator:
 
         return len(filtered_tasks)
 
-    def _get_all_tasks(self) -> list[Task]:
-        """Retrieve all tasks from all task lists.
+    def _get_all_tasks(self) -> Iterator[Task]:
+        """Iterate over all tasks from all task lists.
+
+        Tasks are fetched lazily, so filtering them keeps only the matches in
+        memory.
 
         Returns:
-            List of all tasks in the system
+            Iterator over all tasks in the system
         """
-        all_tasks = []
-        task_lists = self.data_store.list_task_lists(None)
-        for task_list in task_lists:
-            all_tasks.extend(self.data_store.list_tasks(task_list.id))
-        return all_tasks
+        return self.data_store.iter_tasks()
 
-    def _apply_filters(self, tasks: list[Task], criteria: SearchCriteria) -> list[Task]:
-        """Apply all filter criteria to a list of tasks.
+    def _apply_filters(self, tasks: Iterable[Task], criteria: SearchCriteria) -> list[Task]:
+        """Apply all filter criteria to an iterable of tasks.
 
         Filters tasks by:
         - Status (if specified)
@@ -156,7 +237,7 @@ class SearchOrchestrator:
         - Text query (if specified)
 
         Args:
-            tasks: List of tasks to filter
+            tasks: Tasks to filter
             criteria: SearchCriteria with filter parameters
 
         Returns:
@@ -168,20 +249,20 @@ class SearchOrchestrator:
 
         # Filter by status
         if criteria.status:
-            filtered = [task for task in filtered if task.status in criteria.status]
+            filtered = (task for task in filtered if task.status in criteria.status)
 
         # Filter by priority
         if criteria.priority:
-            filtered = [task for task in filtered if task.priority in criteria.priority]
+            filtered = (task for task in filtered if task.priority in criteria.priority)
 
         # Filter by tags
         if criteria.tags:
             # Task must have at least one of the specified tags
-            filtered = [
+            filtered = (
                 task
                 for task in filtered
                 if task.tags and any(tag in task.tags for tag in criteria.tags)
-            ]
+            )
 
         # Filter by project ID (takes precedence over project name)
         if criteria.project_id:
@@ -194,13 +275,13 @@ class SearchOrchestrator:
         if criteria.query:
             filtered = self._filter_by_text(filtered, criteria.query)
 
-        return filtered
+        return list(filtered)
 
-    def _filter_by_project_id(self, tasks: list[Task], project_id) -> list[Task]:
+    def _filter_by_project_id(self, tasks: Iterable[Task], project_id) -> list[Task]:
         """Filter tasks by project ID.
 
         Args:
-            tasks: List of tasks to filter
+            tasks: Tasks to filter
             project_id: UUID of the project to filter by
 
         Returns:
@@ -215,11 +296,11 @@ class SearchOrchestrator:
         # Filter tasks by task list membership
         return [task for task in tasks if task.task_list_id in task_list_ids]
 
-    def _filter_by_project(self, tasks: list[Task], project_name: str) -> list[Task]:
+    def _filter_by_project(self, tasks: Iterable[Task], project_name: str) -> list[Task]:
         """Filter tasks by project name.
 
         Args:
-            tasks: List of tasks to filter
+            tasks: Tasks to filter
             project_name: Name of the project to filter by
 
         Returns:
@@ -244,13 +325,13 @@ class SearchOrchestrator:
         # Filter tasks by task list membership
         return [task for task in tasks if task.task_list_id in task_list_ids]
 
-    def _filter_by_text(self, tasks: list[Task], query: str) -> list[Task]:
+    def _filter_by_text(self, tasks: Iterable[Task], query: str) -> list[Task]:
         """Filter tasks by text query in title and description.
 
         Uses case-insensitive substring matching with Unicode case-folding.
 
         Args:
-            tasks: List of tasks to filter
+            tasks: Tasks to filter
             query: Text query to search for
 
         Returns:
@@ -299,9 +380,33 @@ class SearchOrchestrator:
 
         return score
 
+    def _sort_keys(self, task: Task, score: float, sort_by: str) -> tuple:
+        """Return the sort key values of a task, compared in descending order.
+
+        Args:
+            task: Task to compute the keys for
+            score: Relevance score of the task
+            sort_by: Sort criteria - "relevance", "created_at", "updated_at", or "priority"
+
+        Returns:
+            Tuple of SORT_KEY_COUNT[sort_by] sort key values
+
+        Requirements: 4.7
+        """
+        if sort_by == "created_at":
+            return (task.created_at,)
+        if sort_by == "updated_at":
+            return (task.updated_at,)
+        if sort_by == "priority":
+            return (self.PRIORITY_ORDER.get(task.priority, 0), task.created_at)
+        return (score, task.created_at)
+
     def _sort_tasks(self, tasks_with_scores: list[tuple[Task, float]], sort_by: str) -> list[Task]:
         """Sort tasks by the specified criteria.
 
+        Tasks are ordered by their sort keys descending; ties are broken by
+        task ID ascending so that the order is total and cursors are stable.
+
         Args:
             tasks_with_scores: List of (task, relevance_score) tuples
             sort_by: Sort criteria - "relevance", "created_at", "updated_at", or "priority"
@@ -311,41 +416,13 @@ class SearchOrchestrator:
 
         Requirements: 4.7
         """
-        if sort_by == "relevance":
-            # Sort by relevance score (descending), then by created_at (descending)
-            sorted_tasks = sorted(
-                tasks_with_scores,
-                key=lambda x: (x[1], x[0].created_at),
-                reverse=True,
-            )
-        elif sort_by == "created_at":
-            # Sort by created_at (descending - newest first)
-            sorted_tasks = sorted(
-                tasks_with_scores,
-                key=lambda x: x[0].created_at,
-                reverse=True,
-            )
-        elif sort_by == "updated_at":
-            # Sort by updated_at (descending - most recently updated first)
-            sorted_tasks = sorted(
-                tasks_with_scores,
-                key=lambda x: x[0].updated_at,
-                reverse=True,
-            )
-        elif sort_by == "priority":
-            # Sort by priority (descending - highest priority first), then by created_at
-            sorted_tasks = sorted(
-                tasks_with_scores,
-                key=lambda x: (self.PRIORITY_ORDER.get(x[0].priority, 0), x[0].created_at),
-                reverse=True,
-            )
-        else:
-            # Should not reach here due to validation, but default to relevance
-            sorted_tasks = sorted(
-                tasks_with_scores,
-                key=lambda x: (x[1], x[0].created_at),
-                reverse=True,
-            )
+        # Python's sort is stable, so sorting by ID first breaks ties by ID
+        by_id = sorted(tasks_with_scores, key=lambda x: x[0].id)
+        sorted_tasks = sorted(
+            by_id,
+            key=lambda x: self._sort_keys(x[0], x[1], sort_by),
+            reverse=True,
+        )
 
         # Extract just the tasks (without scores)
         return [task for task, _ in sorted_tasks]
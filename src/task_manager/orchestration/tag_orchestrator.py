@@ -8,10 +8,12 @@ Requirements: 3.2, 3.3, 3.4, 3.5, 3.6
 
 import re
 from datetime import datetime, timezone
+from typing import Optional
 from uuid import UUID
 
 from task_manager.data.delegation.data_store import DataStore
 from task_manager.models.entities import Task
+from task_manager.orchestration.event_bus import TASK_UPDATED, EventBus, publish_task_event
 
 
 class TagOrchestrator:
@@ -26,6 +28,7 @@ class TagOrchestrator:
 
     Attributes:
         data_store: The backing store implementation for data persistence
+        event_bus: Optional event bus notified of tag changes
     """
 
     # Maximum length for a single tag
@@ -42,13 +45,15 @@ class TagOrchestrator:
     # \U00010000-\U0010FFFF matches supplementary unicode planes (including most emoji)
     TAG_PATTERN = re.compile(r"^[\w\-\u0080-\uFFFF\U00010000-\U0010FFFF]+$", re.UNICODE)
 
-    def __init__(self, data_store: DataStore):
+    def __init__(self, data_store: DataStore, event_bus: Optional[EventBus] = None):
         """Initialize the TagOrchestrator.
 
         Args:
             data_store: The DataStore implementation to use for persistence
+            event_bus: Optional event bus to publish task changes to
         """
         self.data_store = data_store
+        self.event_bus = event_bus
 
     def validate_tag(self, tag: str) -> bool:
         """Validate a single tag.
@@ -137,7 +142,9 @@ class TagOrchestrator:
         task.updated_at = datetime.now(timezone.utc)
 
         # Persist changes
-        return self.data_store.update_task(task)
+        task = self.data_store.update_task(task)
+        publish_task_event(self.event_bus, self.data_store, TASK_UPDATED, task)
+        return task
 
     def remove_tags(self, task_id: UUID, tags: list[str]) -> Task:
         """Remove tags from a task.
@@ -173,7 +180,76 @@ class TagOrchestrator:
         task.updated_at = datetime.now(timezone.utc)
 
         # Persist changes
-        return self.data_store.update_task(task)
+        task = self.data_store.update_task(task)
+        publish_task_event(self.event_bus, self.data_store, TASK_UPDATED, task)
+        return task
+
+    def add_tags_to_tasks(self, task_ids: list[UUID], tags: list[str]) -> list[Task]:
+        """Add tags to several tasks together.
+
+        The tags and the resulting tag count of every task are validated as in
+        add_tags() before the store adds the tags to all tasks in one call.
+
+        Args:
+            task_ids: The UUIDs of the tasks to add tags to; repeated IDs are ignored
+            tags: List of tag strings to add to each task
+
+        Returns:
+            The updated tasks, in the order of their IDs in task_ids
+
+        Raises:
+            ValueError: If a task does not exist, any tag is invalid, or adding
+                       the tags would exceed the maximum tag count of a task
+
+        Requirements: 3.2, 3.3, 3.4, 3.5
+        """
+        # Validate all tags before adding any
+        for tag in tags:
+            self.validate_tag(tag)
+
+        ids = list(dict.fromkeys(task_ids))
+        tasks = {task.id: task for task in self.data_store.get_tasks(ids)}
+        for task_id in ids:
+            task = tasks.get(task_id)
+            if task is None:
+                raise ValueError(f"Task with id '{task_id}' does not exist")
+
+            # Check maximum tag count
+            tag_count = len(set(task.tags or []) | set(tags))
+            if tag_count > self.MAX_TAGS_PER_TASK:
+                raise ValueError(
+                    f"Task cannot have more than {self.MAX_TAGS_PER_TASK} tags "
+                    f"(would have {tag_count} tags)"
+                )
+
+        # Persist changes
+        updated = self.data_store.add_tags_to_tasks(ids, tags)
+        for task in updated:
+            publish_task_event(self.event_bus, self.data_store, TASK_UPDATED, task)
+        return updated
+
+    def remove_tags_from_tasks(self, task_ids: list[UUID], tags: list[str]) -> list[Task]:
+        """Remove tags from several tasks together.
+
+        Tags that don't exist on a task are silently ignored.
+
+        Args:
+            task_ids: The UUIDs of the tasks to remove tags from; repeated IDs are ignored
+            tags: List of tag strings to remove from each task
+
+        Returns:
+            The updated tasks, in the order of their IDs in task_ids
+
+        Raises:
+            ValueError: If a task does not exist
+
+        Requirements: 3.6
+        """
+        # Persist changes; the store checks that the tasks exist
+        updated = self.data_store.remove_tags_from_tasks(list(dict.fromkeys(task_ids)), tags)
+        for task in updated:
+            publish_task_event(self.event_bus, self.data_store, TASK_UPDATED, task)
+        return updated
 
     def get_tasks_by_tag(self, tag: str) -> list[Task]:
         """Get all tasks with a specific tag.
@@ -186,11 +262,5 @@ class TagOrchestrator:
 
         Requirements: 3.7
         """
-        # Get all tasks
-        all_tasks = []
-        task_lists = self.data_store.list_task_lists(None)
-        for task_list in task_lists:
-            all_tasks.extend(self.data_store.list_tasks(task_list.id))
-
-        # Filter tasks by tag
-        return [task for task in all_tasks if task.tags and tag in task.tags]
+        # Filter tasks by tag while iterating, so only matches are kept in memory
+        return [task for task in self.data_store.iter_tasks() if task.tags and tag in task.tags]
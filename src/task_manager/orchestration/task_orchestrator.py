@@ -9,13 +9,22 @@ Requirements: 5.1, 5.2, 5.3, 5.4, 5.5, 5.6, 5.7, 5.8, 6.4, 6.5, 6.6, 7.1, 7.2, 7
 """
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional
 from uuid import UUID, uuid4
 
 from task_manager.data.delegation.data_store import DataStore
 from task_manager.models.entities import ActionPlanItem, Dependency, ExitCriteria, Note, Task
 from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
 from task_manager.orchestration.dependency_orchestrator import DependencyOrchestrator
+from task_manager.orchestration.event_bus import (
+    TASK_CREATED,
+    TASK_DELETED,
+    TASK_NOTE_ADDED,
+    TASK_STATUS_CHANGED,
+    TASK_UPDATED,
+    EventBus,
+    publish_task_event,
+)
 
 
 class BusinessLogicError(Exception):
@@ -36,19 +45,37 @@ class TaskOrchestrator:
     - Timestamp management (creation and update timestamps)
     - Dependency cleanup when deleting tasks
 
+    Every mutation publishes a TaskEvent to the event bus, if one is given.
+
     Attributes:
         data_store: The backing store implementation for data persistence
         dependency_orchestrator: Orchestrator for dependency graph operations
+        event_bus: Optional event bus notified of task changes
     """
 
-    def __init__(self, data_store: DataStore):
+    def __init__(self, data_store: DataStore, event_bus: Optional[EventBus] = None):
         """Initialize the TaskOrchestrator.
 
         Args:
             data_store: The DataStore implementation to use for persistence
+            event_bus: Optional event bus to publish task changes to
         """
         self.data_store = data_store
         self.dependency_orchestrator = DependencyOrchestrator(data_store)
+        self.event_bus = event_bus
+
+    def _publish(self, event_type: str, task: Task) -> Task:
+        """Publish a task event and return the task.
+
+        Args:
+            event_type: One of the TASK_* event types
+            task: The changed task
+
+        Returns:
+            The task, unchanged
+        """
+        publish_task_event(self.event_bus, self.data_store, event_type, task)
+        return task
 
     def validate_exit_criteria_for_completion(self, task: Task) -> None:
         """Validate that all exit criteria are complete before allowing task completion.
@@ -178,7 +205,55 @@ class TaskOrchestrator:
         )
 
         # Persist to backing store
-        return self.data_store.create_task(task)
+        return self._publish(TASK_CREATED, self.data_store.create_task(task))
+
+    def create_tasks(self, tasks: list[Task]) -> list[Task]:
+        """Create several new tasks together.
+
+        The tasks are built by the caller, including their IDs, so that they can
+        depend on each other. All of them are validated as in create_task()
+        before any is persisted: each task list is looked up once, and the
+        dependencies of the whole batch are validated and checked for cycles
+        at once. The store then persists all tasks together.
+
+        Args:
+            tasks: The tasks to create with all fields and timestamps populated
+
+        Returns:
+            The created tasks, in the order of tasks
+
+        Raises:
+            ValueError: If validation fails for any task (empty required fields,
+                       empty exit criteria, duplicate IDs, invalid dependencies,
+                       circular dependencies)
+
+        Requirements: 5.1, 5.2, 5.3, 5.4, 5.5, 5.6
+        """
+        for task in tasks:
+            if not task.title or not task.title.strip():
+                raise ValueError("Task title cannot be empty")
+            if not task.description or not task.description.strip():
+                raise ValueError("Task description cannot be empty")
+            if not task.exit_criteria:
+                raise ValueError("Task must have at least one exit criteria")
+
+        if len({task.id for task in tasks}) != len(tasks):
+            raise ValueError("Cannot create tasks: task IDs must be unique")
+
+        # Verify task lists exist
+        for task_list_id in dict.fromkeys(task.task_list_id for task in tasks):
+            if self.data_store.get_task_list(task_list_id) is None:
+                raise ValueError(f"Task list with id '{task_list_id}' does not exist")
+
+        self.dependency_orchestrator.validate_batch_dependencies(tasks)
+        if self.dependency_orchestrator.detect_circular_dependency_in_batch(tasks):
+            raise ValueError("Cannot create tasks: would create circular dependency")
+
+        # Persist to backing store
+        created = self.data_store.create_tasks(tasks)
+        for task in created:
+            self._publish(TASK_CREATED, task)
+        return created
 
     def get_task(self, task_id: UUID) -> Optional[Task]:
         """Retrieve a task by its unique identifier.
@@ -193,6 +268,28 @@ class TaskOrchestrator:
         """
         return self.data_store.get_task(task_id)
 
+    def get_tasks(self, task_ids: Iterable[UUID]) -> list[Task]:
+        """Retrieve several tasks by their unique identifiers.
+
+        Args:
+            task_ids: UUIDs of the tasks to retrieve
+
+        Returns:
+            The tasks found, in the order of task_ids; unknown IDs are skipped
+        """
+        return self.data_store.get_tasks(task_ids)
+
+    def get_dependents(self, task_id: UUID) -> list[Task]:
+        """Retrieve the tasks that depend on a task.
+
+        Args:
+            task_id: The UUID of the task depended on
+
+        Returns:
+            Tasks whose dependencies include task_id
+        """
+        return self.data_store.get_dependents(task_id)
+
     def list_tasks(self, task_list_id: Optional[UUID] = None) -> list[Task]:
         """Retrieve tasks, optionally filtered by task list.
 
@@ -213,6 +310,44 @@ class TaskOrchestrator:
         else:
             return self.data_store.list_tasks(task_list_id)
 
+    def iter_tasks(self, task_list_id: Optional[UUID] = None) -> Iterator[Task]:
+        """Iterate over tasks lazily, optionally filtered by task list.
+
+        Yields the same tasks as list_tasks() while the store fetches them
+        incrementally, so memory use does not grow with the number of tasks.
+
+        Args:
+            task_list_id: Optional UUID to filter tasks by task list.
+                         If None, iterates over all tasks.
+
+        Returns:
+            Iterator over the tasks matching the filter criteria
+        """
+        return self.data_store.iter_tasks(task_list_id)
+
+    def get_task_version(self, task_id: UUID) -> Optional[str]:
+        """Retrieve a token that changes whenever a task is modified.
+
+        Args:
+            task_id: The UUID of the task
+
+        Returns:
+            An opaque version token, or None if the task does not exist
+        """
+        return self.data_store.get_task_version(task_id)
+
+    def get_tasks_version(self, task_list_id: Optional[UUID] = None) -> str:
+        """Retrieve a token that changes whenever the tasks of list_tasks() change.
+
+        Args:
+            task_list_id: Optional UUID to restrict the token to one task list.
+                         If None, covers all tasks.
+
+        Returns:
+            An opaque version token
+        """
+        return self.data_store.get_tasks_version(task_list_id)
+
     def update_task(
         self,
         task_id: UUID,
@@ -250,6 +385,77 @@ class TaskOrchestrator:
         if task is None:
             raise ValueError(f"Task with id '{task_id}' does not exist")
 
+        event_type = self._apply_update(
+            task, title, description, status, priority, agent_instructions_template
+        )
+
+        # Persist changes
+        return self._publish(event_type, self.data_store.update_task(task))
+
+    def update_tasks(self, updates: list[tuple[UUID, dict[str, Any]]]) -> list[Task]:
+        """Update several existing tasks together.
+
+        The tasks are read with one get_tasks() call, every update is validated
+        and applied as in update_task(), and the store then persists all tasks
+        together. A task may be updated more than once; its updates are applied
+        in order.
+
+        Args:
+            updates: Pairs of a task ID and the keyword arguments of
+                     update_task() for that task
+
+        Returns:
+            The updated tasks, in the order of updates
+
+        Raises:
+            ValueError: If a task does not exist or validation fails
+
+        Requirements: 5.7
+        """
+        task_ids = [task_id for task_id, _ in updates]
+        tasks = {task.id: task for task in self.data_store.get_tasks(task_ids)}
+
+        event_types: dict[UUID, str] = {}
+        for task_id, fields in updates:
+            task = tasks.get(task_id)
+            if task is None:
+                raise ValueError(f"Task with id '{task_id}' does not exist")
+
+            event_type = self._apply_update(task, **fields)
+            if event_types.get(task_id) != TASK_STATUS_CHANGED:
+                event_types[task_id] = event_type
+
+        # Persist changes
+        updated = {task.id: task for task in self.data_store.update_tasks(list(tasks.values()))}
+        for task_id, event_type in event_types.items():
+            self._publish(event_type, updated[task_id])
+        return [updated[task_id] for task_id, _ in updates]
+
+    def _apply_update(
+        self,
+        task: Task,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+        agent_instructions_template: Optional[str] = None,
+    ) -> str:
+        """Apply the field changes of update_task() to a task.
+
+        Args:
+            task: The task to change in place
+            title: Optional new title for the task
+            description: Optional new description for the task
+            status: Optional new status for the task
+            priority: Optional new priority for the task
+            agent_instructions_template: Optional new template (empty string clears it)
+
+        Returns:
+            The type of the event to publish for the change
+
+        Raises:
+            ValueError: If the title or description is empty
+        """
         # Update fields if provided
         if title is not None:
             if not title.strip():
@@ -261,7 +467,10 @@ class TaskOrchestrator:
                 raise ValueError("Task description cannot be empty")
             task.description = description
 
+        event_type = TASK_UPDATED
         if status is not None:
+            if status != task.status:
+                event_type = TASK_STATUS_CHANGED
             task.status = status
 
         if priority is not None:
@@ -274,9 +483,7 @@ class TaskOrchestrator:
 
         # Update timestamp
         task.updated_at = datetime.now(timezone.utc)
-
-        # Persist changes
-        return self.data_store.update_task(task)
+        return event_type
 
     def delete_task(self, task_id: UUID) -> None:
         """Delete a task with dependency cleanup.
@@ -297,23 +504,58 @@ class TaskOrchestrator:
         if task is None:
             raise ValueError(f"Task with id '{task_id}' does not exist")
 
-        # Find all tasks that depend on this task and remove the dependency
-        all_tasks = self.list_tasks()
-
-        for dependent_task in all_tasks:
-            # Check if this task has a dependency on the task being deleted
-            updated_dependencies = [
+        # Remove the dependency on the task being deleted from its dependents
+        for dependent_task in self.data_store.get_dependents(task_id):
+            dependent_task.dependencies = [
                 dep for dep in dependent_task.dependencies if dep.task_id != task_id
             ]
-
-            # If dependencies changed, update the task
-            if len(updated_dependencies) != len(dependent_task.dependencies):
-                dependent_task.dependencies = updated_dependencies
-                dependent_task.updated_at = datetime.now(timezone.utc)
-                self.data_store.update_task(dependent_task)
+            dependent_task.updated_at = datetime.now(timezone.utc)
+            self._publish(TASK_UPDATED, self.data_store.update_task(dependent_task))
 
         # Delete the task
         self.data_store.delete_task(task_id)
+        self._publish(TASK_DELETED, task)
+
+    def delete_tasks(self, task_ids: list[UUID]) -> None:
+        """Delete several tasks together with dependency cleanup.
+
+        The tasks are read with one get_tasks() call and deleted with one store
+        call, which also removes them from the dependencies of other tasks.
+
+        Args:
+            task_ids: The UUIDs of the tasks to delete; repeated IDs are ignored
+
+        Raises:
+            ValueError: If a task does not exist
+
+        Requirements: 5.8, 8.5
+        """
+        ids = list(dict.fromkeys(task_ids))
+        tasks = self.data_store.get_tasks(ids)
+        found = {task.id for task in tasks}
+        for task_id in ids:
+            if task_id not in found:
+                raise ValueError(f"Task with id '{task_id}' does not exist")
+
+        # The dependents are only needed for their events
+        dependents: dict[UUID, Task] = {}
+        if self.event_bus is not None and self.event_bus.has_subscribers:
+            for task_id in ids:
+                for dependent_task in self.data_store.get_dependents(task_id):
+                    if dependent_task.id not in found:
+                        dependents.setdefault(dependent_task.id, dependent_task)
+
+        self.data_store.delete_tasks(ids)
+
+        now = datetime.now(timezone.utc)
+        for dependent_task in dependents.values():
+            dependent_task.dependencies = [
+                dep for dep in dependent_task.dependencies if dep.task_id not in found
+            ]
+            dependent_task.updated_at = now
+            self._publish(TASK_UPDATED, dependent_task)
+        for task in tasks:
+            self._publish(TASK_DELETED, task)
 
     def update_dependencies(self, task_id: UUID, dependencies: list[Dependency]) -> Task:
         """Update task dependencies with circular dependency validation.
@@ -355,7 +597,7 @@ class TaskOrchestrator:
         task.updated_at = datetime.now(timezone.utc)
 
         # Persist changes
-        return self.data_store.update_task(task)
+        return self._publish(TASK_UPDATED, self.data_store.update_task(task))
 
     def add_note(self, task_id: UUID, content: str) -> Task:
         """Add a general note to a task.
@@ -388,7 +630,7 @@ class TaskOrchestrator:
         task.updated_at = datetime.now(timezone.utc)
 
         # Persist changes
-        return self.data_store.update_task(task)
+        return self._publish(TASK_NOTE_ADDED, self.data_store.update_task(task))
 
     def add_research_note(self, task_id: UUID, content: str) -> Task:
         """Add a research note to a task.
@@ -426,7 +668,7 @@ class TaskOrchestrator:
         task.updated_at = datetime.now(timezone.utc)
 
         # Persist changes
-        return self.data_store.update_task(task)
+        return self._publish(TASK_NOTE_ADDED, self.data_store.update_task(task))
 
     def update_action_plan(self, task_id: UUID, action_plan: list[ActionPlanItem]) -> Task:
         """Update the action plan for a task.
@@ -456,7 +698,7 @@ class TaskOrchestrator:
         task.updated_at = datetime.now(timezone.utc)
 
         # Persist changes
-        return self.data_store.update_task(task)
+        return self._publish(TASK_UPDATED, self.data_store.update_task(task))
 
     def add_execution_note(self, task_id: UUID, content: str) -> Task:
         """Add an execution note to a task.
@@ -494,7 +736,7 @@ class TaskOrchestrator:
         task.updated_at = datetime.now(timezone.utc)
 
         # Persist changes
-        return self.data_store.update_task(task)
+        return self._publish(TASK_NOTE_ADDED, self.data_store.update_task(task))
 
     def update_status(self, task_id: UUID, status: Status) -> Task:
         """Update task status with exit criteria validation.
@@ -529,7 +771,7 @@ class TaskOrchestrator:
         task.updated_at = datetime.now(timezone.utc)
 
         # Persist changes
-        return self.data_store.update_task(task)
+        return self._publish(TASK_STATUS_CHANGED, self.data_store.update_task(task))
 
     def update_exit_criteria(self, task_id: UUID, exit_criteria: list[ExitCriteria]) -> Task:
         """Update exit criteria for a task.
@@ -560,4 +802,4 @@ class TaskOrchestrator:
         task.updated_at = datetime.now(timezone.utc)
 
         # Persist changes
-        return self.data_store.update_task(task)
+        return self._publish(TASK_UPDATED, self.data_store.update_task(task))
@@ -522,12 +522,12 @@ class TestErrorHandling:
 
 
 class TestDirectStoreAccess:
-    """Test that operations hit the filesystem directly without caching."""
+    """Test that reads reflect the filesystem and are never served from a stale cache."""
 
     def test_create_then_read_reflects_changes(
         self, temp_store, sample_project, sample_task_list, sample_task
     ):
-        """Test that reads immediately reflect writes (no caching)."""
+        """Test that reads immediately reflect writes (no stale cache)."""
         # Create entities
         temp_store.create_project(sample_project)
         temp_store.create_task_list(sample_task_list)
@@ -544,7 +544,7 @@ class TestDirectStoreAccess:
     def test_update_then_read_reflects_changes(
         self, temp_store, sample_project, sample_task_list, sample_task
     ):
-        """Test that reads immediately reflect updates (no caching)."""
+        """Test that reads immediately reflect updates (no stale cache)."""
         # Create entities
         temp_store.create_project(sample_project)
         temp_store.create_task_list(sample_task_list)
@@ -565,7 +565,7 @@ class TestDirectStoreAccess:
     def test_delete_then_read_returns_none(
         self, temp_store, sample_project, sample_task_list, sample_task
     ):
-        """Test that reads immediately reflect deletes (no caching)."""
+        """Test that reads immediately reflect deletes (no stale cache)."""
         # Create entities
         temp_store.create_project(sample_project)
         temp_store.create_task_list(sample_task_list)
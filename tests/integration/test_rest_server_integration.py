@@ -870,3 +870,46 @@ def test_reset_task_list_invalid_id(test_client):
     data = response.json()
     assert "error" in data
     assert data["error"]["code"] == "VALIDATION_ERROR"
+
+
+def test_stream_ndjson_closes_iterator_after_disconnect(test_client):
+    """Test that a stream cancelled mid-fetch closes its iterator on a worker thread.
+
+    The worker thread fetching the next chunk is still inside the iterator
+    when the request is cancelled, so the close has to wait for it.
+
+    Requirements: 15.1
+    """
+    import asyncio
+    import threading
+    import time
+
+    from task_manager.interfaces.rest import server
+
+    events = []
+
+    def tasks():
+        try:
+            yield {"title": "first"}
+            events.append("fetching")
+            time.sleep(0.2)
+            yield {"title": "second"}
+        finally:
+            events.append(("closed", threading.current_thread().name))
+
+    async def disconnect():
+        async def consume():
+            async for _ in server.stream_ndjson(tasks(), b"{}\n"):
+                pass
+
+        consumer = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.05)
+        consumer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await consumer
+
+    asyncio.run(disconnect())
+
+    assert events[0] == "fetching"
+    assert events[1][0] == "closed"
+    assert events[1][1] != threading.current_thread().name
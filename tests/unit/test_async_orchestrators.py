@@ -0,0 +1,107 @@
+"""Unit tests for the asynchronous orchestrators.
+
+The AsyncDataStore is mocked; the tests check validation and the calls made
+to the store.
+
+Requirements: 4.7, 4.8, 5.6, 12.1, 12.2
+"""
+
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from task_manager.data.delegation.async_data_store import AsyncDataStore
+from task_manager.models.entities import SearchCriteria, SearchPage
+from task_manager.models.enums import Status
+from task_manager.orchestration.async_search_orchestrator import AsyncSearchOrchestrator
+from task_manager.orchestration.async_task_orchestrator import AsyncTaskOrchestrator
+
+
+@pytest.fixture
+def data_store():
+    """Create a mock AsyncDataStore."""
+    return AsyncMock(spec=AsyncDataStore)
+
+
+class TestAsyncSearchOrchestrator:
+    """Test search on an async store."""
+
+    async def test_search_page_delegates_to_store(self, data_store):
+        """Test that the store evaluates validated criteria."""
+        task = Mock()
+        data_store.search_task_page.return_value = SearchPage(tasks=[task], next_cursor="next")
+        criteria = SearchCriteria(query="deploy", limit=5)
+
+        page = await AsyncSearchOrchestrator(data_store).search_page(criteria)
+
+        assert page.tasks == [task] and page.next_cursor == "next"
+        data_store.search_task_page.assert_awaited_once_with(criteria)
+        assert await AsyncSearchOrchestrator(data_store).search_tasks(criteria) == [task]
+
+    @pytest.mark.parametrize(
+        "criteria, message",
+        [
+            (SearchCriteria(sort_by="title"), "Invalid sort field"),
+            (SearchCriteria(limit=101), "Limit must be between 1 and 100"),
+            (SearchCriteria(offset=-1), "Offset must be non-negative"),
+            (SearchCriteria(offset=5, cursor="abc"), "Offset cannot be combined"),
+        ],
+    )
+    async def test_invalid_criteria_are_rejected(self, data_store, criteria, message):
+        """Test that the same validation rules as SearchOrchestrator apply."""
+        with pytest.raises(ValueError, match=message):
+            await AsyncSearchOrchestrator(data_store).search_page(criteria)
+
+        data_store.search_task_page.assert_not_awaited()
+
+    async def test_count_results(self, data_store):
+        """Test that counting is a single store call."""
+        data_store.count_tasks.return_value = 4
+
+        assert await AsyncSearchOrchestrator(data_store).count_results(SearchCriteria()) == 4
+
+
+class TestAsyncTaskOrchestrator:
+    """Test task reads on an async store."""
+
+    async def test_get_and_list_tasks(self, data_store):
+        """Test that reads are passed to the store."""
+        task_id, task_list_id = uuid4(), uuid4()
+        orchestrator = AsyncTaskOrchestrator(data_store)
+
+        await orchestrator.get_task(task_id)
+        await orchestrator.list_tasks(task_list_id)
+
+        data_store.get_task.assert_awaited_once_with(task_id)
+        data_store.list_tasks.assert_awaited_once_with(task_list_id)
+
+    @pytest.mark.parametrize(
+        "multi_agent_mode, statuses",
+        [
+            (False, [Status.NOT_STARTED, Status.IN_PROGRESS]),
+            (True, [Status.NOT_STARTED]),
+        ],
+    )
+    async def test_ready_tasks_statuses(self, data_store, multi_agent_mode, statuses):
+        """Test that the multi-agent mode selects the ready statuses."""
+        scope_id = uuid4()
+
+        await AsyncTaskOrchestrator(data_store).get_ready_tasks(
+            "project", scope_id, multi_agent_mode=multi_agent_mode
+        )
+
+        data_store.get_ready_tasks.assert_awaited_once_with("project", scope_id, statuses=statuses)
+
+    async def test_invalid_scope_type(self, data_store):
+        """Test that unknown scope types are rejected before querying."""
+        with pytest.raises(ValueError, match="Invalid scope_type"):
+            await AsyncTaskOrchestrator(data_store).get_ready_tasks("team", uuid4())
+
+        data_store.get_ready_tasks.assert_not_awaited()
+
+    async def test_unknown_scope_has_no_ready_tasks(self, data_store):
+        """Test that a scope the store does not find has no ready tasks, as in BlockingDetector."""
+        data_store.get_ready_tasks.side_effect = ValueError("Project does not exist")
+
+        assert await AsyncTaskOrchestrator(data_store).get_ready_tasks("project", uuid4()) == []
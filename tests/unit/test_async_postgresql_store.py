@@ -0,0 +1,158 @@
+"""Unit tests for the asynchronous PostgreSQL store.
+
+The store is run against a SQLite database through the aiosqlite driver, like
+the synchronous PostgreSQLStore tests. They are skipped when the async
+extras (sqlalchemy[asyncio], aiosqlite) are not installed.
+
+Requirements: 2.1, 2.2, 3.1, 4.5, 5.2, 5.6, 5.7, 9.1
+"""
+
+import asyncio
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("greenlet")
+pytest.importorskip("aiosqlite")
+
+from task_manager.data.access.async_postgresql_store import (  # noqa: E402
+    AsyncPostgreSQLStore,
+    to_async_url,
+)
+from task_manager.data.access.postgresql_store import StorageError  # noqa: E402
+from task_manager.models.entities import (  # noqa: E402
+    Dependency,
+    ExitCriteria,
+    Note,
+    Project,
+    Task,
+    TaskList,
+)
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status  # noqa: E402
+
+
+@pytest.fixture
+async def store():
+    """Create an initialized AsyncPostgreSQLStore backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = AsyncPostgreSQLStore(f"sqlite:///{Path(tmpdir) / 'tasks.db'}")
+        await store.initialize()
+        yield store
+        await store.close()
+
+
+async def _create_task_list(store):
+    project = await store.create_project(
+        Project(
+            id=uuid4(),
+            name="Async Project",
+            is_default=False,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+    return await store.create_task_list(
+        TaskList(
+            id=uuid4(),
+            name="List",
+            project_id=project.id,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+
+
+def _make_task(task_list, title, status=Status.NOT_STARTED, depends_on=()):
+    return Task(
+        id=uuid4(),
+        task_list_id=task_list.id,
+        title=title,
+        description="Description",
+        status=status,
+        dependencies=[Dependency(task_id=t.id, task_list_id=t.task_list_id) for t in depends_on],
+        exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+        priority=Priority.MEDIUM,
+        notes=[],
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+
+class TestAsyncUrl:
+    """Test the selection of async drivers."""
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("postgresql://u:p@db:5432/tasks", "postgresql+asyncpg://u:p@db:5432/tasks"),
+            ("postgresql+psycopg2://u:p@db/tasks", "postgresql+asyncpg://u:p@db/tasks"),
+            ("postgresql+asyncpg://u:p@db/tasks", "postgresql+asyncpg://u:p@db/tasks"),
+            ("sqlite:///tasks.db", "sqlite+aiosqlite:///tasks.db"),
+        ],
+    )
+    def test_drivers_are_replaced(self, url, expected):
+        """Test that synchronous drivers are swapped for async ones."""
+        assert to_async_url(url) == expected
+
+    def test_unsupported_database(self):
+        """Test that databases without an async driver are rejected."""
+        with pytest.raises(StorageError, match="No async driver"):
+            to_async_url("oracle://u:p@db/tasks")
+
+
+class TestAsyncPostgreSQLStore:
+    """Test store operations through the async engine."""
+
+    async def test_initialize_creates_default_projects(self, store):
+        """Test that initialize() is idempotent and creates the default projects."""
+        await store.initialize()
+
+        names = {p.name for p in await store.list_projects()}
+
+        assert {"Chore", "Repeatable"} <= names
+
+    async def test_task_round_trip(self, store):
+        """Test creating, updating, reading and deleting a task."""
+        task_list = await _create_task_list(store)
+        task = await store.create_task(_make_task(task_list, "Write tests"))
+
+        task.notes = [Note(content="Started", timestamp=datetime(2024, 1, 1))]
+        await store.update_task(task)
+        loaded = await store.get_task(task.id)
+
+        assert loaded.title == "Write tests"
+        assert [n.content for n in loaded.notes] == ["Started"]
+
+        await store.delete_task(task.id)
+        assert await store.get_task(task.id) is None
+
+    async def test_ready_tasks(self, store):
+        """Test that readiness is evaluated by the store."""
+        task_list = await _create_task_list(store)
+        done = await store.create_task(_make_task(task_list, "Done", Status.COMPLETED))
+        open_task = await store.create_task(_make_task(task_list, "Open"))
+        await store.create_task(_make_task(task_list, "Unblocked", depends_on=[done]))
+        await store.create_task(_make_task(task_list, "Blocked", depends_on=[open_task]))
+
+        ready = await store.get_ready_tasks(
+            "task_list", task_list.id, statuses=[Status.NOT_STARTED]
+        )
+
+        assert {t.title for t in ready} == {"Open", "Unblocked"}
+
+    async def test_concurrent_calls(self, store):
+        """Test that many calls can be awaited concurrently on one loop."""
+        task_list = await _create_task_list(store)
+        tasks = [await store.create_task(_make_task(task_list, f"Task {i}")) for i in range(10)]
+
+        loaded = await asyncio.gather(*(store.get_task(t.id) for t in tasks * 3))
+
+        assert [t.id for t in loaded] == [t.id for t in tasks * 3]
+
+    async def test_errors_are_propagated(self, store):
+        """Test that store errors surface unchanged."""
+        with pytest.raises(ValueError, match="does not exist"):
+            await store.get_ready_tasks("task_list", uuid4())
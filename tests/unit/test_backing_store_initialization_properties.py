@@ -93,7 +93,7 @@ def invalid_store_type_strategy(draw: Any) -> str:
             ),
         )
     )
-    assume(invalid_type.lower() not in ["filesystem", "postgresql"])
+    assume(invalid_type.lower() not in ["filesystem", "postgresql", "log", "sqlite"])
     assume(invalid_type.strip())  # Ensure it's not just whitespace
     return invalid_type
 
@@ -1,11 +1,16 @@
 """Unit tests for BlockingDetector."""
 
+import tempfile
 from datetime import datetime, timezone
+from pathlib import Path
 from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
 
+from task_manager.data.access.filesystem_store import FilesystemStore
+from task_manager.data.access.log_store import LogStore
+from task_manager.data.access.sqlite_store import SQLiteStore
 from task_manager.models.entities import Dependency, ExitCriteria, Task
 from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
 from task_manager.orchestration.blocking_detector import BlockingDetector
@@ -413,3 +418,34 @@ class TestBlockingDetector:
         assert result is sample_task
         assert result.id == sample_task.id
         assert result.title == sample_task.title
+
+
+class TestReadyTasksOfUnknownScope:
+    """Test ready tasks of a scope that does not exist on stores with native readiness."""
+
+    @pytest.fixture(params=["filesystem", "log", "sqlite"])
+    def store(self, request):
+        """Create an initialized store of each backend type."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            if request.param == "filesystem":
+                store = FilesystemStore(tmpdir)
+            elif request.param == "log":
+                store = LogStore(tmpdir)
+            else:
+                store = SQLiteStore(str(Path(tmpdir) / "tasks.db"))
+            store.initialize()
+            yield store
+            if request.param == "sqlite":
+                store.engine.dispose()
+
+    @pytest.mark.parametrize("scope_type", ["project", "task_list"])
+    def test_unknown_scope_has_no_ready_tasks(self, store, scope_type):
+        """Test that an unknown project or task list has no ready tasks instead of raising."""
+        assert store.supports_ready_task_query is True
+
+        assert BlockingDetector(store).get_ready_tasks(scope_type, uuid4()) == []
+
+    def test_invalid_scope_type_is_still_rejected(self, store):
+        """Test that an invalid scope type raises rather than returning no tasks."""
+        with pytest.raises(ValueError, match="Invalid scope_type"):
+            BlockingDetector(store).get_ready_tasks("team", uuid4())
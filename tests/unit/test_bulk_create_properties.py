@@ -11,8 +11,7 @@ import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
-from task_manager.models.entities import ExitCriteria, Task, TaskList
-from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+from task_manager.models.entities import TaskList
 from task_manager.orchestration.bulk_operations_handler import BulkOperationsHandler
 
 
@@ -95,24 +94,11 @@ def test_bulk_create_accepts_arrays_of_valid_tasks(task_count: int) -> None:
         task_def["title"] = f"Task {i}"
         task_definitions.append(task_def)
 
-    # Mock the create_task method to return a task
-    def mock_create_task(*args, **kwargs):
-        return Task(
-            id=uuid4(),
-            task_list_id=task_list.id,
-            title=kwargs.get("title", "Test Task"),
-            description=kwargs.get("description", "Test Description"),
-            status=kwargs.get("status", Status.NOT_STARTED),
-            dependencies=kwargs.get("dependencies", []),
-            exit_criteria=kwargs.get("exit_criteria", []),
-            priority=kwargs.get("priority", Priority.MEDIUM),
-            notes=kwargs.get("notes", []),
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            tags=kwargs.get("tags", []),
-        )
-
-    handler.task_orchestrator.create_task = mock_create_task
+    # Mock the create_tasks method to return the tasks
+    def mock_create_tasks(tasks):
+        return tasks
+
+    handler.task_orchestrator.create_tasks = mock_create_tasks
 
     # Perform bulk create
     result = handler.bulk_create_tasks(task_definitions)
@@ -161,24 +147,11 @@ def test_bulk_create_accepts_arrays_with_varied_content(
         task_def["description"] = descriptions[i % len(descriptions)]
         task_definitions.append(task_def)
 
-    # Mock the create_task method to return a task
-    def mock_create_task(*args, **kwargs):
-        return Task(
-            id=uuid4(),
-            task_list_id=task_list.id,
-            title=kwargs.get("title", "Test Task"),
-            description=kwargs.get("description", "Test Description"),
-            status=kwargs.get("status", Status.NOT_STARTED),
-            dependencies=kwargs.get("dependencies", []),
-            exit_criteria=kwargs.get("exit_criteria", []),
-            priority=kwargs.get("priority", Priority.MEDIUM),
-            notes=kwargs.get("notes", []),
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            tags=kwargs.get("tags", []),
-        )
-
-    handler.task_orchestrator.create_task = mock_create_task
+    # Mock the create_tasks method to return the tasks
+    def mock_create_tasks(tasks):
+        return tasks
+
+    handler.task_orchestrator.create_tasks = mock_create_tasks
 
     # Perform bulk create
     result = handler.bulk_create_tasks(task_definitions)
@@ -226,24 +199,11 @@ def test_bulk_create_accepts_arrays_with_varied_enums(
         task_def["priority"] = priorities[i % len(priorities)]
         task_definitions.append(task_def)
 
-    # Mock the create_task method to return a task
-    def mock_create_task(*args, **kwargs):
-        return Task(
-            id=uuid4(),
-            task_list_id=task_list.id,
-            title=kwargs.get("title", "Test Task"),
-            description=kwargs.get("description", "Test Description"),
-            status=kwargs.get("status", Status.NOT_STARTED),
-            dependencies=kwargs.get("dependencies", []),
-            exit_criteria=kwargs.get("exit_criteria", []),
-            priority=kwargs.get("priority", Priority.MEDIUM),
-            notes=kwargs.get("notes", []),
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            tags=kwargs.get("tags", []),
-        )
-
-    handler.task_orchestrator.create_task = mock_create_task
+    # Mock the create_tasks method to return the tasks
+    def mock_create_tasks(tasks):
+        return tasks
+
+    handler.task_orchestrator.create_tasks = mock_create_tasks
 
     # Perform bulk create
     result = handler.bulk_create_tasks(task_definitions)
@@ -286,26 +246,12 @@ def test_bulk_create_returns_task_ids_for_all_created_tasks(task_count: int) ->
     # Track created task IDs
     created_task_ids = []
 
-    # Mock the create_task method to return a task
-    def mock_create_task(*args, **kwargs):
-        task_id = uuid4()
-        created_task_ids.append(str(task_id))
-        return Task(
-            id=task_id,
-            task_list_id=task_list.id,
-            title=kwargs.get("title", "Test Task"),
-            description=kwargs.get("description", "Test Description"),
-            status=kwargs.get("status", Status.NOT_STARTED),
-            dependencies=kwargs.get("dependencies", []),
-            exit_criteria=kwargs.get("exit_criteria", []),
-            priority=kwargs.get("priority", Priority.MEDIUM),
-            notes=kwargs.get("notes", []),
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            tags=kwargs.get("tags", []),
-        )
-
-    handler.task_orchestrator.create_task = mock_create_task
+    # Mock the create_tasks method to return the tasks
+    def mock_create_tasks(tasks):
+        created_task_ids.extend(str(task.id) for task in tasks)
+        return tasks
+
+    handler.task_orchestrator.create_tasks = mock_create_tasks
 
     # Perform bulk create
     result = handler.bulk_create_tasks(task_definitions)
@@ -352,26 +298,12 @@ def test_bulk_create_maintains_array_order(task_count: int) -> None:
     # Track created tasks in order
     created_tasks = []
 
-    # Mock the create_task method to return a task
-    def mock_create_task(*args, **kwargs):
-        task = Task(
-            id=uuid4(),
-            task_list_id=task_list.id,
-            title=kwargs.get("title", "Test Task"),
-            description=kwargs.get("description", "Test Description"),
-            status=kwargs.get("status", Status.NOT_STARTED),
-            dependencies=kwargs.get("dependencies", []),
-            exit_criteria=kwargs.get("exit_criteria", []),
-            priority=kwargs.get("priority", Priority.MEDIUM),
-            notes=kwargs.get("notes", []),
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            tags=kwargs.get("tags", []),
-        )
-        created_tasks.append(task)
-        return task
-
-    handler.task_orchestrator.create_task = mock_create_task
+    # Mock the create_tasks method to return the tasks
+    def mock_create_tasks(tasks):
+        created_tasks.extend(tasks)
+        return tasks
+
+    handler.task_orchestrator.create_tasks = mock_create_tasks
 
     # Perform bulk create
     result = handler.bulk_create_tasks(task_definitions)
@@ -85,24 +85,21 @@ def test_bulk_delete_accepts_arrays_of_valid_task_ids(task_count: int) -> None:
         test_tasks.append(task)
 
     # Setup mock to return tasks
-    def mock_get_task(task_id):
-        for task in test_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in test_tasks if task.id in task_ids]
 
-    mock_data_store.get_task = mock_get_task
+    mock_data_store.get_tasks = mock_get_tasks
 
     # Create an array of task IDs to delete
     task_ids = [str(task.id) for task in test_tasks]
 
-    # Mock the delete_task method
+    # Mock the delete_tasks method
     deleted_task_ids = []
 
-    def mock_delete_task(task_id):
-        deleted_task_ids.append(task_id)
+    def mock_delete_tasks(task_ids):
+        deleted_task_ids.extend(task_ids)
 
-    handler.task_orchestrator.delete_task = mock_delete_task
+    handler.task_orchestrator.delete_tasks = mock_delete_tasks
 
     # Perform bulk delete
     result = handler.bulk_delete_tasks(task_ids)
@@ -141,22 +138,19 @@ def test_bulk_delete_returns_task_ids_for_all_deleted_tasks(task_count: int) ->
         test_tasks.append(task)
 
     # Setup mock to return tasks
-    def mock_get_task(task_id):
-        for task in test_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in test_tasks if task.id in task_ids]
 
-    mock_data_store.get_task = mock_get_task
+    mock_data_store.get_tasks = mock_get_tasks
 
     # Create an array of task IDs to delete
     task_ids = [str(task.id) for task in test_tasks]
 
-    # Mock the delete_task method
-    def mock_delete_task(task_id):
+    # Mock the delete_tasks method
+    def mock_delete_tasks(task_ids):
         pass
 
-    handler.task_orchestrator.delete_task = mock_delete_task
+    handler.task_orchestrator.delete_tasks = mock_delete_tasks
 
     # Perform bulk delete
     result = handler.bulk_delete_tasks(task_ids)
@@ -194,22 +188,19 @@ def test_bulk_delete_maintains_array_order(task_count: int) -> None:
         test_tasks.append(task)
 
     # Setup mock to return tasks
-    def mock_get_task(task_id):
-        for task in test_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in test_tasks if task.id in task_ids]
 
-    mock_data_store.get_task = mock_get_task
+    mock_data_store.get_tasks = mock_get_tasks
 
     # Create an array of task IDs to delete
     task_ids = [str(task.id) for task in test_tasks]
 
-    # Mock the delete_task method
-    def mock_delete_task(task_id):
+    # Mock the delete_tasks method
+    def mock_delete_tasks(task_ids):
         pass
 
-    handler.task_orchestrator.delete_task = mock_delete_task
+    handler.task_orchestrator.delete_tasks = mock_delete_tasks
 
     # Perform bulk delete
     result = handler.bulk_delete_tasks(task_ids)
@@ -246,13 +237,10 @@ def test_bulk_delete_accepts_arrays_with_string_uuids(task_count: int) -> None:
         test_tasks.append(task)
 
     # Setup mock to return tasks
-    def mock_get_task(task_id):
-        for task in test_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in test_tasks if task.id in task_ids]
 
-    mock_data_store.get_task = mock_get_task
+    mock_data_store.get_tasks = mock_get_tasks
 
     # Create an array of task IDs as strings (typical API format)
     task_ids = [str(task.id) for task in test_tasks]
@@ -260,11 +248,11 @@ def test_bulk_delete_accepts_arrays_with_string_uuids(task_count: int) -> None:
     # Verify all IDs are strings
     assert all(isinstance(task_id, str) for task_id in task_ids)
 
-    # Mock the delete_task method
-    def mock_delete_task(task_id):
+    # Mock the delete_tasks method
+    def mock_delete_tasks(task_ids):
         pass
 
-    handler.task_orchestrator.delete_task = mock_delete_task
+    handler.task_orchestrator.delete_tasks = mock_delete_tasks
 
     # Perform bulk delete
     result = handler.bulk_delete_tasks(task_ids)
@@ -281,8 +269,8 @@ def test_bulk_delete_calls_delete_for_each_task(task_count: int) -> None:
     """
     Feature: agent-ux-enhancements, Property 36: Bulk delete accepts arrays
 
-    Test that bulk_delete_tasks calls the delete operation for each task ID
-    in the input array.
+    Test that bulk_delete_tasks passes every task ID in the input array
+    to the delete operation.
 
     Validates: Requirements 7.3
     """
@@ -300,13 +288,10 @@ def test_bulk_delete_calls_delete_for_each_task(task_count: int) -> None:
         test_tasks.append(task)
 
     # Setup mock to return tasks
-    def mock_get_task(task_id):
-        for task in test_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in test_tasks if task.id in task_ids]
 
-    mock_data_store.get_task = mock_get_task
+    mock_data_store.get_tasks = mock_get_tasks
 
     # Create an array of task IDs to delete
     task_ids = [str(task.id) for task in test_tasks]
@@ -314,10 +299,10 @@ def test_bulk_delete_calls_delete_for_each_task(task_count: int) -> None:
     # Track which tasks were deleted
     deleted_task_ids = set()
 
-    def mock_delete_task(task_id):
-        deleted_task_ids.add(task_id)
+    def mock_delete_tasks(task_ids):
+        deleted_task_ids.update(task_ids)
 
-    handler.task_orchestrator.delete_task = mock_delete_task
+    handler.task_orchestrator.delete_tasks = mock_delete_tasks
 
     # Perform bulk delete
     result = handler.bulk_delete_tasks(task_ids)
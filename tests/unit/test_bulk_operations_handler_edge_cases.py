@@ -184,8 +184,8 @@ class TestBulkCreateTasksEdgeCases:
         )
         handler = BulkOperationsHandler(mock_store)
 
-        # Make task_orchestrator.create_task raise an exception
-        handler.task_orchestrator.create_task = Mock(side_effect=Exception("Creation failed"))
+        # Make task_orchestrator.create_tasks raise an exception
+        handler.task_orchestrator.create_tasks = Mock(side_effect=Exception("Creation failed"))
 
         task_defs = [
             {
@@ -205,6 +205,98 @@ class TestBulkCreateTasksEdgeCases:
         assert len(result.errors) == 1
         assert "Creation failed" in result.errors[0]["error"]
 
+    def test_bulk_create_resolves_dependencies_on_tasks_of_the_batch(self):
+        """Test bulk create with a dependency given as the index of another definition."""
+        mock_store = Mock()
+        task_list_id = uuid4()
+        mock_store.get_task_list.return_value = TaskList(
+            id=task_list_id,
+            name="Test List",
+            project_id=uuid4(),
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+        mock_store.create_tasks.side_effect = lambda tasks: tasks
+        handler = BulkOperationsHandler(mock_store)
+
+        task_defs = [
+            {
+                "task_list_id": str(task_list_id),
+                "title": f"Task {i}",
+                "description": "Description",
+                "status": "NOT_STARTED",
+                "priority": "MEDIUM",
+                "exit_criteria": [{"criteria": "Done"}],
+                "dependencies": [{"task_index": 0}] if i else [],
+            }
+            for i in range(2)
+        ]
+
+        result = handler.bulk_create_tasks(task_defs)
+
+        assert result.succeeded == 2
+        mock_store.create_tasks.assert_called_once()
+        first, second = mock_store.create_tasks.call_args[0][0]
+        assert second.dependencies[0].task_id == first.id
+        assert result.results[0]["task_id"] == str(first.id)
+        mock_store.create_task.assert_not_called()
+        mock_store.get_tasks.assert_not_called()
+
+    def test_bulk_create_with_circular_dependency_in_batch(self):
+        """Test that a cycle between tasks of the batch creates no task."""
+        mock_store = Mock()
+        task_list_id = uuid4()
+        mock_store.get_task_list.return_value = TaskList(
+            id=task_list_id,
+            name="Test List",
+            project_id=uuid4(),
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+        handler = BulkOperationsHandler(mock_store)
+
+        task_defs = [
+            {
+                "task_list_id": str(task_list_id),
+                "title": f"Task {i}",
+                "description": "Description",
+                "status": "NOT_STARTED",
+                "priority": "MEDIUM",
+                "exit_criteria": [{"criteria": "Done"}],
+                "dependencies": [{"task_index": 1 - i}],
+            }
+            for i in range(2)
+        ]
+
+        result = handler.bulk_create_tasks(task_defs)
+
+        assert result.succeeded == 0
+        assert result.failed == 2
+        assert "circular dependency" in result.errors[0]["error"]
+        mock_store.create_tasks.assert_not_called()
+
+    def test_bulk_create_with_invalid_dependency_task_index(self):
+        """Test bulk create with a task_index outside the batch."""
+        mock_store = Mock()
+        handler = BulkOperationsHandler(mock_store)
+
+        task_defs = [
+            {
+                "task_list_id": str(uuid4()),
+                "title": "Task 1",
+                "description": "Description 1",
+                "status": "NOT_STARTED",
+                "priority": "MEDIUM",
+                "exit_criteria": [{"criteria": "Done"}],
+                "dependencies": [{"task_index": 1}],
+            }
+        ]
+
+        result = handler.bulk_create_tasks(task_defs)
+
+        assert result.succeeded == 0
+        assert "Invalid dependency task_index" in result.errors[0]["error"]
+
 
 class TestBulkUpdateTasksEdgeCases:
     """Test edge cases in bulk_update_tasks."""
@@ -232,19 +324,21 @@ class TestBulkUpdateTasksEdgeCases:
         """Test bulk update with empty title."""
         mock_store = Mock()
         task_id = uuid4()
-        mock_store.get_task.return_value = Task(
-            id=task_id,
-            task_list_id=uuid4(),
-            title="Original",
-            description="Description",
-            status=Status.NOT_STARTED,
-            priority=Priority.MEDIUM,
-            dependencies=[],
-            exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
-            notes=[],
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
+        mock_store.get_tasks.return_value = [
+            Task(
+                id=task_id,
+                task_list_id=uuid4(),
+                title="Original",
+                description="Description",
+                status=Status.NOT_STARTED,
+                priority=Priority.MEDIUM,
+                dependencies=[],
+                exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+                notes=[],
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+        ]
         handler = BulkOperationsHandler(mock_store)
 
         updates = [
@@ -265,19 +359,21 @@ class TestBulkUpdateTasksEdgeCases:
         """Test bulk update with empty description."""
         mock_store = Mock()
         task_id = uuid4()
-        mock_store.get_task.return_value = Task(
-            id=task_id,
-            task_list_id=uuid4(),
-            title="Title",
-            description="Original",
-            status=Status.NOT_STARTED,
-            priority=Priority.MEDIUM,
-            dependencies=[],
-            exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
-            notes=[],
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
+        mock_store.get_tasks.return_value = [
+            Task(
+                id=task_id,
+                task_list_id=uuid4(),
+                title="Title",
+                description="Original",
+                status=Status.NOT_STARTED,
+                priority=Priority.MEDIUM,
+                dependencies=[],
+                exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+                notes=[],
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+        ]
         handler = BulkOperationsHandler(mock_store)
 
         updates = [
@@ -298,19 +394,21 @@ class TestBulkUpdateTasksEdgeCases:
         """Test bulk update with invalid status enum."""
         mock_store = Mock()
         task_id = uuid4()
-        mock_store.get_task.return_value = Task(
-            id=task_id,
-            task_list_id=uuid4(),
-            title="Title",
-            description="Description",
-            status=Status.NOT_STARTED,
-            priority=Priority.MEDIUM,
-            dependencies=[],
-            exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
-            notes=[],
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
+        mock_store.get_tasks.return_value = [
+            Task(
+                id=task_id,
+                task_list_id=uuid4(),
+                title="Title",
+                description="Description",
+                status=Status.NOT_STARTED,
+                priority=Priority.MEDIUM,
+                dependencies=[],
+                exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+                notes=[],
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+        ]
         handler = BulkOperationsHandler(mock_store)
 
         updates = [
@@ -331,19 +429,21 @@ class TestBulkUpdateTasksEdgeCases:
         """Test bulk update with invalid priority enum."""
         mock_store = Mock()
         task_id = uuid4()
-        mock_store.get_task.return_value = Task(
-            id=task_id,
-            task_list_id=uuid4(),
-            title="Title",
-            description="Description",
-            status=Status.NOT_STARTED,
-            priority=Priority.MEDIUM,
-            dependencies=[],
-            exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
-            notes=[],
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
+        mock_store.get_tasks.return_value = [
+            Task(
+                id=task_id,
+                task_list_id=uuid4(),
+                title="Title",
+                description="Description",
+                status=Status.NOT_STARTED,
+                priority=Priority.MEDIUM,
+                dependencies=[],
+                exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+                notes=[],
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+        ]
         handler = BulkOperationsHandler(mock_store)
 
         updates = [
@@ -364,23 +464,25 @@ class TestBulkUpdateTasksEdgeCases:
         """Test bulk update when an exception occurs during task update."""
         mock_store = Mock()
         task_id = uuid4()
-        mock_store.get_task.return_value = Task(
-            id=task_id,
-            task_list_id=uuid4(),
-            title="Title",
-            description="Description",
-            status=Status.NOT_STARTED,
-            priority=Priority.MEDIUM,
-            dependencies=[],
-            exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
-            notes=[],
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
+        mock_store.get_tasks.return_value = [
+            Task(
+                id=task_id,
+                task_list_id=uuid4(),
+                title="Title",
+                description="Description",
+                status=Status.NOT_STARTED,
+                priority=Priority.MEDIUM,
+                dependencies=[],
+                exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+                notes=[],
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+        ]
         handler = BulkOperationsHandler(mock_store)
 
-        # Make task_orchestrator.update_task raise an exception
-        handler.task_orchestrator.update_task = Mock(side_effect=Exception("Update failed"))
+        # Make task_orchestrator.update_tasks raise an exception
+        handler.task_orchestrator.update_tasks = Mock(side_effect=Exception("Update failed"))
 
         updates = [
             {
@@ -404,23 +506,25 @@ class TestBulkDeleteTasksEdgeCases:
         """Test bulk delete when an exception occurs during task deletion."""
         mock_store = Mock()
         task_id = uuid4()
-        mock_store.get_task.return_value = Task(
-            id=task_id,
-            task_list_id=uuid4(),
-            title="Title",
-            description="Description",
-            status=Status.NOT_STARTED,
-            priority=Priority.MEDIUM,
-            dependencies=[],
-            exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
-            notes=[],
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
+        mock_store.get_tasks.return_value = [
+            Task(
+                id=task_id,
+                task_list_id=uuid4(),
+                title="Title",
+                description="Description",
+                status=Status.NOT_STARTED,
+                priority=Priority.MEDIUM,
+                dependencies=[],
+                exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+                notes=[],
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+        ]
         handler = BulkOperationsHandler(mock_store)
 
-        # Make task_orchestrator.delete_task raise an exception
-        handler.task_orchestrator.delete_task = Mock(side_effect=Exception("Deletion failed"))
+        # Make task_orchestrator.delete_tasks raise an exception
+        handler.task_orchestrator.delete_tasks = Mock(side_effect=Exception("Deletion failed"))
 
         task_ids = [str(task_id)]
 
@@ -439,24 +543,28 @@ class TestBulkAddTagsEdgeCases:
         """Test bulk add tags when an exception occurs during tag addition."""
         mock_store = Mock()
         task_id = uuid4()
-        mock_store.get_task.return_value = Task(
-            id=task_id,
-            task_list_id=uuid4(),
-            title="Title",
-            description="Description",
-            status=Status.NOT_STARTED,
-            priority=Priority.MEDIUM,
-            dependencies=[],
-            exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
-            notes=[],
-            tags=[],
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
+        mock_store.get_tasks.return_value = [
+            Task(
+                id=task_id,
+                task_list_id=uuid4(),
+                title="Title",
+                description="Description",
+                status=Status.NOT_STARTED,
+                priority=Priority.MEDIUM,
+                dependencies=[],
+                exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+                notes=[],
+                tags=[],
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+        ]
         handler = BulkOperationsHandler(mock_store)
 
-        # Make tag_orchestrator.add_tags raise an exception
-        handler.tag_orchestrator.add_tags = Mock(side_effect=Exception("Tag addition failed"))
+        # Make tag_orchestrator.add_tags_to_tasks raise an exception
+        handler.tag_orchestrator.add_tags_to_tasks = Mock(
+            side_effect=Exception("Tag addition failed")
+        )
 
         task_ids = [str(task_id)]
         tags = ["tag1", "tag2"]
@@ -476,24 +584,28 @@ class TestBulkRemoveTagsEdgeCases:
         """Test bulk remove tags when an exception occurs during tag removal."""
         mock_store = Mock()
         task_id = uuid4()
-        mock_store.get_task.return_value = Task(
-            id=task_id,
-            task_list_id=uuid4(),
-            title="Title",
-            description="Description",
-            status=Status.NOT_STARTED,
-            priority=Priority.MEDIUM,
-            dependencies=[],
-            exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
-            notes=[],
-            tags=["tag1", "tag2"],
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
+        mock_store.get_tasks.return_value = [
+            Task(
+                id=task_id,
+                task_list_id=uuid4(),
+                title="Title",
+                description="Description",
+                status=Status.NOT_STARTED,
+                priority=Priority.MEDIUM,
+                dependencies=[],
+                exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+                notes=[],
+                tags=["tag1", "tag2"],
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+        ]
         handler = BulkOperationsHandler(mock_store)
 
-        # Make tag_orchestrator.remove_tags raise an exception
-        handler.tag_orchestrator.remove_tags = Mock(side_effect=Exception("Tag removal failed"))
+        # Make tag_orchestrator.remove_tags_from_tasks raise an exception
+        handler.tag_orchestrator.remove_tags_from_tasks = Mock(
+            side_effect=Exception("Tag removal failed")
+        )
 
         task_ids = [str(task_id)]
         tags = ["tag1"]
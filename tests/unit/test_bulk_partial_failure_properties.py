@@ -171,13 +171,10 @@ def test_bulk_update_reports_partial_failures_with_nonexistent_tasks(
         existing_tasks.append(task)
 
     # Setup mock to return existing tasks
-    def mock_get_task(task_id):
-        for task in existing_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in existing_tasks if task.id in task_ids]
 
-    mock_data_store.get_task.side_effect = mock_get_task
+    mock_data_store.get_tasks.side_effect = mock_get_tasks
 
     # Create an array with mixed valid and invalid updates
     updates = []
@@ -229,13 +226,10 @@ def test_bulk_delete_reports_partial_failures_with_nonexistent_tasks(
         existing_tasks.append(task)
 
     # Setup mock to return existing tasks
-    def mock_get_task(task_id):
-        for task in existing_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in existing_tasks if task.id in task_ids]
 
-    mock_data_store.get_task.side_effect = mock_get_task
+    mock_data_store.get_tasks.side_effect = mock_get_tasks
 
     # Create an array with mixed valid and invalid task IDs
     task_ids = []
@@ -287,13 +281,10 @@ def test_bulk_add_tags_reports_partial_failures_with_nonexistent_tasks(
         existing_tasks.append(task)
 
     # Setup mock to return existing tasks
-    def mock_get_task(task_id):
-        for task in existing_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in existing_tasks if task.id in task_ids]
 
-    mock_data_store.get_task.side_effect = mock_get_task
+    mock_data_store.get_tasks.side_effect = mock_get_tasks
 
     # Create an array with mixed valid and invalid task IDs
     task_ids = []
@@ -409,13 +400,10 @@ def test_bulk_operations_distinguish_between_succeeded_and_failed_operations(
         existing_tasks.append(task)
 
     # Setup mock to return existing tasks
-    def mock_get_task(task_id):
-        for task in existing_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in existing_tasks if task.id in task_ids]
 
-    mock_data_store.get_task.side_effect = mock_get_task
+    mock_data_store.get_tasks.side_effect = mock_get_tasks
 
     # Create an array with mixed valid and invalid task IDs
     task_ids = []
@@ -110,7 +110,10 @@ def test_bulk_add_tags_accepts_arrays_of_task_ids_and_tags(task_count: int, tag_
                 return task
         return None
 
-    mock_data_store.get_task.side_effect = mock_get_task
+    def mock_get_tasks(task_ids):
+        return [task for task in tasks if task.id in task_ids]
+
+    mock_data_store.get_tasks.side_effect = mock_get_tasks
 
     # Mock tag orchestrator methods
     def mock_validate_tag(tag):
@@ -128,7 +131,11 @@ def test_bulk_add_tags_accepts_arrays_of_task_ids_and_tags(task_count: int, tag_
         return task
 
     handler.tag_orchestrator.validate_tag = mock_validate_tag
-    handler.tag_orchestrator.add_tags = mock_add_tags
+
+    def mock_add_tags_to_tasks(task_ids, new_tags):
+        return [mock_add_tags(task_id, new_tags) for task_id in task_ids]
+
+    handler.tag_orchestrator.add_tags_to_tasks = mock_add_tags_to_tasks
 
     # Perform bulk add tags
     result = handler.bulk_add_tags(task_ids, tags)
@@ -189,7 +196,10 @@ def test_bulk_remove_tags_accepts_arrays_of_task_ids_and_tags(
                 return task
         return None
 
-    mock_data_store.get_task.side_effect = mock_get_task
+    def mock_get_tasks(task_ids):
+        return [task for task in tasks if task.id in task_ids]
+
+    mock_data_store.get_tasks.side_effect = mock_get_tasks
 
     # Mock tag orchestrator methods
     def mock_remove_tags(task_id, tags_to_remove_list):
@@ -199,7 +209,10 @@ def test_bulk_remove_tags_accepts_arrays_of_task_ids_and_tags(
             task.tags = [tag for tag in task.tags if tag not in tags_to_remove_list]
         return task
 
-    handler.tag_orchestrator.remove_tags = mock_remove_tags
+    def mock_remove_tags_from_tasks(task_ids, tags_to_remove_list):
+        return [mock_remove_tags(task_id, tags_to_remove_list) for task_id in task_ids]
+
+    handler.tag_orchestrator.remove_tags_from_tasks = mock_remove_tags_from_tasks
 
     # Perform bulk remove tags
     result = handler.bulk_remove_tags(task_ids, tags_to_remove)
@@ -255,7 +268,10 @@ def test_bulk_add_tags_accepts_arrays_with_varied_tags(task_count: int, tags: li
                 return task
         return None
 
-    mock_data_store.get_task.side_effect = mock_get_task
+    def mock_get_tasks(task_ids):
+        return [task for task in tasks if task.id in task_ids]
+
+    mock_data_store.get_tasks.side_effect = mock_get_tasks
 
     # Mock tag orchestrator methods
     def mock_validate_tag(tag):
@@ -273,7 +289,11 @@ def test_bulk_add_tags_accepts_arrays_with_varied_tags(task_count: int, tags: li
         return task
 
     handler.tag_orchestrator.validate_tag = mock_validate_tag
-    handler.tag_orchestrator.add_tags = mock_add_tags
+
+    def mock_add_tags_to_tasks(task_ids, new_tags):
+        return [mock_add_tags(task_id, new_tags) for task_id in task_ids]
+
+    handler.tag_orchestrator.add_tags_to_tasks = mock_add_tags_to_tasks
 
     # Perform bulk add tags
     result = handler.bulk_add_tags(task_ids, tags)
@@ -326,7 +346,10 @@ def test_bulk_add_tags_returns_task_ids_for_all_updated_tasks(task_count: int) -
                 return task
         return None
 
-    mock_data_store.get_task.side_effect = mock_get_task
+    def mock_get_tasks(task_ids):
+        return [task for task in tasks if task.id in task_ids]
+
+    mock_data_store.get_tasks.side_effect = mock_get_tasks
 
     # Mock tag orchestrator methods
     def mock_validate_tag(tag):
@@ -341,7 +364,11 @@ def test_bulk_add_tags_returns_task_ids_for_all_updated_tasks(task_count: int) -
         return task
 
     handler.tag_orchestrator.validate_tag = mock_validate_tag
-    handler.tag_orchestrator.add_tags = mock_add_tags
+
+    def mock_add_tags_to_tasks(task_ids, new_tags):
+        return [mock_add_tags(task_id, new_tags) for task_id in task_ids]
+
+    handler.tag_orchestrator.add_tags_to_tasks = mock_add_tags_to_tasks
 
     # Perform bulk add tags
     result = handler.bulk_add_tags(task_ids, tags)
@@ -392,7 +419,10 @@ def test_bulk_tag_operations_maintain_array_order(task_count: int) -> None:
                 return task
         return None
 
-    mock_data_store.get_task.side_effect = mock_get_task
+    def mock_get_tasks(task_ids):
+        return [task for task in tasks if task.id in task_ids]
+
+    mock_data_store.get_tasks.side_effect = mock_get_tasks
 
     # Mock tag orchestrator methods
     def mock_validate_tag(tag):
@@ -407,7 +437,11 @@ def test_bulk_tag_operations_maintain_array_order(task_count: int) -> None:
         return task
 
     handler.tag_orchestrator.validate_tag = mock_validate_tag
-    handler.tag_orchestrator.add_tags = mock_add_tags
+
+    def mock_add_tags_to_tasks(task_ids, new_tags):
+        return [mock_add_tags(task_id, new_tags) for task_id in task_ids]
+
+    handler.tag_orchestrator.add_tags_to_tasks = mock_add_tags_to_tasks
 
     # Perform bulk add tags
     result = handler.bulk_add_tags(task_ids, tags)
@@ -98,13 +98,10 @@ def test_bulk_update_accepts_arrays_of_valid_updates(task_count: int) -> None:
         test_tasks.append(task)
 
     # Setup mock to return tasks
-    def mock_get_task(task_id):
-        for task in test_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in test_tasks if task.id in task_ids]
 
-    mock_data_store.get_task = mock_get_task
+    mock_data_store.get_tasks = mock_get_tasks
 
     # Create an array of update definitions
     updates = []
@@ -115,7 +112,7 @@ def test_bulk_update_accepts_arrays_of_valid_updates(task_count: int) -> None:
         }
         updates.append(update)
 
-    # Mock the update_task method to return an updated task
+    # Mock the update_tasks method to return an updated task
     def mock_update_task(task_id, **kwargs):
         for task in test_tasks:
             if task.id == task_id:
@@ -136,7 +133,10 @@ def test_bulk_update_accepts_arrays_of_valid_updates(task_count: int) -> None:
                 )
         return None
 
-    handler.task_orchestrator.update_task = mock_update_task
+    def mock_update_tasks(updates):
+        return [mock_update_task(task_id, **kwargs) for task_id, kwargs in updates]
+
+    handler.task_orchestrator.update_tasks = mock_update_tasks
 
     # Perform bulk update
     result = handler.bulk_update_tasks(updates)
@@ -177,13 +177,10 @@ def test_bulk_update_accepts_arrays_with_varied_titles(task_count: int, titles:
         test_tasks.append(task)
 
     # Setup mock to return tasks
-    def mock_get_task(task_id):
-        for task in test_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in test_tasks if task.id in task_ids]
 
-    mock_data_store.get_task = mock_get_task
+    mock_data_store.get_tasks = mock_get_tasks
 
     # Create an array of update definitions with varied titles
     updates = []
@@ -194,7 +191,7 @@ def test_bulk_update_accepts_arrays_with_varied_titles(task_count: int, titles:
         }
         updates.append(update)
 
-    # Mock the update_task method
+    # Mock the update_tasks method
     def mock_update_task(task_id, **kwargs):
         for task in test_tasks:
             if task.id == task_id:
@@ -214,7 +211,10 @@ def test_bulk_update_accepts_arrays_with_varied_titles(task_count: int, titles:
                 )
         return None
 
-    handler.task_orchestrator.update_task = mock_update_task
+    def mock_update_tasks(updates):
+        return [mock_update_task(task_id, **kwargs) for task_id, kwargs in updates]
+
+    handler.task_orchestrator.update_tasks = mock_update_tasks
 
     # Perform bulk update
     result = handler.bulk_update_tasks(updates)
@@ -257,13 +257,10 @@ def test_bulk_update_accepts_arrays_with_varied_enums(
         test_tasks.append(task)
 
     # Setup mock to return tasks
-    def mock_get_task(task_id):
-        for task in test_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in test_tasks if task.id in task_ids]
 
-    mock_data_store.get_task = mock_get_task
+    mock_data_store.get_tasks = mock_get_tasks
 
     # Create an array of update definitions with varied enums
     updates = []
@@ -275,7 +272,7 @@ def test_bulk_update_accepts_arrays_with_varied_enums(
         }
         updates.append(update)
 
-    # Mock the update_task method
+    # Mock the update_tasks method
     def mock_update_task(task_id, **kwargs):
         for task in test_tasks:
             if task.id == task_id:
@@ -295,7 +292,10 @@ def test_bulk_update_accepts_arrays_with_varied_enums(
                 )
         return None
 
-    handler.task_orchestrator.update_task = mock_update_task
+    def mock_update_tasks(updates):
+        return [mock_update_task(task_id, **kwargs) for task_id, kwargs in updates]
+
+    handler.task_orchestrator.update_tasks = mock_update_tasks
 
     # Perform bulk update
     result = handler.bulk_update_tasks(updates)
@@ -331,13 +331,10 @@ def test_bulk_update_returns_task_ids_for_all_updated_tasks(task_count: int) ->
         test_tasks.append(task)
 
     # Setup mock to return tasks
-    def mock_get_task(task_id):
-        for task in test_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in test_tasks if task.id in task_ids]
 
-    mock_data_store.get_task = mock_get_task
+    mock_data_store.get_tasks = mock_get_tasks
 
     # Create an array of update definitions
     updates = []
@@ -348,7 +345,7 @@ def test_bulk_update_returns_task_ids_for_all_updated_tasks(task_count: int) ->
         }
         updates.append(update)
 
-    # Mock the update_task method
+    # Mock the update_tasks method
     def mock_update_task(task_id, **kwargs):
         for task in test_tasks:
             if task.id == task_id:
@@ -368,7 +365,10 @@ def test_bulk_update_returns_task_ids_for_all_updated_tasks(task_count: int) ->
                 )
         return None
 
-    handler.task_orchestrator.update_task = mock_update_task
+    def mock_update_tasks(updates):
+        return [mock_update_task(task_id, **kwargs) for task_id, kwargs in updates]
+
+    handler.task_orchestrator.update_tasks = mock_update_tasks
 
     # Perform bulk update
     result = handler.bulk_update_tasks(updates)
@@ -406,13 +406,10 @@ def test_bulk_update_maintains_array_order(task_count: int) -> None:
         test_tasks.append(task)
 
     # Setup mock to return tasks
-    def mock_get_task(task_id):
-        for task in test_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in test_tasks if task.id in task_ids]
 
-    mock_data_store.get_task = mock_get_task
+    mock_data_store.get_tasks = mock_get_tasks
 
     # Create an array of update definitions
     updates = []
@@ -423,7 +420,7 @@ def test_bulk_update_maintains_array_order(task_count: int) -> None:
         }
         updates.append(update)
 
-    # Mock the update_task method
+    # Mock the update_tasks method
     def mock_update_task(task_id, **kwargs):
         for task in test_tasks:
             if task.id == task_id:
@@ -443,7 +440,10 @@ def test_bulk_update_maintains_array_order(task_count: int) -> None:
                 )
         return None
 
-    handler.task_orchestrator.update_task = mock_update_task
+    def mock_update_tasks(updates):
+        return [mock_update_task(task_id, **kwargs) for task_id, kwargs in updates]
+
+    handler.task_orchestrator.update_tasks = mock_update_tasks
 
     # Perform bulk update
     result = handler.bulk_update_tasks(updates)
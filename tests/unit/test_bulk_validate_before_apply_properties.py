@@ -127,6 +127,7 @@ def test_bulk_create_validates_all_before_creating_any(
         return create_test_task(task_list_id)
 
     mock_data_store.create_task.side_effect = mock_create_task
+    mock_data_store.create_tasks.side_effect = mock_create_task
 
     # Create an array with mostly valid task definitions and one invalid
     task_definitions = []
@@ -191,23 +192,20 @@ def test_bulk_update_validates_all_before_updating_any(
         existing_tasks.append(task)
 
     # Setup mock to return existing tasks
-    def mock_get_task(task_id):
-        for task in existing_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in existing_tasks if task.id in task_ids]
 
-    mock_data_store.get_task.side_effect = mock_get_task
+    mock_data_store.get_tasks.side_effect = mock_get_tasks
 
-    # Track how many times update_task is called
-    update_task_call_count = 0
+    # Track how many times update_tasks is called
+    update_tasks_call_count = 0
 
-    def mock_update_task(*args, **kwargs):
-        nonlocal update_task_call_count
-        update_task_call_count += 1
-        return existing_tasks[0]
+    def mock_update_tasks(*args, **kwargs):
+        nonlocal update_tasks_call_count
+        update_tasks_call_count += 1
+        return [existing_tasks[0]]
 
-    mock_data_store.update_task.side_effect = mock_update_task
+    mock_data_store.update_tasks.side_effect = mock_update_tasks
 
     # Create an array with mostly valid updates and one invalid
     updates = []
@@ -224,9 +222,9 @@ def test_bulk_update_validates_all_before_updating_any(
     result = handler.bulk_update_tasks(updates)
 
     # Verify that NO tasks were updated (validate-before-apply)
-    assert update_task_call_count == 0, (
-        f"Expected 0 update_task calls due to validation failure, "
-        f"but got {update_task_call_count}"
+    assert update_tasks_call_count == 0, (
+        f"Expected 0 update_tasks calls due to validation failure, "
+        f"but got {update_tasks_call_count}"
     )
 
     # Verify the result indicates failure
@@ -266,22 +264,19 @@ def test_bulk_delete_validates_all_before_deleting_any(
         existing_tasks.append(task)
 
     # Setup mock to return existing tasks
-    def mock_get_task(task_id):
-        for task in existing_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in existing_tasks if task.id in task_ids]
 
-    mock_data_store.get_task.side_effect = mock_get_task
+    mock_data_store.get_tasks.side_effect = mock_get_tasks
 
-    # Track how many times delete_task is called
-    delete_task_call_count = 0
+    # Track how many times delete_tasks is called
+    delete_tasks_call_count = 0
 
-    def mock_delete_task(*args, **kwargs):
-        nonlocal delete_task_call_count
-        delete_task_call_count += 1
+    def mock_delete_tasks(*args, **kwargs):
+        nonlocal delete_tasks_call_count
+        delete_tasks_call_count += 1
 
-    mock_data_store.delete_task.side_effect = mock_delete_task
+    mock_data_store.delete_tasks.side_effect = mock_delete_tasks
 
     # Create an array with mostly valid task IDs and one invalid
     task_ids = []
@@ -298,9 +293,9 @@ def test_bulk_delete_validates_all_before_deleting_any(
     result = handler.bulk_delete_tasks(task_ids)
 
     # Verify that NO tasks were deleted (validate-before-apply)
-    assert delete_task_call_count == 0, (
-        f"Expected 0 delete_task calls due to validation failure, "
-        f"but got {delete_task_call_count}"
+    assert delete_tasks_call_count == 0, (
+        f"Expected 0 delete_tasks calls due to validation failure, "
+        f"but got {delete_tasks_call_count}"
     )
 
     # Verify the result indicates failure
@@ -340,23 +335,20 @@ def test_bulk_add_tags_validates_all_before_adding_any(
         existing_tasks.append(task)
 
     # Setup mock to return existing tasks
-    def mock_get_task(task_id):
-        for task in existing_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in existing_tasks if task.id in task_ids]
 
-    mock_data_store.get_task.side_effect = mock_get_task
+    mock_data_store.get_tasks.side_effect = mock_get_tasks
 
-    # Track how many times update_task is called (tags are updated via update_task)
-    update_task_call_count = 0
+    # Track how many times add_tags_to_tasks is called
+    add_tags_to_tasks_call_count = 0
 
-    def mock_update_task(*args, **kwargs):
-        nonlocal update_task_call_count
-        update_task_call_count += 1
-        return existing_tasks[0]
+    def mock_add_tags_to_tasks(*args, **kwargs):
+        nonlocal add_tags_to_tasks_call_count
+        add_tags_to_tasks_call_count += 1
+        return [existing_tasks[0]]
 
-    mock_data_store.update_task.side_effect = mock_update_task
+    mock_data_store.add_tags_to_tasks.side_effect = mock_add_tags_to_tasks
 
     # Create an array with mostly valid task IDs and one invalid
     task_ids = []
@@ -373,9 +365,9 @@ def test_bulk_add_tags_validates_all_before_adding_any(
     result = handler.bulk_add_tags(task_ids, ["test-tag"])
 
     # Verify that NO tags were added (validate-before-apply)
-    assert update_task_call_count == 0, (
-        f"Expected 0 update_task calls due to validation failure, "
-        f"but got {update_task_call_count}"
+    assert add_tags_to_tasks_call_count == 0, (
+        f"Expected 0 add_tags_to_tasks calls due to validation failure, "
+        f"but got {add_tags_to_tasks_call_count}"
     )
 
     # Verify the result indicates failure
@@ -415,23 +407,20 @@ def test_bulk_remove_tags_validates_all_before_removing_any(
         existing_tasks.append(task)
 
     # Setup mock to return existing tasks
-    def mock_get_task(task_id):
-        for task in existing_tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def mock_get_tasks(task_ids):
+        return [task for task in existing_tasks if task.id in task_ids]
 
-    mock_data_store.get_task.side_effect = mock_get_task
+    mock_data_store.get_tasks.side_effect = mock_get_tasks
 
-    # Track how many times update_task is called (tags are updated via update_task)
-    update_task_call_count = 0
+    # Track how many times remove_tags_from_tasks is called
+    remove_tags_from_tasks_call_count = 0
 
-    def mock_update_task(*args, **kwargs):
-        nonlocal update_task_call_count
-        update_task_call_count += 1
-        return existing_tasks[0]
+    def mock_remove_tags_from_tasks(*args, **kwargs):
+        nonlocal remove_tags_from_tasks_call_count
+        remove_tags_from_tasks_call_count += 1
+        return [existing_tasks[0]]
 
-    mock_data_store.update_task.side_effect = mock_update_task
+    mock_data_store.remove_tags_from_tasks.side_effect = mock_remove_tags_from_tasks
 
     # Create an array with mostly valid task IDs and one invalid
     task_ids = []
@@ -448,9 +437,9 @@ def test_bulk_remove_tags_validates_all_before_removing_any(
     result = handler.bulk_remove_tags(task_ids, ["test-tag"])
 
     # Verify that NO tags were removed (validate-before-apply)
-    assert update_task_call_count == 0, (
-        f"Expected 0 update_task calls due to validation failure, "
-        f"but got {update_task_call_count}"
+    assert remove_tags_from_tasks_call_count == 0, (
+        f"Expected 0 remove_tags_from_tasks calls due to validation failure, "
+        f"but got {remove_tags_from_tasks_call_count}"
     )
 
     # Verify the result indicates failure
@@ -485,12 +474,11 @@ def test_bulk_create_with_all_valid_creates_all_tasks(task_count: int) -> None:
     # Track created tasks
     created_tasks = []
 
-    def mock_create_task(*args, **kwargs):
-        task = create_test_task(task_list_id)
-        created_tasks.append(task)
-        return task
+    def mock_create_tasks(tasks):
+        created_tasks.extend(tasks)
+        return tasks
 
-    mock_data_store.create_task.side_effect = mock_create_task
+    mock_data_store.create_tasks.side_effect = mock_create_tasks
 
     # Create an array with all valid task definitions
     task_definitions = []
@@ -544,6 +532,7 @@ def test_bulk_create_validates_different_field_types(valid_count: int, invalid_f
         return create_test_task(task_list_id)
 
     mock_data_store.create_task.side_effect = mock_create_task
+    mock_data_store.create_tasks.side_effect = mock_create_task
 
     # Create an array with mostly valid task definitions and one with invalid field
     task_definitions = []
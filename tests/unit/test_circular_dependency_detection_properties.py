@@ -100,6 +100,7 @@ def test_circular_dependency_detection_self_reference(data: Any) -> None:
     # Set up mock data store
     mock_data_store = Mock()
     mock_data_store.get_task.return_value = task
+    mock_data_store.get_tasks.return_value = [task]
 
     # Create orchestrator
     orchestrator = DependencyOrchestrator(mock_data_store)
@@ -146,6 +147,9 @@ def test_circular_dependency_detection_two_task_cycle(data: Any) -> None:
         task_b.id: task_b,
     }
     mock_data_store.get_task.side_effect = lambda tid: task_map.get(tid)
+    mock_data_store.get_tasks.side_effect = lambda tids: [
+        task_map[tid] for tid in tids if tid in task_map
+    ]
 
     # Create orchestrator
     orchestrator = DependencyOrchestrator(mock_data_store)
@@ -199,6 +203,9 @@ def test_circular_dependency_detection_three_task_cycle(data: Any) -> None:
         task_c.id: task_c,
     }
     mock_data_store.get_task.side_effect = lambda tid: task_map.get(tid)
+    mock_data_store.get_tasks.side_effect = lambda tids: [
+        task_map[tid] for tid in tids if tid in task_map
+    ]
 
     # Create orchestrator
     orchestrator = DependencyOrchestrator(mock_data_store)
@@ -248,6 +255,9 @@ def test_circular_dependency_detection_long_cycle(data: Any, cycle_length: int)
     mock_data_store = Mock()
     task_map = {task.id: task for task in tasks}
     mock_data_store.get_task.side_effect = lambda tid: task_map.get(tid)
+    mock_data_store.get_tasks.side_effect = lambda tids: [
+        task_map[tid] for tid in tids if tid in task_map
+    ]
 
     # Create orchestrator
     orchestrator = DependencyOrchestrator(mock_data_store)
@@ -301,6 +311,9 @@ def test_circular_dependency_detection_cross_task_list_cycle(data: Any) -> None:
         task_b.id: task_b,
     }
     mock_data_store.get_task.side_effect = lambda tid: task_map.get(tid)
+    mock_data_store.get_tasks.side_effect = lambda tids: [
+        task_map[tid] for tid in tids if tid in task_map
+    ]
 
     # Create orchestrator
     orchestrator = DependencyOrchestrator(mock_data_store)
@@ -367,6 +380,9 @@ def test_circular_dependency_detection_diamond_with_cycle(data: Any) -> None:
         task_d.id: task_d,
     }
     mock_data_store.get_task.side_effect = lambda tid: task_map.get(tid)
+    mock_data_store.get_tasks.side_effect = lambda tids: [
+        task_map[tid] for tid in tids if tid in task_map
+    ]
 
     # Create orchestrator
     orchestrator = DependencyOrchestrator(mock_data_store)
@@ -425,6 +441,9 @@ def test_circular_dependency_detection_multiple_new_dependencies_one_creates_cyc
         task_c.id: task_c,
     }
     mock_data_store.get_task.side_effect = lambda tid: task_map.get(tid)
+    mock_data_store.get_tasks.side_effect = lambda tids: [
+        task_map[tid] for tid in tids if tid in task_map
+    ]
 
     # Create orchestrator
     orchestrator = DependencyOrchestrator(mock_data_store)
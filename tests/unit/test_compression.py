@@ -0,0 +1,150 @@
+"""Unit tests for REST response compression.
+
+This module tests that:
+1. Responses above the minimum size are gzip-compressed for clients accepting gzip
+2. Small responses and clients not accepting gzip get the identity encoding
+3. Compressed responses carry weak ETags
+4. Event streams are never compressed
+5. Compression is configured from environment variables
+
+Requirements: 2.3, 9.2
+"""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from task_manager.data.config import ConfigurationError
+from task_manager.interfaces.rest.compression import CompressionMiddleware, install_compression
+
+LARGE_BODY = b"digraph { a -> b; }\n" * 100
+
+
+@pytest.fixture
+def client():
+    """Create a client for an app serving small, large and streamed bodies."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500, compresslevel=6)
+
+    @app.get("/small")
+    def small():
+        return Response(b"digraph {}", media_type="text/plain", headers={"ETag": '"small"'})
+
+    @app.get("/large")
+    def large():
+        return Response(LARGE_BODY, media_type="text/plain", headers={"ETag": '"large"'})
+
+    @app.get("/weak")
+    def weak():
+        return Response(LARGE_BODY, media_type="text/plain", headers={"ETag": 'W/"weak"'})
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(
+            (b'{"n":%d}\n' % i * 100 for i in range(3)), media_type="application/x-ndjson"
+        )
+
+    return TestClient(app)
+
+
+def _get_raw(client, path, accept_encoding):
+    """Get a response without letting the client decode its body."""
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+class TestCompressionMiddleware:
+    """Test compressing responses."""
+
+    def test_compresses_large_responses(self, client):
+        """Test that large bodies are gzipped with a weak ETag and Vary header."""
+        response, body = _get_raw(client, "/large", "gzip, deflate")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == 'W/"large"'
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) == len(body) < len(LARGE_BODY) // 5
+        assert gzip.decompress(body) == LARGE_BODY
+
+    def test_keeps_weak_etags(self, client):
+        """Test that an already weak ETag is not prefixed again."""
+        response, _ = _get_raw(client, "/weak", "gzip")
+
+        assert response.headers["etag"] == 'W/"weak"'
+
+    @pytest.mark.parametrize("path,accept_encoding", [("/small", "gzip"), ("/large", "identity")])
+    def test_identity_encoding(self, client, path, accept_encoding):
+        """Test that small bodies and clients without gzip support are not compressed."""
+        response, body = _get_raw(client, path, accept_encoding)
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"].startswith('"')
+        assert body in (LARGE_BODY, b"digraph {}")
+
+    def test_compresses_streams(self, client):
+        """Test that streamed bodies are compressed as one gzip stream."""
+        response, body = _get_raw(client, "/stream", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(body).count(b"\n") == 300
+
+    def test_skips_event_streams(self, client):
+        """Test that requests accepting text/event-stream are not compressed."""
+        with client.stream(
+            "GET", "/large", headers={"Accept": "text/event-stream", "Accept-Encoding": "gzip"}
+        ) as response:
+            body = b"".join(response.iter_raw())
+
+        assert "content-encoding" not in response.headers
+        assert body == LARGE_BODY
+
+    @pytest.mark.parametrize("kwargs", [{"minimum_size": -1}, {"compresslevel": 10}])
+    def test_rejects_invalid_settings(self, kwargs):
+        """Test that a negative size or an out-of-range level raises ValueError."""
+        with pytest.raises(ValueError):
+            CompressionMiddleware(FastAPI(), **kwargs)
+
+
+class TestInstallCompression:
+    """Test configuring compression from environment variables."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test that no middleware is added unless REST_COMPRESSION is set."""
+        monkeypatch.delenv("REST_COMPRESSION", raising=False)
+        app = FastAPI()
+
+        assert install_compression(app) is False
+        assert app.user_middleware == []
+
+    def test_from_environment(self, monkeypatch):
+        """Test that the size threshold and level are read from the environment."""
+        monkeypatch.setenv("REST_COMPRESSION", "GZIP")
+        monkeypatch.setenv("REST_COMPRESSION_MIN_SIZE", "0")
+        monkeypatch.setenv("REST_COMPRESSION_LEVEL", "9")
+        app = FastAPI()
+
+        assert install_compression(app) is True
+        [middleware] = app.user_middleware
+        assert middleware.cls is CompressionMiddleware
+        assert middleware.kwargs == {"minimum_size": 0, "compresslevel": 9}
+
+    @pytest.mark.parametrize(
+        "name,value",
+        [
+            ("REST_COMPRESSION", "zstd"),
+            ("REST_COMPRESSION_MIN_SIZE", "-1"),
+            ("REST_COMPRESSION_MIN_SIZE", "1k"),
+            ("REST_COMPRESSION_LEVEL", "0"),
+            ("REST_COMPRESSION_LEVEL", "10"),
+        ],
+    )
+    def test_invalid_values_are_rejected(self, monkeypatch, name, value):
+        """Test that invalid settings raise ConfigurationError."""
+        monkeypatch.setenv("REST_COMPRESSION", "gzip")
+        monkeypatch.setenv(name, value)
+
+        with pytest.raises(ConfigurationError, match=name):
+            install_compression(FastAPI())
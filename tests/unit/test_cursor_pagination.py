@@ -0,0 +1,207 @@
+"""Unit tests for keyset (cursor) pagination of search results.
+
+This module tests that:
+1. Cursors round-trip and malformed or mismatched cursors are rejected
+2. Walking cursor pages returns every match exactly once, in sort order
+3. Cursor pages are not shifted by tasks created between requests
+
+Requirements: 4.7, 4.8
+"""
+
+import base64
+import json
+import tempfile
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from task_manager.data.access.filesystem_store import FilesystemStore
+from task_manager.models.entities import ExitCriteria, Project, SearchCriteria, Task, TaskList
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+from task_manager.models.pagination import decode_cursor, encode_cursor, is_after_cursor
+from task_manager.orchestration.search_orchestrator import SearchOrchestrator
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def store():
+    """Create an initialized filesystem store in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = FilesystemStore(tmpdir)
+        store.initialize()
+        yield store
+
+
+@pytest.fixture
+def task_list(store):
+    """Create a task list in a non-default project."""
+    project = store.create_project(
+        Project(
+            id=uuid4(),
+            name="Cursor Project",
+            is_default=False,
+            created_at=BASE_TIME,
+            updated_at=BASE_TIME,
+        )
+    )
+    return store.create_task_list(
+        TaskList(
+            id=uuid4(),
+            name="List",
+            project_id=project.id,
+            created_at=BASE_TIME,
+            updated_at=BASE_TIME,
+        )
+    )
+
+
+def _create_task(store, task_list, title, minutes=0, priority=Priority.MEDIUM):
+    return store.create_task(
+        Task(
+            id=uuid4(),
+            task_list_id=task_list.id,
+            title=title,
+            description="Deploy step",
+            status=Status.NOT_STARTED,
+            dependencies=[],
+            exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+            priority=priority,
+            notes=[],
+            created_at=BASE_TIME + timedelta(minutes=minutes),
+            updated_at=BASE_TIME + timedelta(minutes=minutes),
+        )
+    )
+
+
+def _walk(orchestrator, **fields):
+    pages = []
+    cursor = None
+    while True:
+        page = orchestrator.search_page(SearchCriteria(limit=2, cursor=cursor, **fields))
+        pages.append([t.title for t in page.tasks])
+        cursor = page.next_cursor
+        if cursor is None:
+            return pages
+
+
+class TestCursorEncoding:
+    """Test the cursor format."""
+
+    def test_round_trip(self):
+        """Test that keys and task ID survive encoding."""
+        task_id = uuid4()
+        cursor = encode_cursor("priority", [4, BASE_TIME], task_id)
+
+        assert decode_cursor(cursor, "priority", 2) == ([4.0, BASE_TIME], task_id)
+
+    def test_rejects_malformed_cursor(self):
+        """Test that garbage and wrongly shaped cursors raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("not a cursor", "created_at", 1)
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(encode_cursor("created_at", [], uuid4()), "created_at", 1)
+
+    @pytest.mark.parametrize(
+        "sort_by, keys",
+        [
+            ("created_at", ["2024-01-01"]),
+            ("created_at", [1.5]),
+            ("created_at", [{"dt": 1}]),
+            ("created_at", [{"dt": "yesterday"}]),
+            ("priority", [{"dt": "2024-01-01T00:00:00"}, {"dt": "2024-01-01T00:00:00"}]),
+            ("priority", [True, {"dt": "2024-01-01T00:00:00"}]),
+            ("priority", [float("nan"), {"dt": "2024-01-01T00:00:00"}]),
+            ("relevance", [[1], {"dt": "2024-01-01T00:00:00"}]),
+        ],
+    )
+    def test_rejects_keys_of_wrong_type(self, sort_by, keys):
+        """Test that crafted cursors with keys not matching the sort order are rejected."""
+        payload = json.dumps({"sort_by": sort_by, "keys": keys, "id": str(uuid4())})
+        cursor = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor, sort_by, len(keys))
+
+    def test_rejects_keys_not_comparable_with_tasks(self):
+        """Test that a timezone-aware cursor key is rejected against naive task keys."""
+        cursor_keys = [BASE_TIME.replace(tzinfo=timezone.utc)]
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            is_after_cursor([BASE_TIME], uuid4(), cursor_keys, uuid4())
+
+    def test_rejects_cursor_of_other_sort_order(self):
+        """Test that a cursor cannot be reused with a different sort_by."""
+        cursor = encode_cursor("created_at", [BASE_TIME], uuid4())
+
+        with pytest.raises(ValueError, match="sort_by 'created_at'"):
+            decode_cursor(cursor, "updated_at", 1)
+
+    def test_ties_are_broken_by_id(self):
+        """Test that equal keys fall back to ascending task ID."""
+        low, high = sorted([uuid4(), uuid4()])
+
+        assert is_after_cursor([1, BASE_TIME], high, [1, BASE_TIME], low)
+        assert not is_after_cursor([1, BASE_TIME], low, [1, BASE_TIME], high)
+        assert is_after_cursor([0, BASE_TIME], low, [1, BASE_TIME], high)
+
+
+class TestCursorPages:
+    """Test cursor pagination through SearchOrchestrator's in-memory path."""
+
+    @pytest.mark.parametrize("sort_by", ["relevance", "created_at", "updated_at", "priority"])
+    def test_cursor_pages_match_offset_order(self, store, task_list, sort_by):
+        """Test that cursor pages concatenate to the full sorted result, ties included."""
+        for i in range(7):
+            priority = Priority.HIGH if i % 3 == 0 else Priority.LOW
+            _create_task(store, task_list, f"Task {i}", minutes=i // 2, priority=priority)
+        orchestrator = SearchOrchestrator(store)
+
+        pages = _walk(orchestrator, sort_by=sort_by)
+        full = orchestrator.search_tasks(SearchCriteria(limit=100, sort_by=sort_by))
+
+        assert [len(p) for p in pages] == [2, 2, 2, 1]
+        assert [title for page in pages for title in page] == [t.title for t in full]
+
+    def test_exact_last_page_has_no_cursor(self, store, task_list):
+        """Test that a full final page does not return a cursor to an empty page."""
+        for i in range(4):
+            _create_task(store, task_list, f"Task {i}", minutes=i)
+
+        pages = _walk(SearchOrchestrator(store), sort_by="created_at")
+
+        assert pages == [["Task 3", "Task 2"], ["Task 1", "Task 0"]]
+
+    def test_inserts_do_not_shift_pages(self, store, task_list):
+        """Test that a task created after the first page does not repeat results."""
+        for i in range(4):
+            _create_task(store, task_list, f"Task {i}", minutes=i)
+        orchestrator = SearchOrchestrator(store)
+
+        first = orchestrator.search_page(SearchCriteria(limit=2, sort_by="created_at"))
+        _create_task(store, task_list, "Newest", minutes=10)
+        second = orchestrator.search_page(
+            SearchCriteria(limit=2, sort_by="created_at", cursor=first.next_cursor)
+        )
+
+        assert [t.title for t in first.tasks] == ["Task 3", "Task 2"]
+        assert [t.title for t in second.tasks] == ["Task 1", "Task 0"]
+        assert second.next_cursor is None
+
+    def test_cursor_with_text_query(self, store, task_list):
+        """Test that relevance cursors carry the score of the last task."""
+        _create_task(store, task_list, "Deploy deploy", minutes=0)
+        _create_task(store, task_list, "Deploy", minutes=1)
+        _create_task(store, task_list, "Other", minutes=2)
+
+        pages = _walk(SearchOrchestrator(store), query="deploy")
+
+        assert pages == [["Deploy deploy", "Deploy"], ["Other"]]
+
+    def test_cursor_cannot_be_combined_with_offset(self, store, task_list):
+        """Test that offset and cursor pagination are mutually exclusive."""
+        cursor = encode_cursor("relevance", [0, BASE_TIME], uuid4())
+
+        with pytest.raises(ValueError, match="Offset cannot be combined with a cursor"):
+            SearchOrchestrator(store).search_page(SearchCriteria(offset=2, cursor=cursor))
@@ -107,6 +107,7 @@ def test_dependency_acceptance_same_task_list(data: Any) -> None:
     # Set up mock data store
     mock_data_store = Mock()
     mock_data_store.get_task.return_value = target_task
+    mock_data_store.get_tasks.return_value = [target_task]
 
     # Create orchestrator
     orchestrator = DependencyOrchestrator(mock_data_store)
@@ -163,6 +164,7 @@ def test_dependency_acceptance_different_task_list(data: Any) -> None:
     # Set up mock data store
     mock_data_store = Mock()
     mock_data_store.get_task.return_value = target_task
+    mock_data_store.get_tasks.return_value = [target_task]
 
     # Create orchestrator
     orchestrator = DependencyOrchestrator(mock_data_store)
@@ -233,6 +235,9 @@ def test_dependency_acceptance_multiple_dependencies(data: Any, num_dependencies
     # Create a mapping for get_task calls
     task_map = {task.id: task for task in target_tasks}
     mock_data_store.get_task.side_effect = lambda tid: task_map.get(tid)
+    mock_data_store.get_tasks.side_effect = lambda tids: [
+        task_map[tid] for tid in tids if tid in task_map
+    ]
 
     # Create orchestrator
     orchestrator = DependencyOrchestrator(mock_data_store)
@@ -299,6 +304,9 @@ def test_dependency_acceptance_dag_structure(data: Any) -> None:
         task_c.id: task_c,
     }
     mock_data_store.get_task.side_effect = lambda tid: task_map.get(tid)
+    mock_data_store.get_tasks.side_effect = lambda tids: [
+        task_map[tid] for tid in tids if tid in task_map
+    ]
 
     # Create orchestrator
     orchestrator = DependencyOrchestrator(mock_data_store)
@@ -0,0 +1,182 @@
+"""Unit tests for the dependency graph with incremental readiness tracking.
+
+This module tests that:
+1. Tasks are ready when all their dependencies exist and are COMPLETED
+2. Completing, reopening and deleting a task updates its dependents
+3. Editing dependencies recounts the edited task
+4. Ready postings are filtered by task list and status
+5. After any sequence of changes, readiness matches a full recomputation
+
+Requirements: 9.1, 9.2, 9.3
+"""
+
+from dataclasses import replace
+from datetime import datetime
+from uuid import uuid4
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from task_manager.data.access.dependency_graph import DependencyGraph
+from task_manager.models.entities import Dependency, ExitCriteria, Task
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+
+TASK_LIST_ID = uuid4()
+
+
+def _task(status=Status.NOT_STARTED, dependencies=(), task_list_id=TASK_LIST_ID, task_id=None):
+    return Task(
+        id=task_id or uuid4(),
+        task_list_id=task_list_id,
+        title="Task",
+        description="Description",
+        status=status,
+        dependencies=[Dependency(task_id=d.id, task_list_id=d.task_list_id) for d in dependencies],
+        exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+        priority=Priority.MEDIUM,
+        notes=[],
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+
+class TestReadiness:
+    """Test readiness of individual tasks."""
+
+    def test_tasks_without_dependencies_are_ready(self):
+        """Test that a task without dependencies is ready."""
+        graph = DependencyGraph()
+        task = _task()
+        graph.add_task(task)
+
+        assert graph.is_ready(task.id)
+        assert graph.ready_task_ids([TASK_LIST_ID]) == {task.id}
+
+    def test_completing_unblocks_dependents(self):
+        """Test that completing a dependency makes its dependents ready and back."""
+        graph = DependencyGraph()
+        dependency = _task()
+        dependents = [_task(dependencies=[dependency]) for _ in range(3)]
+        for task in [dependency, *dependents]:
+            graph.add_task(task)
+
+        assert graph.ready_task_ids([TASK_LIST_ID]) == {dependency.id}
+
+        graph.add_task(replace(dependency, status=Status.COMPLETED))
+
+        assert graph.ready_task_ids([TASK_LIST_ID]) == {dependency.id} | {t.id for t in dependents}
+
+        graph.add_task(replace(dependency, status=Status.IN_PROGRESS))
+
+        assert graph.ready_task_ids([TASK_LIST_ID]) == {dependency.id}
+
+    def test_missing_and_deleted_dependencies_block(self):
+        """Test that a dependency on a missing task is unsatisfied until it exists."""
+        graph = DependencyGraph()
+        dependency = _task(Status.COMPLETED)
+        dependent = _task(dependencies=[dependency])
+
+        graph.add_task(dependent)
+        assert not graph.is_ready(dependent.id)
+
+        graph.add_task(dependency)
+        assert graph.is_ready(dependent.id)
+
+        graph.remove_task(dependency.id)
+        assert not graph.is_ready(dependent.id)
+        assert graph.dependent_task_ids(dependency.id) == {dependent.id}
+
+    def test_editing_dependencies_recounts(self):
+        """Test that replacing a task's dependencies updates its readiness."""
+        graph = DependencyGraph()
+        done, open_ = _task(Status.COMPLETED), _task()
+        task = _task(dependencies=[open_])
+        for t in (done, open_, task):
+            graph.add_task(t)
+        assert not graph.is_ready(task.id)
+
+        graph.add_task(_task(dependencies=[done], task_id=task.id))
+
+        assert graph.is_ready(task.id)
+        assert graph.dependent_task_ids(open_.id) == set()
+        assert graph.dependent_task_ids(done.id) == {task.id}
+
+    def test_self_dependency(self):
+        """Test that a task depending on itself is ready only while completed."""
+        graph = DependencyGraph()
+        task = _task()
+        task.dependencies = [Dependency(task_id=task.id, task_list_id=TASK_LIST_ID)]
+
+        graph.add_task(task)
+        assert not graph.is_ready(task.id)
+
+        task.status = Status.COMPLETED
+        graph.add_task(task)
+        assert graph.is_ready(task.id)
+
+        graph.remove_task(task.id)
+        assert graph.ready_task_ids([TASK_LIST_ID]) == set()
+
+    def test_filters_by_task_list_and_status(self):
+        """Test that ready postings are selected by task list and status."""
+        graph = DependencyGraph()
+        other_list = uuid4()
+        not_started = _task()
+        in_progress = _task(Status.IN_PROGRESS)
+        elsewhere = _task(task_list_id=other_list)
+        for task in (not_started, in_progress, elsewhere):
+            graph.add_task(task)
+
+        assert graph.ready_task_ids([TASK_LIST_ID], [Status.NOT_STARTED]) == {not_started.id}
+        assert graph.ready_task_ids([TASK_LIST_ID, other_list], [Status.NOT_STARTED]) == {
+            not_started.id,
+            elsewhere.id,
+        }
+        assert graph.ready_task_ids([uuid4()]) == set()
+
+        graph.clear()
+        assert graph.ready_task_ids([TASK_LIST_ID, other_list]) == set()
+
+
+class TestIncrementalConsistency:
+    """Test the incremental counts against a full recomputation."""
+
+    @settings(max_examples=50, deadline=None)
+    @given(
+        st.lists(
+            st.tuples(
+                st.sampled_from(["put", "remove"]),
+                st.integers(0, 7),
+                st.sampled_from(Status),
+                st.lists(st.integers(0, 7), max_size=3),
+            ),
+            max_size=40,
+        )
+    )
+    def test_matches_recomputation(self, operations):
+        """Test that readiness after random changes matches recomputing it."""
+        ids = [uuid4() for _ in range(8)]
+        graph = DependencyGraph()
+        tasks = {}
+
+        for operation, index, status, dependency_indexes in operations:
+            if operation == "remove":
+                graph.remove_task(ids[index])
+                tasks.pop(ids[index], None)
+                continue
+            task = _task(status, task_id=ids[index])
+            task.dependencies = [
+                Dependency(task_id=ids[i], task_list_id=TASK_LIST_ID) for i in dependency_indexes
+            ]
+            graph.add_task(task)
+            tasks[task.id] = task
+
+        expected = {
+            task.id
+            for task in tasks.values()
+            if all(
+                dep.task_id in tasks and tasks[dep.task_id].status == Status.COMPLETED
+                for dep in task.dependencies
+            )
+        }
+        assert graph.ready_task_ids([TASK_LIST_ID]) == expected
@@ -1,5 +1,6 @@
 """Unit tests for DependencyOrchestrator."""
 
+import sys
 from datetime import datetime
 from unittest.mock import Mock
 from uuid import uuid4
@@ -227,7 +228,7 @@ class TestDependencyOrchestrator:
 
         new_dependencies = [Dependency(task_id=task_b_id, task_list_id=task_list_id)]
 
-        mock_data_store.get_task.return_value = task_b
+        mock_data_store.get_tasks.return_value = [task_b]
 
         # Execute
         result = orchestrator.detect_circular_dependency(task_a_id, new_dependencies)
@@ -275,7 +276,9 @@ class TestDependencyOrchestrator:
         # Now Task A wants to depend on Task B (would create cycle)
         new_dependencies = [Dependency(task_id=task_b_id, task_list_id=task_list_id)]
 
-        mock_data_store.get_task.side_effect = lambda tid: task_b if tid == task_b_id else task_a
+        mock_data_store.get_tasks.side_effect = lambda tids: [
+            task_b if tid == task_b_id else task_a for tid in tids
+        ]
 
         # Execute
         result = orchestrator.detect_circular_dependency(task_a_id, new_dependencies)
@@ -347,7 +350,9 @@ class TestDependencyOrchestrator:
                 return task_c
             return None
 
-        mock_data_store.get_task.side_effect = get_task_mock
+        mock_data_store.get_tasks.side_effect = lambda tids: [
+            task for task in map(get_task_mock, tids) if task is not None
+        ]
 
         # Execute
         result = orchestrator.detect_circular_dependency(task_a_id, new_dependencies)
@@ -439,13 +444,39 @@ class TestDependencyOrchestrator:
                 return task_d
             return None
 
-        mock_data_store.get_task.side_effect = get_task_mock
+        mock_data_store.get_tasks.side_effect = lambda tids: [
+            task for task in map(get_task_mock, tids) if task is not None
+        ]
 
         # Execute
         result = orchestrator.detect_circular_dependency(task_a_id, new_dependencies)
 
-        # Verify - no cycle in diamond pattern
+        # Verify - no cycle in diamond pattern, one bulk read per level
         assert result is False
+        assert [c.args[0] for c in mock_data_store.get_tasks.call_args_list] == [
+            [task_b_id, task_c_id],
+            [task_d_id],
+        ]
+        mock_data_store.get_task.assert_not_called()
+
+    def test_detect_circular_dependency_deep_chain(self, orchestrator, mock_data_store):
+        """Test that a chain deeper than the recursion limit is searched iteratively."""
+        task_list_id = uuid4()
+        chain_ids = [uuid4() for _ in range(sys.getrecursionlimit() + 100)]
+        adjacency = {
+            task_id: (dependency_id,) for task_id, dependency_id in zip(chain_ids, chain_ids[1:])
+        }
+        adjacency[chain_ids[-1]] = ()
+        new_dependencies = [Dependency(task_id=chain_ids[0], task_list_id=task_list_id)]
+
+        assert (
+            orchestrator.detect_circular_dependency(uuid4(), new_dependencies, adjacency) is False
+        )
+        assert (
+            orchestrator.detect_circular_dependency(chain_ids[-1], new_dependencies, adjacency)
+            is True
+        )
+        mock_data_store.get_tasks.assert_not_called()
 
     # get_ready_tasks tests
 
@@ -0,0 +1,182 @@
+"""Unit tests for ETags and the entity versions they are derived from.
+
+This module tests that:
+1. ETags are stable, quoted and distinct per resource and version
+2. If-None-Match matching follows weak comparison, lists and "*"
+3. Task versions change on updates and collection versions on creates,
+   updates and deletes, in the default implementation and in the index
+   generation and SQL implementations of the stores
+
+Requirements: 2.2, 2.3, 9.1
+"""
+
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from task_manager.data.access.filesystem_store import FilesystemStore
+from task_manager.data.access.log_store import LogStore
+from task_manager.data.access.sqlite_store import SQLiteStore
+from task_manager.data.delegation.data_store import DataStore
+from task_manager.interfaces.rest.etag import etag_matches, make_etag, not_modified_response
+from task_manager.models.entities import Dependency, ExitCriteria, Project, Task, TaskList
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class TestEtag:
+    """Test ETag construction and matching."""
+
+    def test_make_etag(self):
+        """Test that ETags are quoted, deterministic and depend on every part."""
+        task_id = uuid4()
+        etag = make_etag("task", task_id, "v1")
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == make_etag("task", task_id, "v1")
+        assert etag != make_etag("task", task_id, "v2")
+        assert etag != make_etag("task_list", task_id, "v1")
+
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            (None, False),
+            ("", False),
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"xyz", "abc"', True),
+            ('"xyz"', False),
+            ("*", True),
+        ],
+    )
+    def test_etag_matches(self, header, expected):
+        """Test If-None-Match comparison."""
+        assert etag_matches(header, '"abc"') is expected
+
+    def test_not_modified_response(self):
+        """Test that 304 responses are empty and carry the ETag."""
+        response = not_modified_response('"abc"')
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == '"abc"'
+
+
+class DefaultVersionStore(FilesystemStore):
+    """Filesystem store using the default DataStore version implementation."""
+
+    get_tasks_version = DataStore.get_tasks_version
+
+
+@pytest.fixture(params=["default", "filesystem", "log", "sqlite"])
+def store(request):
+    """Create a store using the default, index generation or SQL version queries."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if request.param == "sqlite":
+            store = SQLiteStore(str(Path(tmpdir) / "tasks.db"))
+        elif request.param == "log":
+            store = LogStore(tmpdir)
+        elif request.param == "default":
+            store = DefaultVersionStore(tmpdir)
+        else:
+            store = FilesystemStore(tmpdir)
+        store.initialize()
+        yield store
+        if request.param == "sqlite":
+            store.engine.dispose()
+
+
+@pytest.fixture
+def task_list(store):
+    """Create a task list in a new project."""
+    project = store.create_project(
+        Project(
+            id=uuid4(),
+            name="Version Project",
+            is_default=False,
+            created_at=BASE_TIME,
+            updated_at=BASE_TIME,
+        )
+    )
+    return store.create_task_list(
+        TaskList(
+            id=uuid4(),
+            name="Version List",
+            project_id=project.id,
+            created_at=BASE_TIME,
+            updated_at=BASE_TIME,
+        )
+    )
+
+
+def _create_task(store, task_list, dependencies=None):
+    return store.create_task(
+        Task(
+            id=uuid4(),
+            task_list_id=task_list.id,
+            title="Task",
+            description="Description",
+            status=Status.NOT_STARTED,
+            dependencies=dependencies or [],
+            exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+            priority=Priority.MEDIUM,
+            notes=[],
+            created_at=BASE_TIME,
+            updated_at=BASE_TIME,
+        )
+    )
+
+
+class TestVersions:
+    """Test the version tokens of the stores."""
+
+    def test_task_version(self, store, task_list):
+        """Test that a task's version is stable until the task is updated."""
+        task = _create_task(store, task_list)
+        version = store.get_task_version(task.id)
+
+        assert version is not None
+        assert store.get_task_version(task.id) == version
+        assert store.get_task_version(uuid4()) is None
+
+        task.title = "Renamed"
+        store.update_task(task)
+
+        assert store.get_task_version(task.id) != version
+
+    def test_tasks_version(self, store, task_list):
+        """Test that a collection's version changes on create, update and delete."""
+        empty = store.get_tasks_version(task_list.id)
+        first = _create_task(store, task_list)
+        one = store.get_tasks_version(task_list.id)
+        second = _create_task(store, task_list)
+        two = store.get_tasks_version(task_list.id)
+
+        assert len({empty, one, two}) == 3
+        assert store.get_tasks_version(task_list.id) == two
+        assert store.get_tasks_version(None) == two
+        assert store.get_tasks_version(uuid4()) == empty
+
+        store.update_task(first)
+        updated = store.get_tasks_version(task_list.id)
+        assert updated != two
+
+        store.delete_task(second.id)
+        assert store.get_tasks_version(task_list.id) not in (two, updated)
+
+    def test_deleting_dependency_changes_dependent_version(self, store, task_list):
+        """Test that removing a task from a dependent's dependencies changes its version."""
+        dependency = _create_task(store, task_list)
+        dependent = _create_task(
+            store, task_list, [Dependency(task_id=dependency.id, task_list_id=task_list.id)]
+        )
+        version = store.get_task_version(dependent.id)
+
+        store.delete_task(dependency.id)
+
+        assert store.get_task(dependent.id).dependencies == []
+        assert store.get_task_version(dependent.id) != version
@@ -0,0 +1,281 @@
+"""Unit tests for the task event bus.
+
+This module tests that:
+1. Subscribers receive the events matching their project and task list filters
+2. Events published from other threads reach the subscriber's event loop
+3. Subscribers that fall behind are overflowed and closed subscribers get nothing
+4. Task mutations through the orchestrators publish the corresponding events
+5. Changes notified by other processes are published, and missed ones overflow
+
+Requirements: 2.3, 9.1
+"""
+
+import asyncio
+import tempfile
+import threading
+from datetime import datetime, timezone
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from task_manager.data.access.filesystem_store import FilesystemStore
+from task_manager.data.access.postgresql_listener import ChangeNotification
+from task_manager.models.entities import Dependency, ExitCriteria, Project, TaskList
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+from task_manager.orchestration.event_bus import (
+    TASK_CREATED,
+    TASK_DELETED,
+    TASK_NOTE_ADDED,
+    TASK_STATUS_CHANGED,
+    TASK_UPDATED,
+    EventBus,
+    TaskEvent,
+    publish_remote_change,
+    publish_task_event,
+)
+from task_manager.orchestration.tag_orchestrator import TagOrchestrator
+from task_manager.orchestration.task_orchestrator import TaskOrchestrator
+
+
+def _event(task_list_id=None, project_id=None):
+    return TaskEvent(
+        type=TASK_UPDATED,
+        task_id=uuid4(),
+        task_list_id=task_list_id or uuid4(),
+        project_id=project_id,
+    )
+
+
+async def _drain(subscription):
+    """Collect the events queued on a subscription."""
+    events = []
+    while (event := await subscription.get(timeout=0.05)) is not None:
+        events.append(event)
+    return events
+
+
+class TestEventBus:
+    """Test publishing and subscribing."""
+
+    async def test_filters_by_project_and_task_list(self):
+        """Test that each subscriber receives only the events matching its filters."""
+        bus = EventBus()
+        project_id, task_list_id = uuid4(), uuid4()
+        everything = bus.subscribe()
+        by_project = bus.subscribe(project_id=project_id)
+        by_task_list = bus.subscribe(task_list_id=task_list_id)
+
+        in_list = _event(task_list_id, project_id)
+        in_project = _event(project_id=project_id)
+        elsewhere = _event(project_id=uuid4())
+        for event in (in_list, in_project, elsewhere):
+            bus.publish(event)
+
+        assert await _drain(everything) == [in_list, in_project, elsewhere]
+        assert await _drain(by_project) == [in_list, in_project]
+        assert await _drain(by_task_list) == [in_list]
+        assert [e.sequence for e in (in_list, in_project, elsewhere)] == [1, 2, 3]
+
+    async def test_publish_from_other_thread(self):
+        """Test that events published on a worker thread wake up the subscriber."""
+        bus = EventBus()
+        subscription = bus.subscribe()
+        event = _event()
+
+        threading.Timer(0.05, bus.publish, [event]).start()
+
+        assert await subscription.get(timeout=5) is event
+
+    async def test_get_times_out(self):
+        """Test that get() returns None when no event arrives in time."""
+        subscription = EventBus().subscribe()
+
+        assert await subscription.get(timeout=0.01) is None
+
+    async def test_overflow(self):
+        """Test that a full queue marks the subscription overflowed and drops events."""
+        bus = EventBus()
+        subscription = bus.subscribe(max_pending=2)
+
+        for _ in range(3):
+            bus.publish(_event())
+        await asyncio.sleep(0)
+
+        assert subscription.overflowed is True
+        assert len(await _drain(subscription)) == 2
+
+    async def test_close_unsubscribes(self):
+        """Test that closed subscriptions receive no further events."""
+        bus = EventBus()
+        subscription = bus.subscribe()
+        assert bus.has_subscribers is True
+
+        subscription.close()
+        bus.publish(_event())
+
+        assert bus.has_subscribers is False
+        assert await _drain(subscription) == []
+
+    async def test_rejects_invalid_queue_size(self):
+        """Test that a queue size below 1 raises ValueError."""
+        with pytest.raises(ValueError, match="at least 1"):
+            EventBus().subscribe(max_pending=0)
+
+    def test_publish_task_event_without_subscribers(self):
+        """Test that nothing is looked up or published while nobody listens."""
+        data_store = Mock()
+        task = Mock()
+
+        publish_task_event(None, data_store, TASK_UPDATED, task)
+        publish_task_event(EventBus(), data_store, TASK_UPDATED, task)
+
+        data_store.get_task_list.assert_not_called()
+
+
+@pytest.fixture
+def store():
+    """Create a filesystem store with one task list."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = FilesystemStore(tmpdir)
+        store.initialize()
+        now = datetime.now(timezone.utc)
+        project = store.create_project(
+            Project(id=uuid4(), name="Events", is_default=False, created_at=now, updated_at=now)
+        )
+        store.create_task_list(
+            TaskList(id=uuid4(), name="List", project_id=project.id, created_at=now, updated_at=now)
+        )
+        yield store
+
+
+class TestOrchestratorEvents:
+    """Test that orchestrator mutations publish events."""
+
+    async def test_task_lifecycle(self, store):
+        """Test the events of creating, changing and deleting a task."""
+        task_list = store.list_task_lists()[0]
+        bus = EventBus()
+        subscription = bus.subscribe(project_id=task_list.project_id)
+        orchestrator = TaskOrchestrator(store, bus)
+        tags = TagOrchestrator(store, bus)
+
+        task = orchestrator.create_task(
+            task_list.id,
+            "Task",
+            "Description",
+            Status.NOT_STARTED,
+            [],
+            [ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+            Priority.MEDIUM,
+            [],
+        )
+        orchestrator.add_note(task.id, "Note")
+        orchestrator.update_status(task.id, Status.IN_PROGRESS)
+        orchestrator.update_task(task.id, title="Renamed")
+        tags.add_tags(task.id, ["backend"])
+        orchestrator.delete_task(task.id)
+
+        events = await _drain(subscription)
+        assert [e.type for e in events] == [
+            TASK_CREATED,
+            TASK_NOTE_ADDED,
+            TASK_STATUS_CHANGED,
+            TASK_UPDATED,
+            TASK_UPDATED,
+            TASK_DELETED,
+        ]
+        assert all(e.task_id == task.id and e.task_list_id == task_list.id for e in events)
+        assert events[2].task.status == Status.IN_PROGRESS
+        assert events[4].task.tags == ["backend"]
+        assert events[5].task is None
+
+    async def test_delete_publishes_dependent_updates(self, store):
+        """Test that dependents losing a dependency are published as updated."""
+        task_list = store.list_task_lists()[0]
+        bus = EventBus()
+        orchestrator = TaskOrchestrator(store, bus)
+        dependency, dependent = [
+            orchestrator.create_task(
+                task_list.id,
+                title,
+                "Description",
+                Status.NOT_STARTED,
+                [],
+                [ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+                Priority.MEDIUM,
+                [],
+            )
+            for title in ("Dependency", "Dependent")
+        ]
+        orchestrator.update_dependencies(
+            dependent.id, [Dependency(task_id=dependency.id, task_list_id=task_list.id)]
+        )
+        subscription = bus.subscribe(task_list_id=task_list.id)
+
+        orchestrator.delete_task(dependency.id)
+
+        events = await _drain(subscription)
+        assert [(e.type, e.task_id) for e in events] == [
+            (TASK_UPDATED, dependent.id),
+            (TASK_DELETED, dependency.id),
+        ]
+        assert events[0].task.dependencies == []
+
+
+def _notification(entity_id, operation, entity="task", task_list_id=None):
+    return ChangeNotification(
+        entity=entity,
+        operation=operation,
+        entity_id=entity_id,
+        task_list_id=task_list_id,
+        origin="other",
+    )
+
+
+class TestRemoteChanges:
+    """Test publishing changes notified by other processes."""
+
+    async def test_created_and_deleted(self, store):
+        """Test that created tasks are reloaded and deletions use the notified task list."""
+        task_list = store.list_task_lists()[0]
+        task = TaskOrchestrator(store).create_task(
+            task_list.id,
+            "Task",
+            "Description",
+            Status.NOT_STARTED,
+            [],
+            [ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+            Priority.MEDIUM,
+            [],
+        )
+        bus = EventBus()
+        subscription = bus.subscribe(project_id=task_list.project_id)
+
+        publish_remote_change(bus, store, _notification(task.id, "created"))
+        publish_remote_change(
+            bus, store, _notification(task.id, "deleted", task_list_id=task_list.id)
+        )
+        publish_remote_change(bus, store, _notification(uuid4(), "updated"))
+        publish_remote_change(bus, store, _notification(task_list.id, "updated", "task_list"))
+
+        events = await _drain(subscription)
+        assert [(e.type, e.task_id) for e in events] == [
+            (TASK_CREATED, task.id),
+            (TASK_DELETED, task.id),
+        ]
+        assert events[0].task.title == "Task"
+        assert events[1].task is None
+        assert all(e.project_id == task_list.project_id for e in events)
+
+    async def test_missed_changes_overflow_subscribers(self):
+        """Test that a None notification overflows and wakes every subscriber."""
+        bus = EventBus()
+        subscription = bus.subscribe()
+        waiting = asyncio.ensure_future(subscription.get(timeout=5))
+        await asyncio.sleep(0)
+
+        threading.Thread(target=publish_remote_change, args=(bus, Mock(), None)).start()
+
+        assert await waiting is None
+        assert subscription.overflowed is True
@@ -0,0 +1,215 @@
+"""Unit tests for the filesystem store's entity cache.
+
+This module tests that:
+1. Repeated reads are served from the cache and counted as hits
+2. Writes go through the cache and deletes invalidate it
+3. Files changed outside the store are re-read
+4. Returned entities are copies that can be mutated safely
+5. The cache evicts least recently used entries when full
+
+Requirements: 1.2, 1.5
+"""
+
+import json
+import tempfile
+from datetime import datetime
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from task_manager.data.access.entity_cache import EntityCache, file_signature
+from task_manager.data.access.filesystem_store import FilesystemStore
+from task_manager.models.entities import ExitCriteria, Note, Project, Task, TaskList
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+
+
+def _make_task(task_list_id, title="Task"):
+    return Task(
+        id=uuid4(),
+        task_list_id=task_list_id,
+        title=title,
+        description="Description",
+        status=Status.NOT_STARTED,
+        dependencies=[],
+        exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+        priority=Priority.MEDIUM,
+        notes=[],
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        tags=["cached"],
+    )
+
+
+@pytest.fixture
+def store():
+    """Create an initialized filesystem store in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = FilesystemStore(tmpdir)
+        store.initialize()
+        yield store
+
+
+@pytest.fixture
+def task_list(store):
+    """Create a task list in a new project."""
+    project = store.create_project(
+        Project(
+            id=uuid4(),
+            name="Cached Project",
+            is_default=False,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+    return store.create_task_list(
+        TaskList(
+            id=uuid4(),
+            name="Cached List",
+            project_id=project.id,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+
+
+class TestFilesystemStoreCache:
+    """Test the entity cache as used by FilesystemStore."""
+
+    def test_written_entity_is_served_from_cache(self, store, task_list):
+        """Test that a read after a write does not open the file."""
+        task = store.create_task(_make_task(task_list.id))
+        hits_before = store.cache_stats()["hits"]
+
+        with patch.object(store, "_read_json", wraps=store._read_json) as read_json:
+            result = store.get_task(task.id)
+
+        assert result == task
+        assert read_json.call_count == 0
+        assert store.cache_stats()["hits"] == hits_before + 1
+
+    def test_cold_read_is_a_miss_then_a_hit(self, store, task_list):
+        """Test that the first read misses and populates the cache."""
+        task = store.create_task(_make_task(task_list.id))
+        store.cache.clear()
+        stats_before = store.cache_stats()
+
+        store.get_task(task.id)
+        store.get_task(task.id)
+
+        stats = store.cache_stats()
+        assert stats["misses"] == stats_before["misses"] + 1
+        assert stats["hits"] == stats_before["hits"] + 1
+
+    def test_returned_entities_are_independent_copies(self, store, task_list):
+        """Test that mutating a returned task does not change the cached one."""
+        task = store.create_task(_make_task(task_list.id))
+
+        first = store.get_task(task.id)
+        first.title = "Changed"
+        first.tags.append("extra")
+        first.notes.append(Note(content="Unsaved", timestamp=datetime.now()))
+        first.exit_criteria[0].status = ExitCriteriaStatus.COMPLETE
+
+        second = store.get_task(task.id)
+        assert second.title == "Task"
+        assert second.tags == ["cached"]
+        assert second.notes == []
+        assert second.exit_criteria[0].status == ExitCriteriaStatus.INCOMPLETE
+
+    def test_update_is_written_through(self, store, task_list):
+        """Test that an update replaces the cached entity."""
+        task = store.create_task(_make_task(task_list.id))
+
+        task.title = "Updated"
+        store.update_task(task)
+
+        assert store.get_task(task.id).title == "Updated"
+
+    def test_delete_invalidates_cache(self, store, task_list):
+        """Test that a deleted task is no longer returned."""
+        task = store.create_task(_make_task(task_list.id))
+        store.delete_task(task.id)
+
+        assert store.get_task(task.id) is None
+
+    def test_external_replacement_is_detected(self, store, task_list):
+        """Test that a file rewritten by another store instance is re-read."""
+        task = store.create_task(_make_task(task_list.id))
+        store.get_task(task.id)
+
+        other = FilesystemStore(str(store.base_path))
+        other.initialize()
+        changed = other.get_task(task.id)
+        changed.title = "Changed elsewhere"
+        other.update_task(changed)
+
+        assert store.get_task(task.id).title == "Changed elsewhere"
+
+    def test_external_in_place_edit_is_detected(self, store, task_list):
+        """Test that a file edited in place is re-read."""
+        task = store.create_task(_make_task(task_list.id))
+        store.get_task(task.id)
+
+        file_path = store.tasks_dir / f"{task.id}.json"
+        data = json.loads(file_path.read_text())
+        data["title"] = "Edited in place with a longer title"
+        file_path.write_text(json.dumps(data))
+
+        assert store.get_task(task.id).title == "Edited in place with a longer title"
+
+    def test_cache_can_be_disabled(self):
+        """Test that a cache size of 0 stores nothing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = FilesystemStore(tmpdir, cache_size=0)
+            store.initialize()
+            chore = next(p for p in store.list_projects() if p.name == "Chore")
+            task_list = store.create_task_list(
+                TaskList(
+                    id=uuid4(),
+                    name="Uncached List",
+                    project_id=chore.id,
+                    created_at=datetime.now(),
+                    updated_at=datetime.now(),
+                )
+            )
+            task = store.create_task(_make_task(task_list.id))
+
+            assert store.get_task(task.id) == task
+            assert store.cache_stats()["size"] == 0
+
+
+class TestEntityCache:
+    """Test the EntityCache class directly."""
+
+    def test_negative_size_rejected(self):
+        """Test that a negative cache size raises ValueError."""
+        with pytest.raises(ValueError):
+            EntityCache(-1)
+
+    def test_signature_mismatch_is_a_miss(self):
+        """Test that a changed signature drops the entry."""
+        cache = EntityCache(10)
+        cache.put("a", (1, 1, 1), "value")
+
+        assert cache.get("a", (1, 2, 1)) is None
+        assert len(cache) == 0
+        assert cache.get("a", (1, 1, 1)) is None
+        assert cache.misses == 2
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = EntityCache(2)
+        cache.put("a", (1, 1, 1), "A")
+        cache.put("b", (2, 1, 1), "B")
+        cache.get("a", (1, 1, 1))
+        cache.put("c", (3, 1, 1), "C")
+
+        assert cache.get("b", (2, 1, 1)) is None
+        assert cache.get("a", (1, 1, 1)) == "A"
+        assert cache.get("c", (3, 1, 1)) == "C"
+        assert cache.stats()["evictions"] == 1
+
+    def test_file_signature_of_missing_file(self, tmp_path):
+        """Test that a missing file has no signature."""
+        assert file_signature(tmp_path / "missing.json") is None
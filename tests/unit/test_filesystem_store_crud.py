@@ -633,6 +633,52 @@ class TestTaskCRUD:
             file_path = store.tasks_dir / f"{task.id}.json"
             assert file_path.exists()
 
+    def test_create_tasks(self):
+        """Test creating several tasks that depend on each other."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = FilesystemStore(tmpdir)
+            store.initialize()
+
+            task_list = TaskList(
+                id=uuid4(),
+                name="Task List",
+                project_id=store.list_projects()[0].id,
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+            )
+            store.create_task_list(task_list)
+
+            tasks = []
+            for i in range(3):
+                dependencies = []
+                if tasks:
+                    dependencies = [Dependency(task_id=tasks[-1].id, task_list_id=task_list.id)]
+                tasks.append(
+                    Task(
+                        id=uuid4(),
+                        task_list_id=task_list.id,
+                        title=f"Task {i}",
+                        description="Description",
+                        status=Status.NOT_STARTED,
+                        dependencies=dependencies,
+                        exit_criteria=[
+                            ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)
+                        ],
+                        priority=Priority.MEDIUM,
+                        notes=[],
+                        created_at=datetime.now(),
+                        updated_at=datetime.now(),
+                    )
+                )
+
+            result = store.create_tasks(tasks)
+
+            assert [task.id for task in result] == [task.id for task in tasks]
+            assert {task.id for task in store.list_tasks(task_list.id)} == {
+                task.id for task in tasks
+            }
+            assert [task.id for task in store.get_dependents(tasks[0].id)] == [tasks[1].id]
+
     def test_create_task_with_nonexistent_task_list_raises_error(self):
         """Test creating a task with nonexistent task list raises error."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -826,6 +872,50 @@ class TestTaskCRUD:
 
             assert len(result) == 2
 
+    def test_iter_tasks_matches_list_tasks(self):
+        """Test that iterating tasks yields the tasks of list_tasks, per list and overall."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = FilesystemStore(tmpdir)
+            store.initialize()
+            project = store.list_projects()[0]
+
+            task_lists = []
+            for i in range(2):
+                task_list = TaskList(
+                    id=uuid4(),
+                    name=f"Task List {i}",
+                    project_id=project.id,
+                    created_at=datetime.now(),
+                    updated_at=datetime.now(),
+                )
+                task_lists.append(store.create_task_list(task_list))
+                for j in range(3):
+                    store.create_task(
+                        Task(
+                            id=uuid4(),
+                            task_list_id=task_list.id,
+                            title=f"Task {i}.{j}",
+                            description="Description",
+                            status=Status.NOT_STARTED,
+                            dependencies=[],
+                            exit_criteria=[
+                                ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)
+                            ],
+                            priority=Priority.MEDIUM,
+                            notes=[],
+                            created_at=datetime.now(),
+                            updated_at=datetime.now(),
+                        )
+                    )
+
+            all_tasks = store.iter_tasks()
+
+            assert not isinstance(all_tasks, list)
+            assert sorted(t.title for t in all_tasks) == sorted(t.title for t in store.list_tasks())
+            assert [t.id for t in store.iter_tasks(task_lists[1].id)] == [
+                t.id for t in store.list_tasks(task_lists[1].id)
+            ]
+
     def test_list_tasks_by_task_list(self):
         """Test listing tasks filtered by task list."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -1392,3 +1482,146 @@ class TestErrorHandling:
             tasks = store.list_tasks()
 
             assert len(tasks) == 0
+
+
+class TestBatchRollback:
+    """Test that failed batched writes leave every task unchanged."""
+
+    def _create_store(self, tmpdir):
+        """Create a store with two tasks, the second depending on the first."""
+        store = FilesystemStore(tmpdir)
+        store.initialize()
+
+        task_list = TaskList(
+            id=uuid4(),
+            name="Task List",
+            project_id=store.list_projects()[0].id,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+        store.create_task_list(task_list)
+
+        tasks = []
+        for i in range(2):
+            dependencies = []
+            if tasks:
+                dependencies = [Dependency(task_id=tasks[-1].id, task_list_id=task_list.id)]
+            tasks.append(
+                Task(
+                    id=uuid4(),
+                    task_list_id=task_list.id,
+                    title=f"Task {i}",
+                    description="Description",
+                    status=Status.NOT_STARTED,
+                    dependencies=dependencies,
+                    exit_criteria=[
+                        ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)
+                    ],
+                    priority=Priority.MEDIUM,
+                    notes=[],
+                    created_at=datetime.now(),
+                    updated_at=datetime.now(),
+                )
+            )
+        store.create_tasks(tasks)
+        return store, tasks
+
+    def _fail_on_write(self, store, monkeypatch, write_number):
+        """Make the write_number-th file write of the store fail."""
+        write_json_atomic = store._write_json_atomic
+        writes = []
+
+        def failing_write(file_path, data):
+            writes.append(file_path)
+            if len(writes) == write_number:
+                raise FilesystemStoreError(f"Failed to write file {file_path}")
+            return write_json_atomic(file_path, data)
+
+        monkeypatch.setattr(store, "_write_json_atomic", failing_write)
+
+    def test_update_tasks(self):
+        """Test updating several tasks together."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store, tasks = self._create_store(tmpdir)
+            for task in tasks:
+                task.title = f"Updated {task.title}"
+
+            store.update_tasks(tasks)
+
+            assert [store.get_task(task.id).title for task in tasks] == [
+                "Updated Task 0",
+                "Updated Task 1",
+            ]
+
+    def test_update_tasks_with_nonexistent_task_writes_nothing(self):
+        """Test that no task is updated if one of them does not exist."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store, tasks = self._create_store(tmpdir)
+            tasks[0].title = "Updated"
+            missing = Task(**{**tasks[1].__dict__, "id": uuid4()})
+
+            with pytest.raises(ValueError, match="does not exist"):
+                store.update_tasks([tasks[0], missing])
+
+            assert store.get_task(tasks[0].id).title == "Task 0"
+
+    def test_update_tasks_restores_written_tasks_on_failure(self, monkeypatch):
+        """Test that tasks written before a failed write are restored."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store, tasks = self._create_store(tmpdir)
+            for task in tasks:
+                task.title = f"Updated {task.title}"
+            tasks[1].dependencies = []
+            self._fail_on_write(store, monkeypatch, write_number=2)
+
+            with pytest.raises(FilesystemStoreError):
+                store.update_tasks(tasks)
+
+            assert [store.get_task(task.id).title for task in tasks] == ["Task 0", "Task 1"]
+            assert [task.id for task in store.get_dependents(tasks[0].id)] == [tasks[1].id]
+
+    def test_delete_tasks_updates_dependents(self):
+        """Test that deleting tasks removes them from the remaining tasks' dependencies."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store, tasks = self._create_store(tmpdir)
+
+            store.delete_tasks([tasks[0].id, tasks[0].id])
+
+            assert store.get_task(tasks[0].id) is None
+            assert store.get_task(tasks[1].id).dependencies == []
+            assert store.get_dependents(tasks[0].id) == []
+
+    def test_delete_tasks_with_nonexistent_task_deletes_nothing(self):
+        """Test that no task is deleted if one of them does not exist."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store, tasks = self._create_store(tmpdir)
+
+            with pytest.raises(ValueError, match="does not exist"):
+                store.delete_tasks([tasks[0].id, uuid4()])
+
+            assert store.get_task(tasks[0].id) is not None
+
+    def test_delete_tasks_restores_tasks_on_failure(self, monkeypatch):
+        """Test that a failed delete restores the deleted tasks and their dependents."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store, tasks = self._create_store(tmpdir)
+            delete_entity_file = store._delete_entity_file
+            deletes = []
+
+            def failing_delete(file_path, entity_name):
+                deletes.append(file_path)
+                if len(deletes) == 2:
+                    raise FilesystemStoreError("Failed to delete task file")
+                delete_entity_file(file_path, entity_name)
+
+            monkeypatch.setattr(store, "_delete_entity_file", failing_delete)
+            extra = Task(**{**tasks[0].__dict__, "id": uuid4(), "dependencies": []})
+            store.create_task(extra)
+
+            with pytest.raises(FilesystemStoreError):
+                store.delete_tasks([tasks[0].id, extra.id])
+
+            assert store.get_task(tasks[0].id) is not None
+            assert store.get_task(extra.id) is not None
+            assert store.get_task(tasks[1].id).dependencies == tasks[1].dependencies
+            assert [task.id for task in store.get_dependents(tasks[0].id)] == [tasks[1].id]
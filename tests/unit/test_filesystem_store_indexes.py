@@ -0,0 +1,436 @@
+"""Unit tests for the filesystem store's in-memory secondary indexes.
+
+This module tests that:
+1. Indexes are built from existing files at initialize()
+2. create/update/delete operations keep the indexes current
+3. Scoped reads only open the files of the matching entities
+4. Writes made by another store instance on the same directory are picked up
+5. Search counts are answered from index postings
+6. Dependents are resolved through the dependency index
+
+Requirements: 1.2, 1.5
+"""
+
+import os
+import tempfile
+from datetime import datetime
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from task_manager.data.access.filesystem_store import FilesystemStore
+from task_manager.models.entities import (
+    Dependency,
+    ExitCriteria,
+    Project,
+    SearchCriteria,
+    Task,
+    TaskList,
+)
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+
+
+def _make_task_list(project_id, name="Task List"):
+    return TaskList(
+        id=uuid4(),
+        name=name,
+        project_id=project_id,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+
+def _make_task(
+    task_list_id, title="Task", status=Status.NOT_STARTED, tags=None, priority=Priority.MEDIUM
+):
+    return Task(
+        id=uuid4(),
+        task_list_id=task_list_id,
+        title=title,
+        description="Description",
+        status=status,
+        dependencies=[],
+        exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+        priority=priority,
+        notes=[],
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        tags=tags or [],
+    )
+
+
+@pytest.fixture
+def store():
+    """Create an initialized filesystem store in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = FilesystemStore(tmpdir)
+        store.initialize()
+        yield store
+
+
+@pytest.fixture
+def project(store):
+    """Create a non-default project."""
+    project = Project(
+        id=uuid4(),
+        name="Indexed Project",
+        is_default=False,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+    return store.create_project(project)
+
+
+class TestIndexMaintenance:
+    """Test that mutations keep the indexes current."""
+
+    def test_create_task_updates_postings(self, store, project):
+        """Test that creating a task adds task list, status and tag postings."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        task = store.create_task(_make_task(task_list.id, tags=["backend", "urgent"]))
+
+        assert store.index.task_list_ids_for_project(project.id) == {task_list.id}
+        assert store.index.task_ids_for_task_list(task_list.id) == {task.id}
+        assert store.index.task_ids_for_statuses([Status.NOT_STARTED]) == {task.id}
+        assert store.index.task_ids_for_tags(["urgent"]) == {task.id}
+
+    def test_update_task_moves_postings(self, store, project):
+        """Test that updating status and tags replaces the old postings."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        task = store.create_task(_make_task(task_list.id, tags=["old"]))
+
+        task.status = Status.COMPLETED
+        task.tags = ["new"]
+        store.update_task(task)
+
+        assert store.index.task_ids_for_statuses([Status.NOT_STARTED]) == set()
+        assert store.index.task_ids_for_statuses([Status.COMPLETED]) == {task.id}
+        assert store.index.task_ids_for_tags(["old"]) == set()
+        assert "old" not in store.index.task_ids_by_tag
+        assert store.index.task_ids_for_tags(["new"]) == {task.id}
+
+    def test_delete_task_list_removes_postings(self, store, project):
+        """Test that deleting a task list drops it and its tasks from the index."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        task = store.create_task(_make_task(task_list.id, tags=["x"]))
+
+        store.delete_task_list(task_list.id)
+
+        assert store.index.task_list_ids_for_project(project.id) == set()
+        assert not store.index.has_task(task.id)
+        assert store.index.task_ids_for_tags(["x"]) == set()
+
+    def test_update_task_list_moves_project_posting(self, store, project):
+        """Test that moving a task list to another project updates the project posting."""
+        chore = next(p for p in store.list_projects() if p.name == "Chore")
+        task_list = store.create_task_list(_make_task_list(project.id))
+
+        task_list.project_id = chore.id
+        store.update_task_list(task_list)
+
+        assert task_list.id not in store.index.task_list_ids_for_project(project.id)
+        assert [tl.id for tl in store.list_task_lists(chore.id)] == [task_list.id]
+
+
+class TestScopedReads:
+    """Test that scoped reads resolve through the index."""
+
+    def test_list_tasks_by_task_list_reads_only_matching_files(self, store, project):
+        """Test that listing one task list does not open other task files."""
+        task_list1 = store.create_task_list(_make_task_list(project.id, "List 1"))
+        task_list2 = store.create_task_list(_make_task_list(project.id, "List 2"))
+        task = store.create_task(_make_task(task_list1.id))
+        for i in range(5):
+            store.create_task(_make_task(task_list2.id, title=f"Other {i}"))
+
+        store.cache.clear()
+        with patch.object(store, "_read_json", wraps=store._read_json) as read_json:
+            result = store.list_tasks(task_list1.id)
+
+        assert [t.id for t in result] == [task.id]
+        assert read_json.call_count == 1
+
+    def test_ready_tasks_read_only_ready_files(self, store, project):
+        """Test that get_ready_tasks opens only the files of ready tasks."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        dependency = store.create_task(_make_task(task_list.id, title="Dependency"))
+        blocked = []
+        for i in range(5):
+            task = _make_task(task_list.id, title=f"Blocked {i}")
+            task.dependencies = [Dependency(task_id=dependency.id, task_list_id=task_list.id)]
+            blocked.append(store.create_task(task))
+
+        store.cache.clear()
+        with patch.object(store, "_read_json", wraps=store._read_json) as read_json:
+            result = store.get_ready_tasks("task_list", task_list.id, [Status.NOT_STARTED])
+
+        assert [t.id for t in result] == [dependency.id]
+        # The task list file, checked for existence, and the ready task's file
+        assert read_json.call_count == 2
+
+        dependency.status = Status.COMPLETED
+        store.update_task(dependency)
+
+        ready = store.get_ready_tasks("project", project.id, [Status.NOT_STARTED])
+        assert {t.id for t in ready} == {t.id for t in blocked}
+
+    def test_list_task_lists_by_project(self, store, project):
+        """Test that listing task lists by project returns only that project's lists."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        chore = next(p for p in store.list_projects() if p.name == "Chore")
+        store.create_task_list(_make_task_list(chore.id, "Chore List"))
+
+        result = store.list_task_lists(project.id)
+
+        assert [tl.id for tl in result] == [task_list.id]
+
+
+class TestIndexRebuild:
+    """Test that the index is rebuilt from files when needed."""
+
+    def test_initialize_builds_index_from_existing_files(self, store, project):
+        """Test that a fresh store over existing files indexes them at initialize()."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        task = store.create_task(_make_task(task_list.id, tags=["persisted"]))
+
+        reopened = FilesystemStore(str(store.base_path))
+        reopened.initialize()
+
+        assert reopened.index.task_ids_for_task_list(task_list.id) == {task.id}
+        assert reopened.index.task_ids_for_tags(["persisted"]) == {task.id}
+
+    def test_writes_from_another_instance_are_visible(self, store, project):
+        """Test that files written by another process invalidate the index."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        store.list_tasks(task_list.id)
+
+        other = FilesystemStore(str(store.base_path))
+        other.initialize()
+        task = other.create_task(_make_task(task_list.id))
+
+        assert [t.id for t in store.list_tasks(task_list.id)] == [task.id]
+
+        other.delete_task(task.id)
+
+        assert store.list_tasks(task_list.id) == []
+
+    def test_in_progress_temp_files_are_ignored(self, store, project):
+        """Test that half-written temp files of atomic writes are not read as entities."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        (store.tasks_dir / ".tmp_partial.json").write_text('{"id": ')
+        (store.projects_dir / ".tmp_partial.json").write_text('{"id": ')
+
+        reopened = FilesystemStore(str(store.base_path))
+        reopened.initialize()
+
+        assert reopened.list_tasks(task_list.id) == []
+        assert len(reopened.list_projects()) == 3
+
+    @staticmethod
+    def _touch(directory):
+        """Move a directory's mtime forward, as a write in a later clock tick would."""
+        mtime = directory.stat().st_mtime_ns + 1_000_000_000
+        os.utime(directory, ns=(mtime, mtime))
+
+    def test_write_during_rebuild_is_picked_up(self, store, project):
+        """Test that a file written by another process while the index is rebuilt is seen."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        other = FilesystemStore(str(store.base_path))
+        other.initialize()
+        first = other.create_task(_make_task(task_list.id, title="First"))
+
+        read_entity = store._read_entity
+        written = []
+
+        def read_and_write_concurrently(file_path, deserialize):
+            if not written:
+                written.append(other.create_task(_make_task(task_list.id, title="Second")))
+                self._touch(store.tasks_dir)
+            return read_entity(file_path, deserialize)
+
+        with patch.object(store, "_read_entity", side_effect=read_and_write_concurrently):
+            store._sync_task_index()
+
+        assert {t.id for t in store.list_tasks(task_list.id)} == {first.id, written[0].id}
+
+    def test_write_before_own_write_is_picked_up(self, store, project):
+        """Test that our own write does not mark another process's earlier write as indexed."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        store.list_tasks(task_list.id)
+        other = FilesystemStore(str(store.base_path))
+        other.initialize()
+
+        sync_task_index = store._sync_task_index
+        written = []
+
+        def sync_then_write_concurrently():
+            sync_task_index()
+            written.append(other.create_task(_make_task(task_list.id, title="Other")))
+            self._touch(store.tasks_dir)
+
+        with patch.object(store, "_sync_task_index", side_effect=sync_then_write_concurrently):
+            own = store.create_task(_make_task(task_list.id, title="Own"))
+
+        assert {t.id for t in store.list_tasks(task_list.id)} == {own.id, written[0].id}
+
+
+class TestDependentsIndex:
+    """Test that dependents are resolved through the dependency index."""
+
+    def test_postings_follow_dependency_changes(self, store, project):
+        """Test that adding and removing a dependency updates the dependents posting."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        dependency = store.create_task(_make_task(task_list.id, title="Dependency"))
+        dependent = store.create_task(_make_task(task_list.id, title="Dependent"))
+
+        dependent.dependencies = [Dependency(task_id=dependency.id, task_list_id=task_list.id)]
+        store.update_task(dependent)
+
+        assert store.index.dependent_task_ids(dependency.id) == {dependent.id}
+        assert [t.id for t in store.get_dependents(dependency.id)] == [dependent.id]
+
+        dependent.dependencies = []
+        store.update_task(dependent)
+
+        assert store.index.dependent_task_ids(dependency.id) == set()
+
+    def test_delete_task_reads_only_dependents(self, store, project):
+        """Test that deleting a task opens its dependents' files, not every task file."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        dependency = store.create_task(_make_task(task_list.id, title="Dependency"))
+        dependent = _make_task(task_list.id, title="Dependent")
+        dependent.dependencies = [Dependency(task_id=dependency.id, task_list_id=task_list.id)]
+        store.create_task(dependent)
+        for i in range(5):
+            store.create_task(_make_task(task_list.id, title=f"Other {i}"))
+
+        store.cache.clear()
+        with patch.object(store, "_read_json", wraps=store._read_json) as read_json:
+            store.delete_task(dependency.id)
+
+        assert read_json.call_count == 2
+        assert store.get_task(dependent.id).dependencies == []
+        assert store.index.dependent_task_ids(dependency.id) == set()
+
+
+class TestCountTasks:
+    """Test that search counts are resolved through the index."""
+
+    def test_count_intersects_postings_without_reading_files(self, store, project):
+        """Test that counts without a text query do not open any task file."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        store.create_task(_make_task(task_list.id, tags=["api"], priority=Priority.HIGH))
+        store.create_task(_make_task(task_list.id, tags=["api"]))
+        store.create_task(_make_task(task_list.id, tags=["ui"], priority=Priority.HIGH))
+        store.create_task(_make_task(task_list.id, status=Status.COMPLETED, tags=["api"]))
+
+        store.cache.clear()
+        with patch.object(store, "_read_json", wraps=store._read_json) as read_json:
+            count = store.count_tasks(
+                SearchCriteria(
+                    status=[Status.NOT_STARTED],
+                    tags=["api"],
+                    priority=[Priority.HIGH, Priority.MEDIUM],
+                    project_id=project.id,
+                )
+            )
+
+        assert count == 2
+        assert read_json.call_count == 0
+
+    def test_count_with_text_query_reads_only_candidates(self, store, project):
+        """Test that a text query only reads the tasks left after index filtering."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        store.create_task(_make_task(task_list.id, title="Deploy API", tags=["api"]))
+        store.create_task(_make_task(task_list.id, title="Deploy UI", tags=["ui"]))
+        store.create_task(_make_task(task_list.id, title="Other", tags=["api"]))
+
+        store.cache.clear()
+        with patch.object(store, "_read_json", wraps=store._read_json) as read_json:
+            count = store.count_tasks(SearchCriteria(query="deploy", tags=["api"]))
+
+        assert count == 1
+        assert read_json.call_count == 2
+
+    def test_count_unknown_project_name(self, store, project):
+        """Test that an unknown project name matches nothing."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        store.create_task(_make_task(task_list.id))
+
+        assert store.count_tasks(SearchCriteria(project_name="Missing")) == 0
+        assert store.count_tasks(SearchCriteria(project_name="Indexed Project")) == 1
+
+    def test_priority_postings_follow_updates(self, store, project):
+        """Test that updating a task's priority moves its priority posting."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        task = store.create_task(_make_task(task_list.id))
+
+        task.priority = Priority.CRITICAL
+        store.update_task(task)
+
+        assert store.index.task_ids_for_priorities([Priority.MEDIUM]) == set()
+        assert store.index.task_ids_for_priorities([Priority.CRITICAL]) == {task.id}
+
+
+class TestTasksVersion:
+    """Test that task collection versions come from the index generation."""
+
+    def test_version_is_read_without_reading_files(self, store, project):
+        """Test that get_tasks_version does not open any task file."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        for i in range(3):
+            store.create_task(_make_task(task_list.id, title=f"Task {i}"))
+
+        store.cache.clear()
+        with patch.object(store, "_read_json", wraps=store._read_json) as read_json:
+            store.get_tasks_version(task_list.id)
+            store.get_tasks_version()
+
+        assert read_json.call_count == 0
+
+    def test_version_is_scoped_to_task_list(self, store, project):
+        """Test that changing one task list's tasks leaves the other's version alone."""
+        task_list1 = store.create_task_list(_make_task_list(project.id, "List 1"))
+        task_list2 = store.create_task_list(_make_task_list(project.id, "List 2"))
+        store.create_task(_make_task(task_list2.id))
+        version1 = store.get_tasks_version(task_list1.id)
+        version2 = store.get_tasks_version(task_list2.id)
+        overall = store.get_tasks_version()
+
+        store.create_task(_make_task(task_list1.id))
+
+        assert store.get_tasks_version(task_list1.id) != version1
+        assert store.get_tasks_version(task_list2.id) == version2
+        assert store.get_tasks_version() != overall
+
+    def test_writes_from_another_instance_change_version(self, store, project):
+        """Test that tasks written by another process change the version."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        task = store.create_task(_make_task(task_list.id))
+        version = store.get_tasks_version(task_list.id)
+
+        other = FilesystemStore(str(store.base_path))
+        other.initialize()
+        task.title = "Renamed elsewhere"
+        other.update_task(task)
+        # Make sure the directory mtime differs from the indexed one
+        TestIndexRebuild._touch(store.tasks_dir)
+
+        assert store.get_tasks_version(task_list.id) != version
+
+    def test_rebuild_does_not_reissue_versions(self, store, project):
+        """Test that rebuilding the index after a delete elsewhere yields a new version."""
+        task_list = store.create_task_list(_make_task_list(project.id))
+        first = store.create_task(_make_task(task_list.id))
+        before = store.get_tasks_version(task_list.id)
+        second = store.create_task(_make_task(task_list.id))
+        issued = {before, store.get_tasks_version(task_list.id)}
+
+        other = FilesystemStore(str(store.base_path))
+        other.initialize()
+        other.delete_task(second.id)
+        TestIndexRebuild._touch(store.tasks_dir)
+
+        assert [t.id for t in store.list_tasks(task_list.id)] == [first.id]
+        assert store.get_tasks_version(task_list.id) not in issued
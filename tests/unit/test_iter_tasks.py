@@ -0,0 +1,198 @@
+"""Unit tests for reading tasks in bulk from the data stores.
+
+This module tests that:
+1. iter_tasks yields the same tasks as list_tasks, overall and per task list,
+   whatever the batch size
+2. Child rows (dependencies, exit criteria, notes) survive batched fetching
+3. Invalid batch sizes are rejected
+4. Closing the iterator early releases the database session
+5. get_tasks returns the requested tasks in order, skipping unknown IDs
+6. get_dependents returns the tasks depending on a task
+
+Requirements: 5.6, 9.1
+"""
+
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from task_manager.data.access.filesystem_store import FilesystemStore
+from task_manager.data.access.log_store import LogStore
+from task_manager.data.access.sqlite_store import SQLiteStore
+from task_manager.models.entities import Dependency, ExitCriteria, Note, Project, Task, TaskList
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+STORE_FACTORIES = {
+    "filesystem": lambda path: FilesystemStore(path),
+    "log": lambda path: LogStore(path),
+    "sqlite": lambda path: SQLiteStore(str(Path(path) / "tasks.db")),
+}
+
+
+@pytest.fixture(params=sorted(STORE_FACTORIES))
+def store(request):
+    """Create an initialized store of each kind in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = STORE_FACTORIES[request.param](tmpdir)
+        store.initialize()
+        yield store
+        if isinstance(store, SQLiteStore):
+            store.engine.dispose()
+        elif isinstance(store, LogStore):
+            store.close()
+
+
+@pytest.fixture
+def task_lists(store):
+    """Create two task lists holding five tasks each, chained by dependencies."""
+    project = store.create_project(
+        Project(
+            id=uuid4(),
+            name="Iteration Project",
+            is_default=False,
+            created_at=BASE_TIME,
+            updated_at=BASE_TIME,
+        )
+    )
+    task_lists = []
+    for i in range(2):
+        task_list = store.create_task_list(
+            TaskList(
+                id=uuid4(),
+                name=f"List {i}",
+                project_id=project.id,
+                created_at=BASE_TIME,
+                updated_at=BASE_TIME,
+            )
+        )
+        previous = None
+        for j in range(5):
+            dependencies = (
+                [Dependency(task_id=previous.id, task_list_id=task_list.id)] if previous else []
+            )
+            previous = store.create_task(
+                Task(
+                    id=uuid4(),
+                    task_list_id=task_list.id,
+                    title=f"Task {i}.{j}",
+                    description="Description",
+                    status=Status.NOT_STARTED,
+                    dependencies=dependencies,
+                    exit_criteria=[
+                        ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)
+                    ],
+                    priority=Priority.MEDIUM,
+                    notes=[Note(content=f"Note {j}", timestamp=BASE_TIME)],
+                    created_at=BASE_TIME,
+                    updated_at=BASE_TIME,
+                )
+            )
+        task_lists.append(task_list)
+    return task_lists
+
+
+def _snapshot(tasks):
+    return sorted(
+        (
+            t.title,
+            [d.task_id for d in t.dependencies],
+            [ec.criteria for ec in t.exit_criteria],
+            [n.content for n in t.notes],
+        )
+        for t in tasks
+    )
+
+
+class TestIterTasks:
+    """Test iter_tasks on every store."""
+
+    @pytest.mark.parametrize("batch_size", [1, 3, 500])
+    def test_matches_list_tasks(self, store, task_lists, batch_size):
+        """Test that iteration yields the tasks of list_tasks with their child rows."""
+        all_tasks = store.iter_tasks(batch_size=batch_size)
+
+        assert not isinstance(all_tasks, list)
+        assert _snapshot(all_tasks) == _snapshot(store.list_tasks())
+        for task_list in task_lists:
+            assert _snapshot(store.iter_tasks(task_list.id, batch_size=batch_size)) == _snapshot(
+                store.list_tasks(task_list.id)
+            )
+
+    def test_unknown_task_list_yields_nothing(self, store, task_lists):
+        """Test that filtering by a task list without tasks yields no tasks."""
+        assert list(store.iter_tasks(uuid4())) == []
+
+    def test_rejects_invalid_batch_size(self, store):
+        """Test that a batch size below 1 raises ValueError."""
+        with pytest.raises(ValueError, match="Batch size must be at least 1"):
+            next(store.iter_tasks(batch_size=0))
+
+
+class TestSQLiteIterTasks:
+    """Test cursor handling of the SQL stores."""
+
+    @pytest.mark.parametrize("store", ["sqlite"], indirect=True)
+    def test_closing_iterator_releases_session(self, store, task_lists):
+        """Test that an abandoned iterator returns its connection to the pool."""
+        iterator = store.iter_tasks(batch_size=2)
+        next(iterator)
+        assert store.engine.pool.checkedout() == 1
+
+        iterator.close()
+
+        assert store.engine.pool.checkedout() == 0
+
+
+class TestGetTasks:
+    """Test get_tasks on every store."""
+
+    def test_returns_tasks_in_requested_order(self, store, task_lists):
+        """Test that tasks come back in ID order, once each, without unknown IDs."""
+        tasks = store.list_tasks(task_lists[0].id) + store.list_tasks(task_lists[1].id)
+        requested = [tasks[7].id, uuid4(), tasks[2].id, tasks[7].id, tasks[5].id]
+
+        found = store.get_tasks(requested)
+
+        assert [t.id for t in found] == [tasks[7].id, tasks[2].id, tasks[5].id]
+        assert _snapshot(found) == _snapshot([tasks[7], tasks[2], tasks[5]])
+
+    def test_empty(self, store, task_lists):
+        """Test that no IDs give no tasks."""
+        assert store.get_tasks([]) == []
+
+    @pytest.mark.parametrize("store", ["sqlite"], indirect=True)
+    def test_fetches_in_batches(self, store, task_lists, monkeypatch):
+        """Test that more IDs than fit in one query are fetched over several."""
+        monkeypatch.setattr("task_manager.data.access.postgresql_store.ITER_TASKS_BATCH_SIZE", 3)
+        tasks = store.list_tasks()
+
+        found = store.get_tasks(reversed([t.id for t in tasks]))
+
+        assert [t.id for t in found] == [t.id for t in reversed(tasks)]
+
+
+class TestGetDependents:
+    """Test get_dependents on every store."""
+
+    def test_returns_direct_dependents(self, store, task_lists):
+        """Test that each task in a chain has the next one as its only dependent."""
+        chain = sorted(store.list_tasks(task_lists[0].id), key=lambda t: t.title)
+
+        for task, dependent in zip(chain, chain[1:]):
+            assert [t.id for t in store.get_dependents(task.id)] == [dependent.id]
+        assert store.get_dependents(chain[-1].id) == []
+        assert store.get_dependents(uuid4()) == []
+
+    def test_delete_removes_dependency_from_dependents(self, store, task_lists):
+        """Test that deleting a task leaves its dependent without the dependency."""
+        chain = sorted(store.list_tasks(task_lists[0].id), key=lambda t: t.title)
+
+        store.delete_task(chain[1].id)
+
+        assert store.get_task(chain[2].id).dependencies == []
+        assert store.get_dependents(chain[0].id) == []
@@ -0,0 +1,309 @@
+"""Unit tests for the append-only log + snapshot data store.
+
+This module tests that:
+1. CRUD operations survive reopening the store (log replay)
+2. Compaction writes a snapshot and starts an empty log
+3. Torn trailing records are ignored and truncated by the next write
+4. Cascading deletes are written as a single record
+5. Writes from another instance sharing the directory are picked up
+
+Requirements: 1.2, 1.4, 1.5
+"""
+
+import json
+import tempfile
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from task_manager.data.access.log_store import LogStore, LogStoreError
+from task_manager.models.entities import (
+    Dependency,
+    ExitCriteria,
+    Project,
+    SearchCriteria,
+    Task,
+    TaskList,
+)
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+
+
+def _make_task(task_list_id, title="Task", dependencies=None):
+    return Task(
+        id=uuid4(),
+        task_list_id=task_list_id,
+        title=title,
+        description="Description",
+        status=Status.NOT_STARTED,
+        dependencies=dependencies or [],
+        exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+        priority=Priority.MEDIUM,
+        notes=[],
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+
+@pytest.fixture
+def tmpdir():
+    """Provide a temporary directory for the store files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture
+def store(tmpdir):
+    """Create an initialized log store."""
+    store = LogStore(tmpdir)
+    store.initialize()
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def task_list(store):
+    """Create a task list in a new project."""
+    project = store.create_project(
+        Project(
+            id=uuid4(),
+            name="Log Project",
+            is_default=False,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+    return store.create_task_list(
+        TaskList(
+            id=uuid4(),
+            name="Log List",
+            project_id=project.id,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+
+
+def _reopen(store, **kwargs):
+    reopened = LogStore(str(store.base_path), **kwargs)
+    reopened.initialize()
+    return reopened
+
+
+class TestLogStoreBasics:
+    """Test initialization and CRUD operations."""
+
+    def test_initialize_creates_default_projects_once(self, store):
+        """Test that default projects are created and not duplicated."""
+        store.initialize()
+        reopened = _reopen(store)
+
+        names = sorted(p.name for p in reopened.list_projects())
+        assert names == ["Chore", "Repeatable"]
+
+    def test_entities_survive_reopen(self, store, task_list):
+        """Test that replaying the log restores every entity."""
+        task = store.create_task(_make_task(task_list.id))
+        task.status = Status.COMPLETED
+        store.update_task(task)
+
+        reopened = _reopen(store)
+
+        assert reopened.get_task_list(task_list.id) == task_list
+        assert reopened.get_task(task.id) == task
+        assert [t.id for t in reopened.list_tasks(task_list.id)] == [task.id]
+
+    def test_validation_errors(self, store, task_list):
+        """Test that the store enforces the same rules as the other stores."""
+        with pytest.raises(ValueError, match="already exists"):
+            store.create_project(
+                Project(
+                    id=uuid4(),
+                    name="Chore",
+                    is_default=False,
+                    created_at=datetime.now(),
+                    updated_at=datetime.now(),
+                )
+            )
+        with pytest.raises(ValueError, match="does not exist"):
+            store.create_task(_make_task(uuid4()))
+        with pytest.raises(ValueError, match="does not exist"):
+            store.delete_task(uuid4())
+
+        chore = next(p for p in store.list_projects() if p.name == "Chore")
+        with pytest.raises(ValueError, match="Cannot delete default project"):
+            store.delete_project(chore.id)
+
+    def test_returned_entities_are_copies(self, store, task_list):
+        """Test that mutating a returned task does not change the store."""
+        task = store.create_task(_make_task(task_list.id))
+
+        fetched = store.get_task(task.id)
+        fetched.title = "Changed"
+
+        assert store.get_task(task.id).title == "Task"
+
+    def test_get_ready_tasks(self, store, task_list):
+        """Test that tasks with incomplete dependencies are not ready."""
+        first = store.create_task(_make_task(task_list.id, "First"))
+        second = store.create_task(
+            _make_task(
+                task_list.id,
+                "Second",
+                dependencies=[Dependency(task_id=first.id, task_list_id=task_list.id)],
+            )
+        )
+
+        ready = store.get_ready_tasks("task_list", task_list.id)
+        assert [t.id for t in ready] == [first.id]
+
+        first.status = Status.COMPLETED
+        store.update_task(first)
+
+        ready_ids = {t.id for t in store.get_ready_tasks("project", task_list.project_id)}
+        assert ready_ids == {first.id, second.id}
+
+    def test_count_tasks(self, store, task_list):
+        """Test that counts combine index filters with the text query."""
+        store.create_task(_make_task(task_list.id, "Deploy API"))
+        store.create_task(_make_task(task_list.id, "Deploy UI"))
+        done = _make_task(task_list.id, "Deploy docs")
+        done.status = Status.COMPLETED
+        store.create_task(done)
+
+        assert store.count_tasks(SearchCriteria(query="DEPLOY")) == 3
+        assert store.count_tasks(SearchCriteria(query="deploy", status=[Status.NOT_STARTED])) == 2
+        assert store.count_tasks(SearchCriteria(project_name="Log Project")) == 3
+        assert store.count_tasks(SearchCriteria(project_name="Missing")) == 0
+
+
+class TestLogStoreDurability:
+    """Test log records, replay and compaction."""
+
+    def test_delete_task_list_is_one_record(self, store, task_list):
+        """Test that a cascading delete, including dependency cleanup, is one record."""
+        other_list = store.create_task_list(
+            TaskList(
+                id=uuid4(),
+                name="Other",
+                project_id=task_list.project_id,
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+            )
+        )
+        task = store.create_task(_make_task(task_list.id))
+        dependent = store.create_task(
+            _make_task(
+                other_list.id,
+                dependencies=[Dependency(task_id=task.id, task_list_id=task_list.id)],
+            )
+        )
+        lines_before = len(store.log_path.read_bytes().splitlines())
+
+        store.delete_task_list(task_list.id)
+
+        assert len(store.log_path.read_bytes().splitlines()) == lines_before + 1
+        reopened = _reopen(store)
+        assert reopened.get_task(task.id) is None
+        assert reopened.get_task(dependent.id).dependencies == []
+
+    def test_create_tasks_is_one_record(self, store, task_list):
+        """Test that creating several tasks, even dependent ones, is one record."""
+        first = _make_task(task_list.id, "First")
+        second = _make_task(
+            task_list.id,
+            "Second",
+            dependencies=[Dependency(task_id=first.id, task_list_id=task_list.id)],
+        )
+        lines_before = len(store.log_path.read_bytes().splitlines())
+
+        store.create_tasks([first, second])
+
+        assert len(store.log_path.read_bytes().splitlines()) == lines_before + 1
+        reopened = _reopen(store)
+        assert reopened.get_task(second.id) == second
+
+        with pytest.raises(ValueError, match="does not exist"):
+            store.create_tasks([_make_task(task_list.id), _make_task(uuid4())])
+        assert len(store.log_path.read_bytes().splitlines()) == lines_before + 1
+
+    def test_batch_updates_are_one_record_each(self, store, task_list):
+        """Test that batched updates, tag changes and deletes are one record each."""
+        first = store.create_task(_make_task(task_list.id, "First"))
+        second = store.create_task(_make_task(task_list.id, "Second"))
+        lines_before = len(store.log_path.read_bytes().splitlines())
+
+        first.status = Status.COMPLETED
+        second.title = "Second updated"
+        store.update_tasks([first, second])
+        store.add_tags_to_tasks([first.id, second.id], ["a", "b"])
+        store.remove_tags_from_tasks([first.id, second.id], ["a"])
+
+        assert len(store.log_path.read_bytes().splitlines()) == lines_before + 3
+        reopened = _reopen(store)
+        assert reopened.get_task(first.id).status == Status.COMPLETED
+        assert reopened.get_task(second.id).title == "Second updated"
+        assert [t.tags for t in reopened.get_tasks([first.id, second.id])] == [["b"], ["b"]]
+
+        with pytest.raises(ValueError, match="does not exist"):
+            store.delete_tasks([first.id, uuid4()])
+        store.delete_tasks([first.id, second.id])
+
+        assert len(store.log_path.read_bytes().splitlines()) == lines_before + 4
+        assert _reopen(store).get_tasks([first.id, second.id]) == []
+
+    def test_compaction_writes_snapshot_and_empties_log(self, tmpdir):
+        """Test that reaching the threshold compacts the log into a snapshot."""
+        # One record for the default projects plus three project creations
+        store = LogStore(tmpdir, compact_threshold=4)
+        store.initialize()
+        for i in range(3):
+            store.create_project(
+                Project(
+                    id=uuid4(),
+                    name=f"Project {i}",
+                    is_default=False,
+                    created_at=datetime.now(),
+                    updated_at=datetime.now(),
+                )
+            )
+
+        snapshot = json.loads(store.snapshot_path.read_text())
+        assert len(snapshot["projects"]) == 5
+        assert store.log_path.read_bytes() == b""
+
+        reopened = _reopen(store)
+        assert len(reopened.list_projects()) == 5
+
+    def test_torn_record_is_ignored_and_truncated(self, store, task_list):
+        """Test that a partial trailing record does not break replay."""
+        task = store.create_task(_make_task(task_list.id))
+        with open(store.log_path, "ab") as f:
+            f.write(b'{"changes":[{"op":"delete","kind":"ta')
+
+        reopened = _reopen(store)
+        assert reopened.get_task(task.id) is not None
+
+        second = reopened.create_task(_make_task(task_list.id, "Second"))
+        assert {t.id for t in _reopen(store).list_tasks(task_list.id)} == {task.id, second.id}
+
+    def test_corrupt_record_raises(self, store, task_list):
+        """Test that a corrupt complete record raises LogStoreError."""
+        with open(store.log_path, "ab") as f:
+            f.write(b"not json\n")
+
+        with pytest.raises(LogStoreError, match="Corrupt log record"):
+            _reopen(store)
+
+    def test_writes_from_another_instance_are_visible(self, store, task_list):
+        """Test that appends and compactions by another instance are picked up."""
+        other = _reopen(store, compact_threshold=2)
+        task = other.create_task(_make_task(task_list.id))
+
+        assert store.get_task(task.id) is not None
+
+        other.compact()
+        other.delete_task(task.id)
+
+        assert store.get_task(task.id) is None
+        assert store.list_tasks(task_list.id) == []
@@ -214,6 +214,15 @@ class TestMCPServerSearchTasksHandler:
         assert "3 more results available" in text
         assert "Use offset=2 to see more" in text
 
+        # Continue with the returned cursor
+        cursor = text.split("use cursor=")[1].split()[0]
+        result = await server._handle_search_tasks({"limit": 2, "cursor": cursor})
+
+        text = result[0].text
+        assert text.count("(ID: ") == 2
+        assert "more results available" not in text
+        assert "use cursor=" in text
+
     @pytest.mark.asyncio
     async def test_search_tasks_with_all_filters(self, tmp_path):
         """Test search_tasks displays all active filters."""
@@ -391,7 +400,7 @@ class TestMCPServerHandlerExceptionPaths:
         server = TaskManagerMCPServer()
 
         # Mock the search orchestrator to raise an exception
-        with patch.object(server.search_orchestrator, "search_tasks") as mock_search:
+        with patch.object(server.search_orchestrator, "search_page") as mock_search:
             mock_search.side_effect = ValueError("Invalid search criteria")
 
             result = await server._handle_search_tasks(
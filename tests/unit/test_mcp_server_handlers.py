@@ -569,7 +569,7 @@ class TestAnalyzeDependenciesErrorPaths:
             circular_dependencies=[],
         )
         mcp_server.dependency_analyzer.analyze = Mock(return_value=mock_analysis)
-        mcp_server.data_store.get_task = Mock(return_value=None)
+        mcp_server.data_store.get_tasks = Mock(return_value=[])
 
         scope_id = str(uuid4())
         result = await mcp_server._handle_analyze_dependencies(
@@ -583,6 +583,10 @@ class TestAnalyzeDependenciesErrorPaths:
         assert "Bottleneck Tasks" in result[0].text
         assert "Leaf Tasks" in result[0].text
         assert "Circular Dependencies" in result[0].text
+        mcp_server.data_store.get_tasks.assert_called_once_with(
+            [*mock_analysis.critical_path, mock_analysis.bottleneck_tasks[0][0]]
+            + mock_analysis.leaf_tasks
+        )
 
 
 class TestVisualizeDependenciesErrorPaths:
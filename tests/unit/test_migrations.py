@@ -15,6 +15,7 @@ from task_manager.data.access.migrations import (
     drop_all_tables,
     get_session_factory,
     initialize_database,
+    migrate_add_position_columns,
     migrate_add_tags_column,
 )
 
@@ -318,6 +319,33 @@ class TestMigrations:
         with pytest.raises(MigrationError, match="Failed to add tags column"):
             migrate_add_tags_column(engine)
 
+    def test_migrate_add_position_columns_numbers_existing_rows(self):
+        """Test that existing child rows are numbered in the order they were stored."""
+        engine = create_engine("sqlite:///:memory:")
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE notes (id TEXT PRIMARY KEY, task_id TEXT, note_type TEXT, "
+                    "content TEXT)"
+                )
+            )
+            for i, (task_id, note_type) in enumerate(
+                [("a", "GENERAL"), ("a", "RESEARCH"), ("b", "GENERAL"), ("a", "GENERAL")]
+            ):
+                conn.execute(
+                    text(f"INSERT INTO notes VALUES ('n{i}', '{task_id}', '{note_type}', 'c')")
+                )
+
+        # Run migration twice
+        migrate_add_position_columns(engine)
+        migrate_add_position_columns(engine)  # Should not fail
+
+        with engine.connect() as conn:
+            positions = dict(conn.execute(text("SELECT id, position FROM notes")).all())
+        assert positions == {"n0": 0, "n1": 0, "n2": 0, "n3": 1}
+
+        engine.dispose()
+
 
 @pytest.fixture
 def test_db_url():
@@ -0,0 +1,337 @@
+"""Unit tests for cross-process change notifications of the PostgreSQL store.
+
+This module tests that:
+1. Mutations queue a NOTIFY with the changed entity in their transaction
+2. Notification payloads are parsed, and malformed or own ones are skipped
+3. The listener loop dispatches notifications, reconnects after errors and
+   reports possibly missed notifications with None
+
+Requirements: 9.1
+"""
+
+import json
+import socket
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from task_manager.data.access.postgresql_listener import (
+    CHANGE_CHANNEL,
+    ChangeListener,
+    ChangeNotification,
+)
+from task_manager.data.access.postgresql_store import StorageError
+from task_manager.data.access.sqlite_store import SQLiteStore
+from task_manager.models.entities import ExitCriteria, Project, Task, TaskList
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+
+
+def _payload(origin="other", entity="task", operation="updated", task_list_id=None):
+    return json.dumps(
+        {
+            "origin": origin,
+            "entity": entity,
+            "operation": operation,
+            "id": str(uuid4()),
+            "task_list_id": str(task_list_id) if task_list_id else None,
+        }
+    )
+
+
+@pytest.fixture
+def notifying_store():
+    """Create a SQLite store that records the NOTIFY statements of PostgreSQL.
+
+    SQLite has no unnest(), so each NOTIFY statement is recorded and replaced
+    with a no-op before it reaches the database.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = SQLiteStore(str(Path(tmpdir) / "tasks.db"))
+        store.notify_changes = True
+        store.instance_id = "this-instance"
+        store.notifications = []
+        store.notify_statements = 0
+
+        def record_notify(conn, cursor, statement, parameters, context, executemany):
+            if "pg_notify" not in statement:
+                return statement, parameters
+            channel, payloads = parameters
+            store.notify_statements += 1
+            store.notifications += [(channel, json.loads(payload)) for payload in payloads]
+            return "SELECT 1", ()
+
+        event.listen(store.engine, "before_cursor_execute", record_notify, retval=True)
+        store.initialize()
+        yield store
+        store.engine.dispose()
+
+
+def _create_task_list(store):
+    """Create a project and task list in a store and return the task list."""
+    now = datetime.now(timezone.utc)
+    project = store.create_project(
+        Project(id=uuid4(), name="Notify", is_default=False, created_at=now, updated_at=now)
+    )
+    return store.create_task_list(
+        TaskList(id=uuid4(), name="List", project_id=project.id, created_at=now, updated_at=now)
+    )
+
+
+def _make_task(task_list_id):
+    """Build a task in a task list."""
+    now = datetime.now(timezone.utc)
+    return Task(
+        id=uuid4(),
+        task_list_id=task_list_id,
+        title="Task",
+        description="Description",
+        status=Status.NOT_STARTED,
+        dependencies=[],
+        exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+        priority=Priority.MEDIUM,
+        notes=[],
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class TestChangeNotifications:
+    """Test the notifications sent by store mutations."""
+
+    def test_task_lifecycle(self, notifying_store):
+        """Test that creating, updating and deleting entities notify with their IDs."""
+        store = notifying_store
+        now = datetime.now(timezone.utc)
+        project = store.create_project(
+            Project(id=uuid4(), name="Notify", is_default=False, created_at=now, updated_at=now)
+        )
+        task_list = store.create_task_list(
+            TaskList(id=uuid4(), name="List", project_id=project.id, created_at=now, updated_at=now)
+        )
+        task = store.create_task(
+            Task(
+                id=uuid4(),
+                task_list_id=task_list.id,
+                title="Task",
+                description="Description",
+                status=Status.NOT_STARTED,
+                dependencies=[],
+                exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+                priority=Priority.MEDIUM,
+                notes=[],
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        store.update_task(task)
+        store.reset_task_list(task_list.id)
+        store.delete_task(task.id)
+        store.delete_task_list(task_list.id)
+
+        assert {channel for channel, _ in store.notifications} == {CHANGE_CHANNEL}
+        payloads = [payload for _, payload in store.notifications]
+        assert all(p["origin"] == "this-instance" for p in payloads)
+        assert [(p["entity"], p["operation"], p["id"]) for p in payloads] == [
+            ("project", "created", str(project.id)),
+            ("task_list", "created", str(task_list.id)),
+            ("task", "created", str(task.id)),
+            ("task", "updated", str(task.id)),
+            ("task", "updated", str(task.id)),
+            ("task", "deleted", str(task.id)),
+            ("task_list", "deleted", str(task_list.id)),
+        ]
+        assert payloads[2]["task_list_id"] == str(task_list.id)
+        assert payloads[0]["task_list_id"] is None
+
+    def test_batches_notify_with_one_statement(self, notifying_store):
+        """Test that batched writes queue the notifications of all tasks at once."""
+        store = notifying_store
+        task_list = _create_task_list(store)
+        tasks = [_make_task(task_list.id) for _ in range(3)]
+        ids = [str(task.id) for task in tasks]
+
+        for operation, write in [
+            ("created", lambda: store.create_tasks(tasks)),
+            ("updated", lambda: store.update_tasks(tasks)),
+            ("updated", lambda: store.add_tags_to_tasks([task.id for task in tasks], ["a"])),
+            ("deleted", lambda: store.delete_tasks([task.id for task in tasks])),
+        ]:
+            store.notifications = []
+            store.notify_statements = 0
+
+            write()
+
+            assert store.notify_statements == 1
+            assert [(p["operation"], p["id"]) for _, p in store.notifications] == [
+                (operation, task_id) for task_id in ids
+            ]
+
+    def test_failed_mutation_does_not_notify(self, notifying_store):
+        """Test that a mutation rejected before writing sends nothing."""
+        with pytest.raises(ValueError):
+            notifying_store.delete_task(uuid4())
+
+        assert notifying_store.notifications == []
+
+    def test_sqlite_cannot_listen(self):
+        """Test that listening requires PostgreSQL."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SQLiteStore(str(Path(tmpdir) / "tasks.db"))
+
+            with pytest.raises(StorageError, match="require a PostgreSQL database"):
+                store.listen_for_changes(lambda notification: None)
+
+
+class TestChangeNotification:
+    """Test parsing notification payloads."""
+
+    def test_from_payload(self):
+        """Test that a payload sent by the store is parsed."""
+        task_list_id = uuid4()
+        payload = _payload(task_list_id=task_list_id)
+
+        notification = ChangeNotification.from_payload(payload)
+
+        assert notification.entity == "task"
+        assert notification.operation == "updated"
+        assert str(notification.entity_id) == json.loads(payload)["id"]
+        assert notification.task_list_id == task_list_id
+        assert notification.origin == "other"
+
+    @pytest.mark.parametrize("payload", ["", "[]", "{}", '{"entity": "task", "id": "x"}'])
+    def test_invalid_payload(self, payload):
+        """Test that malformed payloads raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid change notification payload"):
+            ChangeNotification.from_payload(payload)
+
+
+class FakeNotify:
+    def __init__(self, payload):
+        self.payload = payload
+
+
+class FakeConnection:
+    """psycopg2-like connection whose readiness is driven by a socket pair.
+
+    The first poll delivers the payloads; with fail=True the second one fails.
+    """
+
+    def __init__(self, payloads, fail=False):
+        self._reader, self._writer = socket.socketpair()
+        self.notifies = []
+        self.autocommit = False
+        self.executed = []
+        self.closed = False
+        self._payloads = payloads
+        self._fail = fail
+        self._writer.send(b"xx" if fail else b"x")
+
+    def fileno(self):
+        return self._reader.fileno()
+
+    def poll(self):
+        self._reader.recv(1)
+        if not self._payloads and self._fail:
+            raise OSError("server closed the connection unexpectedly")
+        self.notifies.extend(FakeNotify(p) for p in self._payloads)
+        self._payloads = []
+
+    def cursor(self):
+        connection = self
+
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def execute(self, sql):
+                connection.executed.append(sql)
+
+        return Cursor()
+
+    def close(self):
+        self.closed = True
+        self._reader.close()
+        self._writer.close()
+
+
+class FakeEngine:
+    """Engine handing out the given connections from raw_connection()."""
+
+    def __init__(self, connections):
+        self._connections = iter(connections)
+        self.detached = 0
+
+    def raw_connection(self):
+        engine = self
+        dbapi_connection = next(self._connections)
+
+        class Proxy:
+            def detach(self):
+                engine.detached += 1
+
+            def close(self):
+                dbapi_connection.close()
+
+        proxy = Proxy()
+        proxy.dbapi_connection = dbapi_connection
+        return proxy
+
+
+class TestChangeListener:
+    """Test the LISTEN loop."""
+
+    def test_handle_payload_skips_own_and_malformed(self):
+        """Test that only valid notifications of other instances reach the callback."""
+        received = []
+        listener = ChangeListener(FakeEngine([]), received.append, ignore_origin="me")
+
+        listener.handle_payload(_payload(origin="me"))
+        listener.handle_payload("not json")
+        listener.handle_payload(_payload(origin="other"))
+
+        assert [n.origin for n in received] == ["other"]
+
+    def test_callback_errors_are_ignored(self):
+        """Test that a failing callback does not stop the listener."""
+
+        def fail(notification):
+            raise RuntimeError("boom")
+
+        ChangeListener(FakeEngine([]), fail).handle_payload(_payload())
+
+    def test_listens_and_reconnects(self):
+        """Test that the loop dispatches, reconnects with None and closes on stop."""
+        first = FakeConnection([_payload(operation="created")], fail=True)
+        second = FakeConnection([_payload(operation="deleted")])
+        engine = FakeEngine([first, second])
+        received = []
+        done = threading.Event()
+
+        def callback(notification):
+            received.append(notification)
+            if len(received) == 3:
+                done.set()
+
+        listener = ChangeListener(engine, callback, poll_interval=0.01, reconnect_delay=0.01)
+        listener.start()
+        try:
+            assert done.wait(5)
+        finally:
+            listener.stop(timeout=5)
+
+        assert not listener.running
+        assert received[0].operation == "created"
+        assert received[1] is None
+        assert received[2].operation == "deleted"
+        assert engine.detached == 2
+        assert first.closed and second.closed
+        assert first.autocommit is True
+        assert first.executed == [f'LISTEN "{CHANGE_CHANNEL}"']
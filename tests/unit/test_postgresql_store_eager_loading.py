@@ -0,0 +1,138 @@
+"""Query-count regression tests for PostgreSQLStore relationship loading.
+
+Converting tasks to entities touches the dependencies, exit criteria, notes
+and action plan items of every task. These tests run the store against a
+SQLite database, count the SQL statements issued, and check that the count
+does not grow with the number of tasks.
+
+Requirements: 1.3, 5.6, 9.1
+"""
+
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from task_manager.data.access.postgresql_store import PostgreSQLStore
+from task_manager.models.entities import (
+    ActionPlanItem,
+    Dependency,
+    ExitCriteria,
+    Note,
+    Project,
+    Task,
+    TaskList,
+)
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+
+
+@pytest.fixture
+def store():
+    """Create a PostgreSQLStore backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = PostgreSQLStore(f"sqlite:///{Path(tmpdir) / 'tasks.db'}")
+        store.initialize()
+        yield store
+        store.engine.dispose()
+
+
+@contextmanager
+def count_queries(store):
+    """Count the SQL statements executed on the store's engine."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(store.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(store.engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _populate(store, task_count):
+    project = store.create_project(
+        Project(
+            id=uuid4(),
+            name=f"Project {uuid4()}",
+            is_default=False,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+    task_list = store.create_task_list(
+        TaskList(
+            id=uuid4(),
+            name="List",
+            project_id=project.id,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+
+    previous = None
+    for i in range(task_count):
+        task = Task(
+            id=uuid4(),
+            task_list_id=task_list.id,
+            title=f"Task {i}",
+            description="Description",
+            status=Status.COMPLETED if i % 2 else Status.NOT_STARTED,
+            dependencies=(
+                [Dependency(task_id=previous.id, task_list_id=task_list.id)] if previous else []
+            ),
+            exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+            priority=Priority.MEDIUM,
+            notes=[Note(content="Note", timestamp=datetime.now())],
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            research_notes=[Note(content="Research", timestamp=datetime.now())],
+            action_plan=[ActionPlanItem(sequence=1, content="Step")],
+        )
+        previous = store.create_task(task)
+
+    return task_list
+
+
+class TestRelationshipLoading:
+    """Test that loading tasks costs a constant number of queries."""
+
+    def test_list_tasks_query_count_is_independent_of_task_count(self, store):
+        """Test that listing 5 or 50 tasks issues the same number of queries."""
+        small = _populate(store, 5)
+        large = _populate(store, 50)
+
+        with count_queries(store) as small_queries:
+            small_tasks = store.list_tasks(small.id)
+        with count_queries(store) as large_queries:
+            large_tasks = store.list_tasks(large.id)
+
+        assert len(small_tasks) == 5
+        assert len(large_tasks) == 50
+        assert len(large_queries) == len(small_queries)
+        assert len(large_queries) <= 5
+
+    def test_list_tasks_loads_all_relationships(self, store):
+        """Test that eagerly loaded tasks carry all their child rows."""
+        task_list = _populate(store, 3)
+
+        tasks = sorted(store.list_tasks(task_list.id), key=lambda t: t.title)
+
+        assert [len(t.dependencies) for t in tasks] == [0, 1, 1]
+        assert all(len(t.notes) == 1 and len(t.research_notes) == 1 for t in tasks)
+        assert all(t.action_plan[0].content == "Step" for t in tasks)
+
+    def test_get_task_query_count(self, store):
+        """Test that fetching one task costs one query per relationship plus one."""
+        task_list = _populate(store, 1)
+        task_id = store.list_tasks(task_list.id)[0].id
+
+        with count_queries(store) as queries:
+            store.get_task(task_id)
+
+        assert len(queries) <= 5
@@ -0,0 +1,188 @@
+"""Tests for the single-query ready task computation of PostgreSQLStore.
+
+The store is run against a SQLite database so the anti-join can be executed
+and its statement count observed.
+
+Requirements: 9.1, 9.2, 9.3, 12.1, 12.2
+"""
+
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from task_manager.data.access.postgresql_store import PostgreSQLStore
+from task_manager.models.entities import Dependency, ExitCriteria, Project, Task, TaskList
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+from task_manager.orchestration.blocking_detector import BlockingDetector
+from task_manager.orchestration.dependency_orchestrator import DependencyOrchestrator
+
+
+@pytest.fixture
+def store():
+    """Create a PostgreSQLStore backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = PostgreSQLStore(f"sqlite:///{Path(tmpdir) / 'tasks.db'}")
+        store.initialize()
+        yield store
+        store.engine.dispose()
+
+
+@pytest.fixture
+def project(store):
+    """Create a non-default project."""
+    return store.create_project(
+        Project(
+            id=uuid4(),
+            name="Ready Project",
+            is_default=False,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+
+
+def _make_task_list(store, project_id, name="List"):
+    return store.create_task_list(
+        TaskList(
+            id=uuid4(),
+            name=name,
+            project_id=project_id,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+
+
+def _make_task(store, task_list_id, title, status=Status.NOT_STARTED, depends_on=()):
+    return store.create_task(
+        Task(
+            id=uuid4(),
+            task_list_id=task_list_id,
+            title=title,
+            description="Description",
+            status=status,
+            dependencies=[
+                Dependency(task_id=dep.id, task_list_id=dep.task_list_id) for dep in depends_on
+            ],
+            exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+            priority=Priority.MEDIUM,
+            notes=[],
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+
+
+def _count_queries(store, func):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(store.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        result = func()
+    finally:
+        event.remove(store.engine, "before_cursor_execute", before_cursor_execute)
+    return result, len(statements)
+
+
+class TestReadyTaskQuery:
+    """Test readiness evaluation in the database."""
+
+    def test_readiness_follows_dependency_status(self, store, project):
+        """Test that only tasks whose dependencies are all completed are ready."""
+        task_list = _make_task_list(store, project.id)
+        done = _make_task(store, task_list.id, "Done", status=Status.COMPLETED)
+        open_task = _make_task(store, task_list.id, "Open")
+        unblocked = _make_task(store, task_list.id, "Unblocked", depends_on=[done])
+        _make_task(store, task_list.id, "Blocked", depends_on=[done, open_task])
+
+        ready = store.get_ready_tasks("task_list", task_list.id)
+
+        assert {t.title for t in ready} == {"Done", "Open", "Unblocked"}
+        assert next(t for t in ready if t.id == unblocked.id).dependencies[0].task_id == done.id
+
+    def test_status_filter(self, store, project):
+        """Test that the optional status filter restricts the returned tasks."""
+        task_list = _make_task_list(store, project.id)
+        _make_task(store, task_list.id, "Not started")
+        _make_task(store, task_list.id, "In progress", status=Status.IN_PROGRESS)
+        _make_task(store, task_list.id, "Done", status=Status.COMPLETED)
+
+        ready = store.get_ready_tasks("task_list", task_list.id, statuses=[Status.NOT_STARTED])
+
+        assert [t.title for t in ready] == ["Not started"]
+
+    def test_project_scope_spans_task_lists(self, store, project):
+        """Test that project scope includes tasks of every task list in the project."""
+        list1 = _make_task_list(store, project.id, "List 1")
+        list2 = _make_task_list(store, project.id, "List 2")
+        first = _make_task(store, list1.id, "First", status=Status.COMPLETED)
+        _make_task(store, list2.id, "Second", depends_on=[first])
+        chore = next(p for p in store.list_projects() if p.name == "Chore")
+        _make_task(store, _make_task_list(store, chore.id).id, "Elsewhere")
+
+        ready = store.get_ready_tasks("project", project.id)
+
+        assert {t.title for t in ready} == {"First", "Second"}
+
+    def test_query_count_is_independent_of_task_count(self, store, project):
+        """Test that readiness costs the same number of queries for 5 or 50 tasks."""
+        counts = []
+        for size in (5, 50):
+            task_list = _make_task_list(store, project.id, f"List {size}")
+            previous = _make_task(store, task_list.id, "Root", status=Status.COMPLETED)
+            for i in range(size - 1):
+                previous = _make_task(store, task_list.id, f"Task {i}", depends_on=[previous])
+
+            ready, count = _count_queries(
+                store, lambda: store.get_ready_tasks("task_list", task_list.id)
+            )
+            assert len(ready) == 2
+            counts.append(count)
+
+        assert counts[0] == counts[1]
+
+    def test_missing_scope_raises(self, store):
+        """Test that unknown projects and task lists are rejected."""
+        with pytest.raises(ValueError, match="does not exist"):
+            store.get_ready_tasks("project", uuid4())
+        with pytest.raises(ValueError, match="does not exist"):
+            store.get_ready_tasks("task_list", uuid4())
+
+
+class TestOrchestratorDelegation:
+    """Test that orchestrators hand readiness to the store."""
+
+    def test_blocking_detector_multi_agent_mode(self, store, project):
+        """Test that multi-agent mode only returns NOT_STARTED tasks."""
+        task_list = _make_task_list(store, project.id)
+        _make_task(store, task_list.id, "Not started")
+        _make_task(store, task_list.id, "In progress", status=Status.IN_PROGRESS)
+        detector = BlockingDetector(store)
+
+        single = detector.get_ready_tasks("task_list", task_list.id)
+        multi = detector.get_ready_tasks("task_list", task_list.id, multi_agent_mode=True)
+
+        assert {t.title for t in single} == {"Not started", "In progress"}
+        assert [t.title for t in multi] == ["Not started"]
+
+    def test_dependency_orchestrator_excludes_completed(self, store, project, monkeypatch):
+        """Test that the orchestrator keeps its status rules when delegating."""
+        task_list = _make_task_list(store, project.id)
+        _make_task(store, task_list.id, "Done", status=Status.COMPLETED)
+        _make_task(store, task_list.id, "In progress", status=Status.IN_PROGRESS)
+        orchestrator = DependencyOrchestrator(store)
+
+        monkeypatch.setenv("MULTI_AGENT_ENVIRONMENT_BEHAVIOR", "false")
+        assert [t.title for t in orchestrator.get_ready_tasks("task_list", task_list.id)] == [
+            "In progress"
+        ]
+
+        monkeypatch.setenv("MULTI_AGENT_ENVIRONMENT_BEHAVIOR", "true")
+        assert orchestrator.get_ready_tasks("task_list", task_list.id) == []
@@ -0,0 +1,240 @@
+"""Unit tests for the SQL search path of PostgreSQLStore.
+
+The session is mocked, and the statement passed to it is compiled with the
+PostgreSQL dialect to check the generated SQL.
+
+Requirements: 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.schema import CreateIndex
+
+from task_manager.data.access.postgresql_schema import TaskModel
+from task_manager.data.access.postgresql_store import PostgreSQLStore, StorageError
+from task_manager.models.entities import SearchCriteria
+from task_manager.models.enums import Priority, Status
+from task_manager.models.pagination import decode_cursor, encode_cursor
+from task_manager.orchestration.search_orchestrator import SearchOrchestrator
+
+
+@pytest.fixture
+def mock_session():
+    """Patch the engine and session factory and return the mock session."""
+    with (
+        patch("task_manager.data.access.postgresql_store.create_engine"),
+        patch("task_manager.data.access.postgresql_store.sessionmaker") as mock_sessionmaker,
+    ):
+        session = MagicMock()
+        session.execute.return_value.all.return_value = []
+        mock_sessionmaker.return_value = MagicMock(return_value=session)
+        yield session
+
+
+def _compiled_sql(session):
+    statement = session.execute.call_args[0][0]
+    return str(
+        statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+
+class TestSearchQuery:
+    """Test the SQL generated for search criteria."""
+
+    def test_text_query_uses_full_text_index(self, mock_session):
+        """Test that text queries match the indexed tsvector with word prefixes."""
+        store = PostgreSQLStore("postgresql://test")
+
+        store.search_tasks(SearchCriteria(query="Auth login"))
+
+        sql = _compiled_sql(mock_session)
+        assert "@@ to_tsquery('simple'::regconfig, 'Auth:* & login:*')" in sql
+        assert "setweight(to_tsvector('simple'::regconfig, tasks.title), 'A')" in sql
+        assert "ts_rank(" in sql
+        assert "ORDER BY CAST(ts_rank(" in sql
+
+    def test_text_query_also_matches_substrings(self, mock_session):
+        """Test that text queries also match the literal substring, like the other stores."""
+        store = PostgreSQLStore("postgresql://test")
+
+        store.search_tasks(SearchCriteria(query="thent"))
+
+        sql = _compiled_sql(mock_session)
+        assert "@@ to_tsquery('simple'::regconfig, 'thent:*')" in sql
+        assert "tasks.title ILIKE '%%' || 'thent' || '%%'" in sql
+        assert "tasks.description ILIKE '%%' || 'thent' || '%%'" in sql
+
+    def test_query_without_words_falls_back_to_substring_match(self, mock_session):
+        """Test that punctuation-only queries use an escaped ILIKE match."""
+        store = PostgreSQLStore("postgresql://test")
+
+        store.search_tasks(SearchCriteria(query="%"))
+
+        sql = _compiled_sql(mock_session)
+        assert "to_tsquery" not in sql
+        assert "ILIKE" in sql
+        assert "'/%%'" in sql
+        assert "ESCAPE '/'" in sql
+        assert "ORDER BY tasks.created_at DESC" in sql
+
+    def test_filters_and_pagination(self, mock_session):
+        """Test that filters, tags, sorting and pagination are applied in SQL."""
+        store = PostgreSQLStore("postgresql://test")
+        project_id = uuid4()
+
+        store.search_tasks(
+            SearchCriteria(
+                status=[Status.NOT_STARTED],
+                priority=[Priority.HIGH],
+                tags=["backend"],
+                project_id=project_id,
+                sort_by="priority",
+                limit=10,
+                offset=20,
+            )
+        )
+
+        sql = _compiled_sql(mock_session)
+        assert "tasks.status IN ('NOT_STARTED')" in sql
+        assert "tasks.priority IN ('HIGH')" in sql
+        assert "tasks.tags && ARRAY['backend']" in sql
+        assert "task_lists.project_id =" in sql
+        assert "LIMIT 11 OFFSET 20" in sql
+        assert "CASE WHEN (tasks.priority = 'CRITICAL') THEN 5" in sql
+
+    def test_query_error_raises_storage_error(self, mock_session):
+        """Test that database errors are wrapped in StorageError."""
+        mock_session.execute.side_effect = SQLAlchemyError("Database error")
+        store = PostgreSQLStore("postgresql://test")
+
+        with pytest.raises(StorageError, match="Failed to search tasks"):
+            store.search_tasks(SearchCriteria())
+
+        mock_session.close.assert_called_once()
+
+
+class TestKeysetPagination:
+    """Test the keyset condition and cursor of search pages."""
+
+    def test_cursor_becomes_keyset_condition(self, mock_session):
+        """Test that a cursor seeks past (sort keys, id) instead of using OFFSET."""
+        store = PostgreSQLStore("postgresql://test")
+        task_id = uuid4()
+        cursor = encode_cursor("created_at", [datetime(2024, 1, 1)], task_id)
+
+        store.search_task_page(SearchCriteria(sort_by="created_at", limit=10, cursor=cursor))
+
+        sql = _compiled_sql(mock_session)
+        assert (
+            "tasks.created_at < '2024-01-01 00:00:00' OR "
+            f"tasks.created_at = '2024-01-01 00:00:00' AND tasks.id > '{task_id}'"
+        ) in sql
+        assert "ORDER BY tasks.created_at DESC, tasks.id" in sql
+        assert "LIMIT 11 OFFSET 0" in sql
+
+    def test_relevance_cursor_compares_double_precision_rank(self, mock_session):
+        """Test that the rank is compared as a double, like the value in the cursor."""
+        store = PostgreSQLStore("postgresql://test")
+        task_id = uuid4()
+        cursor = encode_cursor("relevance", [0.0607927, datetime(2024, 1, 1)], task_id)
+
+        store.search_task_page(SearchCriteria(query="auth", limit=1, cursor=cursor))
+
+        sql = _compiled_sql(mock_session)
+        rank = "CAST(ts_rank("
+        assert sql.count("ts_rank(") == sql.count(rank) == 5
+        assert "AS FLOAT(53)) < 0.0607927 OR " in sql
+        assert "AS FLOAT(53)) = 0.0607927 AND tasks.created_at < " in sql
+        assert f"ORDER BY {rank}" in sql
+
+    def test_next_cursor_is_built_from_the_last_row(self, mock_session):
+        """Test that the extra row only signals a next page and is not returned."""
+        rows = [(MagicMock(id=uuid4()), 4, datetime(2024, 1, day)) for day in (3, 2, 1)]
+        mock_session.execute.return_value.all.return_value = rows
+        store = PostgreSQLStore("postgresql://test")
+
+        with patch.object(store, "_task_model_to_entity", side_effect=lambda m: m.id):
+            page = store.search_task_page(SearchCriteria(sort_by="priority", limit=2))
+
+        assert page.tasks == [rows[0][0].id, rows[1][0].id]
+        assert decode_cursor(page.next_cursor, "priority", 2) == (
+            [4.0, datetime(2024, 1, 2)],
+            rows[1][0].id,
+        )
+
+    def test_last_page_has_no_cursor(self, mock_session):
+        """Test that a page without an extra row has no next cursor."""
+        store = PostgreSQLStore("postgresql://test")
+
+        assert store.search_task_page(SearchCriteria(limit=2)).next_cursor is None
+
+
+class TestCountQuery:
+    """Test the count-only query."""
+
+    def test_count_uses_search_filters_without_pagination(self, mock_session):
+        """Test that counting issues one SELECT count(*) with the search filters."""
+        mock_session.execute.return_value.scalar_one.return_value = 7
+        store = PostgreSQLStore("postgresql://test")
+
+        count = store.count_tasks(SearchCriteria(query="deploy", tags=["api"], limit=10, offset=30))
+
+        sql = _compiled_sql(mock_session)
+        assert count == 7
+        assert sql.startswith("SELECT count(*) AS count_1")
+        assert "@@ to_tsquery('simple'::regconfig, 'deploy:*')" in sql
+        assert "tasks.tags && ARRAY['api']" in sql
+        assert "LIMIT" not in sql
+        assert "ORDER BY" not in sql
+
+    def test_orchestrator_count_delegates_to_store(self, mock_session):
+        """Test that count_results issues a single count query."""
+        mock_session.execute.return_value.scalar_one.return_value = 3
+        store = PostgreSQLStore("postgresql://test")
+
+        assert SearchOrchestrator(store).count_results(SearchCriteria(status=[Status.BLOCKED])) == 3
+        mock_session.execute.assert_called_once()
+
+    def test_count_error_raises_storage_error(self, mock_session):
+        """Test that database errors are wrapped in StorageError."""
+        mock_session.execute.side_effect = SQLAlchemyError("Database error")
+        store = PostgreSQLStore("postgresql://test")
+
+        with pytest.raises(StorageError, match="Failed to count tasks"):
+            store.count_tasks(SearchCriteria())
+
+
+class TestSearchIndex:
+    """Test the full-text index definition."""
+
+    def test_index_matches_query_expression(self):
+        """Test that the GIN index is built on the expression the query uses."""
+        index = next(i for i in TaskModel.__table__.indexes if i.name == "ix_tasks_search_vector")
+
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+        assert "USING gin" in ddl
+        assert (
+            "setweight(to_tsvector('simple'::regconfig, title), 'A') || "
+            "setweight(to_tsvector('simple'::regconfig, description), 'B')"
+        ) in ddl
+
+
+class TestOrchestratorDelegation:
+    """Test that SearchOrchestrator hands the search to the store."""
+
+    def test_orchestrator_delegates_to_store(self, mock_session):
+        """Test that the orchestrator issues one SQL query instead of listing tasks."""
+        store = PostgreSQLStore("postgresql://test")
+        orchestrator = SearchOrchestrator(store)
+
+        result = orchestrator.search_tasks(SearchCriteria(query="deploy", limit=5))
+
+        assert result == []
+        mock_session.execute.assert_called_once()
+        assert "LIMIT 6" in _compiled_sql(mock_session)
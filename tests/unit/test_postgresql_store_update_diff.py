@@ -0,0 +1,252 @@
+"""Tests for the in-place child row updates of PostgreSQLStore.update_task.
+
+The store is run against a SQLite database and the rows inserted, updated and
+deleted by each flush are recorded per table.
+
+Requirements: 5.7
+"""
+
+import tempfile
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from task_manager.data.access.postgresql_store import PostgreSQLStore
+from task_manager.models.entities import (
+    ActionPlanItem,
+    Dependency,
+    ExitCriteria,
+    Note,
+    Project,
+    Task,
+    TaskList,
+)
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+
+
+@pytest.fixture
+def store():
+    """Create a PostgreSQLStore backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = PostgreSQLStore(f"sqlite:///{Path(tmpdir) / 'tasks.db'}")
+        store.initialize()
+        yield store
+        store.engine.dispose()
+
+
+@pytest.fixture
+def task_list(store):
+    """Create a task list in a non-default project."""
+    project = store.create_project(
+        Project(
+            id=uuid4(),
+            name="Diff Project",
+            is_default=False,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+    return store.create_task_list(
+        TaskList(
+            id=uuid4(),
+            name="List",
+            project_id=project.id,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+    )
+
+
+def _make_task(store, task_list, title="Task", **fields):
+    defaults = {
+        "dependencies": [],
+        "exit_criteria": [
+            ExitCriteria(criteria=f"Criterion {i}", status=ExitCriteriaStatus.INCOMPLETE)
+            for i in range(3)
+        ],
+        "notes": [
+            Note(content=f"Note {i}", timestamp=datetime(2024, 1, 1, 0, i)) for i in range(5)
+        ],
+    }
+    defaults.update(fields)
+    return store.create_task(
+        Task(
+            id=uuid4(),
+            task_list_id=task_list.id,
+            title=title,
+            description="Description",
+            status=Status.NOT_STARTED,
+            priority=Priority.MEDIUM,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            **defaults,
+        )
+    )
+
+
+@contextmanager
+def record_writes():
+    """Count the rows each flush inserts, updates and deletes, per table."""
+    writes = Counter()
+
+    def after_flush(session, flush_context):
+        for verb, rows in (
+            ("INSERT", session.new),
+            ("UPDATE", [row for row in session.dirty if session.is_modified(row)]),
+            ("DELETE", session.deleted),
+        ):
+            for row in rows:
+                writes[(verb, row.__tablename__)] += 1
+
+    event.listen(Session, "after_flush", after_flush)
+    try:
+        yield writes
+    finally:
+        event.remove(Session, "after_flush", after_flush)
+
+
+class TestUpdateTaskDiff:
+    """Test that update_task only writes the child rows that changed."""
+
+    def test_appending_note_inserts_one_row(self, store, task_list):
+        """Test that appending a note inserts it without touching existing notes."""
+        task = _make_task(store, task_list)
+        task.notes.append(Note(content="New", timestamp=datetime(2024, 1, 2)))
+
+        with record_writes() as writes:
+            updated = store.update_task(task)
+
+        assert writes == Counter({("INSERT", "notes"): 1, ("UPDATE", "tasks"): 1})
+        assert [n.content for n in updated.notes] == [f"Note {i}" for i in range(5)] + ["New"]
+
+    def test_unchanged_children_are_not_written(self, store, task_list):
+        """Test that a field-only update leaves all child rows alone."""
+        task = _make_task(store, task_list)
+        task.title = "Renamed"
+
+        with record_writes() as writes:
+            store.update_task(task)
+
+        assert writes == Counter({("UPDATE", "tasks"): 1})
+
+    def test_changed_exit_criterion_is_updated_in_place(self, store, task_list):
+        """Test that changing an exit criterion updates only its row."""
+        task = _make_task(store, task_list)
+        task.exit_criteria[0].status = ExitCriteriaStatus.COMPLETE
+
+        with record_writes() as writes:
+            updated = store.update_task(task)
+
+        assert writes == Counter({("UPDATE", "exit_criteria"): 1, ("UPDATE", "tasks"): 1})
+        assert [ec.status for ec in updated.exit_criteria] == [
+            ExitCriteriaStatus.COMPLETE,
+            ExitCriteriaStatus.INCOMPLETE,
+            ExitCriteriaStatus.INCOMPLETE,
+        ]
+
+    def test_inserting_note_updates_following_rows(self, store, task_list):
+        """Test that inserting a note shifts the following rows without deleting any."""
+        task = _make_task(store, task_list)
+        task.notes.insert(3, Note(content="Inserted", timestamp=datetime(2024, 1, 3)))
+
+        with record_writes() as writes:
+            updated = store.update_task(task)
+
+        assert writes[("UPDATE", "notes")] == 2
+        assert writes[("INSERT", "notes")] == 1
+        assert ("DELETE", "notes") not in writes
+        assert [n.content for n in updated.notes] == [n.content for n in task.notes]
+
+    def test_removing_exit_criterion_deletes_one_row(self, store, task_list):
+        """Test that removing the last exit criterion deletes only its row."""
+        task = _make_task(store, task_list)
+        del task.exit_criteria[2]
+
+        with record_writes() as writes:
+            updated = store.update_task(task)
+
+        assert writes == Counter({("DELETE", "exit_criteria"): 1, ("UPDATE", "tasks"): 1})
+        assert [ec.criteria for ec in updated.exit_criteria] == ["Criterion 0", "Criterion 1"]
+
+    def test_order_survives_legacy_rows_without_positions(self, store, task_list):
+        """Test that an update assigns positions to rows stored before the column existed."""
+        task = _make_task(store, task_list)
+        with store.engine.begin() as conn:
+            conn.execute(text("UPDATE exit_criteria SET position = 0"))
+        task.exit_criteria[1].comment = "checked"
+
+        store.update_task(task)
+
+        assert store.get_task(task.id).exit_criteria == task.exit_criteria
+
+    def test_order_is_preserved_after_changes(self, store, task_list):
+        """Test that removing and inserting in the middle keeps the requested order."""
+        task = _make_task(store, task_list)
+        task.exit_criteria[0].comment = "checked"
+        task.notes.insert(1, Note(content="Inserted", timestamp=datetime(2024, 1, 3)))
+        del task.notes[3]
+
+        updated = store.update_task(task)
+
+        assert updated.exit_criteria == task.exit_criteria
+        assert [n.content for n in updated.notes] == [n.content for n in task.notes]
+        assert store.get_task(task.id).notes == updated.notes
+
+    def test_dependencies_can_be_reordered(self, store, task_list):
+        """Test that re-adding an existing dependency does not violate its unique constraint."""
+        first = _make_task(store, task_list, "First")
+        second = _make_task(store, task_list, "Second")
+        task = _make_task(
+            store,
+            task_list,
+            dependencies=[
+                Dependency(task_id=first.id, task_list_id=task_list.id),
+                Dependency(task_id=second.id, task_list_id=task_list.id),
+            ],
+        )
+        task.dependencies.reverse()
+
+        updated = store.update_task(task)
+
+        assert [d.task_id for d in updated.dependencies] == [second.id, first.id]
+
+    def test_note_types_are_diffed_separately(self, store, task_list):
+        """Test that adding research and execution notes leaves general notes alone."""
+        task = _make_task(store, task_list)
+        task.research_notes = [Note(content="Research", timestamp=datetime(2024, 1, 4))]
+        task.execution_notes = [Note(content="Execution", timestamp=datetime(2024, 1, 5))]
+
+        with record_writes() as writes:
+            updated = store.update_task(task)
+
+        assert writes[("INSERT", "notes")] == 2
+        assert ("DELETE", "notes") not in writes
+        assert [n.content for n in updated.research_notes] == ["Research"]
+        assert [n.content for n in updated.execution_notes] == ["Execution"]
+
+    def test_action_plan_items_are_updated_in_place(self, store, task_list):
+        """Test that action plan items are matched by sequence."""
+        task = _make_task(
+            store,
+            task_list,
+            action_plan=[ActionPlanItem(sequence=i, content=f"Step {i}") for i in range(1, 4)],
+        )
+        task.action_plan = [
+            ActionPlanItem(sequence=1, content="Step 1"),
+            ActionPlanItem(sequence=2, content="Revised"),
+            ActionPlanItem(sequence=4, content="Step 4"),
+        ]
+
+        with record_writes() as writes:
+            updated = store.update_task(task)
+
+        assert writes[("UPDATE", "action_plan_items")] == 1
+        assert writes[("DELETE", "action_plan_items")] == 1
+        assert writes[("INSERT", "action_plan_items")] == 1
+        assert updated.action_plan == task.action_plan
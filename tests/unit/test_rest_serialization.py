@@ -0,0 +1,209 @@
+"""Unit tests for the fast task list serialization of the REST API.
+
+This module tests that:
+1. Tasks are converted to the TaskResponse schema, field for field
+2. The orjson and standard library encoders produce the same bytes
+3. Task list responses carry the tasks and any extra top-level keys
+4. Task iterators are encoded as NDJSON in bounded chunks
+5. Task events are encoded as Server-Sent Events
+
+Requirements: 2.3, 2.4, 9.2
+"""
+
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from task_manager.interfaces.rest import serialization
+from task_manager.interfaces.rest.serialization import (
+    dumps,
+    ndjson_chunk,
+    sse_event,
+    task_list_response,
+    task_to_dict,
+)
+from task_manager.models.entities import ActionPlanItem, Dependency, ExitCriteria, Note, Task
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+from task_manager.orchestration.event_bus import TASK_DELETED, TASK_UPDATED, TaskEvent
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _create_task(**overrides):
+    fields = dict(
+        id=uuid4(),
+        task_list_id=uuid4(),
+        title="Deploy",
+        description="Ship the release",
+        status=Status.IN_PROGRESS,
+        dependencies=[],
+        exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+        priority=Priority.HIGH,
+        notes=[],
+        created_at=BASE_TIME,
+        updated_at=BASE_TIME,
+    )
+    fields.update(overrides)
+    return Task(**fields)
+
+
+class TestTaskToDict:
+    """Test conversion of Task entities to the TaskResponse schema."""
+
+    def test_full_task(self):
+        """Test that every field is converted like TaskResponse.model_dump()."""
+        dependency = Dependency(task_id=uuid4(), task_list_id=uuid4())
+        task = _create_task(
+            dependencies=[dependency],
+            exit_criteria=[
+                ExitCriteria(
+                    criteria="Tests pass", status=ExitCriteriaStatus.COMPLETE, comment="CI green"
+                )
+            ],
+            notes=[Note(content="Started", timestamp=BASE_TIME)],
+            research_notes=[Note(content="Read docs", timestamp=BASE_TIME)],
+            action_plan=[ActionPlanItem(sequence=1, content="Build")],
+            execution_notes=[Note(content="Built", timestamp=BASE_TIME)],
+            agent_instructions_template="Work on {title}",
+            tags=["release", "ops"],
+        )
+
+        result = task_to_dict(task)
+
+        assert list(result) == [
+            "id",
+            "task_list_id",
+            "title",
+            "description",
+            "status",
+            "priority",
+            "dependencies",
+            "exit_criteria",
+            "notes",
+            "research_notes",
+            "action_plan",
+            "execution_notes",
+            "agent_instructions_template",
+            "tags",
+            "created_at",
+            "updated_at",
+        ]
+        assert result["id"] == str(task.id)
+        assert result["status"] == "IN_PROGRESS"
+        assert result["priority"] == "HIGH"
+        assert result["dependencies"] == [
+            {"task_id": str(dependency.task_id), "task_list_id": str(dependency.task_list_id)}
+        ]
+        assert result["exit_criteria"] == [
+            {"criteria": "Tests pass", "status": "COMPLETE", "comment": "CI green"}
+        ]
+        assert result["notes"] == [{"content": "Started", "timestamp": "2024-01-01T12:00:00"}]
+        assert result["research_notes"] == [
+            {"content": "Read docs", "timestamp": "2024-01-01T12:00:00"}
+        ]
+        assert result["action_plan"] == [{"sequence": 1, "content": "Build"}]
+        assert result["execution_notes"] == [
+            {"content": "Built", "timestamp": "2024-01-01T12:00:00"}
+        ]
+        assert result["agent_instructions_template"] == "Work on {title}"
+        assert result["tags"] == ["release", "ops"]
+        assert result["created_at"] == "2024-01-01T12:00:00"
+
+    def test_empty_optional_fields(self):
+        """Test that empty optional lists become null and missing tags an empty list."""
+        task = _create_task(research_notes=[], action_plan=None, tags=[])
+
+        result = task_to_dict(task)
+
+        assert result["research_notes"] is None
+        assert result["action_plan"] is None
+        assert result["execution_notes"] is None
+        assert result["agent_instructions_template"] is None
+        assert result["tags"] == []
+
+
+class TestEncoding:
+    """Test JSON encoding of task lists."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_matches_fastapi_json_encoding(self, monkeypatch, use_orjson):
+        """Test that both encoders produce the bytes of FastAPI's JSONResponse."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(serialization, "orjson", None)
+        content = {"tasks": [task_to_dict(_create_task(title="Déployer ✓"))], "next": None}
+
+        expected = json.dumps(
+            content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
+        assert dumps(content) == expected
+
+    def test_task_list_response(self):
+        """Test that the response holds the tasks in order followed by extra keys."""
+        tasks = [_create_task(title="First"), _create_task(title="Second")]
+
+        response = task_list_response(tasks, {"next_cursor": "abc"})
+
+        assert response.media_type == "application/json"
+        body = json.loads(response.body)
+        assert list(body) == ["tasks", "next_cursor"]
+        assert [t["title"] for t in body["tasks"]] == ["First", "Second"]
+        assert body["next_cursor"] == "abc"
+
+
+class TestNdjsonChunk:
+    """Test newline-delimited JSON encoding of task iterators."""
+
+    def test_chunks_until_exhausted(self):
+        """Test that each chunk holds at most max_tasks lines and the end is b''."""
+        task_list = [_create_task(title=f"Task {i}") for i in range(5)]
+        tasks = iter(task_list)
+
+        chunks = [ndjson_chunk(tasks, 2) for _ in range(4)]
+
+        assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1, 0]
+        assert chunks[3] == b""
+        lines = b"".join(chunks).splitlines()
+        assert [json.loads(line) for line in lines] == [task_to_dict(t) for t in task_list]
+
+
+class TestSseEvent:
+    """Test Server-Sent Events encoding of task events."""
+
+    def test_update_event(self):
+        """Test that the message carries the sequence, type and task as JSON data."""
+        task = _create_task()
+        event = TaskEvent(
+            type=TASK_UPDATED,
+            task_id=task.id,
+            task_list_id=task.task_list_id,
+            project_id=uuid4(),
+            task=task,
+            sequence=7,
+            timestamp=BASE_TIME,
+        )
+
+        message = sse_event(event)
+
+        lines = message.decode().split("\n")
+        assert lines[:2] == ["id: 7", "event: task.updated"]
+        assert lines[3:] == ["", ""]
+        data = json.loads(lines[2].removeprefix("data: "))
+        assert data["type"] == "task.updated"
+        assert data["sequence"] == 7
+        assert data["project_id"] == str(event.project_id)
+        assert data["task"] == task_to_dict(task)
+        assert data["timestamp"] == "2024-01-01T12:00:00"
+
+    def test_delete_event(self):
+        """Test that deletion events carry the IDs and a null task."""
+        event = TaskEvent(type=TASK_DELETED, task_id=uuid4(), task_list_id=uuid4(), sequence=1)
+
+        data = json.loads(sse_event(event).split(b"\n")[2].removeprefix(b"data: "))
+
+        assert data["task_id"] == str(event.task_id)
+        assert data["project_id"] is None
+        assert data["task"] is None
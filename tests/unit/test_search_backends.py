@@ -0,0 +1,155 @@
+"""Cross-backend tests for text search.
+
+The same tasks are searched on every backing store to pin the text matching
+they have in common: a query matches tasks whose title or description contains
+it, case-insensitively, including in the middle of a word, and pages sorted
+by relevance hold every matching task exactly once.
+
+The PostgreSQL store is only tested when TEST_POSTGRES_URL is set.
+
+Requirements: 4.2
+"""
+
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from task_manager.data.access.filesystem_store import FilesystemStore
+from task_manager.data.access.log_store import LogStore
+from task_manager.data.access.postgresql_store import PostgreSQLStore
+from task_manager.data.access.sqlite_store import SQLiteStore
+from task_manager.models.entities import ExitCriteria, Project, SearchCriteria, Task, TaskList
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+from task_manager.orchestration.search_orchestrator import SearchOrchestrator
+
+
+@pytest.fixture(params=["filesystem", "log", "sqlite", "postgresql"])
+def store(request):
+    """Create an initialized store of each backend type."""
+    if request.param == "postgresql":
+        postgres_url = os.environ.get("TEST_POSTGRES_URL")
+        if not postgres_url:
+            pytest.skip("TEST_POSTGRES_URL not set")
+        store = PostgreSQLStore(postgres_url)
+        store.initialize()
+        yield store
+        store.engine.dispose()
+        return
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if request.param == "filesystem":
+            store = FilesystemStore(tmpdir)
+        elif request.param == "log":
+            store = LogStore(tmpdir)
+        else:
+            store = SQLiteStore(str(Path(tmpdir) / "tasks.db"))
+        store.initialize()
+        yield store
+        if request.param == "sqlite":
+            store.engine.dispose()
+
+
+def _create_project_tasks(store, texts):
+    """Create a task for each (title, description) in a new project and return the project."""
+    now = datetime.now(timezone.utc)
+    project = store.create_project(
+        Project(
+            id=uuid4(),
+            name=f"Search Project {uuid4()}",
+            is_default=False,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    task_list = store.create_task_list(
+        TaskList(id=uuid4(), name="List", project_id=project.id, created_at=now, updated_at=now)
+    )
+    for title, description in texts:
+        store.create_task(
+            Task(
+                id=uuid4(),
+                task_list_id=task_list.id,
+                title=title,
+                description=description,
+                status=Status.NOT_STARTED,
+                dependencies=[],
+                exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+                priority=Priority.MEDIUM,
+                notes=[],
+                created_at=now,
+                updated_at=now,
+            )
+        )
+    return project
+
+
+@pytest.fixture
+def search(store):
+    """Create tasks in a new project and return a search function scoped to it."""
+    project = _create_project_tasks(
+        store,
+        [
+            ("Implement authentication", "Login flow"),
+            ("Write docs", "Document the Authentication API"),
+            ("Fix build", "Token refresh fails"),
+        ],
+    )
+    orchestrator = SearchOrchestrator(store)
+
+    def search(query):
+        criteria = SearchCriteria(query=query, project_id=project.id, sort_by="created_at")
+        return sorted(task.title for task in orchestrator.search_tasks(criteria))
+
+    return search
+
+
+class TestTextSearchAcrossBackends:
+    """Test that every backend matches text queries the same way."""
+
+    def test_substring_within_word_matches(self, search):
+        """Test that a query matching the middle of a word finds the task."""
+        assert search("thent") == ["Implement authentication", "Write docs"]
+
+    def test_match_is_case_insensitive(self, search):
+        """Test that the query and the text are compared case-insensitively."""
+        assert search("AUTHENTICATION") == ["Implement authentication", "Write docs"]
+
+    def test_multi_word_substring_matches(self, search):
+        """Test that a query with several words matches them as one substring."""
+        assert search("token refresh") == ["Fix build"]
+
+    def test_non_matching_query_finds_nothing(self, search):
+        """Test that a query contained in no title or description finds no tasks."""
+        assert search("deploy") == []
+
+
+class TestRelevancePagesAcrossBackends:
+    """Test that walking relevance-sorted pages returns every task once."""
+
+    def test_pages_of_one_task_with_tied_ranks(self, store):
+        """Test that a cursor after a task with a tied rank neither repeats nor skips tasks."""
+        project = _create_project_tasks(
+            store,
+            [("Deploy service", "Roll out the deploy")] * 3
+            + [("Deploy docs", "Publish")] * 2
+            + [("Review", "Check the deploy script")],
+        )
+        orchestrator = SearchOrchestrator(store)
+
+        seen = []
+        cursor = None
+        for _ in range(10):
+            page = orchestrator.search_page(
+                SearchCriteria(query="deploy", project_id=project.id, limit=1, cursor=cursor)
+            )
+            seen.extend(task.id for task in page.tasks)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert cursor is None
+        assert len(seen) == len(set(seen)) == 6
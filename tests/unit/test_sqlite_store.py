@@ -0,0 +1,383 @@
+"""Unit tests for the embedded SQLite store.
+
+This module tests that:
+1. Connections are configured for WAL journaling and foreign keys
+2. CRUD operations and cascading deletes work against a real database file
+3. Ready tasks are computed in SQL with the same semantics as the other stores
+4. search_tasks filters, scores, sorts and paginates (offset or cursor) like
+   SearchOrchestrator
+5. count_tasks agrees with in-memory filtering
+
+Requirements: 1.3, 1.5, 4.1-4.8, 9.1-9.3
+"""
+
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+
+from task_manager.data.access.filesystem_store import FilesystemStore
+from task_manager.data.access.sqlite_store import SQLiteStore
+from task_manager.models.entities import (
+    Dependency,
+    ExitCriteria,
+    Project,
+    SearchCriteria,
+    Task,
+    TaskList,
+)
+from task_manager.models.enums import ExitCriteriaStatus, Priority, Status
+from task_manager.orchestration.search_orchestrator import SearchOrchestrator
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _make_task(task_list_id, title="Task", description="Description", **kwargs):
+    return Task(
+        id=uuid4(),
+        task_list_id=task_list_id,
+        title=title,
+        description=description,
+        status=kwargs.get("status", Status.NOT_STARTED),
+        dependencies=kwargs.get("dependencies", []),
+        exit_criteria=[ExitCriteria(criteria="Done", status=ExitCriteriaStatus.INCOMPLETE)],
+        priority=kwargs.get("priority", Priority.MEDIUM),
+        notes=[],
+        created_at=kwargs.get("created_at", BASE_TIME),
+        updated_at=kwargs.get("created_at", BASE_TIME),
+        tags=kwargs.get("tags", []),
+    )
+
+
+@pytest.fixture
+def tmpdir():
+    """Provide a temporary directory for the database file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture
+def store(tmpdir):
+    """Create an initialized SQLite store."""
+    store = SQLiteStore(str(Path(tmpdir) / "tasks.db"))
+    store.initialize()
+    yield store
+    store.engine.dispose()
+
+
+def _create_task_list(store, name="List", project_name="Project"):
+    project = next((p for p in store.list_projects() if p.name == project_name), None)
+    if project is None:
+        project = store.create_project(
+            Project(
+                id=uuid4(),
+                name=project_name,
+                is_default=False,
+                created_at=BASE_TIME,
+                updated_at=BASE_TIME,
+            )
+        )
+    return store.create_task_list(
+        TaskList(
+            id=uuid4(),
+            name=name,
+            project_id=project.id,
+            created_at=BASE_TIME,
+            updated_at=BASE_TIME,
+        )
+    )
+
+
+class TestSQLiteStoreSetup:
+    """Test engine configuration and basic persistence."""
+
+    def test_connections_use_wal_and_foreign_keys(self, store):
+        """Test that pragmas are applied to every connection."""
+        with store.engine.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert connection.execute(text("PRAGMA foreign_keys")).scalar() == 1
+
+    def test_schema_indexes_are_created(self, store):
+        """Test that the indexes from postgresql_schema.py exist."""
+        with store.engine.connect() as connection:
+            indexes = {
+                row[0]
+                for row in connection.execute(
+                    text("SELECT name FROM sqlite_master WHERE type = 'index'")
+                )
+            }
+        assert {"ix_tasks_task_list_id", "ix_tasks_status", "ix_dependencies_target_task_id"} <= (
+            indexes
+        )
+
+    def test_data_survives_reopen(self, store, tmpdir):
+        """Test that a new store instance on the same file sees existing data."""
+        task_list = _create_task_list(store)
+        task = store.create_task(_make_task(task_list.id, tags=["persisted"]))
+
+        reopened = SQLiteStore(str(store.database_path))
+        reopened.initialize()
+
+        assert reopened.get_task(task.id).tags == ["persisted"]
+        assert len([p for p in reopened.list_projects() if p.is_default]) == 2
+        reopened.engine.dispose()
+
+    def test_delete_task_list_cascades_to_child_rows(self, store):
+        """Test that ON DELETE CASCADE removes tasks and their exit criteria."""
+        task_list = _create_task_list(store)
+        store.create_task(_make_task(task_list.id))
+
+        store.delete_task_list(task_list.id)
+
+        with store.engine.connect() as connection:
+            assert connection.execute(text("SELECT COUNT(*) FROM tasks")).scalar() == 0
+            assert connection.execute(text("SELECT COUNT(*) FROM exit_criteria")).scalar() == 0
+
+
+class TestSQLiteReadyTasks:
+    """Test the SQL ready-task query."""
+
+    def test_ready_tasks_exclude_pending_and_missing_dependencies(self, store):
+        """Test that tasks with incomplete or missing dependencies are not ready."""
+        task_list = _create_task_list(store)
+        done = store.create_task(_make_task(task_list.id, "Done", status=Status.COMPLETED))
+        open_task = store.create_task(_make_task(task_list.id, "Open"))
+        after_done = store.create_task(
+            _make_task(
+                task_list.id,
+                "After done",
+                dependencies=[Dependency(task_id=done.id, task_list_id=task_list.id)],
+            )
+        )
+        store.create_task(
+            _make_task(
+                task_list.id,
+                "After open",
+                dependencies=[Dependency(task_id=open_task.id, task_list_id=task_list.id)],
+            )
+        )
+        store.create_task(
+            _make_task(
+                task_list.id,
+                "After missing",
+                dependencies=[Dependency(task_id=uuid4(), task_list_id=task_list.id)],
+            )
+        )
+
+        ready = store.get_ready_tasks("task_list", task_list.id)
+        assert {t.id for t in ready} == {done.id, open_task.id, after_done.id}
+
+        project_ready = store.get_ready_tasks("project", task_list.project_id)
+        assert {t.id for t in project_ready} == {done.id, open_task.id, after_done.id}
+
+    def test_ready_tasks_validates_scope(self, store):
+        """Test that invalid scopes raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid scope_type"):
+            store.get_ready_tasks("team", uuid4())
+        with pytest.raises(ValueError, match="does not exist"):
+            store.get_ready_tasks("task_list", uuid4())
+
+
+class TestSQLiteBatchWrites:
+    """Test the batched update, delete and tag statements."""
+
+    def test_update_tasks(self, store):
+        """Test that several tasks are updated together."""
+        task_list = _create_task_list(store)
+        first = store.create_task(_make_task(task_list.id, "First"))
+        second = store.create_task(_make_task(task_list.id, "Second"))
+
+        first.title = "First updated"
+        second.status = Status.COMPLETED
+        second.dependencies = [Dependency(task_id=first.id, task_list_id=task_list.id)]
+        updated = store.update_tasks([first, second])
+
+        assert [t.title for t in updated] == ["First updated", "Second"]
+        assert store.get_task(second.id).status == Status.COMPLETED
+        assert store.get_task(second.id).dependencies[0].task_id == first.id
+
+    def test_update_tasks_missing_task_writes_nothing(self, store):
+        """Test that a missing task fails the whole batch."""
+        task_list = _create_task_list(store)
+        task = store.create_task(_make_task(task_list.id, "Original"))
+
+        task.title = "Changed"
+        with pytest.raises(ValueError, match="does not exist"):
+            store.update_tasks([task, _make_task(task_list.id)])
+
+        assert store.get_task(task.id).title == "Original"
+
+    def test_delete_tasks_removes_dependencies_on_them(self, store):
+        """Test that deleted tasks disappear from their dependents."""
+        task_list = _create_task_list(store)
+        first = store.create_task(_make_task(task_list.id, "First"))
+        second = store.create_task(_make_task(task_list.id, "Second"))
+        dependent = store.create_task(
+            _make_task(
+                task_list.id,
+                "Dependent",
+                dependencies=[
+                    Dependency(task_id=first.id, task_list_id=task_list.id),
+                    Dependency(task_id=second.id, task_list_id=task_list.id),
+                ],
+            )
+        )
+
+        store.delete_tasks([first.id, second.id])
+
+        assert store.get_tasks([first.id, second.id]) == []
+        remaining = store.get_task(dependent.id)
+        assert remaining.dependencies == []
+        assert remaining.updated_at > BASE_TIME
+        with store.engine.connect() as connection:
+            assert connection.execute(text("SELECT COUNT(*) FROM exit_criteria")).scalar() == 1
+
+    def test_delete_tasks_missing_task_deletes_nothing(self, store):
+        """Test that a missing task fails the whole batch."""
+        task_list = _create_task_list(store)
+        task = store.create_task(_make_task(task_list.id))
+
+        with pytest.raises(ValueError, match="does not exist"):
+            store.delete_tasks([task.id, uuid4()])
+
+        assert store.get_task(task.id) is not None
+
+    def test_add_and_remove_tags(self, store):
+        """Test that tags are added once and removed in place."""
+        task_list = _create_task_list(store)
+        first = store.create_task(_make_task(task_list.id, tags=["a", "b"]))
+        second = store.create_task(_make_task(task_list.id))
+
+        added = store.add_tags_to_tasks([first.id, second.id], ["b", "c"])
+        assert [t.tags for t in added] == [["a", "b", "c"], ["b", "c"]]
+
+        removed = store.remove_tags_from_tasks([first.id, second.id], ["a", "c", "x"])
+        assert [t.tags for t in removed] == [["b"], ["b"]]
+        assert store.get_task(first.id).tags == ["b"]
+
+    def test_add_tags_missing_task_writes_nothing(self, store):
+        """Test that a missing task fails the whole batch."""
+        task_list = _create_task_list(store)
+        task = store.create_task(_make_task(task_list.id))
+
+        with pytest.raises(ValueError, match="does not exist"):
+            store.add_tags_to_tasks([task.id, uuid4()], ["new"])
+
+        assert store.get_task(task.id).tags == []
+
+
+class TestSQLiteSearch:
+    """Test that SQL search matches the in-memory SearchOrchestrator."""
+
+    @staticmethod
+    def _populate(store):
+        backend = _create_task_list(store, "Backend", "Alpha")
+        frontend = _create_task_list(store, "Frontend", "Beta")
+        specs = [
+            (backend, "Fix API bug", "API returns 500", Priority.HIGH, ["api"]),
+            (backend, "Write docs", "Document the api and the API client", Priority.LOW, []),
+            (frontend, "Style pass", "Polish the UI", Priority.CRITICAL, ["ui", "api"]),
+            (frontend, "Straße routing", "Handle STRASSE in addresses", Priority.MEDIUM, []),
+        ]
+        for i, (task_list, title, description, priority, tags) in enumerate(specs):
+            status = Status.COMPLETED if i == 3 else Status.NOT_STARTED
+            store.create_task(
+                _make_task(
+                    task_list.id,
+                    title,
+                    description,
+                    priority=priority,
+                    tags=tags,
+                    status=status,
+                    created_at=BASE_TIME + timedelta(minutes=i),
+                )
+            )
+
+    @pytest.mark.parametrize(
+        "criteria",
+        [
+            SearchCriteria(query="api"),
+            SearchCriteria(query="strasse"),
+            SearchCriteria(tags=["api"], sort_by="priority"),
+            SearchCriteria(status=[Status.COMPLETED]),
+            SearchCriteria(priority=[Priority.HIGH, Priority.LOW], sort_by="created_at"),
+            SearchCriteria(project_name="Beta"),
+            SearchCriteria(limit=2, offset=1, sort_by="updated_at"),
+        ],
+    )
+    def test_search_matches_in_memory_results(self, store, tmpdir, criteria):
+        """Test that SQL search returns the same tasks in the same order."""
+        self._populate(store)
+        reference_store = FilesystemStore(str(Path(tmpdir) / "reference"))
+        reference_store.initialize()
+        self._populate(reference_store)
+
+        sql_titles = [t.title for t in SearchOrchestrator(store).search_tasks(criteria)]
+        memory_titles = [
+            t.title for t in SearchOrchestrator(reference_store).search_tasks(criteria)
+        ]
+
+        assert sql_titles == memory_titles
+
+    def test_search_by_project_id(self, store):
+        """Test filtering by project ID."""
+        self._populate(store)
+        alpha = next(p for p in store.list_projects() if p.name == "Alpha")
+
+        result = store.search_tasks(SearchCriteria(project_id=alpha.id, sort_by="created_at"))
+
+        assert [t.title for t in result] == ["Write docs", "Fix API bug"]
+
+    @pytest.mark.parametrize(
+        "criteria",
+        [
+            SearchCriteria(),
+            SearchCriteria(query="api"),
+            SearchCriteria(tags=["api"], priority=[Priority.CRITICAL]),
+            SearchCriteria(status=[Status.NOT_STARTED], project_name="Alpha"),
+            SearchCriteria(project_name="Missing"),
+        ],
+    )
+    def test_count_matches_in_memory_filtering(self, store, tmpdir, criteria):
+        """Test that the SQL count and the filesystem index count agree with in-memory filtering."""
+        self._populate(store)
+        reference_store = FilesystemStore(str(Path(tmpdir) / "reference"))
+        reference_store.initialize()
+        self._populate(reference_store)
+        reference = SearchOrchestrator(reference_store)
+        expected = len(reference._apply_filters(reference._get_all_tasks(), criteria))
+
+        assert SearchOrchestrator(store).count_results(criteria) == expected
+        assert reference.count_results(criteria) == expected
+
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            {"query": "api"},
+            {"sort_by": "created_at"},
+            {"sort_by": "updated_at"},
+            {"sort_by": "priority"},
+        ],
+    )
+    def test_cursor_pages_match_full_result(self, store, fields):
+        """Test that keyset pages walk the full sorted result, ties included."""
+        self._populate(store)
+        extra = _create_task_list(store, "Extra", "Alpha")
+        for i in range(3):
+            store.create_task(_make_task(extra.id, f"Tied api {i}", priority=Priority.HIGH))
+        orchestrator = SearchOrchestrator(store)
+
+        titles = []
+        page = orchestrator.search_page(SearchCriteria(limit=2, **fields))
+        titles.extend(t.title for t in page.tasks)
+        while page.next_cursor:
+            page = orchestrator.search_page(
+                SearchCriteria(limit=2, cursor=page.next_cursor, **fields)
+            )
+            titles.extend(t.title for t in page.tasks)
+
+        full = orchestrator.search_tasks(SearchCriteria(limit=100, **fields))
+        assert titles == [t.title for t in full]
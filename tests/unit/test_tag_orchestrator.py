@@ -276,6 +276,48 @@ class TestTagOrchestrator:
         assert before <= updated_task.updated_at <= after
         assert updated_task.updated_at > original_updated_at
 
+    # add_tags_to_tasks / remove_tags_from_tasks tests
+
+    def test_add_tags_to_tasks_uses_one_store_call(
+        self, orchestrator, mock_data_store, sample_task
+    ):
+        """Test that tags are added to several tasks with one store call."""
+        # Setup
+        mock_data_store.get_tasks.return_value = [sample_task]
+        mock_data_store.add_tags_to_tasks.return_value = [sample_task]
+
+        # Execute
+        orchestrator.add_tags_to_tasks([sample_task.id, sample_task.id], ["tag1"])
+
+        # Verify
+        mock_data_store.add_tags_to_tasks.assert_called_once_with([sample_task.id], ["tag1"])
+        mock_data_store.update_task.assert_not_called()
+
+    def test_add_tags_to_tasks_enforces_max_count(self, orchestrator, mock_data_store, sample_task):
+        """Test that one task reaching the maximum tag count fails the whole batch."""
+        # Setup
+        sample_task.tags = [f"tag{i}" for i in range(10)]
+        other_task = Task(**{**sample_task.__dict__, "id": uuid4(), "tags": []})
+        mock_data_store.get_tasks.return_value = [other_task, sample_task]
+
+        # Execute & Verify
+        with pytest.raises(ValueError, match="Task cannot have more than 10 tags"):
+            orchestrator.add_tags_to_tasks([other_task.id, sample_task.id], ["new"])
+        mock_data_store.add_tags_to_tasks.assert_not_called()
+
+    def test_remove_tags_from_tasks_uses_one_store_call(
+        self, orchestrator, mock_data_store, sample_task
+    ):
+        """Test that tags are removed from several tasks with one store call."""
+        # Setup
+        mock_data_store.remove_tags_from_tasks.return_value = [sample_task]
+
+        # Execute
+        orchestrator.remove_tags_from_tasks([sample_task.id], ["tag1"])
+
+        # Verify
+        mock_data_store.remove_tags_from_tasks.assert_called_once_with([sample_task.id], ["tag1"])
+
     # get_tasks_by_tag tests
 
     def test_get_tasks_by_tag_finds_matching_tasks(
@@ -316,10 +358,7 @@ class TestTagOrchestrator:
             tags=["javascript"],
         )
 
-        task_list = Mock()
-        task_list.id = uuid4()
-        mock_data_store.list_task_lists.return_value = [task_list]
-        mock_data_store.list_tasks.return_value = [task1, task2, task3]
+        mock_data_store.iter_tasks.return_value = iter([task1, task2, task3])
 
         # Execute
         result = orchestrator.get_tasks_by_tag("python")
@@ -334,10 +373,7 @@ class TestTagOrchestrator:
         """Test getting tasks by tag when no tasks match."""
         # Setup
         sample_task.tags = ["python"]
-        task_list = Mock()
-        task_list.id = uuid4()
-        mock_data_store.list_task_lists.return_value = [task_list]
-        mock_data_store.list_tasks.return_value = [sample_task]
+        mock_data_store.iter_tasks.return_value = iter([sample_task])
 
         # Execute
         result = orchestrator.get_tasks_by_tag("javascript")
@@ -351,10 +387,7 @@ class TestTagOrchestrator:
         """Test getting tasks by tag handles tasks without tags."""
         # Setup
         sample_task.tags = []
-        task_list = Mock()
-        task_list.id = uuid4()
-        mock_data_store.list_task_lists.return_value = [task_list]
-        mock_data_store.list_tasks.return_value = [sample_task]
+        mock_data_store.iter_tasks.return_value = iter([sample_task])
 
         # Execute
         result = orchestrator.get_tasks_by_tag("python")
@@ -368,6 +368,16 @@ class TestTaskOrchestratorListTasks:
         assert result[0] == sample_task
         mock_data_store.list_tasks.assert_called_once_with(sample_task_list.id)
 
+    def test_iter_tasks_delegates_to_store(self, task_orchestrator, mock_data_store, sample_task):
+        """Test that iterating tasks uses the store's lazy iterator."""
+        mock_data_store.iter_tasks.return_value = iter([sample_task])
+
+        result = task_orchestrator.iter_tasks(sample_task.task_list_id)
+
+        assert list(result) == [sample_task]
+        mock_data_store.iter_tasks.assert_called_once_with(sample_task.task_list_id)
+        mock_data_store.list_tasks.assert_not_called()
+
 
 class TestTaskOrchestratorUpdateTask:
     """Test task update operations."""
@@ -621,6 +631,52 @@ class TestTaskOrchestratorUpdateTask:
         assert len(updated_task.dependencies) == 0
         mock_data_store.update_task.assert_called_once()
 
+    def test_update_tasks_uses_one_store_call(
+        self, task_orchestrator, mock_data_store, sample_task
+    ):
+        """Test updating several tasks persists them in one call.
+
+        Requirements: 5.7
+        """
+        # Setup
+        mock_data_store.get_tasks.return_value = [sample_task]
+
+        def update_tasks_side_effect(tasks):
+            return tasks
+
+        mock_data_store.update_tasks.side_effect = update_tasks_side_effect
+
+        # Execute - the same task may be updated more than once
+        updated = task_orchestrator.update_tasks(
+            [
+                (sample_task.id, {"title": "Updated Title"}),
+                (sample_task.id, {"status": Status.IN_PROGRESS}),
+            ]
+        )
+
+        # Verify
+        assert [task.title for task in updated] == ["Updated Title", "Updated Title"]
+        assert updated[0].status == Status.IN_PROGRESS
+        mock_data_store.update_tasks.assert_called_once()
+        mock_data_store.update_task.assert_not_called()
+
+    def test_update_tasks_invalid_update_writes_nothing(
+        self, task_orchestrator, mock_data_store, sample_task
+    ):
+        """Test that one invalid update fails the whole batch.
+
+        Requirements: 5.7
+        """
+        # Setup
+        mock_data_store.get_tasks.return_value = [sample_task]
+
+        # Execute and verify
+        with pytest.raises(ValueError, match="Task title cannot be empty"):
+            task_orchestrator.update_tasks(
+                [(sample_task.id, {"priority": Priority.HIGH}), (sample_task.id, {"title": " "})]
+            )
+        mock_data_store.update_tasks.assert_not_called()
+
 
 class TestTaskOrchestratorDeleteTask:
     """Test task deletion operations."""
@@ -633,14 +689,14 @@ class TestTaskOrchestratorDeleteTask:
         # Setup
         mock_data_store.get_task.return_value = sample_task
         mock_data_store.delete_task.return_value = None
-        mock_data_store.list_tasks.return_value = []
-        mock_data_store.list_task_lists.return_value = []
+        mock_data_store.get_dependents.return_value = []
 
         # Execute
         task_orchestrator.delete_task(sample_task.id)
 
         # Verify
         mock_data_store.delete_task.assert_called_once_with(sample_task.id)
+        mock_data_store.update_task.assert_not_called()
 
     def test_delete_task_removes_from_dependents(
         self, task_orchestrator, mock_data_store, sample_task, sample_task_list
@@ -668,10 +724,9 @@ class TestTaskOrchestratorDeleteTask:
             updated_at=datetime.now(timezone.utc),
         )
 
-        # Mock to return task being deleted and dependent task
+        # Mock to return task being deleted and its dependent task
         mock_data_store.get_task.return_value = sample_task
-        mock_data_store.list_task_lists.return_value = [sample_task_list]
-        mock_data_store.list_tasks.return_value = [dependent_task]
+        mock_data_store.get_dependents.return_value = [dependent_task]
 
         # Execute
         task_orchestrator.delete_task(sample_task.id)
@@ -680,6 +735,7 @@ class TestTaskOrchestratorDeleteTask:
         mock_data_store.update_task.assert_called_once()
         updated_task = mock_data_store.update_task.call_args[0][0]
         assert len(updated_task.dependencies) == 0
+        mock_data_store.get_dependents.assert_called_once_with(sample_task.id)
         mock_data_store.delete_task.assert_called_once_with(sample_task.id)
 
     def test_delete_task_nonexistent_raises_error(self, task_orchestrator, mock_data_store):
@@ -695,6 +751,40 @@ class TestTaskOrchestratorDeleteTask:
         with pytest.raises(ValueError, match=f"Task with id '{task_id}' does not exist"):
             task_orchestrator.delete_task(task_id)
 
+    def test_delete_tasks_uses_one_store_call(
+        self, task_orchestrator, mock_data_store, sample_task
+    ):
+        """Test deleting several tasks reads and deletes them in one call each.
+
+        Requirements: 5.8
+        """
+        # Setup
+        mock_data_store.get_tasks.return_value = [sample_task]
+
+        # Execute
+        task_orchestrator.delete_tasks([sample_task.id, sample_task.id])
+
+        # Verify
+        mock_data_store.get_tasks.assert_called_once_with([sample_task.id])
+        mock_data_store.delete_tasks.assert_called_once_with([sample_task.id])
+        mock_data_store.delete_task.assert_not_called()
+
+    def test_delete_tasks_nonexistent_deletes_nothing(
+        self, task_orchestrator, mock_data_store, sample_task
+    ):
+        """Test that a nonexistent task fails the whole batch.
+
+        Requirements: 5.8
+        """
+        # Setup
+        mock_data_store.get_tasks.return_value = [sample_task]
+        task_id = uuid4()
+
+        # Execute and verify
+        with pytest.raises(ValueError, match=f"Task with id '{task_id}' does not exist"):
+            task_orchestrator.delete_tasks([sample_task.id, task_id])
+        mock_data_store.delete_tasks.assert_not_called()
+
 
 class TestTaskOrchestratorNoteOperations:
     """Test task note operations."""
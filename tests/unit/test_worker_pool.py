@@ -0,0 +1,120 @@
+"""Unit tests for the REST worker pool.
+
+This module tests that:
+1. Blocking calls run off the event loop and in parallel up to the thread count
+2. Calls beyond the pending limit are rejected with ServerBusyError
+3. Pending slots are held until the worker finishes, even after cancellation
+4. The pool is configured from environment variables
+
+Requirements: 15.1
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from task_manager.data.config import ConfigurationError
+from task_manager.interfaces.rest.worker_pool import ServerBusyError, WorkerPool
+
+
+@pytest.fixture
+def pool():
+    """Create a pool with two threads and room for three pending calls."""
+    pool = WorkerPool(max_workers=2, max_pending=3)
+    yield pool
+    pool.shutdown()
+
+
+class TestWorkerPool:
+    """Test running calls on the pool."""
+
+    async def test_returns_result_and_raises_errors(self, pool):
+        """Test that results and exceptions of the call are passed through."""
+        assert await pool.run(lambda a, b=0: a + b, 1, b=2) == 3
+
+        def fail():
+            raise ValueError("Task does not exist")
+
+        with pytest.raises(ValueError, match="does not exist"):
+            await pool.run(fail)
+        assert pool.pending == 0
+
+    async def test_calls_run_in_parallel_off_the_event_loop(self, pool):
+        """Test that two slow calls overlap while the event loop keeps running."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        start = time.monotonic()
+        threads = await asyncio.gather(
+            pool.run(lambda: time.sleep(0.2) or threading.get_ident()),
+            pool.run(lambda: time.sleep(0.2) or threading.get_ident()),
+        )
+        elapsed = time.monotonic() - start
+        ticker_task.cancel()
+
+        assert elapsed < 0.35
+        assert len(set(threads)) == 2
+        assert threading.get_ident() not in threads
+        assert ticks >= 5
+
+    async def test_rejects_calls_beyond_pending_limit(self, pool):
+        """Test that queued plus running calls are capped at max_pending."""
+        release = threading.Event()
+        calls = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServerBusyError, match="busy"):
+            await pool.run(lambda: None)
+
+        release.set()
+        await asyncio.gather(*calls)
+        assert pool.pending == 0
+        assert await pool.run(lambda: "ok") == "ok"
+
+    async def test_cancelled_call_holds_slot_until_finished(self, pool):
+        """Test that cancelling the awaiting request does not free a running slot."""
+        release = threading.Event()
+        call = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+        assert pool.pending == 1
+
+        release.set()
+        for _ in range(100):
+            if pool.pending == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert pool.pending == 0
+
+
+class TestWorkerPoolConfiguration:
+    """Test configuration from environment variables."""
+
+    def test_from_environment(self, monkeypatch):
+        """Test that thread count and pending limit are read from the environment."""
+        monkeypatch.setenv("REST_WORKER_THREADS", "3")
+        monkeypatch.delenv("REST_MAX_PENDING_CALLS", raising=False)
+
+        pool = WorkerPool.from_environment()
+        pool.shutdown()
+
+        assert (pool.max_workers, pool.max_pending) == (3, 12)
+
+    @pytest.mark.parametrize("value", ["0", "-1", "many"])
+    def test_invalid_values_are_rejected(self, monkeypatch, value):
+        """Test that non-positive or non-numeric values raise ConfigurationError."""
+        monkeypatch.setenv("REST_MAX_PENDING_CALLS", value)
+
+        with pytest.raises(ConfigurationError, match="REST_MAX_PENDING_CALLS"):
+            WorkerPool.from_environment()